@@ -0,0 +1,94 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#####################
+#
+# Microbenchmark of the ModelVariantNameManager, as used by a large brute
+# search sweep: names a number of unique model config variants, then looks
+# all of them up again, and finally restores the manager from a checkpoint.
+#
+# Example usage:
+#
+# python3 benchmark_model_variant_names.py --num-variants 50000
+#####################
+
+import argparse
+import time
+
+from model_analyzer.config.generate.model_variant_name_manager import ModelVariantNameManager
+
+
+def create_model_config_dict(index):
+    return {
+        'name': f'my_model_config_{index}',
+        'platform': 'tensorrt_plan',
+        'max_batch_size': 2**(index % 8),
+        'instance_group': [{
+            'count': index // 8 % 16 + 1,
+            'kind': 'KIND_GPU'
+        }],
+        'dynamic_batching': {
+            'max_queue_delay_microseconds': str(index // 128)
+        },
+        'input': [{
+            'name': 'INPUT0',
+            'data_type': 'TYPE_FP32',
+            'dims': ['16']
+        }],
+        'output': [{
+            'name': 'OUTPUT0',
+            'data_type': 'TYPE_FP32',
+            'dims': ['16']
+        }]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-variants",
+                        type=int,
+                        default=50000,
+                        help="The number of unique model config variants")
+    args = parser.parse_args()
+
+    model_config_dicts = [
+        create_model_config_dict(index) for index in range(args.num_variants)
+    ]
+    param_combo = {'max_batch_size': 1}
+    manager = ModelVariantNameManager()
+
+    start = time.perf_counter()
+    for model_config_dict in model_config_dicts:
+        manager.get_model_variant_name('my_model', model_config_dict,
+                                       param_combo)
+    create_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for model_config_dict in model_config_dicts:
+        manager.get_model_variant_name('my_model', model_config_dict,
+                                       param_combo)
+    lookup_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ModelVariantNameManager.from_dict(manager.to_dict())
+    restore_time = time.perf_counter() - start
+
+    print(f"variants: {args.num_variants}")
+    print(f"create (s): {create_time:.3f}")
+    print(f"lookup (s): {lookup_time:.3f}")
+    print(f"restore from checkpoint (s): {restore_time:.3f}")
+
+
+if __name__ == "__main__":
+    main()
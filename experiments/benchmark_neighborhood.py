@@ -0,0 +1,104 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#####################
+#
+# Microbenchmark of the quick search Neighborhood for multi-model
+# concurrent search, where every model adds a max_batch_size and an
+# instance_count dimension. For each model count, times creating the
+# neighborhood and the per-step operations that walk all of it.
+#
+# Example usage:
+#
+# python3 benchmark_neighborhood.py --num-models 1 2 4 6 8 --radius 3
+#####################
+
+import argparse
+import time
+
+from model_analyzer.config.generate.coordinate import Coordinate
+from model_analyzer.config.generate.coordinate_data import CoordinateData
+from model_analyzer.config.generate.neighborhood import Neighborhood
+from model_analyzer.config.generate.search_config import NeighborhoodConfig
+from model_analyzer.config.generate.search_dimension import SearchDimension
+from model_analyzer.config.generate.search_dimensions import SearchDimensions
+
+
+def create_neighborhood_config(num_models, radius, min_initialized):
+    dimensions = SearchDimensions()
+    for index in range(num_models):
+        dimensions.add_dimensions(index, [
+            SearchDimension("max_batch_size",
+                            SearchDimension.DIMENSION_TYPE_EXPONENTIAL),
+            SearchDimension("instance_count",
+                            SearchDimension.DIMENSION_TYPE_LINEAR)
+        ])
+    return NeighborhoodConfig(dimensions,
+                              radius=radius,
+                              min_initialized=min_initialized)
+
+
+def benchmark(num_models, radius, min_initialized):
+    neighborhood_config = create_neighborhood_config(num_models, radius,
+                                                     min_initialized)
+    num_dimensions = neighborhood_config.get_num_dimensions()
+    home = Coordinate([1] * num_dimensions)
+
+    coordinate_data = CoordinateData()
+    coordinate_data.set_measurement(home, None)
+
+    start = time.perf_counter()
+    neighborhood = Neighborhood(neighborhood_config, home, coordinate_data)
+    create_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(min_initialized):
+        coordinate = neighborhood.pick_coordinate_to_initialize()
+        coordinate_data.set_measurement(coordinate, None)
+    pick_time = (time.perf_counter() - start) / min_initialized
+
+    start = time.perf_counter()
+    neighborhood.get_nearest_neighbor(home + radius)
+    nearest_time = time.perf_counter() - start
+
+    return create_time, pick_time, nearest_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-models",
+                        type=int,
+                        nargs='+',
+                        default=[1, 2, 4, 6, 8],
+                        help="The model counts to benchmark")
+    parser.add_argument("--radius",
+                        type=int,
+                        default=3,
+                        help="The neighborhood radius")
+    parser.add_argument("--min-initialized",
+                        type=int,
+                        default=3,
+                        help="The number of coordinates picked per step")
+    args = parser.parse_args()
+
+    print("models  dimensions  create (s)  pick (s)  nearest (s)")
+    for num_models in args.num_models:
+        create_time, pick_time, nearest_time = benchmark(
+            num_models, args.radius, args.min_initialized)
+        print(f"{num_models:6d}  {2 * num_models:10d}  {create_time:10.4f}  "
+              f"{pick_time:8.4f}  {nearest_time:11.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#####################
+#
+# Microbenchmark of the Results store, as used by a large brute search
+# sweep: adds a measurement for every run config, looks each of them up
+# as the duplicate check, the reports and the perf model do, and then
+# restores the results from a checkpoint and looks them up again.
+#
+# Example usage:
+#
+# python3 benchmark_results.py --num-variants 1000 --num-models 2
+#####################
+
+import argparse
+import json
+import time
+
+from model_analyzer.config.run.model_run_config import ModelRunConfig
+from model_analyzer.config.run.run_config import RunConfig
+from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.result.results import Results
+from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+from model_analyzer.triton.model.model_config import ModelConfig
+
+BATCH_SIZES = [1, 2, 4, 8]
+CONCURRENCIES = [1, 2, 4, 8, 16, 32, 64, 128]
+NUM_LOOKUPS = 3
+
+
+def create_run_config(num_models, variant_index, batch_size, concurrency):
+    run_config = RunConfig({})
+    for model_index in range(num_models):
+        model_name = f'my_model_{model_index}'
+        model_config = ModelConfig.create_from_dictionary(
+            {'name': f'{model_name}_config_{variant_index}'})
+
+        perf_config = PerfAnalyzerConfig()
+        perf_config.update_config({
+            'model-name': model_name,
+            'latency-report-file': f'{model_name}-results.csv',
+            'measurement-mode': 'count_windows',
+            'verbose-csv': '--verbose-csv',
+            'protocol': 'grpc',
+            'url': 'localhost:8001',
+            'collect-metrics': 'True',
+            'metrics-url': 'http://localhost:8002/metrics',
+            'metrics-interval': 1000,
+            'batch-size': batch_size,
+            'concurrency-range': concurrency
+        })
+
+        run_config.add_model_run_config(
+            ModelRunConfig(model_name, model_config, perf_config))
+
+    return run_config
+
+
+def lookup(results, run_config):
+    models_name = run_config.models_name()
+    model_variants_name = run_config.model_variants_name()
+
+    if not results.contains_model_variant(models_name, model_variants_name):
+        return None
+
+    return results.get_model_variants_measurements_dict(
+        models_name, model_variants_name).get(run_config.representation())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-variants",
+                        type=int,
+                        default=1000,
+                        help="The number of model config variants")
+    parser.add_argument("--num-models",
+                        type=int,
+                        default=1,
+                        help="The number of models profiled concurrently")
+    args = parser.parse_args()
+
+    run_configs = [
+        create_run_config(args.num_models, variant_index, batch_size,
+                          concurrency)
+        for variant_index in range(args.num_variants)
+        for batch_size in BATCH_SIZES
+        for concurrency in CONCURRENCIES
+    ]
+    run_config_measurements = [
+        RunConfigMeasurement(run_config.model_variants_name(), {})
+        for run_config in run_configs
+    ]
+    results = Results()
+
+    start = time.perf_counter()
+    for run_config, run_config_measurement in zip(run_configs,
+                                                  run_config_measurements):
+        results.add_run_config_measurement(run_config, run_config_measurement)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(NUM_LOOKUPS):
+        for run_config, run_config_measurement in zip(
+                run_configs, run_config_measurements):
+            assert lookup(results, run_config) is run_config_measurement
+    lookup_time = time.perf_counter() - start
+
+    results_dict = json.loads(
+        json.dumps(results, default=lambda obj: obj.to_dict()
+                   if hasattr(obj, 'to_dict') else obj.__dict__))
+    start = time.perf_counter()
+    restored_results = Results.from_dict(results_dict)
+    restore_time = time.perf_counter() - start
+
+    # The run configs are generated again after a checkpoint is restored
+    run_configs = [
+        create_run_config(args.num_models, variant_index, batch_size,
+                          concurrency)
+        for variant_index in range(args.num_variants)
+        for batch_size in BATCH_SIZES
+        for concurrency in CONCURRENCIES
+    ]
+    start = time.perf_counter()
+    for _ in range(NUM_LOOKUPS):
+        for run_config in run_configs:
+            assert lookup(restored_results, run_config) is not None
+    restored_lookup_time = time.perf_counter() - start
+
+    print(f"run configs: {len(run_configs)}")
+    print(f"insert (s): {insert_time:.3f}")
+    print(f"lookup x{NUM_LOOKUPS} (s): {lookup_time:.3f}")
+    print(f"restore from checkpoint (s): {restore_time:.3f}")
+    print(f"lookup x{NUM_LOOKUPS} after restore (s): "
+          f"{restored_lookup_time:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#####################
+#
+# Offline benchmark of the run config search algorithms. Every checkpoint
+# found under --data-path is replayed against every combination of the
+# swept search parameters, one replay per process, and the results are
+# written as JSON so that they can be compared against a stored baseline.
+#
+# The experiments import model_analyzer, so the repository root must be
+# on PYTHONPATH, as in the examples, which run from the experiments directory.
+#
+# Example usage:
+#
+# PYTHONPATH=.. python3 benchmark_search.py --search-modes quick brute --radius 2 3 4 --output bench.json
+# PYTHONPATH=.. python3 benchmark_search.py --baseline bench.json --regret-tolerance 0.02
+#####################
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from statistics import mean
+
+RUN_KEY_FIELDS = [
+    "checkpoint", "model", "search_mode", "radius", "min_initialized",
+    "min_model_batch_size", "max_model_batch_size", "min_instance_count",
+    "max_instance_count", "load_all_measurements"
+]
+
+
+def find_all_checkpoints(path):
+    """
+    Return a sorted list of all checkpoints at any depth below input path
+    """
+    if path.endswith(".ckpt"):
+        return [path]
+
+    all_checkpoints = []
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            if filename.endswith(".ckpt"):
+                all_checkpoints.append(os.path.join(dirpath, filename))
+    return sorted(all_checkpoints)
+
+
+def get_models_in_checkpoint(contents):
+    """
+    Return a list of all model names inside of the checkpoint contents
+    """
+    return list(json.loads(contents)["ResultManager.results"]["_results"].keys())
+
+
+def is_linear_inst(contents):
+    """
+    Checkpoints that contain an instance count of 3 were swept linearly
+    """
+    return re.search(r'instanceGroup": \[{"count": 3,', contents) is not None
+
+
+def get_min_mbs_index(contents):
+    """
+    If max batch size of 2 is not in the checkpoint, then find the index
+    where max batch sizes start (other than 1, which is part of default)
+    """
+    min_mbs_index = 0
+    if not re.search('maxBatchSize": 2,', contents):
+        min_mbs_index = 1
+        found = False
+        while not found and min_mbs_index < 16:
+            min_mbs_index += 1
+            found = re.search(f'maxBatchSize": {2**min_mbs_index},',
+                              contents)
+    return min_mbs_index
+
+
+def create_runs(args):
+    """
+    Return the list of runs (one dict per replay) for the requested sweep
+    """
+    runs = []
+    for ckpt in find_all_checkpoints(args.data_path):
+        with open(ckpt, 'r') as f:
+            contents = f.read()
+
+        models = get_models_in_checkpoint(contents)
+        if args.model_names:
+            models = [model for model in models if model in args.model_names]
+
+        for model, search_mode, radius, min_initialized, min_mbs, max_mbs, min_inst, max_inst in itertools.product(
+                models, args.search_modes, args.radius, args.min_initialized,
+                args.min_model_batch_size, args.max_model_batch_size,
+                args.min_instance_count, args.max_instance_count):
+            runs.append({
+                "checkpoint": ckpt,
+                "model": model,
+                "search_mode": search_mode,
+                "radius": radius,
+                "min_initialized": min_initialized,
+                "min_model_batch_size": min_mbs,
+                "max_model_batch_size": max_mbs,
+                "min_instance_count": min_inst,
+                "max_instance_count": max_inst,
+                "exponential_inst_count": not is_linear_inst(contents),
+                "min_mbs_index": get_min_mbs_index(contents),
+                "load_all_measurements": args.load_all_measurements
+            })
+    return runs
+
+
+def create_experiment_args(run):
+    """
+    Convert a run into the CLI arguments used by ExperimentConfigCommandCreator
+    """
+    #yapf: disable
+    other_args = [
+        '--run-config-search-mode', run["search_mode"],
+        '--radius', str(run["radius"]),
+        '--min-initialized', str(run["min_initialized"]),
+        '--min-mbs-index', str(run["min_mbs_index"])
+    ]
+    #yapf: enable
+
+    if run["exponential_inst_count"]:
+        other_args.append('--exponential-inst-count')
+
+    optional_args = {
+        "min_model_batch_size": '--run-config-search-min-model-batch-size',
+        "max_model_batch_size": '--run-config-search-max-model-batch-size',
+        "min_instance_count": '--run-config-search-min-instance-count',
+        "max_instance_count": '--run-config-search-max-instance-count'
+    }
+    for key, flag in optional_args.items():
+        if run[key] is not None:
+            other_args += [flag, str(run[key])]
+
+    return other_args
+
+
+def execute_run(run):
+    """
+    Replay a single run and return its results. Runs in a fresh
+    worker process because the replay patches model analyzer globally
+    """
+    result = {key: run[key] for key in RUN_KEY_FIELDS}
+    try:
+        # An import failure is recorded for this run, instead of
+        # aborting every other run of the pool
+        from evaluate_config_generator import EvaluateConfigGenerator
+        from checkpoint_experiment_data import CheckpointExperimentData
+
+        CheckpointExperimentData.LOAD_ONLY_VISABLE = not run[
+            "load_all_measurements"]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ecg = EvaluateConfigGenerator(run["model"], run["checkpoint"],
+                                          "./output",
+                                          create_experiment_args(run))
+
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            ecg.execute_generator()
+            result["generator_cpu_time"] = time.process_time() - cpu_start
+            result["generator_wall_time"] = time.perf_counter() - wall_start
+
+            result.update(ecg.get_results())
+    except SystemExit as e:
+        result["error"] = f"Replay exited with status {e.code}"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+def summarize(results):
+    """
+    Aggregate the results of all successful runs per search mode
+    """
+    summary = {}
+    for search_mode in sorted(set(r["search_mode"] for r in results)):
+        mode_results = [
+            r for r in results
+            if r["search_mode"] == search_mode and r.get("regret") is not None
+        ]
+        if not mode_results:
+            continue
+
+        summary[search_mode] = {
+            "runs":
+                len(mode_results),
+            "mean_regret":
+                mean([r["regret"] for r in mode_results]),
+            "max_regret":
+                max([r["regret"] for r in mode_results]),
+            "mean_measurements":
+                mean([r["generator_num_measurements"] for r in mode_results]),
+            "mean_measurements_to_best":
+                mean([
+                    r["generator_measurements_to_best"] for r in mode_results
+                ]),
+            "total_generator_cpu_time":
+                sum([r["generator_cpu_time"] for r in mode_results])
+        }
+    return summary
+
+
+def find_regressions(results, baseline, regret_tolerance,
+                     measurement_tolerance):
+    """
+    Compare results against a baseline, matching runs on their swept
+    parameters. Returns a list of human readable regressions
+    """
+
+    def run_key(run):
+        return tuple(run.get(key) for key in RUN_KEY_FIELDS)
+
+    baseline_runs = {run_key(run): run for run in baseline["runs"]}
+
+    regressions = []
+    for result in results:
+        base = baseline_runs.get(run_key(result))
+        if base is None or base.get("regret") is None:
+            continue
+
+        name = ", ".join(f"{key}={result[key]}" for key in RUN_KEY_FIELDS)
+        if result.get("regret") is None:
+            regressions.append(
+                f"{name}: failed ({result.get('error', 'no measurements')})")
+            continue
+
+        if result["regret"] > base["regret"] + regret_tolerance:
+            regressions.append(
+                f"{name}: regret {result['regret']} > baseline {base['regret']}"
+            )
+        if result["generator_num_measurements"] > base[
+                "generator_num_measurements"] + measurement_tolerance:
+            regressions.append(
+                f"{name}: measurements {result['generator_num_measurements']} > "
+                f"baseline {base['generator_num_measurements']}")
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data-path",
+                        type=str,
+                        default="./data",
+                        help="The checkpoint file or directory of checkpoints")
+    parser.add_argument("--model-names",
+                        type=str,
+                        nargs='+',
+                        default=None,
+                        help="Only benchmark these models (default: all)")
+    parser.add_argument("--search-modes",
+                        type=str,
+                        nargs='+',
+                        default=["quick"],
+                        choices=["quick", "brute"],
+                        help="The search modes to benchmark")
+    parser.add_argument("--radius",
+                        type=int,
+                        nargs='+',
+                        default=[3],
+                        help="The neighborhood radii to sweep")
+    parser.add_argument("--min-initialized",
+                        type=int,
+                        nargs='+',
+                        default=[3],
+                        help="The min initialized values to sweep")
+    for name in [
+            "min-model-batch-size", "max-model-batch-size",
+            "min-instance-count", "max-instance-count"
+    ]:
+        parser.add_argument(f"--{name}",
+                            type=int,
+                            nargs='+',
+                            default=[None],
+                            help=f"The run-config-search-{name} values to sweep")
+    parser.add_argument(
+        "--load-all-measurements",
+        action='store_true',
+        help="Load every checkpoint measurement, not only those visible to "
+        "the quick search. Use this when benchmarking brute search")
+    parser.add_argument("-j",
+                        "--jobs",
+                        type=int,
+                        default=os.cpu_count(),
+                        help="Number of replays to run in parallel")
+    parser.add_argument("-o",
+                        "--output",
+                        type=str,
+                        default=None,
+                        help="Write the JSON results to this file")
+    parser.add_argument("--baseline",
+                        type=str,
+                        default=None,
+                        help="JSON results of a previous run to gate against")
+    parser.add_argument(
+        "--regret-tolerance",
+        type=float,
+        default=0.0,
+        help="Allowed increase in regret over the baseline per run")
+    parser.add_argument(
+        "--measurement-tolerance",
+        type=int,
+        default=0,
+        help="Allowed increase in measurements over the baseline per run")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    runs = create_runs(args)
+    if not runs:
+        print(f"No checkpoints found in {args.data_path}")
+        return 1
+
+    print(f"Replaying {len(runs)} runs on {args.jobs} processes")
+
+    # Each replay gets a fresh process, as the patches it applies are never undone
+    with multiprocessing.Pool(processes=args.jobs, maxtasksperchild=1) as pool:
+        results = pool.map(execute_run, runs, chunksize=1)
+
+    for result in results:
+        if "error" in result:
+            print(
+                f"  {result['model']} ({result['search_mode']}): {result['error']}"
+            )
+
+    output = {"runs": results, "summary": summarize(results)}
+    for search_mode, summary in output["summary"].items():
+        print(
+            f"{search_mode}: runs = {summary['runs']}, mean regret = {summary['mean_regret']:.3f}, "
+            f"mean measurements = {summary['mean_measurements']:.1f}, "
+            f"mean measurements to best = {summary['mean_measurements_to_best']:.1f}, "
+            f"generator cpu time = {summary['total_generator_cpu_time']:.2f}s")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=2)
+    else:
+        json.dump(output, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline,
+                                       args.regret_tolerance,
+                                       args.measurement_tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#####################
+#
+# Measures the startup time of the model-analyzer CLI for each subcommand,
+# by timing fresh interpreters that parse `<subcommand> --help`, and then
+# lists the slowest imports of the slowest of them.
+#
+# Example usage:
+#
+# python3 benchmark_startup.py --repeats 5
+#####################
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+SUBCOMMANDS = ['', 'profile', 'report']
+
+RUN_CLI = ("import sys; from model_analyzer.entrypoint import main; "
+           "sys.argv = ['model-analyzer'] + sys.argv[1:]; main()")
+
+
+def time_subcommand(subcommand, repeats):
+    args = [sys.executable, '-c', RUN_CLI] + subcommand.split() + ['--help']
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(args, stdout=subprocess.DEVNULL, check=False)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def slowest_imports(subcommand, count):
+    args = [sys.executable, '-X', 'importtime', '-c', RUN_CLI
+           ] + subcommand.split() + ['--help']
+    output = subprocess.run(args,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE,
+                            text=True,
+                            check=False).stderr
+
+    # Lines look like 'import time: self [us] | cumulative | package'
+    imports = []
+    for line in output.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            imports.append((int(fields[1]), fields[2].rstrip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats",
+                        type=int,
+                        default=5,
+                        help="The number of times each subcommand is run")
+    parser.add_argument("--top-imports",
+                        type=int,
+                        default=10,
+                        help="The number of slowest imports to list")
+    args = parser.parse_args()
+
+    print("subcommand  median (s)  min (s)")
+    for subcommand in SUBCOMMANDS:
+        times = time_subcommand(subcommand, args.repeats)
+        print(f"{subcommand or '(none)':10s}  {statistics.median(times):10.3f}"
+              f"  {min(times):7.3f}")
+
+    print("\nslowest cumulative imports (us):")
+    for cumulative, package in slowest_imports('profile', args.top_imports):
+        print(f"{cumulative:10d} {package}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@
 
 from experiments.experiment_data import ExperimentData
 from model_analyzer.state.analyzer_state_manager import AnalyzerStateManager
+from model_analyzer.result.constraint_manager import ConstraintManager
 from unittest.mock import MagicMock
 from copy import deepcopy
 import re
@@ -33,10 +34,8 @@ def __init__(self, config):
 
     def get_default_config_dict(self):
         ret = self._default_run_config.model_run_configs()[0].model_config(
-        ).to_dict()
-        ret = deepcopy(ret)
-        del ret["cpu_only"]
-        return ret
+        ).get_config()
+        return deepcopy(ret)
 
     def _load_checkpoint(self, config):
         state_manager = AnalyzerStateManager(config, MagicMock())
@@ -46,6 +45,7 @@ def _load_checkpoint(self, config):
 
         model_name = ",".join([x.model_name() for x in config.profile_models])
         model_measurements = results.get_model_measurements_dict(model_name)
+        constraint_manager = ConstraintManager(config)
         for (run_config,
              run_config_measurements) in model_measurements.values():
 
@@ -63,10 +63,12 @@ def _load_checkpoint(self, config):
             for (perf_analyzer_string,
                  run_config_measurement) in run_config_measurements.items():
 
-                run_config_measurement.set_model_config_constraints(
-                    model_config_constraints=[config.constraints])
+                run_config_measurement.set_constraint_manager(
+                    constraint_manager=constraint_manager)
                 run_config_measurement.set_metric_weightings(
                     metric_objectives=[config.objectives])
+                run_config_measurement.set_model_config_weighting(
+                    model_config_weights=[1])
                 pa_key = self._make_pa_key_from_cli_string(perf_analyzer_string)
 
                 if CheckpointExperimentData.LOAD_ONLY_VISABLE:
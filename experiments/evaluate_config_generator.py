@@ -20,6 +20,7 @@
 from experiment_file_writer import ExperimentFileWriter
 from unittest.mock import MagicMock, patch
 from model_analyzer.state.analyzer_state import AnalyzerState
+from model_analyzer.result.constraint_manager import ConstraintManager
 from model_analyzer.config.generate.model_variant_name_manager import ModelVariantNameManager
 
 
@@ -39,12 +40,13 @@ def __init__(self, model_name, data_path, output_path, other_args):
             data_path, model_name, other_args)
 
         self._checkpoint_data = CheckpointExperimentData(self._config_command)
+        self._constraint_manager = ConstraintManager(self._config_command)
         self._profile_data = ExperimentData()
 
         self._default_config_dict = self._checkpoint_data.get_default_config_dict(
         )
         p = patch(
-            'model_analyzer.config.generate.base_model_config_generator.BaseModelConfigGenerator.get_base_model_config_dict',
+            'model_analyzer.triton.model.model_config.ModelConfig.create_model_config_dict',
             MagicMock(return_value=self._default_config_dict))
         p.start()
 
@@ -61,6 +63,12 @@ def print_results(self):
                                                self._config_command)
         result_evaluator.print_results()
 
+    def get_results(self):
+        result_evaluator = ExperimentEvaluator(self._checkpoint_data,
+                                               self._profile_data,
+                                               self._config_command)
+        return result_evaluator.get_results()
+
     def store_results(self):
         configs = self._config_command.get_all_config()
         file_writer = ExperimentFileWriter(
@@ -76,8 +84,10 @@ def _run_generator(self, cg):
             if run_config_measurement:
                 run_config_measurement.set_metric_weightings(
                     metric_objectives=[self._config_command.objectives])
-                run_config_measurement.set_model_config_constraints(
-                    model_config_constraints=[self._config_command.constraints])
+                run_config_measurement.set_constraint_manager(
+                    constraint_manager=self._constraint_manager)
+                run_config_measurement.set_model_config_weighting(
+                    model_config_weights=[1])
 
             self._profile_data.add_run_config_measurement(
                 run_config, run_config_measurement)
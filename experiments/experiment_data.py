@@ -27,10 +27,15 @@ def __init__(self):
         self._best_run_config_measurement = None
         self._missing_measurement_count = 0
 
+        self._attempted_measurement_count = 0
+        self._measurements_to_best = 0
+
     def add_run_config_measurement(self, run_config, run_config_measurement):
         """
         Add a run_config_measurement for the given run_config
         """
+        self._attempted_measurement_count += 1
+
         if not run_config_measurement:
             return
 
@@ -63,6 +68,20 @@ def get_run_config_measurement_count(self):
     def get_missing_measurement_count(self):
         return self._missing_measurement_count
 
+    def get_attempted_measurement_count(self):
+        """
+        Get the number of measurements that were requested, including
+        any that were not found in the data
+        """
+        return self._attempted_measurement_count
+
+    def get_measurements_to_best(self):
+        """
+        Get the number of requested measurements up to and including
+        the one that produced the best measurement
+        """
+        return self._measurements_to_best
+
     def get_best_run_config_measurement(self):
         """
         Get the best overall measurement in the data
@@ -92,6 +111,7 @@ def _update_best_trackers(self, run_config, run_config_measurement):
 
             self._best_run_config_measurement = run_config_measurement
             self._best_run_config = run_config
+            self._measurements_to_best = self._attempted_measurement_count
 
     def _get_run_config_measurement_from_keys(self,
                                               ma_key,
@@ -73,25 +73,84 @@ def print_results(self):
                 'perf_throughput')
             best_latency = generator_best_measurement.get_non_gpu_metric_value(
                 'perf_latency_p99')
-            overall_best_throughput = overall_best_measurement.get_non_gpu_metric_value(
-                'perf_throughput')
-            overall_best_latency = overall_best_measurement.get_non_gpu_metric_value(
-                'perf_latency_p99')
-
-            if self._maximize_throughput:
-                percentile = round(best_throughput / overall_best_throughput, 2)
-            else:
-                percentile = round(overall_best_latency / best_latency, 2)
         else:
             best_throughput = None
             best_latency = None
-            percentile = None
+        percentile = self._calculate_percentile()
 
         print(f"Generator best throughput: {best_throughput}")
         print(f"Generator best latency: {best_latency}")
         print(f"Percentile: {percentile}")
         print()
 
+    def get_results(self):
+        """
+        Return the comparison of the generator against the raw data
+        as a dict of plain values
+        """
+        overall_best_measurement = self._raw_data.get_best_run_config_measurement(
+        )
+        generator_best_measurement = self._profile_data.get_best_run_config_measurement(
+        )
+
+        results = {
+            "overall_num_measurements":
+                self._raw_data.get_run_config_measurement_count(),
+            "overall_best_throughput":
+                overall_best_measurement.get_non_gpu_metric_value(
+                    'perf_throughput'),
+            "overall_best_latency":
+                overall_best_measurement.get_non_gpu_metric_value(
+                    'perf_latency_p99'),
+            "generator_num_measurements":
+                self._profile_data.get_attempted_measurement_count(),
+            "generator_missing_num_measurements":
+                self._raw_data.get_missing_measurement_count(),
+            "generator_measurements_to_best":
+                self._profile_data.get_measurements_to_best(),
+            "generator_best_throughput":
+                None,
+            "generator_best_latency":
+                None,
+            "percentile":
+                self._calculate_percentile(),
+            "regret":
+                None
+        }
+
+        if generator_best_measurement:
+            results[
+                "generator_best_throughput"] = generator_best_measurement.get_non_gpu_metric_value(
+                    'perf_throughput')
+            results[
+                "generator_best_latency"] = generator_best_measurement.get_non_gpu_metric_value(
+                    'perf_latency_p99')
+            results["regret"] = round(1 - results["percentile"], 2)
+
+        return results
+
+    def _calculate_percentile(self):
+        overall_best_measurement = self._raw_data.get_best_run_config_measurement(
+        )
+        generator_best_measurement = self._profile_data.get_best_run_config_measurement(
+        )
+
+        if not generator_best_measurement:
+            return None
+
+        if self._maximize_throughput:
+            best_throughput = generator_best_measurement.get_non_gpu_metric_value(
+                'perf_throughput')
+            overall_best_throughput = overall_best_measurement.get_non_gpu_metric_value(
+                'perf_throughput')
+            return round(best_throughput / overall_best_throughput, 2)
+        else:
+            best_latency = generator_best_measurement.get_non_gpu_metric_value(
+                'perf_latency_p99')
+            overall_best_latency = overall_best_measurement.get_non_gpu_metric_value(
+                'perf_latency_p99')
+            return round(overall_best_latency / best_latency, 2)
+
     def _run_config_to_string(self, run_config):
         if run_config:
             str = "\n".join([
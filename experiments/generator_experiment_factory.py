@@ -50,8 +50,16 @@ def create_generator(config_command):
         p2 = patch(
             'model_analyzer.config.generate.run_config_generator_factory.RunConfigGeneratorFactory._get_batching_not_supported_dimensions',
             GeneratorExperimentFactory.get_batching_not_supported_dimensions)
+        p3 = patch(
+            'model_analyzer.config.generate.run_config_generator_factory.RADIUS',
+            config_command.radius)
+        p4 = patch(
+            'model_analyzer.config.generate.run_config_generator_factory.MIN_INITIALIZED',
+            config_command.min_initialized)
         p1.start()
         p2.start()
+        p3.start()
+        p4.start()
         mvn = ModelVariantNameManager()
         generator = RunConfigGeneratorFactory.create_run_config_generator(
             config_command, MagicMock(), config_command.profile_models,
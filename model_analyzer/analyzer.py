@@ -15,11 +15,11 @@
 from typing import List, Union, Optional
 import sys
 from model_analyzer.constants import LOGGER_NAME
-from .model_manager import ModelManager
 from .result.result_manager import ResultManager
 from .result.result_table_manager import ResultTableManager
+from .result.measurement_exporter import MeasurementExporter
 from .result.constraint_manager import ConstraintManager
-from .record.metrics_manager import MetricsManager
+from .perf_analyzer.request_trace import RequestTrace
 from .reports.report_manager import ReportManager
 from .config.input.config_command_report \
     import ConfigCommandReport
@@ -33,6 +33,7 @@
 from model_analyzer.triton.server.server import TritonServer
 
 from model_analyzer.config.generate.base_model_config_generator import BaseModelConfigGenerator
+from model_analyzer.triton.model.model_config import ModelConfig
 
 from .triton.client.client import TritonClient
 from .device.gpu_device import GPUDevice
@@ -105,10 +106,23 @@ def profile(self, client: TritonClient, gpus: List[GPUDevice], mode: str,
                 f"Expected config of type {ConfigCommandProfile},"
                 " got {type(self._config)}.")
 
+        # Fail before profiling if an export format cannot be written
+        measurement_exporter = MeasurementExporter(self._config,
+                                                   self._result_manager,
+                                                   self._constraint_manager)
+
         self._create_metrics_manager(client, gpus)
         self._create_model_manager(client, gpus)
 
         if self._config.model_repository:
+            if self._config.request_trace:
+                self._convert_request_trace(client, gpus)
+
+            if self._config.dry_run:
+                # Nothing is launched, measured or saved
+                self._profile_models()
+                return
+
             self._get_server_only_metrics(client, gpus)
             self._profile_models()
 
@@ -123,6 +137,8 @@ def profile(self, client: TritonClient, gpus: List[GPUDevice], mode: str,
                 "No model repository specified and no checkpoint found. Please either specify a model repository (-m) or load a checkpoint (--checkpoint-directory)."
             )
 
+        measurement_exporter.export()
+
         if not self._config.skip_summary_reports:
             self._create_summary_tables(verbose)
             self._create_summary_reports(mode)
@@ -171,6 +187,9 @@ def report(self, mode: str) -> None:
         self._report_manager.export_detailed_reports()
 
     def _create_metrics_manager(self, client, gpus):
+        # Profiling only, and slow to import (monitors, perf_analyzer)
+        from .record.metrics_manager import MetricsManager
+
         self._metrics_manager = MetricsManager(
             config=self._config,
             client=client,
@@ -180,6 +199,8 @@ def _create_metrics_manager(self, client, gpus):
             state_manager=self._state_manager)
 
     def _create_model_manager(self, client, gpus):
+        from .model_manager import ModelManager
+
         self._model_manager = ModelManager(
             config=self._config,
             gpus=gpus,
@@ -205,29 +226,47 @@ def _get_server_only_metrics(self, client, gpus):
 
             logger.info('Profiling server only metrics...')
             self._server.start()
-            client.wait_for_server_ready(self._config.client_max_retries)
+            client.wait_for_server_ready(self._config.client_max_retries,
+                                         server=self._server)
             self._metrics_manager.profile_server()
             self._server.stop()
 
+    def _convert_request_trace(self, client, gpus):
+        # The input data of the trace is filled in by data type
+        input_data_types = {}
+        for model in self._config.profile_models:
+            model_config = ModelConfig.create_from_profile_spec(
+                model, self._config, client, gpus).get_config()
+            input_data_types[model.model_name()] = {
+                model_input['name']: model_input.get('data_type')
+                for model_input in model_config.get('input', [])
+            }
+
+        RequestTrace(self._config.request_trace,
+                     RequestTrace.get_output_path(
+                         self._config.export_path)).convert(
+                             list(input_data_types), input_data_types)
+
     def _profile_models(self):
 
         models = self._config.profile_models
 
         if self._should_profile_multiple_models_concurrently():
             # Profile all models concurrently
-            try:
-                self._model_manager.run_models(models=models)
-            finally:
-                self._state_manager.save_checkpoint()
+            self._run_models(models)
         else:
             # Profile each model, save state after each
             for model in models:
                 if self._state_manager.exiting():
                     break
-                try:
-                    self._model_manager.run_models(models=[model])
-                finally:
-                    self._state_manager.save_checkpoint()
+                self._run_models([model])
+
+    def _run_models(self, models):
+        try:
+            self._model_manager.run_models(models=models)
+        finally:
+            if not self._config.dry_run:
+                self._state_manager.save_checkpoint()
 
     def _create_summary_tables(self, verbose: bool) -> None:
         self._result_table_manager = ResultTableManager(self._config,
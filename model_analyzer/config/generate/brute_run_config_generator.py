@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Generator, Optional, Dict
+from typing import List, Generator, Optional, Dict, Type
 
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 
@@ -21,6 +21,7 @@
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 from model_analyzer.config.generate.model_profile_spec import ModelProfileSpec
 from model_analyzer.config.generate.model_run_config_generator import ModelRunConfigGenerator
+from model_analyzer.config.generate.successive_halving_model_run_config_generator import SuccessiveHalvingModelRunConfigGenerator
 from model_analyzer.config.generate.model_variant_name_manager import ModelVariantNameManager
 from model_analyzer.triton.client.client import TritonClient
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
@@ -71,7 +72,7 @@ def __init__(self,
             None for n in range(self._num_models)
         ]
         self._curr_results: List = [[] for n in range(self._num_models)]
-        self._curr_generators: Dict[int, ConfigGeneratorInterface] = {}
+        self._curr_generators: Dict[int, ModelRunConfigGenerator] = {}
 
         self._skip_default_config = skip_default_config
 
@@ -103,10 +104,15 @@ def _should_generate_non_default_configs(self) -> bool:
     def _generate_subset(
             self, index: int,
             default_only: bool) -> Generator[RunConfig, None, None]:
-        mrcg = ModelRunConfigGenerator(self._config, self._gpus,
-                                       self._models[index], self._client,
-                                       self._model_variant_name_manager,
-                                       default_only)
+        mrcg_class: Type[ModelRunConfigGenerator]
+        if self._config.successive_halving_enable and not default_only:
+            mrcg_class = SuccessiveHalvingModelRunConfigGenerator
+        else:
+            mrcg_class = ModelRunConfigGenerator
+
+        mrcg = mrcg_class(self._config, self._gpus, self._models[index],
+                          self._client, self._model_variant_name_manager,
+                          default_only)
 
         self._curr_generators[index] = mrcg
 
@@ -124,6 +130,8 @@ def _make_run_config(self) -> RunConfig:
         run_config = RunConfig(self._triton_env)
         for index in range(len(self._models)):
             run_config.add_model_run_config(self._curr_model_run_configs[index])
+            if self._curr_generators[index].is_screening():
+                run_config.set_screening(True)
         return run_config
 
     def _send_results_to_generator(self, index: int) -> None:
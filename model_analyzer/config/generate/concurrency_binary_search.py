@@ -0,0 +1,141 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, List, Optional, Tuple
+
+from model_analyzer.constants import LOGGER_NAME, THROUGHPUT_MINIMUM_GAIN
+from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class ConcurrencyBinarySearch:
+    """
+    Searches a sorted list of concurrencies for the highest concurrency
+    whose p99 latency is within the latency budget, which (as throughput
+    increases with concurrency) is the one with the highest throughput
+    meeting the budget
+
+    The budget is bracketed by the highest concurrency known to meet it
+    and the lowest concurrency known to miss it, and the bracket is halved
+    on every measurement. If the measurements show that latency or
+    throughput is not monotonic in concurrency, the search falls back to
+    sweeping all of the concurrencies not yet measured
+    """
+
+    def __init__(self, concurrencies: List[int], latency_budget: float):
+        """
+        Parameters
+        ----------
+        concurrencies: list of ints
+            The sorted concurrencies that can be measured
+        latency_budget: float
+            Maximum p99 latency (in ms)
+        """
+        self._concurrencies = concurrencies
+        self._latency_budget = latency_budget
+
+        # Indices of the bracket: _low meets the budget, _high misses it
+        self._low = -1
+        self._high = len(concurrencies)
+
+        # Index -> (throughput, meets budget)
+        self._measured: Dict[int, Tuple[float, bool]] = {}
+        self._fallen_back = False
+
+    @staticmethod
+    def get_latency_budget(constraints_list: List) -> Optional[float]:
+        """
+        Returns the tightest p99 latency budget of the given
+        (per model) constraints, or None if there is none
+        """
+        budgets = [
+            constraints['perf_latency_p99']['max']
+            for constraints in constraints_list
+            if constraints and constraints.has_metric('perf_latency_p99') and
+            'max' in constraints['perf_latency_p99']
+        ]
+
+        return min(budgets) if budgets else None
+
+    def next_index(self) -> Optional[int]:
+        """
+        Returns the index of the next concurrency to measure,
+        or None if the search is done
+        """
+        if self._fallen_back:
+            unmeasured = [
+                index for index in range(len(self._concurrencies))
+                if index not in self._measured
+            ]
+            return unmeasured[0] if unmeasured else None
+
+        if self._high - self._low <= 1:
+            return None
+
+        return (self._low + self._high) // 2
+
+    def add_measurement(self, index: int,
+                        measurement: Optional[RunConfigMeasurement]) -> None:
+        """
+        Updates the bracket with the measurement of the
+        concurrency at index. A missing measurement misses the budget
+        """
+        if measurement:
+            throughput = measurement.get_non_gpu_metric_value('perf_throughput')
+            latency = max([
+                record.value() for record in measurement.get_non_gpu_metric(
+                    'perf_latency_p99')
+            ],
+                          default=0)
+            meets_budget = latency <= self._latency_budget
+        else:
+            throughput = 0.0
+            meets_budget = False
+
+        self._measured[index] = (throughput, meets_budget)
+
+        if meets_budget:
+            self._low = max(self._low, index)
+        else:
+            self._high = min(self._high, index)
+
+        if not self._fallen_back and not self._is_monotonic():
+            logger.info(
+                "Latency or throughput is not monotonic in concurrency. "
+                "Falling back to a full concurrency sweep")
+            self._fallen_back = True
+
+    def _is_monotonic(self) -> bool:
+        measured = sorted(self._measured.items())
+
+        missed_budget = False
+        best_throughput = 0.0
+        for _, (throughput, meets_budget) in measured:
+            if not meets_budget:
+                missed_budget = True
+                continue
+
+            # Latency: a concurrency above one that missed the budget meets it
+            if missed_budget:
+                return False
+
+            # Throughput: a higher concurrency meeting the budget is slower
+            if throughput < best_throughput * (1 - THROUGHPUT_MINIMUM_GAIN):
+                return False
+            best_throughput = max(best_throughput, throughput)
+
+        return True
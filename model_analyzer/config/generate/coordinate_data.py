@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, List
+
+import numpy as np
+
 from model_analyzer.config.generate.coordinate import Coordinate
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 
@@ -23,37 +26,44 @@ class CoordinateData:
     """
     A class that tracks the measurement data in the current neighborhood
     and the visit counts of all the coordinates in the coordinate space.
+
+    Every coordinate ever seen is stored once, as a row of an array, and
+    indexed by a hash of its values, so that the coordinates can be
+    retrieved together as a single array
     """
 
     def __init__(self) -> None:
-        self._measurements: Dict[CoordinateKey,
-                                 Optional[RunConfigMeasurement]] = {}
-        self._visit_counts: Dict[CoordinateKey, int] = {}
-        self._is_measured: Dict[CoordinateKey, bool] = {}
+        self._index: Dict[CoordinateKey, int] = {}
+        self._coordinates: List[CoordinateKey] = []
+        self._coordinate_array: Optional[np.ndarray] = None
+
+        self._measurements: List[Optional[RunConfigMeasurement]] = []
+        self._visit_counts: List[int] = []
+        self._is_measured: List[bool] = []
 
     def get_measurement(
             self, coordinate: Coordinate) -> Optional[RunConfigMeasurement]:
         """
         Return the measurement data of the given coordinate.
         """
-        key: CoordinateKey = tuple(coordinate)
-        return self._measurements.get(key, None)
+        index = self._index.get(tuple(coordinate))
+        return None if index is None else self._measurements[index]
 
     def set_measurement(self, coordinate: Coordinate,
                         measurement: Optional[RunConfigMeasurement]) -> None:
         """
         Set the measurement for the given coordinate.
         """
-        key: CoordinateKey = tuple(coordinate)
-        self._measurements[key] = measurement
-        self._is_measured[key] = True
+        index = self._get_or_add_index(coordinate)
+        self._measurements[index] = measurement
+        self._is_measured[index] = True
 
     def is_measured(self, coordinate: Coordinate) -> bool:
         """
         Returns true if a measurement has been set for the given Coordinate
         """
-        key: CoordinateKey = tuple(coordinate)
-        return self._is_measured.get(key, False)
+        index = self._index.get(tuple(coordinate))
+        return False if index is None else self._is_measured[index]
 
     def has_valid_measurement(self, coordinate: Coordinate) -> bool:
         """
@@ -61,24 +71,62 @@ def has_valid_measurement(self, coordinate: Coordinate) -> bool:
         """
         return self.get_measurement(coordinate) is not None
 
+    def get_measured_coordinates(self) -> np.ndarray:
+        """
+        Returns an array with a row for every coordinate that
+        has had a measurement set
+        """
+        return self._get_coordinate_array()[np.array(self._is_measured,
+                                                     dtype=bool)]
+
+    def get_coordinates_with_valid_measurements(self) -> np.ndarray:
+        """
+        Returns an array with a row for every coordinate
+        that has a valid measurement
+        """
+        return self._get_coordinate_array()[np.array(
+            [measurement is not None for measurement in self._measurements],
+            dtype=bool)]
+
     def reset_measurements(self) -> None:
         """
         Resets the collection of measurements.
         """
-        self._measurements = {}
+        self._measurements = [None] * len(self._measurements)
 
     def get_visit_count(self, coordinate: Coordinate) -> int:
         """
         Get the visit count for the given coordinate. 
         Returns 0 if the coordinate hasn't been visited yet
         """
-        key: CoordinateKey = tuple(coordinate)
-        return self._visit_counts.get(key, 0)
+        index = self._index.get(tuple(coordinate))
+        return 0 if index is None else self._visit_counts[index]
 
     def increment_visit_count(self, coordinate: Coordinate) -> None:
         """
         Increase the visit count for the given coordinate by 1
         """
+        index = self._get_or_add_index(coordinate)
+        self._visit_counts[index] += 1
+
+    def _get_or_add_index(self, coordinate: Coordinate) -> int:
         key: CoordinateKey = tuple(coordinate)
-        new_count = self.get_visit_count(coordinate) + 1
-        self._visit_counts[key] = new_count
+        index = self._index.get(key)
+        if index is None:
+            index = len(self._coordinates)
+            self._index[key] = index
+            self._coordinates.append(key)
+            self._measurements.append(None)
+            self._visit_counts.append(0)
+            self._is_measured.append(False)
+            self._coordinate_array = None
+        return index
+
+    def _get_coordinate_array(self) -> np.ndarray:
+        if self._coordinate_array is None:
+            if self._coordinates:
+                self._coordinate_array = np.array(self._coordinates,
+                                                  dtype=np.int64)
+            else:
+                self._coordinate_array = np.zeros((0, 0), dtype=np.int64)
+        return self._coordinate_array
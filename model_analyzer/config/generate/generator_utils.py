@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from itertools import product
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 
 
 class GeneratorUtils:
@@ -77,7 +77,9 @@ def generate_combinations(value: object) -> List:
         return [value]
 
     @staticmethod
-    def generate_parameter_combinations(params: Dict) -> List[Dict]:
+    def generate_parameter_combinations(
+            params: Dict,
+            is_legal: Optional[Callable[[Dict], bool]] = None) -> List[Dict]:
         """
         Generate a list of all possible subdictionaries
         from given dictionary. The subdictionaries will
@@ -88,10 +90,17 @@ def generate_parameter_combinations(params: Dict) -> List[Dict]:
         ----------
         params : dict
             keys are strings and the values must be lists
+        is_legal : callable
+            If given, only the subdictionaries for which
+            it returns true are generated
         """
 
-        param_combinations = list(product(*tuple(params.values())))
-        return [dict(zip(params.keys(), vals)) for vals in param_combinations]
+        param_combinations = (dict(zip(params.keys(), vals))
+                              for vals in product(*tuple(params.values())))
+        return [
+            param_combination for param_combination in param_combinations
+            if is_legal is None or is_legal(param_combination)
+        ]
 
     @staticmethod
     def generate_doubled_list(min_value: int, max_value: int) -> List[int]:
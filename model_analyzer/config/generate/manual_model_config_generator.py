@@ -22,6 +22,7 @@
 from .generator_utils import GeneratorUtils
 from model_analyzer.constants import LOGGER_NAME, DEFAULT_CONFIG_PARAMS
 from model_analyzer.triton.model.model_config import ModelConfig
+from model_analyzer.config.run.model_run_config import ModelRunConfig
 
 import logging
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
@@ -63,18 +64,26 @@ def __init__(self, config: ConfigCommandProfile, gpus: List[GPUDevice],
         self._non_max_batch_size_param_combos: List[Dict] = []
         self._determine_max_batch_sizes_and_param_combos()
 
+        self._default_model_config_dict = {} if self._remote_mode else model.get_default_config(
+        )
+
         # All configs are pregenerated in _configs[][]
         # Indexed as follows:
         #    _configs[_curr_config_index][_curr_max_batch_size_index]
         #
         self._configs = self._generate_model_configs()
 
+    def _is_done(self) -> bool:
+        # Every combination may have been pruned as illegal
+        return not self._configs or super()._is_done()
+
     def _done_walking(self) -> bool:
         return len(self._configs) == self._curr_config_index
 
     def _done_walking_max_batch_size(self) -> bool:
-        if (self._max_batch_sizes is None or
-                len(self._max_batch_sizes) == self._curr_max_batch_size_index):
+        # Illegal max batch sizes were pruned, so rows can be shorter
+        if len(self._configs[
+                self._curr_config_index]) == self._curr_max_batch_size_index:
             return True
 
         if self._early_exit_enable and self._last_results_erroneous():
@@ -132,17 +141,46 @@ def _generate_direct_modes_model_configs(self) -> List[List[ModelConfig]]:
             if self._max_batch_sizes:
                 for mbs in self._max_batch_sizes:
                     param_combo['max_batch_size'] = mbs
-                    model_config = self._make_direct_mode_model_config(
-                        param_combo)
-                    configs_with_max_batch_size.append(model_config)
-            else:
+                    if self._is_legal_param_combo(param_combo):
+                        model_config = self._make_direct_mode_model_config(
+                            param_combo)
+                        configs_with_max_batch_size.append(model_config)
+            elif self._is_legal_param_combo(param_combo):
                 model_config = self._make_direct_mode_model_config(param_combo)
                 configs_with_max_batch_size.append(model_config)
 
-            model_configs.append(configs_with_max_batch_size)
+            if configs_with_max_batch_size:
+                model_configs.append(configs_with_max_batch_size)
 
         return model_configs
 
+    def _is_legal_param_combo(self, param_combo: Dict) -> bool:
+        """
+        Returns false if the model config made from the param combo
+        would be illegal (see ModelRunConfig.is_legal_combination).
+        Only the fields that are checked are applied to the default config
+        """
+        if not param_combo:
+            return True
+
+        model_config_dict = {
+            key: deepcopy(self._default_model_config_dict[key])
+            for key in ['max_batch_size', 'dynamic_batching']
+            if key in self._default_model_config_dict
+        }
+        for key in ['max_batch_size', 'dynamic_batching']:
+            if param_combo.get(key) is not None:
+                BaseModelConfigGenerator._apply_value_to_dict(
+                    key, param_combo[key], model_config_dict)
+
+        legal = ModelRunConfig.is_legal_preferred_batch_size(model_config_dict)
+        if not legal:
+            logger.debug(
+                f"Pruning model config {param_combo} as its maximum preferred batch size is greater than its max batch size"
+            )
+
+        return legal
+
     def _determine_max_batch_sizes_and_param_combos(self) -> None:
         """
         Determine self._max_batch_sizes and self._non_max_batch_size_param_combos
@@ -21,6 +21,7 @@
 from .config_generator_interface import ConfigGeneratorInterface
 from .model_config_generator_factory import ModelConfigGeneratorFactory
 from .perf_analyzer_config_generator import PerfAnalyzerConfigGenerator
+from .concurrency_binary_search import ConcurrencyBinarySearch
 from .model_profile_spec import ModelProfileSpec
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
@@ -64,6 +65,8 @@ def __init__(self, config: ConfigCommandProfile, gpus: List[GPUDevice],
         self._model_pa_flags = model.perf_analyzer_flags()
         self._model_parameters = model.parameters()
         self._triton_server_env = model.triton_server_environment()
+        self._latency_budget = ConcurrencyBinarySearch.get_latency_budget(
+            [model.constraints()])
 
         self._determine_early_exit_enables(config, model)
 
@@ -82,15 +85,7 @@ def get_configs(self) -> Generator[ModelRunConfig, None, None]:
             The next ModelRunConfig generated by this class
         """
         for model_config in self._mcg.get_configs():
-            self._pacg = PerfAnalyzerConfigGenerator(
-                self._config, model_config.get_field('name'),
-                self._model_pa_flags, self._model_parameters,
-                self._pacg_early_exit_enable)
-
-            for perf_analyzer_config in self._pacg.get_configs():
-                run_config = self._generate_model_run_config(
-                    model_config, perf_analyzer_config)
-                yield run_config
+            yield from self._generate_model_run_configs(model_config)
 
             self._set_last_results_model_config_generator()
 
@@ -107,10 +102,42 @@ def set_last_results(
         self._pacg.set_last_results(measurements)
         self._curr_mc_measurements.extend(measurements)
 
+    def is_screening(self) -> bool:
+        """
+        Returns true if the last ModelRunConfig is a screening run, whose
+        measurement is only for this generator and must not be reported
+        """
+        return False
+
     def _set_last_results_model_config_generator(self) -> None:
         self._mcg.set_last_results(self._curr_mc_measurements)
         self._curr_mc_measurements = []
 
+    def _generate_model_run_configs(
+            self, model_config: ModelConfig,
+            model_parameters: Optional[dict] = None,
+            early_exit_enable: Optional[bool] = None
+    ) -> Generator[ModelRunConfig, None, None]:
+        """
+        Generates the ModelRunConfigs of every PerfAnalyzerConfig
+        for the given ModelConfig
+        """
+        self._pacg = PerfAnalyzerConfigGenerator(
+            self._config, model_config.get_field('name'), self._model_pa_flags,
+            model_parameters or self._model_parameters,
+            self._pacg_early_exit_enable
+            if early_exit_enable is None else early_exit_enable,
+            self._latency_budget,
+            max_batch_size=ModelRunConfig.get_max_batch_size(
+                model_config.get_config()),
+            base_model_name=self._model_name,
+            model_config=model_config.get_config())
+
+        for perf_analyzer_config in self._pacg.get_configs():
+            run_config = self._generate_model_run_config(
+                model_config, perf_analyzer_config)
+            yield run_config
+
     def _generate_model_run_config(
             self, model_config: ModelConfig,
             perf_analyzer_config: PerfAnalyzerConfig) -> ModelRunConfig:
@@ -17,6 +17,9 @@
 from copy import deepcopy
 from model_analyzer.constants import DEFAULT_CONFIG_PARAMS
 
+import hashlib
+import json
+
 
 class ModelVariantNameManager:
 
@@ -28,6 +31,9 @@ def __init__(self) -> None:
         # Dict of {base_model_name: current_count_integer}
         self._model_name_index: Dict[str, int] = {}
 
+        # Dict of {model_config_fingerprint: model_config_name}
+        self._model_config_fingerprints: Dict[str, str] = {}
+
     @classmethod
     def from_dict(
             cls,
@@ -39,8 +45,21 @@ def from_dict(
         model_variant_name_manager._model_name_index = model_variant_name_manager_dict[
             '_model_name_index']
 
+        # The fingerprints are not checkpointed, they are rebuilt
+        for model_config_name, model_config_dict in model_variant_name_manager._model_config_dicts.items(
+        ):
+            model_variant_name_manager._model_config_fingerprints.setdefault(
+                model_variant_name_manager._fingerprint(model_config_dict),
+                model_config_name)
+
         return model_variant_name_manager
 
+    def to_dict(self) -> Dict:
+        return {
+            '_model_config_dicts': self._model_config_dicts,
+            '_model_name_index': self._model_name_index
+        }
+
     @staticmethod
     def make_ensemble_submodel_key(
             ensemble_config_dicts: List[Dict]) -> Dict[str, str]:
@@ -85,11 +104,12 @@ def _get_variant_name(self,
                           config_dict: Dict,
                           is_ensemble: bool,
                           param_combo: Dict = {}) -> Tuple[bool, str]:
-        model_config_dict = self._copy_and_restore_model_config_dict_name(
+        model_config_dict = self._restore_model_config_dict_name(
             model_name, config_dict)
+        fingerprint = self._fingerprint(model_config_dict)
 
         variant_found, model_variant_name = self._find_existing_variant(
-            model_config_dict)
+            fingerprint)
 
         if is_ensemble:
             if self._is_ensemble_default_config(config_dict):
@@ -102,23 +122,30 @@ def _get_variant_name(self,
             return (True, model_variant_name)
 
         model_variant_name = self._create_new_model_variant(
-            model_name, model_config_dict)
+            model_name, deepcopy(model_config_dict), fingerprint)
 
         return (False, model_variant_name)
 
-    def _copy_and_restore_model_config_dict_name(
-            self, model_name: str, model_config_dict: Dict) -> Dict:
-        model_config_dict_copy = deepcopy(model_config_dict)
-        model_config_dict_copy['name'] = model_name
+    def _restore_model_config_dict_name(self, model_name: str,
+                                        model_config_dict: Dict) -> Dict:
+        # Shallow copy: only copied in full if a new variant is created
+        return {**model_config_dict, 'name': model_name}
 
-        return model_config_dict_copy
+    def _fingerprint(self, model_config_dict: Dict) -> str:
+        """
+        Returns a hash of the model config dict that is
+        independent of the order of its keys
+        """
+        canonical_dict = json.dumps(model_config_dict,
+                                    sort_keys=True,
+                                    separators=(',', ':'),
+                                    default=str)
 
-    def _find_existing_variant(self,
-                               model_config_dict: Dict) -> Tuple[bool, str]:
-        for model_config_name, model_config_variant_dict in self._model_config_dicts.items(
-        ):
-            if model_config_dict == model_config_variant_dict:
-                return (True, model_config_name)
+        return hashlib.sha256(canonical_dict.encode('utf-8')).hexdigest()
+
+    def _find_existing_variant(self, fingerprint: str) -> Tuple[bool, str]:
+        if fingerprint in self._model_config_fingerprints:
+            return (True, self._model_config_fingerprints[fingerprint])
 
         return (False, "")
 
@@ -129,7 +156,8 @@ def _is_ensemble_default_config(self, ensemble_dict: Dict) -> bool:
         return '_config_default' in ensemble_dict['key']
 
     def _create_new_model_variant(self, model_name: str,
-                                  model_config_dict: Dict) -> str:
+                                  model_config_dict: Dict,
+                                  fingerprint: str) -> str:
         if model_name not in self._model_name_index:
             new_index = 0
         else:
@@ -138,5 +166,6 @@ def _create_new_model_variant(self, model_name: str,
         self._model_name_index[model_name] = new_index
         model_config_name = model_name + '_config_' + str(new_index)
         self._model_config_dicts[model_config_name] = model_config_dict
+        self._model_config_fingerprints[fingerprint] = model_config_name
 
         return model_config_name
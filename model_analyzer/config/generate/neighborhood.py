@@ -12,12 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import math
-from itertools import product
 from copy import deepcopy
 
 from typing import List, Tuple, Dict, Optional
 
+import numpy as np
+
 from model_analyzer.config.generate.coordinate import Coordinate
 from model_analyzer.config.generate.coordinate_data import CoordinateData
 from model_analyzer.config.generate.search_config import NeighborhoodConfig
@@ -41,6 +41,10 @@ class Neighborhood:
     #
     TRANSLATION_LIST = [0.09, 0.3, 1.0]
 
+    # Coordinates are small indices, so the neighborhood
+    # (which can have millions of points) is stored compactly
+    COORDINATE_DTYPE = np.int16
+
     def __init__(self, neighborhood_config: NeighborhoodConfig,
                  home_coordinate: Coordinate, coordinate_data: CoordinateData):
         """
@@ -57,6 +61,8 @@ def __init__(self, neighborhood_config: NeighborhoodConfig,
         self._home_coordinate = home_coordinate
         self._coordinate_data = coordinate_data
 
+        self._home = np.array([int(v) for v in home_coordinate],
+                              dtype=Neighborhood.COORDINATE_DTYPE)
         self._radius = self._config.get_radius()
         self._neighborhood = self._create_neighborhood()
 
@@ -69,12 +75,8 @@ def calc_distance(cls, coordinate1: Coordinate,
         Return the euclidean distance between two coordinates
         """
 
-        distance = 0.0
-        for i, _ in enumerate(coordinate1):
-            diff = coordinate1[i] - coordinate2[i]
-            distance += math.pow(diff, 2)
-        distance = math.sqrt(distance)
-        return distance
+        diff = np.subtract(list(coordinate1), list(coordinate2), dtype=float)
+        return float(np.sqrt(np.dot(diff, diff)))
 
     def enough_coordinates_initialized(self) -> bool:
         """
@@ -129,7 +131,10 @@ def _get_best_coordinate_found(self) -> Coordinate:
             vectors.append(Coordinate([0] * self._config.get_num_dimensions()))
             measurements.append(home_measurement)
 
-        _, best_vector = sorted(zip(measurements, vectors))[-1]
+        # Sort on the measurements only, as equal measurements
+        # cannot be tie-broken by their (unorderable) vectors
+        _, best_vector = sorted(zip(measurements, vectors),
+                                key=lambda pair: pair[0])[-1]
 
         best_coordinate = self._home_coordinate + best_vector
         return best_coordinate
@@ -182,88 +187,134 @@ def _pick_slow_mode_coordinate_to_initialize(self) -> Coordinate:
         raise Exception("Picking slow mode coordinate, but none are unvisited")
 
     def _pick_fast_mode_coordinate_to_initialize(self) -> Optional[Coordinate]:
+        """
+        Returns the first unmeasured coordinate of the neighborhood
+        with the most dimension values not yet covered by a measurement
+        """
         covered_values_per_dimension = self._get_covered_values_per_dimension()
 
-        max_num_uncovered = -1
-        best_coordinate = None
-        for coordinate in self._neighborhood:
-            if not self._is_coordinate_measured(coordinate):
-                num_uncovered = self._get_num_uncovered_values(
-                    coordinate, covered_values_per_dimension)
+        num_uncovered = np.zeros(len(self._neighborhood), dtype=np.int64)
+        for dim, covered_values in enumerate(covered_values_per_dimension):
+            num_uncovered += ~np.isin(
+                self._neighborhood[:, dim],
+                np.fromiter(covered_values, dtype=np.int64))
 
-                if num_uncovered > max_num_uncovered:
-                    max_num_uncovered = num_uncovered
-                    best_coordinate = coordinate
+        num_uncovered[self._get_measured_mask()] = -1
 
-        return best_coordinate
+        if len(num_uncovered) == 0 or num_uncovered.max() < 0:
+            return None
+
+        return self._to_coordinate(self._neighborhood[np.argmax(num_uncovered)])
 
     def get_nearest_neighbor(self, coordinate_in: Coordinate) -> Coordinate:
         """
         Find the nearest coordinate to the `coordinate_in` among the
         coordinates within the current neighborhood.
         """
-        min_distance = float('inf')
-        nearest_neighbor = self._home_coordinate
-
-        for coordinate in self._neighborhood:
-            distance = Neighborhood.calc_distance(coordinate, coordinate_in)
-            if distance < min_distance:
-                nearest_neighbor = coordinate
-                min_distance = distance
+        if len(self._neighborhood) == 0:
+            return self._home_coordinate
 
-        return nearest_neighbor
+        distances = np.zeros(len(self._neighborhood), dtype=np.int64)
+        for dim, value in enumerate(coordinate_in):
+            distances += (self._neighborhood[:, dim].astype(np.int64) -
+                          int(value))**2
 
-    def _create_neighborhood(self) -> List[Coordinate]:
+        return self._to_coordinate(self._neighborhood[np.argmin(distances)])
 
-        neighborhood = []
-        potential_neighborhood = self._get_potential_neighborhood(
-            self._home_coordinate, self._radius)
+    def _create_neighborhood(self) -> np.ndarray:
+        """
+        Returns an array with a row for every coordinate within the radius
+        of home (and within the bounds of every dimension), in lexicographic
+        order
 
-        for potential_coordinate in potential_neighborhood:
-            distance = Neighborhood.calc_distance(self._home_coordinate,
-                                                  potential_coordinate)
+        The ball is generated directly, one dimension at a time from the
+        last, keeping only the values that fit in the remaining squared radius
+        """
+        neighborhood = np.zeros((1, 0), dtype=Neighborhood.COORDINATE_DTYPE)
+        remaining = np.full(1, self._radius**2, dtype=np.int64)
 
-            if distance <= self._radius:
-                neighborhood.append(potential_coordinate)
+        for dim in reversed(range(self._config.get_num_dimensions())):
+            dimension = self._config.get_dimension(dim)
+            home_value = int(self._home[dim])
+
+            lower_bound = max(dimension.get_min_idx(), home_value - self._radius)
+            upper_bound = min(dimension.get_max_idx(), home_value + self._radius)
+
+            blocks = []
+            block_remaining = []
+            for value in range(lower_bound, upper_bound + 1):
+                cost = (value - home_value)**2
+                fits = remaining >= cost
+                if not fits.any():
+                    continue
+
+                block = neighborhood[fits]
+                blocks.append(
+                    np.hstack([
+                        np.full((len(block), 1),
+                                value,
+                                dtype=Neighborhood.COORDINATE_DTYPE), block
+                    ]))
+                block_remaining.append(remaining[fits] - cost)
+
+            neighborhood = np.concatenate(blocks)
+            remaining = np.concatenate(block_remaining)
 
         return neighborhood
 
-    def _get_potential_neighborhood(self, coordinate: Coordinate,
-                                    radius: int) -> List[Coordinate]:
-        bounds = self._get_bounds(coordinate, radius)
-        potential_values = self._enumerate_all_values_in_bounds(bounds)
-        return [Coordinate(x) for x in potential_values]
-
-    def _get_bounds(self, coordinate: Coordinate,
-                    radius: int) -> List[List[int]]:
-        bounds = []
-        for i in range(self._config.get_num_dimensions()):
-            dimension = self._config.get_dimension(i)
-
-            lower_bound = max(dimension.get_min_idx(),
-                              int(coordinate[i]) - radius)
-            upper_bound = min(dimension.get_max_idx(),
-                              int(coordinate[i]) + radius + 1)
-            bounds.append([lower_bound, upper_bound])
-        return bounds
-
-    def _enumerate_all_values_in_bounds(
-            self, bounds: List[List[int]]) -> List[List[int]]:
-        possible_index_values = []
-        for bound in bounds:
-            low: int = bound[0]
-            high: int = bound[1]
-            possible_index_values.append(list(range(low, high + 1)))
-        tuples = list(product(*possible_index_values))
-        return [list(x) for x in tuples]
-
     def _get_coordinates_with_valid_measurements(self) -> List[Coordinate]:
-        initialized_coordinates = []
-        for coordinate in self._neighborhood:
-            if coordinate != self._home_coordinate and self._coordinate_data.has_valid_measurement(
-                    coordinate):
-                initialized_coordinates.append(deepcopy(coordinate))
-        return initialized_coordinates
+        return [
+            self._to_coordinate(coordinate)
+            for coordinate in self._get_valid_measured_array()
+        ]
+
+    def _get_valid_measured_array(self) -> np.ndarray:
+        """
+        Returns the coordinates of the neighborhood (other than home) with
+        valid measurements, in the order of the neighborhood
+        """
+        coordinates = self._get_neighborhood_coordinates(
+            self._coordinate_data.get_coordinates_with_valid_measurements())
+        coordinates = coordinates[np.any(coordinates != self._home, axis=1)]
+
+        return coordinates[np.lexsort(coordinates.T[::-1])]
+
+    def _get_measured_mask(self) -> np.ndarray:
+        """
+        Returns a mask of the neighborhood coordinates that are measured
+        """
+        measured_coordinates = self._get_neighborhood_coordinates(
+            self._coordinate_data.get_measured_coordinates())
+
+        return np.isin(Neighborhood._as_row_keys(self._neighborhood),
+                       Neighborhood._as_row_keys(measured_coordinates))
+
+    def _get_neighborhood_coordinates(self,
+                                      coordinates: np.ndarray) -> np.ndarray:
+        """
+        Returns the given coordinates that are inside the neighborhood
+        """
+        num_dimensions = self._config.get_num_dimensions()
+        coordinates = coordinates.reshape(-1, num_dimensions)
+
+        offsets = coordinates - self._home.astype(np.int64)
+        in_radius = np.sum(offsets**2, axis=1) <= self._radius**2
+
+        return coordinates[in_radius].astype(Neighborhood.COORDINATE_DTYPE)
+
+    @staticmethod
+    def _as_row_keys(coordinates: np.ndarray) -> np.ndarray:
+        """
+        Views every row of the array as a single hashable/sortable value
+        """
+        coordinates = np.ascontiguousarray(coordinates)
+        return coordinates.view(
+            np.dtype((np.void, coordinates.dtype.itemsize *
+                      coordinates.shape[1]))).ravel()
+
+    @staticmethod
+    def _to_coordinate(row: np.ndarray) -> Coordinate:
+        return Coordinate([int(v) for v in row])
 
     def _get_step_vector(self) -> List[float]:
         """
@@ -312,28 +363,23 @@ def _calculate_step_vector_from_measurements(
     def _calculate_step_vector_from_vectors_and_weights(
             self, vectors: List[Coordinate],
             weights: List[float]) -> List[float]:
-        step_vector = [0.0] * self._config.get_num_dimensions()
-        dim_sum_vector = [0.0] * self._config.get_num_dimensions()
+        num_dimensions = self._config.get_num_dimensions()
+        vector_array = np.array([list(vector) for vector in vectors],
+                                dtype=float).reshape(-1, num_dimensions)
+        weight_array = np.array(weights, dtype=float).reshape(-1, 1)
 
         # For each dimension -
         #   if non zero, add weight (inverting if dimension is negative)
         #   divide by sum of coordinate of that dimension
-        for vector, weight in zip(vectors, weights):
-
-            for dim, v in enumerate(vector):
-                if v:
-                    if v > 0:
-                        step_vector[dim] += weight
-                        dim_sum_vector[dim] += v
-                    else:
-                        step_vector[dim] -= weight
-                        dim_sum_vector[dim] -= v
+        step_vector = np.sum(np.sign(vector_array) * weight_array, axis=0)
+        dim_sum_vector = np.sum(np.abs(vector_array), axis=0)
 
-        for dim, v in enumerate(dim_sum_vector):
-            if v:
-                step_vector[dim] /= v
+        step_vector = np.divide(step_vector,
+                                dim_sum_vector,
+                                out=step_vector,
+                                where=dim_sum_vector != 0)
 
-        return step_vector
+        return step_vector.tolist()
 
     def _get_all_measurements(
             self) -> Tuple[List[Coordinate], List[RunConfigMeasurement]]:
@@ -394,7 +440,7 @@ def _clamp_coordinate_to_bounds(self, coordinate: Coordinate) -> Coordinate:
             clamped_coordinate[i] = v
         return clamped_coordinate
 
-    def _get_covered_values_per_dimension(self) -> List[Dict[Coordinate, bool]]:
+    def _get_covered_values_per_dimension(self) -> List[Dict[int, bool]]:
         """
         Returns a list of dicts that indicates which values have been
         covered in each dimension.
@@ -402,33 +448,15 @@ def _get_covered_values_per_dimension(self) -> List[Dict[Coordinate, bool]]:
         (e.g.)
             covered_values_per_dimension[dimension][value] = bool
         """
-        measured_coordinates = self._get_coordinates_with_valid_measurements()
+        measured_coordinates = self._get_valid_measured_array()
 
-        covered_values_per_dimension: List[Dict[Coordinate, bool]] = [
-            {} for _ in range(self._config.get_num_dimensions())
+        covered_values_per_dimension: List[Dict[int, bool]] = [
+            dict.fromkeys(np.unique(measured_coordinates[:, i]).tolist(), True)
+            for i in range(self._config.get_num_dimensions())
         ]
 
-        for coordinate in measured_coordinates:
-            for i, v in enumerate(coordinate):
-                covered_values_per_dimension[i][v] = True
-
         return covered_values_per_dimension
 
-    def _get_num_uncovered_values(
-            self, coordinate: Coordinate,
-            covered_values_per_dimension: List[Dict[Coordinate, bool]]) -> int:
-        """
-        Determine how many of the coordinate dimensions in the input coordinate have values
-        that are not covered in covered_values_per_dimension
-        """
-        num_uncovered = 0
-
-        for i, v in enumerate(coordinate):
-            if not covered_values_per_dimension[i].get(v, False):
-                num_uncovered += 1
-
-        return num_uncovered
-
     def _is_slow_mode(self) -> bool:
         if self._force_slow_mode:
             return True
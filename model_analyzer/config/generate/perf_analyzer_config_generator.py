@@ -12,15 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Generator, Optional
+from typing import Dict, List, Generator, Optional, Sequence, Union
 
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
 
 from .config_generator_interface import ConfigGeneratorInterface
 from .generator_utils import GeneratorUtils as utils
+from .concurrency_binary_search import ConcurrencyBinarySearch
 
 from model_analyzer.constants import LOGGER_NAME, THROUGHPUT_MINIMUM_GAIN, THROUGHPUT_MINIMUM_CONSECUTIVE_CONCURRENCY_TRIES, THROUGHPUT_MINIMUM_CONSECUTIVE_BATCH_SIZE_TRIES
 from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.perf_analyzer.request_trace import RequestTrace
+from model_analyzer.perf_analyzer.shared_memory import SharedMemory
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 
 import logging
@@ -32,13 +35,18 @@ class PerfAnalyzerConfigGenerator(ConfigGeneratorInterface):
     """
     Given Perf Analyzer configuration options, generates Perf Analyzer configs
 
-    All combinations are pregenerated in __init__, but it may return is_done==true
-    earlier depending on results that it receives
+    The configs are created lazily, when they are returned, from a common
+    base config. It may return is_done==true before all combinations have
+    been generated, depending on results that it receives
     """
 
     def __init__(self, cli_config: ConfigCommandProfile, model_name: str,
                  model_perf_analyzer_flags: dict, model_parameters: dict,
-                 early_exit_enable: bool) -> None:
+                 early_exit_enable: bool,
+                 latency_budget: Optional[float] = None,
+                 max_batch_size: Optional[int] = None,
+                 base_model_name: Optional[str] = None,
+                 model_config: Optional[Dict] = None) -> None:
         """
         Parameters
         ----------
@@ -53,20 +61,43 @@ def __init__(self, cli_config: ConfigCommandProfile, model_name: str,
 
         model_parameters: Dict
             model constraints for batch_sizes and/or concurrency
+            or request_rate
 
         early_exit_enable: Bool
             If true, this class can early exit during search of concurrency
+            (or request rate)
+
+        latency_budget: Float
+            The p99 latency budget of the model, if any. Used to binary
+            search concurrency if enabled in the CLI config
+
+        max_batch_size: Int
+            The max batch size of the model config, if any. Client batch
+            sizes larger than it are illegal, and are never generated
+
+        base_model_name: String
+            The name of the model that model_name is a variant of, if
+            any. Selects the requests of the request trace to replay
+
+        model_config: Dict
+            The config of the model variant, if any. The size of
+            its tensors selects the shared memory perf_analyzer uses
         """
 
         self._early_exit_enable = early_exit_enable
 
-        # All configs are pregenerated in _configs[][]
-        # Indexed as follows:
-        #    _configs[_curr_batch_size_index][_curr_concurrency_index]
+        # Configs are created from the base config and
+        # _non_concurrency_params[_curr_batch_size_index], at
+        # _concurrencies[_curr_concurrency_index]
         #
-        self._curr_concurrency_index = 0
+        # When searching the request rate, the request rates
+        # are walked in place of the concurrencies. When replaying
+        # a request trace, _request_intervals are walked instead
+        # The binary search sets the index to None once it is done
+        #
+        self._curr_concurrency_index: Optional[int] = 0
         self._curr_batch_size_index = 0
-        self._configs: List[List[PerfAnalyzerConfig]] = []
+        self._non_concurrency_params: List[dict] = []
         self._concurrency_warning_printed = False
 
         # Flag to indicate we have started to return results
@@ -81,12 +112,47 @@ def __init__(self, cli_config: ConfigCommandProfile, model_name: str,
         self._perf_analyzer_flags = model_perf_analyzer_flags
 
         self._batch_sizes = sorted(model_parameters['batch_sizes'])
-        self._concurrencies = self._create_concurrency_list(
+        self._max_batch_size = max_batch_size
+
+        self._request_rate_enable = PerfAnalyzerConfigGenerator.is_request_rate_enabled(
             cli_config, model_parameters)
+        self._request_trace_flags = {}
+        self._request_intervals: List[str] = []
+        self._concurrencies: List[int] = []
+        if cli_config.request_trace:
+            self._request_trace_flags = RequestTrace.get_perf_analyzer_flags(
+                RequestTrace.get_output_path(cli_config.export_path),
+                base_model_name or model_name)
+            self._load_parameter = 'request-intervals'
+            self._request_intervals = [
+                self._request_trace_flags.pop('request-intervals')
+            ]
+        elif self._request_rate_enable:
+            self._load_parameter = 'request-rate-range'
+            self._concurrencies = PerfAnalyzerConfigGenerator.create_request_rate_list(
+                cli_config, model_parameters)
+        else:
+            self._load_parameter = 'concurrency-range'
+            self._concurrencies = PerfAnalyzerConfigGenerator.create_concurrency_list(
+                cli_config, model_parameters)
 
         self._cli_config = cli_config
 
-        self._generate_perf_configs()
+        self._shared_memory_flags = {}
+        if model_config:
+            self._shared_memory_flags = SharedMemory.get_perf_analyzer_flags(
+                cli_config, model_config, model_perf_analyzer_flags)
+
+        self._binary_search_enable = (
+            early_exit_enable and latency_budget is not None and
+            cli_config.concurrency_binary_search_enable and
+            not self._request_intervals)
+        self._latency_budget = latency_budget
+        self._concurrency_search: Optional[ConcurrencyBinarySearch] = None
+        self._reset_concurrency_search()
+
+        self._base_perf_config = self._create_base_perf_config()
+        self._generate_non_concurrency_params()
 
     @staticmethod
     def throughput_gain_valid_helper(
@@ -108,6 +174,19 @@ def throughput_gain_valid_helper(
 
         return gain > min_gain
 
+    @staticmethod
+    def request_rate_saturated(
+            measurement: Optional[RunConfigMeasurement]) -> bool:
+        """
+        Returns true if the throughput of a request rate measurement fell
+        short of the offered load, meaning that requests queued up faster
+        than the models could serve them
+        """
+        if not measurement:
+            return False
+
+        return measurement.is_request_rate_saturated()
+
     @staticmethod
     def get_throughput(measurement: Optional[RunConfigMeasurement]) -> float:
         if measurement:
@@ -117,6 +196,9 @@ def get_throughput(measurement: Optional[RunConfigMeasurement]) -> float:
 
     def _is_done(self) -> bool:
         """ Returns true if this generator is done generating configs """
+        if not self._non_concurrency_params:
+            return True
+
         return self._generator_started and self._done_walking()
 
     def get_configs(self) -> Generator[PerfAnalyzerConfig, None, None]:
@@ -126,8 +208,10 @@ def get_configs(self) -> Generator[PerfAnalyzerConfig, None, None]:
                 break
 
             self._generator_started = True
-            config = self._configs[self._curr_batch_size_index][
-                self._curr_concurrency_index]
+            assert self._curr_concurrency_index is not None
+            config = self._create_perf_config(
+                self._non_concurrency_params[self._curr_batch_size_index],
+                self._get_loads()[self._curr_concurrency_index])
             yield (config)
 
             if self._last_results_erroneous():
@@ -156,8 +240,12 @@ def set_last_results(
             self._last_results = measurement
             self._concurrency_results.extend(measurement)
 
-    def _create_concurrency_list(self, cli_config: ConfigCommandProfile,
-                                 model_parameters: dict) -> List[int]:
+    @staticmethod
+    def create_concurrency_list(cli_config: ConfigCommandProfile,
+                                model_parameters: dict) -> List[int]:
+        """
+        Returns the sorted list of concurrencies to sweep for a model
+        """
         if model_parameters['concurrency']:
             return sorted(model_parameters['concurrency'])
         elif cli_config.run_config_search_disable:
@@ -167,28 +255,61 @@ def _create_concurrency_list(self, cli_config: ConfigCommandProfile,
                 cli_config.run_config_search_min_concurrency,
                 cli_config.run_config_search_max_concurrency)
 
-    def _generate_perf_configs(self) -> None:
+    @staticmethod
+    def is_request_rate_enabled(cli_config: ConfigCommandProfile,
+                                model_parameters: dict) -> bool:
+        """
+        Returns true if the request rate, rather than the
+        concurrency, is to be swept for a model
+        """
+        if model_parameters.get('request_rate'):
+            return True
+
+        return cli_config.request_rate_search_enable and not model_parameters[
+            'concurrency']
+
+    @staticmethod
+    def create_request_rate_list(cli_config: ConfigCommandProfile,
+                                 model_parameters: dict) -> List[int]:
+        """
+        Returns the sorted list of request rates to sweep for a model
+        """
+        if model_parameters.get('request_rate'):
+            return sorted(model_parameters['request_rate'])
+        elif cli_config.run_config_search_disable:
+            return [cli_config.run_config_search_min_request_rate]
+        else:
+            return utils.generate_doubled_list(
+                cli_config.run_config_search_min_request_rate,
+                cli_config.run_config_search_max_request_rate)
+
+    def _create_base_perf_config(self) -> PerfAnalyzerConfig:
+        base_perf_config = PerfAnalyzerConfig()
+        base_perf_config.update_config_from_profile_config(
+            self._model_name, self._cli_config)
+        base_perf_config.update_config(self._request_trace_flags)
+        base_perf_config.update_config(self._shared_memory_flags)
+
+        return base_perf_config
+
+    def _generate_non_concurrency_params(self) -> None:
         perf_config_non_concurrency_params = self._create_non_concurrency_perf_config_params(
         )
 
-        for params in utils.generate_parameter_combinations(
-                perf_config_non_concurrency_params):
-            configs_with_concurrency = []
-            for concurrency in self._concurrencies:
-                new_perf_config = PerfAnalyzerConfig()
+        self._non_concurrency_params = utils.generate_parameter_combinations(
+            perf_config_non_concurrency_params,
+            is_legal=self._is_legal_non_concurrency_params)
 
-                new_perf_config.update_config_from_profile_config(
-                    self._model_name, self._cli_config)
+    def _create_perf_config(self, non_concurrency_params: dict,
+                            load: Union[int, str]) -> PerfAnalyzerConfig:
+        new_perf_config = self._base_perf_config.create_derived_config(
+            non_concurrency_params)
+        new_perf_config.update_config({self._load_parameter: load})
 
-                new_perf_config.update_config(params)
-                new_perf_config.update_config(
-                    {'concurrency-range': concurrency})
+        # User provided flags can override the search parameters
+        new_perf_config.update_config(self._perf_analyzer_flags)
 
-                # User provided flags can override the search parameters
-                new_perf_config.update_config(self._perf_analyzer_flags)
-
-                configs_with_concurrency.append(new_perf_config)
-            self._configs.append(configs_with_concurrency)
+        return new_perf_config
 
     def _create_non_concurrency_perf_config_params(self) -> dict:
         perf_config_params = {
@@ -197,6 +318,38 @@ def _create_non_concurrency_perf_config_params(self) -> dict:
 
         return perf_config_params
 
+    def _is_legal_non_concurrency_params(self, params: dict) -> bool:
+        """
+        Returns false if the client batch size is greater than the
+        model's max batch size (see ModelRunConfig.is_legal_combination)
+        """
+        if self._max_batch_size is None:
+            return True
+
+        # User provided flags override the search parameters
+        batch_size = params['batch-size']
+        if type(self._perf_analyzer_flags
+               ) is dict and 'batch-size' in self._perf_analyzer_flags:
+            batch_size = int(self._perf_analyzer_flags['batch-size'])
+
+        legal = batch_size <= self._max_batch_size
+        if not legal:
+            logger.debug(
+                f"Pruning client batch size {batch_size} as it is greater than the model max batch size {self._max_batch_size}"
+            )
+
+        return legal
+
+    def _get_loads(self) -> Sequence[Union[int, str]]:
+        """
+        Returns the loads walked at each batch size: the request
+        intervals of the trace, or the concurrencies (or request rates)
+        """
+        if self._request_intervals:
+            return self._request_intervals
+
+        return self._concurrencies
+
     def _step(self) -> None:
         self._step_concurrency()
 
@@ -215,9 +368,23 @@ def _reset_concurrencies(self) -> None:
         self._curr_concurrency_index = 0
         self._concurrency_warning_printed = False
         self._concurrency_results = []
+        self._reset_concurrency_search()
+
+    def _reset_concurrency_search(self) -> None:
+        if self._binary_search_enable:
+            assert self._latency_budget is not None
+            self._concurrency_search = ConcurrencyBinarySearch(
+                self._concurrencies, self._latency_budget)
+            self._curr_concurrency_index = self._concurrency_search.next_index()
 
     def _step_concurrency(self) -> None:
-        self._curr_concurrency_index += 1
+        assert self._curr_concurrency_index is not None
+        if self._concurrency_search:
+            self._concurrency_search.add_measurement(
+                self._curr_concurrency_index, self._last_results[-1])
+            self._curr_concurrency_index = self._concurrency_search.next_index()
+        else:
+            self._curr_concurrency_index += 1
 
     def _step_batch_size(self) -> None:
         self._curr_batch_size_index += 1
@@ -226,7 +393,16 @@ def _done_walking(self) -> bool:
         return self._done_walking_batch_sizes()
 
     def _done_walking_concurrencies(self) -> bool:
-        if len(self._concurrencies) == self._curr_concurrency_index:
+        if self._concurrency_search:
+            return self._curr_concurrency_index is None
+        if len(self._get_loads()) == self._curr_concurrency_index:
+            return True
+        if self._early_exit_enable and self._request_rate_saturated():
+            if not self._concurrency_warning_printed:
+                logger.info(
+                    "No longer increasing request rate as the throughput no longer keeps up with it"
+                )
+                self._concurrency_warning_printed = True
             return True
         if self._early_exit_enable and not self._concurrency_throughput_gain_valid(
         ):
@@ -239,7 +415,7 @@ def _done_walking_concurrencies(self) -> bool:
         return False
 
     def _done_walking_batch_sizes(self) -> bool:
-        if len(self._batch_sizes) == self._curr_batch_size_index:
+        if len(self._non_concurrency_params) == self._curr_batch_size_index:
             return True
 
         if self._early_exit_enable and not self._batch_size_throughput_gain_valid(
@@ -255,6 +431,13 @@ def _done_walking_batch_sizes(self) -> bool:
     def _last_results_erroneous(self) -> bool:
         return not self._last_results or self._last_results[-1] is None
 
+    def _request_rate_saturated(self) -> bool:
+        """ Check if the last request rate result was saturated """
+        return (self._request_rate_enable and
+                bool(self._concurrency_results) and
+                PerfAnalyzerConfigGenerator.request_rate_saturated(
+                    self._concurrency_results[-1]))
+
     def _concurrency_throughput_gain_valid(self) -> bool:
         """ Check if any of the last X concurrency results resulted in valid gain """
         return PerfAnalyzerConfigGenerator.throughput_gain_valid_helper(
@@ -21,6 +21,7 @@
 from model_analyzer.config.generate.quick_run_config_generator import QuickRunConfigGenerator
 from model_analyzer.config.generate.model_variant_name_manager import ModelVariantNameManager
 from model_analyzer.config.generate.perf_analyzer_config_generator import PerfAnalyzerConfigGenerator
+from model_analyzer.config.generate.concurrency_binary_search import ConcurrencyBinarySearch
 from model_analyzer.config.run.run_config import RunConfig
 from model_analyzer.triton.client.client import TritonClient
 from model_analyzer.device.gpu_device import GPUDevice
@@ -45,6 +46,9 @@ class QuickPlusConcurrencySweepRunConfigGenerator(ConfigGeneratorInterface):
     """
     First run QuickRunConfigGenerator for a hill climbing search, then use 
     Brute for a concurrency sweep of the default and Top N results
+
+    If request rate search is enabled, the request rate
+    is swept instead of the concurrency
     """
 
     def __init__(self, search_config: SearchConfig,
@@ -136,28 +140,77 @@ def _sweep_concurrency_over_top_results(
             for count, result in enumerate(top_results):
                 run_config = deepcopy(result.run_config())
 
-                max_concurrency_index = int(
-                    log2(self._config.run_config_search_max_concurrency))
-
-                run_config_measurements = []
-                for concurrency in (
-                        2**i for i in range(0, max_concurrency_index + 1)):
-                    run_config = self._set_concurrency(run_config, concurrency)
-                    yield run_config
-
-                    run_config_measurements.append(self._last_measurement)
-
-                    if not PerfAnalyzerConfigGenerator.throughput_gain_valid_helper(
-                            throughputs=run_config_measurements):
-                        logger.info(
-                            "Terminating concurrency sweep - throughput is decreasing"
-                        )
-                        break
+                # The loads are request rates when they are searched instead
+                if self._config.request_rate_search_enable:
+                    loads = PerfAnalyzerConfigGenerator.create_request_rate_list(
+                        self._config, model_parameters={})
+                else:
+                    max_concurrency_index = int(
+                        log2(self._config.run_config_search_max_concurrency))
+                    loads = [
+                        2**i for i in range(0, max_concurrency_index + 1)
+                    ]
+
+                latency_budget = ConcurrencyBinarySearch.get_latency_budget(
+                    [model.constraints() for model in self._models])
+
+                if self._config.concurrency_binary_search_enable and latency_budget is not None:
+                    yield from self._binary_search_concurrency(
+                        run_config, loads, latency_budget)
+                else:
+                    yield from self._sweep_concurrency(run_config, loads)
+
+    def _sweep_concurrency(
+            self, run_config: RunConfig,
+            loads: List[int]) -> Generator[RunConfig, None, None]:
+        run_config_measurements = []
+        for load in loads:
+            run_config = self._set_concurrency(run_config, load)
+            yield run_config
+
+            run_config_measurements.append(self._last_measurement)
+
+            if PerfAnalyzerConfigGenerator.request_rate_saturated(
+                    self._last_measurement):
+                logger.info(
+                    "Terminating request rate sweep - throughput no longer keeps up with it"
+                )
+                break
+
+            if not PerfAnalyzerConfigGenerator.throughput_gain_valid_helper(
+                    throughputs=run_config_measurements):
+                logger.info(
+                    "Terminating concurrency sweep - throughput is decreasing")
+                break
+
+    def _binary_search_concurrency(
+            self, run_config: RunConfig, loads: List[int],
+            latency_budget: float) -> Generator[RunConfig, None, None]:
+        concurrency_search = ConcurrencyBinarySearch(loads, latency_budget)
+
+        index = concurrency_search.next_index()
+        while index is not None:
+            run_config = self._set_concurrency(run_config, loads[index])
+            yield run_config
+
+            concurrency_search.add_measurement(index, self._last_measurement)
+            index = concurrency_search.next_index()
+
+    def _set_concurrency(self, run_config: RunConfig, load: int) -> RunConfig:
+        """
+        Sets the load of every model of the run config: its
+        request rate if request rates are searched, and
+        its concurrency otherwise
+        """
 
-    def _set_concurrency(self, run_config: RunConfig,
-                         concurrency: int) -> RunConfig:
         for model_run_config in run_config.model_run_configs():
             perf_config = model_run_config.perf_config()
-            perf_config.update_config({'concurrency-range': concurrency})
+            if self._config.request_rate_search_enable:
+                perf_config.update_config({
+                    'concurrency-range': None,
+                    'request-rate-range': load
+                })
+            else:
+                perf_config.update_config({'concurrency-range': load})
 
         return run_config
@@ -27,6 +27,7 @@
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 from model_analyzer.config.run.run_config import RunConfig
 from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.perf_analyzer.shared_memory import SharedMemory
 from model_analyzer.triton.model.model_config import ModelConfig
 from model_analyzer.triton.client.client import TritonClient
 from model_analyzer.device.gpu_device import GPUDevice
@@ -311,7 +312,7 @@ def _get_next_model_run_config(
 
         model_variant_name = model_config.get_field('name')
         perf_analyzer_config = self._get_next_perf_analyzer_config(
-            model_variant_name, model, start_model_index)
+            model_variant_name, model, start_model_index, model_config)
 
         model_name = model.model_name()
         model_run_config = ModelRunConfig(model_name, model_config,
@@ -395,9 +396,9 @@ def _get_next_model_config(self, model: ModelProfileSpec,
             model_variant_name_manager=self._model_variant_name_manager)
         return model_config
 
-    def _get_next_perf_analyzer_config(self, model_variant_name: str,
-                                       model: ModelProfileSpec,
-                                       model_index: int) -> PerfAnalyzerConfig:
+    def _get_next_perf_analyzer_config(
+            self, model_variant_name: str, model: ModelProfileSpec,
+            model_index: int, model_config: ModelConfig) -> PerfAnalyzerConfig:
         dimension_values = self._get_coordinate_values(
             self._coordinate_to_measure, model_index)
 
@@ -411,6 +412,10 @@ def _get_next_perf_analyzer_config(self, model_variant_name: str,
         perf_config_params = {'batch-size': 1, 'concurrency-range': concurrency}
         perf_analyzer_config.update_config(perf_config_params)
 
+        perf_analyzer_config.update_config(
+            SharedMemory.get_perf_analyzer_flags(self._config,
+                                                 model_config.get_config(),
+                                                 model.perf_analyzer_flags()))
         perf_analyzer_config.update_config(model.perf_analyzer_flags())
         return perf_analyzer_config
 
@@ -543,6 +548,10 @@ def _create_default_perf_analyzer_config(
         perf_config_params = {'batch-size': 1, 'concurrency-range': 1}
         default_perf_analyzer_config.update_config(perf_config_params)
 
+        default_perf_analyzer_config.update_config(
+            SharedMemory.get_perf_analyzer_flags(self._config,
+                                                 model_config.get_config(),
+                                                 model.perf_analyzer_flags()))
         default_perf_analyzer_config.update_config(model.perf_analyzer_flags())
 
         return default_perf_analyzer_config
@@ -0,0 +1,174 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Generator, Optional, Tuple
+from math import ceil
+
+from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
+from model_analyzer.device.gpu_device import GPUDevice
+from model_analyzer.triton.client.client import TritonClient
+from model_analyzer.config.generate.model_variant_name_manager import ModelVariantNameManager
+from model_analyzer.config.run.model_run_config import ModelRunConfig
+from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+from model_analyzer.triton.model.model_config import ModelConfig
+from model_analyzer.constants import LOGGER_NAME
+from .model_run_config_generator import ModelRunConfigGenerator
+from .perf_analyzer_config_generator import PerfAnalyzerConfigGenerator
+from .model_profile_spec import ModelProfileSpec
+
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class SuccessiveHalvingModelRunConfigGenerator(ModelRunConfigGenerator):
+    """
+    Given a model, first screens every ModelConfig with short measurements
+    at a few concurrencies, and then generates the full sweep of
+    ModelRunConfigs only for the best fraction of the ModelConfigs
+
+    Screening measurements use time windows, so that they are never
+    mistaken for (and reused in place of) the full-length measurements,
+    and are kept by this generator instead of being reported
+    """
+
+    def __init__(self, config: ConfigCommandProfile, gpus: List[GPUDevice],
+                 model: ModelProfileSpec, client: TritonClient,
+                 model_variant_name_manager: ModelVariantNameManager,
+                 default_only: bool) -> None:
+        """
+        Parameters
+        ----------
+        config: ModelAnalyzerConfig
+
+        gpus: List of GPUDevices
+
+        model: ConfigModelProfileSpec
+            The model to generate ModelRunConfigs for
+
+        client: TritonClient
+
+        model_variant_name_manager: ModelVariantNameManager
+
+        default_only: Bool
+        """
+        super().__init__(config, gpus, model, client,
+                         model_variant_name_manager, default_only)
+
+        self._screened_model_configs: List[Tuple[
+            ModelConfig, Optional[RunConfigMeasurement]]] = []
+        self._screening = False
+
+    def get_configs(self) -> Generator[ModelRunConfig, None, None]:
+        """
+        Returns
+        -------
+        ModelRunConfig
+            The next ModelRunConfig generated by this class
+        """
+        self._screening = True
+        yield from self._screen_model_configs()
+        self._screening = False
+
+        for model_config in self._select_model_configs():
+            yield from self._generate_model_run_configs(model_config)
+            self._curr_mc_measurements = []
+
+    def is_screening(self) -> bool:
+        """
+        Returns true while the ModelConfigs are screened. Screening
+        measurements are short, so they are only used to select the
+        ModelConfigs, and are never stored with the full measurements
+        """
+        return self._screening
+
+    def _screen_model_configs(self) -> Generator[ModelRunConfig, None, None]:
+        screening_parameters = self._create_screening_model_parameters()
+
+        for model_config in self._mcg.get_configs():
+            for run_config in self._generate_model_run_configs(
+                    model_config,
+                    model_parameters=screening_parameters,
+                    early_exit_enable=False):
+                run_config.perf_config().update_config({
+                    'measurement-mode':
+                        'time_windows',
+                    'measurement-interval':
+                        self._config.successive_halving_screening_window
+                })
+                yield run_config
+
+            self._screened_model_configs.append(
+                (model_config,
+                 self._get_best_measurement(self._curr_mc_measurements)))
+            self._set_last_results_model_config_generator()
+
+    def _create_screening_model_parameters(self) -> dict:
+        """
+        Screen at the smallest client batch size, with concurrencies
+        spread evenly over the full concurrency sweep
+        """
+        concurrencies = PerfAnalyzerConfigGenerator.create_concurrency_list(
+            self._config, self._model_parameters)
+
+        num_screening = min(len(concurrencies),
+                            self._config.successive_halving_screening_concurrencies)
+        if num_screening > 1:
+            screening_concurrencies = [
+                concurrencies[round(i * (len(concurrencies) - 1) /
+                                    (num_screening - 1))]
+                for i in range(num_screening)
+            ]
+        else:
+            screening_concurrencies = concurrencies[:1]
+
+        screening_parameters = dict(self._model_parameters)
+        screening_parameters.update({
+            'batch_sizes': [min(self._model_parameters['batch_sizes'])],
+            'concurrency': sorted(set(screening_concurrencies))
+        })
+        return screening_parameters
+
+    def _select_model_configs(self) -> List[ModelConfig]:
+        """
+        Returns the ModelConfigs with the best screening measurements,
+        preferring those that pass the constraints
+        """
+        screened = [(model_config, measurement)
+                    for model_config, measurement in self._screened_model_configs
+                    if measurement]
+
+        num_selected = ceil(
+            len(screened) * self._config.successive_halving_keep_fraction)
+
+        screened.sort(key=lambda screened_config: (screened_config[
+            1].is_passing_constraints(), screened_config[1]),
+                      reverse=True)
+
+        logger.info(
+            f"Successive halving: fully profiling {num_selected} of "
+            f"{len(self._screened_model_configs)} screened model configs")
+
+        return [model_config for model_config, _ in screened[:num_selected]]
+
+    def _get_best_measurement(
+        self, measurements: List[Optional[RunConfigMeasurement]]
+    ) -> Optional[RunConfigMeasurement]:
+        valid_measurements = [m for m in measurements if m]
+        if not valid_measurements:
+            return None
+
+        return max(valid_measurements,
+                   key=lambda measurement:
+                   (measurement.is_passing_constraints(), measurement))
@@ -188,6 +188,7 @@ def _check_for_quick_search_incompatability(
             return
 
         self._check_no_search_disable(args, yaml_config)
+        self._check_no_request_trace(args, yaml_config)
         self._check_no_global_list_values(args, yaml_config)
         self._check_no_per_model_list_values(args, yaml_config)
 
@@ -201,16 +202,25 @@ def _check_no_search_disable(
                 '\nPlease use brute search mode or remove --run-config-search-disable.'
             )
 
+    def _check_no_request_trace(
+            self, args: Namespace, yaml_config: Optional[Dict[str,
+                                                              List]]) -> None:
+        if self._get_config_value('request_trace', args, yaml_config):
+            raise TritonModelAnalyzerException(
+                f'\nReplaying a request trace is not supported in quick search mode.'
+                '\nPlease use brute search mode or remove --request-trace.')
+
     def _check_no_global_list_values(
             self, args: Namespace, yaml_config: Optional[Dict[str,
                                                               List]]) -> None:
         concurrency = self._get_config_value('concurrency', args, yaml_config)
         batch_sizes = self._get_config_value('batch_sizes', args, yaml_config)
+        request_rate = self._get_config_value('request_rate', args, yaml_config)
 
-        if concurrency or batch_sizes:
+        if concurrency or batch_sizes or request_rate:
             raise TritonModelAnalyzerException(
-                f'\nProfiling of models in quick search mode is not supported with lists of concurrencies or batch sizes.'
-                '\nPlease use brute search mode or remove concurrency/batch sizes list.'
+                f'\nProfiling of models in quick search mode is not supported with lists of concurrencies, request rates or batch sizes.'
+                '\nPlease use brute search mode or remove concurrency/request rate/batch sizes list.'
             )
 
     def _check_no_per_model_list_values(
@@ -227,11 +237,11 @@ def _check_no_per_model_list_values(
             if not 'parameters' in model:
                 continue
 
-            if 'concurrency' in model['parameters'] or 'batch size' in model[
-                    'parameters']:
+            if 'concurrency' in model['parameters'] or 'request_rate' in model[
+                    'parameters'] or 'batch size' in model['parameters']:
                 raise TritonModelAnalyzerException(
-                    f'\nProfiling of models in quick search mode is not supported with lists of concurrencies or batch sizes.'
-                    '\nPlease use brute search mode or remove concurrency/batch sizes list.'
+                    f'\nProfiling of models in quick search mode is not supported with lists of concurrencies, request rates or batch sizes.'
+                    '\nPlease use brute search mode or remove concurrency/request rate/batch sizes list.'
                 )
 
         for model in profile_models.values():
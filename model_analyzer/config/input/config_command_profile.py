@@ -13,7 +13,8 @@
 # limitations under the License.
 
 from model_analyzer.config.input.config_utils \
-    import binary_path_validator, objective_list_output_mapper, file_path_validator, parent_path_validator
+    import binary_path_validator, objective_list_output_mapper, file_path_validator, parent_path_validator, \
+    plot_data_formats_validator, measurement_export_formats_validator
 from .config_field import ConfigField
 from .config_primitive import ConfigPrimitive
 from .config_list_string import ConfigListString
@@ -21,27 +22,34 @@
 from .config_object import ConfigObject
 from .config_list_generic import ConfigListGeneric
 from .config_union import ConfigUnion
-from .config_none import ConfigNone
-from .config_sweep import ConfigSweep
-from .config_enum import ConfigEnum
 from .config_command import ConfigCommand
 
 from .config_defaults import \
     DEFAULT_BATCH_SIZES, DEFAULT_CHECKPOINT_DIRECTORY, \
     DEFAULT_CLIENT_PROTOCOL, DEFAULT_DURATION_SECONDS, \
-    DEFAULT_GPUS, DEFAULT_SKIP_SUMMARY_REPORTS, DEFAULT_MAX_RETRIES, \
+    DEFAULT_GPUS, DEFAULT_SKIP_SUMMARY_REPORTS, DEFAULT_DRY_RUN, DEFAULT_MAX_RETRIES, \
     DEFAULT_MONITORING_INTERVAL, DEFAULT_COLLECT_CPU_METRICS, DEFAULT_OFFLINE_OBJECTIVES, \
     DEFAULT_OUTPUT_MODEL_REPOSITORY, DEFAULT_OVERRIDE_OUTPUT_REPOSITORY_FLAG, \
+    DEFAULT_PRUNE_OUTPUT_REPOSITORY_FLAG, \
     DEFAULT_PERF_ANALYZER_CPU_UTIL, DEFAULT_PERF_ANALYZER_PATH, DEFAULT_PERF_MAX_AUTO_ADJUSTS, \
-    DEFAULT_PERF_OUTPUT_FLAG, DEFAULT_RUN_CONFIG_MAX_CONCURRENCY, DEFAULT_RUN_CONFIG_MIN_CONCURRENCY, \
+    DEFAULT_PERF_OUTPUT_FLAG, DEFAULT_COLLECT_LATENCY_HISTOGRAMS, DEFAULT_RUN_CONFIG_MAX_CONCURRENCY, DEFAULT_RUN_CONFIG_MIN_CONCURRENCY, \
+    DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE, DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE, DEFAULT_REQUEST_RATE_SEARCH_ENABLE, \
     DEFAULT_RUN_CONFIG_PROFILE_MODELS_CONCURRENTLY_ENABLE, DEFAULT_RUN_CONFIG_SEARCH_MODE, \
     DEFAULT_RUN_CONFIG_MAX_INSTANCE_COUNT, DEFAULT_RUN_CONFIG_MIN_INSTANCE_COUNT, \
     DEFAULT_RUN_CONFIG_MAX_MODEL_BATCH_SIZE, DEFAULT_RUN_CONFIG_MIN_MODEL_BATCH_SIZE, \
-    DEFAULT_RUN_CONFIG_SEARCH_DISABLE, DEFAULT_TRITON_DOCKER_IMAGE, DEFAULT_TRITON_GRPC_ENDPOINT, \
+    DEFAULT_RUN_CONFIG_SEARCH_DISABLE, DEFAULT_SUCCESSIVE_HALVING_ENABLE, \
+    DEFAULT_SUCCESSIVE_HALVING_SCREENING_CONCURRENCIES, DEFAULT_SUCCESSIVE_HALVING_SCREENING_WINDOW, \
+    DEFAULT_SUCCESSIVE_HALVING_KEEP_FRACTION, DEFAULT_CONCURRENCY_BINARY_SEARCH_ENABLE, \
+    DEFAULT_MAX_MEASUREMENT_REPEATS, DEFAULT_MEASUREMENT_REPEAT_TOLERANCE, \
+    DEFAULT_LOAD_GENERATOR, DEFAULT_PERF_ANALYZER_SHARED_MEMORY, \
+    DEFAULT_GPU_PRICE_PER_HOUR, \
+    DEFAULT_TRITON_DOCKER_IMAGE, DEFAULT_TRITON_GRPC_ENDPOINT, \
     DEFAULT_TRITON_HTTP_ENDPOINT, DEFAULT_TRITON_INSTALL_PATH, DEFAULT_TRITON_LAUNCH_MODE, DEFAULT_TRITON_METRICS_URL, \
     DEFAULT_TRITON_SERVER_PATH, DEFAULT_PERF_ANALYZER_TIMEOUT, \
+    DEFAULT_SIMULATION_GPU_COUNT, DEFAULT_SIMULATION_NOISE, DEFAULT_SIMULATION_SEED, \
     DEFAULT_EXPORT_PATH, DEFAULT_FILENAME_MODEL_INFERENCE, DEFAULT_FILENAME_MODEL_GPU, \
-    DEFAULT_FILENAME_SERVER_ONLY, DEFAULT_NUM_CONFIGS_PER_MODEL, DEFAULT_NUM_TOP_MODEL_CONFIGS, \
+    DEFAULT_FILENAME_SERVER_ONLY, DEFAULT_MEASUREMENT_EXPORT_FORMATS, DEFAULT_NUM_CONFIGS_PER_MODEL, DEFAULT_NUM_TOP_MODEL_CONFIGS, \
+    DEFAULT_NUM_REPORT_WORKERS, DEFAULT_PLOT_DATA_FORMATS, \
     DEFAULT_INFERENCE_OUTPUT_FIELDS, DEFAULT_GPU_OUTPUT_FIELDS, DEFAULT_SERVER_OUTPUT_FIELDS, \
     DEFAULT_ONLINE_OBJECTIVES, DEFAULT_ONLINE_PLOTS, DEFAULT_OFFLINE_PLOTS, DEFAULT_MODEL_WEIGHTING
 
@@ -50,21 +58,16 @@
     TritonServerConfig
 from model_analyzer.perf_analyzer.perf_config import \
     PerfAnalyzerConfig
+from model_analyzer.perf_analyzer.perf_analyzer import PerfAnalyzer
 from model_analyzer.record.record import RecordType
 from model_analyzer.model_analyzer_exceptions \
     import TritonModelAnalyzerException
 from .objects.config_plot import ConfigPlot
 from .objects.config_model_profile_spec import ConfigModelProfileSpec
-from .objects.config_protobuf_utils import \
-    is_protobuf_type_primitive, protobuf_to_config_type
-
-from tritonclient.grpc.model_config_pb2 import ModelConfig
-from google.protobuf.descriptor import FieldDescriptor
+from .objects.config_protobuf_utils import ModelConfigSchema
 
 import os
-import numba
 import argparse
-from numba import cuda
 import psutil
 import logging
 
@@ -76,86 +79,12 @@ class ConfigCommandProfile(ConfigCommand):
     Model Analyzer config object.
     """
 
-    def _resolve_protobuf_field(self, field: FieldDescriptor) -> ConfigSweep:
-        """
-        Recursively resolve protobuf fields.
-
-        Parameters
-        ----------
-        field : google.protobuf.pyext._message.FieldDescriptor
-
-        Returns
-        -------
-        ConfigValue
-            A config type equivalent to the protobuf type.
-
-        Raises
-        ------
-        TritonModelAnalyzerException
-            If the protobuf config field cannot be resolved, this exception
-            will be raised.
-        """
-
-        if is_protobuf_type_primitive(field.type):
-            config_type = protobuf_to_config_type(field.type)
-
-            # If it is a repeated field, we should use ConfigListGeneric
-            if field.label == FieldDescriptor.LABEL_REPEATED:
-                config_type = ConfigListGeneric(ConfigPrimitive(config_type))
-            else:
-                config_type = ConfigPrimitive(config_type)
-
-        elif field.type == FieldDescriptor.TYPE_MESSAGE:
-            # If the field type is TYPE_MESSAGE, we need to create a new
-            # message of type ConfigObject
-            sub_field_schema = {}
-
-            # Custom handling for map field
-            # TODO: Add support for types in the keys
-            if field.message_type.has_options and field.message_type.GetOptions(
-            ).map_entry:
-                value_field_type = self._resolve_protobuf_field(
-                    field.message_type.fields_by_name['value'])
-                sub_field_schema['*'] = value_field_type
-                config_type = ConfigObject(schema=sub_field_schema)
-
-            else:
-                fields = field.message_type.fields
-                for sub_field in fields:
-                    sub_field_schema[
-                        sub_field.name] = self._resolve_protobuf_field(
-                            sub_field)
-                if field.label == FieldDescriptor.LABEL_REPEATED:
-                    config_type = ConfigListGeneric(
-                        ConfigObject(schema=sub_field_schema))
-                else:
-                    config_type = ConfigObject(schema=sub_field_schema)
-        elif field.type == FieldDescriptor.TYPE_ENUM:
-            choices = []
-            enum_values = field.enum_type.values
-            for enum_value in enum_values:
-                choices.append(enum_value.name)
-            config_type = ConfigEnum(choices)
-        else:
-            raise TritonModelAnalyzerException(
-                'The current version of Model Config is not supported by Model Analyzer.'
-            )
-
-        return ConfigSweep(ConfigUnion([config_type, ConfigNone()]))
-
     def _get_model_config_fields(self):
         """
         Constructs a ConfigObject from the ModelConfig protobuf.
         """
 
-        model_config_prototype = ModelConfig()
-        fields = model_config_prototype.DESCRIPTOR.fields
-
-        schema = {}
-        for field in fields:
-            schema[field.name] = self._resolve_protobuf_field(field)
-
-        return ConfigObject(schema)
+        return ConfigObject(schema=ModelConfigSchema())
 
     def _fill_config(self):
         """
@@ -220,6 +149,16 @@ def _fill_config(self):
                 default_value=DEFAULT_SKIP_SUMMARY_REPORTS,
                 description=
                 'Skips the generation of analysis summary reports and tables.'))
+        self._add_config(
+            ConfigField(
+                'dry_run',
+                flags=['--dry-run'],
+                field_type=ConfigPrimitive(bool),
+                parser_args={'action': 'store_true'},
+                default_value=DEFAULT_DRY_RUN,
+                description=
+                'Reports the size of the search space, after pruning the illegal'
+                ' configurations, without launching Triton or perf_analyzer.'))
 
         self._add_repository_configs()
         self._add_client_configs()
@@ -261,6 +200,16 @@ def _add_repository_configs(self):
                 description=
                 'Will override the contents of the output model repository'
                 ' and replace it with the new results.'))
+        self._add_config(
+            ConfigField(
+                'prune_output_model_repository',
+                field_type=ConfigPrimitive(bool),
+                parser_args={'action': 'store_true'},
+                default_value=DEFAULT_PRUNE_OUTPUT_REPOSITORY_FLAG,
+                flags=['--prune-output-model-repository'],
+                description=
+                'Will remove each model variant from the output model repository'
+                ' once it has been profiled and is no longer loaded.'))
 
     def _add_profile_models_configs(self):
         """
@@ -335,6 +284,14 @@ def _add_profile_models_configs(self):
                     ConfigObject(schema={
                         'max': ConfigPrimitive(int),
                     }),
+                'perf_latency_p50':
+                    ConfigObject(schema={
+                        'max': ConfigPrimitive(int),
+                    }),
+                'perf_latency_p999':
+                    ConfigObject(schema={
+                        'max': ConfigPrimitive(int),
+                    }),
                 'perf_latency':
                     ConfigObject(schema={
                         'max': ConfigPrimitive(int),
@@ -343,6 +300,18 @@ def _add_profile_models_configs(self):
                     ConfigObject(schema={
                         'max': ConfigPrimitive(int),
                     }),
+                'gpu_energy':
+                    ConfigObject(schema={
+                        'max': ConfigPrimitive(float),
+                    }),
+                'perf_inferences_per_joule':
+                    ConfigObject(schema={
+                        'min': ConfigPrimitive(int),
+                    }),
+                'perf_inferences_per_dollar':
+                    ConfigObject(schema={
+                        'min': ConfigPrimitive(int),
+                    }),
             })
         self._add_config(
             ConfigField(
@@ -366,6 +335,16 @@ def _add_profile_models_configs(self):
                 description=
                 'A weighting used to bias the model when determining the best configuration'
             ))
+        self._add_config(
+            ConfigField(
+                'gpu_price_per_hour',
+                flags=['--gpu-price-per-hour'],
+                field_type=ConfigPrimitive(float),
+                default_value=DEFAULT_GPU_PRICE_PER_HOUR,
+                description=
+                "The price of one GPU for an hour, in dollars, that the"
+                " inferences per dollar of each measurement are computed"
+                " from. They are not computed when it is 0."))
 
         model_config_fields = self._get_model_config_fields()
         profile_model_scheme = ConfigObject(
@@ -384,6 +363,8 @@ def _add_profile_models_configs(self):
                                         'batch_sizes':
                                             ConfigListNumeric(type_=int),
                                         'concurrency':
+                                            ConfigListNumeric(type_=int),
+                                        'request_rate':
                                             ConfigListNumeric(type_=int)
                                     }),
                             'objectives':
@@ -440,6 +421,23 @@ def _add_profile_models_configs(self):
                 description=
                 "Comma-delimited list of concurrency values or ranges <start:end:step>"
                 " to be used during profiling"))
+        self._add_config(
+            ConfigField(
+                'request_rate',
+                flags=['--request-rate'],
+                field_type=ConfigListNumeric(int),
+                description=
+                "Comma-delimited list of request rate values or ranges <start:end:step>"
+                " to be used during profiling, instead of concurrencies"))
+        self._add_config(
+            ConfigField(
+                'request_trace',
+                flags=['--request-trace'],
+                field_type=ConfigPrimitive(str,
+                                           validator=file_path_validator),
+                description=
+                "Path to a recorded request trace (JSON Lines) to replay to each"
+                " model, instead of sweeping concurrencies or request rates."))
         self._add_config(
             ConfigField(
                 'reload_model_disable',
@@ -508,6 +506,34 @@ def _add_run_search_configs(self):
                 description=
                 "Min concurrency value that run config search should start with."
             ))
+        self._add_config(
+            ConfigField(
+                'request_rate_search_enable',
+                flags=['--request-rate-search-enable'],
+                field_type=ConfigPrimitive(bool),
+                parser_args={'action': 'store_true'},
+                default_value=DEFAULT_REQUEST_RATE_SEARCH_ENABLE,
+                description=
+                "Search the request rate (open-loop load) instead of the concurrency"
+                " for models without a list of concurrencies."))
+        self._add_config(
+            ConfigField(
+                'run_config_search_max_request_rate',
+                flags=['--run-config-search-max-request-rate'],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE,
+                description=
+                "Max request rate value that run config search should not go beyond that."
+            ))
+        self._add_config(
+            ConfigField(
+                'run_config_search_min_request_rate',
+                flags=['--run-config-search-min-request-rate'],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE,
+                description=
+                "Min request rate value that run config search should start with."
+            ))
         self._add_config(
             ConfigField(
                 'run_config_search_max_instance_count',
@@ -557,6 +583,74 @@ def _add_run_search_configs(self):
                 " configuration options.  'quick' will attempt to find a near-optimal"
                 " configuration as fast as possible, but isn't guaranteed to find the"
                 " best."))
+        self._add_config(
+            ConfigField(
+                'successive_halving_enable',
+                flags=['--successive-halving-enable'],
+                field_type=ConfigPrimitive(bool),
+                parser_args={'action': 'store_true'},
+                default_value=DEFAULT_SUCCESSIVE_HALVING_ENABLE,
+                description=
+                "Enables successive halving in brute search: every model config"
+                " is first screened with short measurements, and only the best"
+                " fraction of the model configs is fully profiled."))
+        self._add_config(
+            ConfigField(
+                'successive_halving_screening_concurrencies',
+                flags=['--successive-halving-screening-concurrencies'],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_SUCCESSIVE_HALVING_SCREENING_CONCURRENCIES,
+                description=
+                "Number of concurrencies, spread over the concurrency sweep,"
+                " that every model config is screened at."))
+        self._add_config(
+            ConfigField(
+                'successive_halving_screening_window',
+                flags=['--successive-halving-screening-window'],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_SUCCESSIVE_HALVING_SCREENING_WINDOW,
+                description=
+                "Time window in milliseconds of the screening measurements."))
+        self._add_config(
+            ConfigField(
+                'successive_halving_keep_fraction',
+                flags=['--successive-halving-keep-fraction'],
+                field_type=ConfigPrimitive(float),
+                default_value=DEFAULT_SUCCESSIVE_HALVING_KEEP_FRACTION,
+                description=
+                "Fraction of the screened model configs that are fully profiled."
+            ))
+        self._add_config(
+            ConfigField(
+                'concurrency_binary_search_enable',
+                flags=['--concurrency-binary-search-enable'],
+                field_type=ConfigPrimitive(bool),
+                parser_args={'action': 'store_true'},
+                default_value=DEFAULT_CONCURRENCY_BINARY_SEARCH_ENABLE,
+                description=
+                "When a model has a p99 latency constraint, binary search the"
+                " concurrency sweep for the highest concurrency meeting it instead"
+                " of sweeping every concurrency."))
+        self._add_config(
+            ConfigField(
+                'max_measurement_repeats',
+                flags=['--max-measurement-repeats'],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_MAX_MEASUREMENT_REPEATS,
+                description=
+                "Maximum number of times a measurement is taken while it is too"
+                " close to the best measurement of its models to be ranked."
+                " Repeated measurements are averaged, and ranked as ties while"
+                " their confidence intervals overlap."))
+        self._add_config(
+            ConfigField(
+                'measurement_repeat_tolerance',
+                flags=['--measurement-repeat-tolerance'],
+                field_type=ConfigPrimitive(float),
+                default_value=DEFAULT_MEASUREMENT_REPEAT_TOLERANCE,
+                description=
+                "Relative difference in the objectives from the best measurement"
+                " within which a measurement is repeated."))
         self._add_config(
             ConfigField('run_config_search_disable',
                         flags=['--run-config-search-disable'],
@@ -587,14 +681,16 @@ def _add_triton_configs(self):
                 field_type=ConfigPrimitive(str),
                 flags=['--triton-launch-mode'],
                 default_value=DEFAULT_TRITON_LAUNCH_MODE,
-                choices=['local', 'docker', 'remote', 'c_api'],
+                choices=['local', 'docker', 'remote', 'c_api', 'simulated'],
                 description="The method by which to launch Triton Server. "
                 "'local' assumes tritonserver binary is available locally. "
                 "'docker' pulls and launches a triton docker container with "
                 "the specified version. 'remote' connects to a running "
                 "server using given http, grpc and metrics endpoints. "
                 "'c_api' allows direct benchmarking of Triton locally"
-                "without the use of endpoints."))
+                "without the use of endpoints. 'simulated' replaces Triton "
+                "and perf_analyzer with a performance model, and needs no GPUs."
+            ))
         self._add_config(
             ConfigField('triton_docker_image',
                         flags=['--triton-docker-image'],
@@ -675,6 +771,40 @@ def _add_triton_configs(self):
                 description=
                 ("Path to Triton install directory i.e. the parent directory of 'lib/libtritonserver.so'."
                  "Required only when using triton_launch_mode=c_api.")))
+        self._add_config(
+            ConfigField(
+                'simulation_checkpoint',
+                field_type=ConfigPrimitive(str,
+                                           validator=file_path_validator),
+                flags=['--simulation-checkpoint'],
+                description=
+                ("Checkpoint file whose measurements are interpolated in "
+                 "triton_launch_mode=simulated. If not specified, a parametric "
+                 "queueing model is used.")))
+        self._add_config(
+            ConfigField(
+                'simulation_gpu_count',
+                field_type=ConfigPrimitive(int),
+                flags=['--simulation-gpu-count'],
+                default_value=DEFAULT_SIMULATION_GPU_COUNT,
+                description=
+                "Number of GPUs to simulate in triton_launch_mode=simulated."))
+        self._add_config(
+            ConfigField(
+                'simulation_noise',
+                field_type=ConfigPrimitive(float),
+                flags=['--simulation-noise'],
+                default_value=DEFAULT_SIMULATION_NOISE,
+                description=
+                ("Relative standard deviation of the noise added to simulated "
+                 "perf_analyzer measurements.")))
+        self._add_config(
+            ConfigField(
+                'simulation_seed',
+                field_type=ConfigPrimitive(int),
+                flags=['--simulation-seed'],
+                default_value=DEFAULT_SIMULATION_SEED,
+                description="Seed for the simulated measurement noise."))
 
     def _add_perf_analyzer_configs(self):
         """
@@ -697,6 +827,27 @@ def _add_perf_analyzer_configs(self):
                 DEFAULT_PERF_ANALYZER_CPU_UTIL,
                 description=
                 "Maximum CPU utilization value allowed for the perf_analyzer."))
+        self._add_config(
+            ConfigField(
+                'load_generator',
+                flags=['--load-generator'],
+                choices=['perf_analyzer', 'python'],
+                field_type=ConfigPrimitive(str),
+                default_value=DEFAULT_LOAD_GENERATOR,
+                description=
+                "The load generator that measures the models: the perf_analyzer"
+                " binary, or an in-process python load generator over gRPC."))
+        self._add_config(
+            ConfigField(
+                'perf_analyzer_shared_memory',
+                flags=['--perf-analyzer-shared-memory'],
+                choices=['auto', 'none', 'system', 'cuda'],
+                field_type=ConfigPrimitive(str),
+                default_value=DEFAULT_PERF_ANALYZER_SHARED_MEMORY,
+                description=
+                "The shared memory perf_analyzer passes the tensors through."
+                " 'auto' uses it for models with large tensors, when"
+                " perf_analyzer runs on the same host as the server."))
         self._add_config(
             ConfigField('perf_analyzer_path',
                         flags=['--perf-analyzer-path'],
@@ -733,6 +884,17 @@ def _add_perf_analyzer_configs(self):
                 description="Maximum number of times perf_analyzer is "
                 "launched with auto adjusted parameters in an attempt to profile a model. "
             ))
+        self._add_config(
+            ConfigField(
+                'collect_latency_histograms',
+                flags=['--collect-latency-histograms'],
+                parser_args={'action': 'store_true'},
+                field_type=ConfigPrimitive(bool),
+                default_value=DEFAULT_COLLECT_LATENCY_HISTOGRAMS,
+                description=
+                'Enables collecting the latency of every request from perf_analyzer,'
+                ' into a histogram per measurement. Needed for the latency percentiles'
+                ' perf_analyzer does not report, such as perf_latency_p999.'))
 
     def _add_export_configs(self):
         """
@@ -768,6 +930,16 @@ def _add_export_configs(self):
                 field_type=ConfigPrimitive(str),
                 default_value=DEFAULT_FILENAME_SERVER_ONLY,
                 description='Specifies filename for server-only metrics'))
+        self._add_config(
+            ConfigField(
+                'measurement_export_formats',
+                flags=['--measurement-export-formats'],
+                field_type=ConfigListString(
+                    validator=measurement_export_formats_validator),
+                default_value=DEFAULT_MEASUREMENT_EXPORT_FORMATS,
+                description=
+                'Comma delimited list of the formats (csv, parquet, arrow) to export all of the'
+                ' measurements in, with typed columns. Parquet and arrow require pyarrow.'))
 
     def _add_report_configs(self):
         """
@@ -791,6 +963,25 @@ def _add_report_configs(self):
                 description=
                 'Model Analyzer will compare this many of the top models configs across all models.'
             ))
+        self._add_config(
+            ConfigField(
+                'num_report_workers',
+                flags=['--num-report-workers'],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_NUM_REPORT_WORKERS,
+                description=
+                'The number of processes plots and reports are rendered on. 0 uses one per CPU,'
+                ' 1 renders them in the Model Analyzer process.'))
+        self._add_config(
+            ConfigField(
+                'plot_data_formats',
+                flags=['--plot-data-formats'],
+                field_type=ConfigListString(
+                    validator=plot_data_formats_validator),
+                default_value=DEFAULT_PLOT_DATA_FORMATS,
+                description=
+                'Comma delimited list of the formats (csv, json) to also export the data'
+                ' of every plot in, next to its image.'))
 
     def _add_table_configs(self):
         """
@@ -952,10 +1143,51 @@ def _preprocess_and_verify_arguments(self):
                     "Triton launch mode is set to C_API, triton logs are not supported. "
                     "Triton server error output can be obtained by setting perf_output_path."
                 )
+        if not 0 < self.successive_halving_keep_fraction <= 1:
+            raise TritonModelAnalyzerException(
+                "successive_halving_keep_fraction must be greater than 0 "
+                "and at most 1.")
+
+        if self.successive_halving_screening_concurrencies < 1:
+            raise TritonModelAnalyzerException(
+                "successive_halving_screening_concurrencies must be at least 1.")
+
+        if self.load_generator == 'python' and (
+                self.client_protocol != 'grpc' or
+                self.triton_launch_mode == 'c_api'):
+            raise TritonModelAnalyzerException(
+                "The python load generator requires the grpc client protocol"
+                " and a launch mode other than c_api.")
+
+        if self.perf_analyzer_shared_memory in ['system', 'cuda'] and (
+                self.load_generator == 'python' or
+                self.triton_launch_mode == 'c_api'):
+            raise TritonModelAnalyzerException(
+                "perf_analyzer_shared_memory requires the perf_analyzer"
+                " load generator and a launch mode other than c_api.")
+
+        if self.gpu_price_per_hour < 0:
+            raise TritonModelAnalyzerException(
+                "gpu_price_per_hour must not be negative.")
+
+        if self.max_measurement_repeats < 1:
+            raise TritonModelAnalyzerException(
+                "max_measurement_repeats must be at least 1.")
+
+        if self.run_config_search_min_request_rate < 1:
+            raise TritonModelAnalyzerException(
+                "run_config_search_min_request_rate must be at least 1.")
+
+        if self.request_trace and (self.request_rate_search_enable or
+                                   self.request_rate):
+            raise TritonModelAnalyzerException(
+                "A request trace cannot be replayed when searching request rates.")
+
         # If run config search is disabled and no concurrency value is provided,
-        # set the default value.
+        # set the default value, unless request rates are profiled instead
         if self.run_config_search_disable:
-            if len(self.concurrency) == 0:
+            if len(self.concurrency) == 0 and not (
+                    self.request_rate or self.request_rate_search_enable):
                 self.concurrency = [1]
 
         # Change default RCS mode to quick for multi-model concurrent profiling
@@ -981,10 +1213,39 @@ def _autofill_values(self):
         Fill in the implied or default
         config values.
         """
+        # Reading the GPUs is slow, so only do it when they are checked
+        from model_analyzer.device.gpu_inventory import GPUInventory
+
         cpu_only = False
-        if len(self.gpus) == 0 or not cuda.is_available():
+        if self.triton_launch_mode == 'simulated':
+            cpu_only = self.simulation_gpu_count == 0
+        elif len(self.gpus) == 0 or not GPUInventory.get().is_available():
             cpu_only = True
 
+        # A replayed trace sets the load, so configs are
+        # scored on tail latency unless told otherwise
+        if self.request_trace and self.objectives == DEFAULT_ONLINE_OBJECTIVES:
+            self._fields['objectives'].set_value({'perf_latency_p99': 10})
+
+        # Report the request rate or the replayed request intervals in
+        # place of the concurrency, unless the output fields were
+        # chosen by the user
+        load_field = None
+        if self.request_rate_search_enable or self.request_rate:
+            load_field = 'request_rate'
+        elif self.request_trace:
+            load_field = 'request_intervals'
+        if load_field:
+            for output_fields, default_output_fields in [
+                ('inference_output_fields', DEFAULT_INFERENCE_OUTPUT_FIELDS),
+                ('gpu_output_fields', DEFAULT_GPU_OUTPUT_FIELDS)
+            ]:
+                if self._fields[output_fields].value() == default_output_fields:
+                    self._fields[output_fields].set_value([
+                        load_field if field == 'concurrency' else field
+                        for field in default_output_fields
+                    ])
+
         # Set global constraints if latency budget is specified
         if self.latency_budget:
             if self.constraints:
@@ -1071,24 +1332,25 @@ def _autofill_values(self):
                         }
                     }
 
-            # Run parameters
-            if not model.parameters():
-                new_model['parameters'] = {
-                    'batch_sizes': self.batch_sizes,
-                    'concurrency': self.concurrency
-                }
-            elif 'batch_sizes' not in model.parameters():
-                new_model['parameters'] = {
-                    'batch_sizes': self.batch_sizes,
-                    'concurrency': model.parameters()['concurrency']
-                }
-            elif 'concurrency' not in model.parameters():
-                new_model['parameters'] = {
-                    'batch_sizes': model.parameters()['batch_sizes'],
-                    'concurrency': self.concurrency
-                }
-            else:
-                new_model['parameters'] = model.parameters()
+            # Run parameters, a model's own concurrencies or request
+            # rates take precedence over the global ones of either
+            model_parameters = model.parameters() or {}
+            new_model['parameters'] = {
+                'batch_sizes':
+                    self.batch_sizes,
+                'concurrency':
+                    [] if 'request_rate' in model_parameters else
+                    self.concurrency
+            }
+            if self.request_rate and 'concurrency' not in model_parameters:
+                new_model['parameters']['request_rate'] = self.request_rate
+            new_model['parameters'].update(model_parameters)
+
+            if new_model['parameters']['concurrency'] and new_model[
+                    'parameters'].get('request_rate'):
+                raise TritonModelAnalyzerException(
+                    f"Model {model.model_name()} cannot be profiled with both "
+                    "a list of concurrencies and a list of request rates.")
 
             # Perf analyzer flags
             if not model.perf_analyzer_flags():
@@ -1119,3 +1381,25 @@ def _autofill_values(self):
 
             new_profile_models[model.model_name()] = new_model
         self._fields['profile_models'].set_value(new_profile_models)
+
+        # Percentiles only a latency histogram has are
+        # collected whenever any of them are asked for
+        requested_tags = self._get_requested_tags(new_profile_models.values())
+        if not self.collect_latency_histograms and any(
+                tag in requested_tags
+                for tag in PerfAnalyzer.get_histogram_metric_tags()):
+            self._fields['collect_latency_histograms'].set_value(True)
+
+        if not self.gpu_price_per_hour and \
+                'perf_inferences_per_dollar' in requested_tags:
+            raise TritonModelAnalyzerException(
+                "perf_inferences_per_dollar requires the gpu_price_per_hour"
+                " to be set.")
+
+    def _get_requested_tags(self, profile_models):
+        requested_tags = set(self.inference_output_fields)
+        for model in profile_models:
+            requested_tags.update(model['objectives'])
+            requested_tags.update(model.get('constraints') or {})
+
+        return requested_tags
@@ -15,7 +15,8 @@
 from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.model_analyzer_exceptions \
     import TritonModelAnalyzerException
-from model_analyzer.config.input.config_utils import file_path_validator, parent_path_validator
+from model_analyzer.config.input.config_utils import file_path_validator, parent_path_validator, \
+    plot_data_formats_validator
 from .config_union import ConfigUnion
 from .config_object import ConfigObject
 from .config_enum import ConfigEnum
@@ -23,7 +24,8 @@
 from .config_list_string import ConfigListString
 from .config_defaults import \
     DEFAULT_CHECKPOINT_DIRECTORY, DEFAULT_EXPORT_PATH, \
-    DEFAULT_OFFLINE_REPORT_PLOTS, DEFAULT_ONLINE_REPORT_PLOTS, DEFAULT_REPORT_FORMAT
+    DEFAULT_OFFLINE_REPORT_PLOTS, DEFAULT_ONLINE_REPORT_PLOTS, DEFAULT_REPORT_FORMAT, \
+    DEFAULT_NUM_REPORT_WORKERS, DEFAULT_PLOT_DATA_FORMATS
 from .config_field import ConfigField
 from .config_primitive import ConfigPrimitive
 from .config_command import ConfigCommand
@@ -137,6 +139,25 @@ def _fill_config(self):
                             ConfigListString()
                         ]),
                         description='Output file format for detailed report.'))
+        self._add_config(
+            ConfigField(
+                'num_report_workers',
+                flags=['--num-report-workers'],
+                field_type=ConfigPrimitive(int),
+                default_value=DEFAULT_NUM_REPORT_WORKERS,
+                description=
+                'The number of processes plots and reports are rendered on. 0 uses one per CPU,'
+                ' 1 renders them in the Model Analyzer process.'))
+        self._add_config(
+            ConfigField(
+                'plot_data_formats',
+                flags=['--plot-data-formats'],
+                field_type=ConfigListString(
+                    validator=plot_data_formats_validator),
+                default_value=DEFAULT_PLOT_DATA_FORMATS,
+                description=
+                'Comma delimited list of the formats (csv, json) to also export the data'
+                ' of every plot in, next to its image.'))
 
     def set_config_values(self, args):
         """
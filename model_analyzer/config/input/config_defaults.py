@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os
+from typing import List
 
 #
 # Common defaults
@@ -33,14 +34,19 @@
 DEFAULT_LOG_LEVEL = 'INFO'
 DEFAULT_GPUS = 'all'
 DEFAULT_SKIP_SUMMARY_REPORTS = False
+DEFAULT_DRY_RUN = False
 DEFAULT_OUTPUT_MODEL_REPOSITORY = os.path.join(os.getcwd(),
                                                'output_model_repository')
 DEFAULT_OVERRIDE_OUTPUT_REPOSITORY_FLAG = False
+DEFAULT_PRUNE_OUTPUT_REPOSITORY_FLAG = False
 DEFAULT_BATCH_SIZES = 1
 DEFAULT_MAX_RETRIES = 50
 DEFAULT_CLIENT_PROTOCOL = 'grpc'
 DEFAULT_RUN_CONFIG_MAX_CONCURRENCY = 1024
 DEFAULT_RUN_CONFIG_MIN_CONCURRENCY = 1
+DEFAULT_RUN_CONFIG_MAX_REQUEST_RATE = 8192
+DEFAULT_RUN_CONFIG_MIN_REQUEST_RATE = 16
+DEFAULT_REQUEST_RATE_SEARCH_ENABLE = False
 DEFAULT_RUN_CONFIG_MAX_INSTANCE_COUNT = 5
 DEFAULT_RUN_CONFIG_MIN_INSTANCE_COUNT = 1
 DEFAULT_RUN_CONFIG_MIN_MODEL_BATCH_SIZE = 1
@@ -48,6 +54,16 @@
 DEFAULT_RUN_CONFIG_SEARCH_DISABLE = False
 DEFAULT_RUN_CONFIG_SEARCH_MODE = 'brute'
 DEFAULT_RUN_CONFIG_PROFILE_MODELS_CONCURRENTLY_ENABLE = False
+DEFAULT_SUCCESSIVE_HALVING_ENABLE = False
+DEFAULT_SUCCESSIVE_HALVING_SCREENING_CONCURRENCIES = 2
+DEFAULT_SUCCESSIVE_HALVING_SCREENING_WINDOW = 1000
+DEFAULT_SUCCESSIVE_HALVING_KEEP_FRACTION = 0.5
+DEFAULT_CONCURRENCY_BINARY_SEARCH_ENABLE = False
+DEFAULT_MAX_MEASUREMENT_REPEATS = 1
+DEFAULT_MEASUREMENT_REPEAT_TOLERANCE = 0.05
+DEFAULT_LOAD_GENERATOR = 'perf_analyzer'
+DEFAULT_PERF_ANALYZER_SHARED_MEMORY = 'auto'
+DEFAULT_GPU_PRICE_PER_HOUR = 0
 DEFAULT_TRITON_LAUNCH_MODE = 'local'
 DEFAULT_TRITON_DOCKER_IMAGE = 'nvcr.io/nvidia/tritonserver:23.02-py3'
 DEFAULT_TRITON_HTTP_ENDPOINT = 'localhost:8000'
@@ -55,11 +71,15 @@
 DEFAULT_TRITON_METRICS_URL = 'http://localhost:8002/metrics'
 DEFAULT_TRITON_SERVER_PATH = 'tritonserver'
 DEFAULT_TRITON_INSTALL_PATH = '/opt/tritonserver'
+DEFAULT_SIMULATION_GPU_COUNT = 1
+DEFAULT_SIMULATION_NOISE = 0.0
+DEFAULT_SIMULATION_SEED = 0
 DEFAULT_PERF_ANALYZER_TIMEOUT = 600
 DEFAULT_PERF_ANALYZER_CPU_UTIL = 80.0
 DEFAULT_PERF_ANALYZER_PATH = 'perf_analyzer'
 DEFAULT_PERF_OUTPUT_FLAG = False
 DEFAULT_PERF_MAX_AUTO_ADJUSTS = 10
+DEFAULT_COLLECT_LATENCY_HISTOGRAMS = False
 DEFAULT_MEASUREMENT_MODE = 'count_windows'
 
 DEFAULT_ONLINE_PLOTS = {
@@ -99,6 +119,7 @@
 DEFAULT_FILENAME_MODEL_INFERENCE = 'metrics-model-inference.csv'
 DEFAULT_FILENAME_MODEL_GPU = 'metrics-model-gpu.csv'
 DEFAULT_FILENAME_SERVER_ONLY = 'metrics-server-only.csv'
+DEFAULT_MEASUREMENT_EXPORT_FORMATS: List[str] = []
 
 DEFAULT_INFERENCE_OUTPUT_FIELDS = [
     'model_name', 'batch_size', 'concurrency', 'model_config_path',
@@ -117,6 +138,8 @@
 
 DEFAULT_NUM_CONFIGS_PER_MODEL = 3
 DEFAULT_NUM_TOP_MODEL_CONFIGS = 0
+DEFAULT_NUM_REPORT_WORKERS = 0
+DEFAULT_PLOT_DATA_FORMATS: List[str] = []
 
 #
 # Report Config defaults
@@ -106,6 +106,55 @@ def file_path_validator(path):
             "not have permissions to execute os.stat on this path")
 
 
+def plot_data_formats_validator(data_formats):
+    """
+    Checks that every plot data format is supported
+
+    Parameters
+    ----------
+    data_formats: list of str
+        The formats to export the plot data in
+
+    Returns
+    -------
+    ConfigStatus
+    """
+
+    for data_format in data_formats:
+        if data_format.strip() not in ['csv', 'json']:
+            return ConfigStatus(
+                status=CONFIG_PARSER_FAILURE,
+                message=f"Plot data format '{data_format}' is not supported."
+                " The supported formats are 'csv' and 'json'")
+
+    return ConfigStatus(status=CONFIG_PARSER_SUCCESS)
+
+
+def measurement_export_formats_validator(export_formats):
+    """
+    Checks that every measurement export format is supported
+
+    Parameters
+    ----------
+    export_formats: list of str
+        The formats to export the measurements in
+
+    Returns
+    -------
+    ConfigStatus
+    """
+
+    for export_format in export_formats:
+        if export_format.strip() not in ['csv', 'parquet', 'arrow']:
+            return ConfigStatus(
+                status=CONFIG_PARSER_FAILURE,
+                message=
+                f"Measurement export format '{export_format}' is not supported."
+                " The supported formats are 'csv', 'parquet' and 'arrow'")
+
+    return ConfigStatus(status=CONFIG_PARSER_SUCCESS)
+
+
 ##################
 # Output mappers #
 ##################
@@ -12,9 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict, Iterator
+
 from google.protobuf.descriptor import FieldDescriptor
 from model_analyzer.model_analyzer_exceptions \
     import TritonModelAnalyzerException
+from ..config_primitive import ConfigPrimitive
+from ..config_object import ConfigObject
+from ..config_list_generic import ConfigListGeneric
+from ..config_union import ConfigUnion
+from ..config_none import ConfigNone
+from ..config_sweep import ConfigSweep
+from ..config_enum import ConfigEnum
 
 
 def is_protobuf_type_primitive(protobuf_type):
@@ -97,3 +108,110 @@ def protobuf_to_config_type(protobuf_type):
         return int
     else:
         return False
+
+
+def resolve_protobuf_field(field: FieldDescriptor) -> ConfigSweep:
+    """
+    Recursively resolve protobuf fields.
+
+    Parameters
+    ----------
+    field : google.protobuf.pyext._message.FieldDescriptor
+
+    Returns
+    -------
+    ConfigValue
+        A config type equivalent to the protobuf type.
+
+    Raises
+    ------
+    TritonModelAnalyzerException
+        If the protobuf config field cannot be resolved, this exception
+        will be raised.
+    """
+
+    if is_protobuf_type_primitive(field.type):
+        config_type = protobuf_to_config_type(field.type)
+
+        # If it is a repeated field, we should use ConfigListGeneric
+        if field.label == FieldDescriptor.LABEL_REPEATED:
+            config_type = ConfigListGeneric(ConfigPrimitive(config_type))
+        else:
+            config_type = ConfigPrimitive(config_type)
+
+    elif field.type == FieldDescriptor.TYPE_MESSAGE:
+        # If the field type is TYPE_MESSAGE, we need to create a new
+        # message of type ConfigObject
+        sub_field_schema = {}
+
+        # Custom handling for map field
+        # TODO: Add support for types in the keys
+        if field.message_type.has_options and field.message_type.GetOptions(
+        ).map_entry:
+            value_field_type = resolve_protobuf_field(
+                field.message_type.fields_by_name['value'])
+            sub_field_schema['*'] = value_field_type
+            config_type = ConfigObject(schema=sub_field_schema)
+
+        else:
+            fields = field.message_type.fields
+            for sub_field in fields:
+                sub_field_schema[sub_field.name] = resolve_protobuf_field(
+                    sub_field)
+            if field.label == FieldDescriptor.LABEL_REPEATED:
+                config_type = ConfigListGeneric(
+                    ConfigObject(schema=sub_field_schema))
+            else:
+                config_type = ConfigObject(schema=sub_field_schema)
+    elif field.type == FieldDescriptor.TYPE_ENUM:
+        choices = []
+        enum_values = field.enum_type.values
+        for enum_value in enum_values:
+            choices.append(enum_value.name)
+        config_type = ConfigEnum(choices)
+    else:
+        raise TritonModelAnalyzerException(
+            'The current version of Model Config is not supported by Model Analyzer.'
+        )
+
+    return ConfigSweep(ConfigUnion([config_type, ConfigNone()]))
+
+
+@lru_cache(maxsize=None)
+def get_model_config_schema() -> Dict[str, ConfigSweep]:
+    """
+    Returns the schema of every field of the ModelConfig protobuf.
+    It is resolved once per process and then reused.
+    """
+
+    # The protobufs pull in the tritonclient (and grpc) packages,
+    # so they are only imported when the schema is first needed
+    from tritonclient.grpc.model_config_pb2 import ModelConfig
+
+    schema = {}
+    for field in ModelConfig.DESCRIPTOR.fields:
+        schema[field.name] = resolve_protobuf_field(field)
+
+    return schema
+
+
+class ModelConfigSchema(Mapping):
+    """
+    A read-only schema of the ModelConfig protobuf fields, which is
+    only resolved the first time one of its keys is looked up
+    (i.e. when model config parameters are specified)
+    """
+
+    def __getitem__(self, key: str) -> ConfigSweep:
+        return get_model_config_schema()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(get_model_config_schema())
+
+    def __len__(self) -> int:
+        return len(get_model_config_schema())
+
+    def __deepcopy__(self, memo):
+        # The schema is never modified (values are set on deep copies
+        # of its entries), so it can be shared between copies
+        return self
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from model_analyzer.constants import LOGGER_NAME
 import logging
@@ -110,14 +110,44 @@ def representation(self) -> str:
 
         return self.perf_config().representation()
 
+    @staticmethod
+    def get_max_batch_size(model_config: Dict) -> int:
+        """
+        Returns the max batch size of a model config dict
+        """
+        return model_config[
+            'max_batch_size'] if 'max_batch_size' in model_config else ModelRunConfig.DEFAULT_MAX_BATCH_SIZE
+
+    @staticmethod
+    def get_max_preferred_batch_size(model_config: Dict) -> Optional[int]:
+        """
+        Returns the largest preferred batch size of a model
+        config dict, or None if there are none
+        """
+        dynamic_batching = model_config.get('dynamic_batching')
+        if dynamic_batching and dynamic_batching.get('preferred_batch_size'):
+            return max(dynamic_batching['preferred_batch_size'])
+
+        return None
+
+    @staticmethod
+    def is_legal_preferred_batch_size(model_config: Dict) -> bool:
+        """
+        Returns false if the maximum preferred batch size of
+        a model config dict is greater than its max batch size
+        """
+        max_preferred_batch_size = ModelRunConfig.get_max_preferred_batch_size(
+            model_config)
+
+        return max_preferred_batch_size is None or ModelRunConfig.get_max_batch_size(
+            model_config) >= max_preferred_batch_size
+
     def _check_for_client_vs_model_batch_size(self):
         """
         Returns false if client batch size is greater than model batch size. Else true
         """
-        model_config = self._model_config.get_config()
-
-        max_batch_size = model_config[
-            'max_batch_size'] if 'max_batch_size' in model_config else self.DEFAULT_MAX_BATCH_SIZE
+        max_batch_size = self.get_max_batch_size(
+            self._model_config.get_config())
         perf_batch_size = self._perf_config[
             'batch-size'] if 'batch-size' in self._perf_config else self.DEFAULT_PERF_BATCH_SIZE
 
@@ -133,7 +163,6 @@ def _check_for_preferred_vs_model_batch_size(self):
         """
         Returns false if maximum of preferred batch size is greater than model batch size. Else true
         """
-        legal = True
         ensemble_subconfigs = [
             subconfig.get_config() for subconfig in self._ensemble_subconfigs
         ]
@@ -142,22 +171,13 @@ def _check_for_preferred_vs_model_batch_size(self):
         ]
 
         for model_config in model_configs:
-            max_batch_size = model_config[
-                'max_batch_size'] if 'max_batch_size' in model_config else self.DEFAULT_MAX_BATCH_SIZE
+            if not self.is_legal_preferred_batch_size(model_config):
+                logger.debug(
+                    f"Illegal model run config because maximum of {model_config['name']}'s preferred batch size {self.get_max_preferred_batch_size(model_config)} is greater than model max batch size {self.get_max_batch_size(model_config)}"
+                )
+                return False
 
-            if 'dynamic_batching' in model_config and 'preferred_batch_size' in model_config[
-                    'dynamic_batching']:
-                max_preferred_batch_size = max(
-                    model_config['dynamic_batching']['preferred_batch_size'])
-                legal = max_batch_size >= max_preferred_batch_size
-
-                if not legal:
-                    logger.debug(
-                        f"Illegal model run config because maximum of {model_config['name']}'s preferred batch size {max_preferred_batch_size} is greater than model max batch size {max_batch_size}"
-                    )
-                    return legal
-
-        return legal
+        return True
 
     def is_legal_combination(self):
         """
@@ -14,6 +14,8 @@
 
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 
+import sys
+
 
 class RunConfig:
     """
@@ -33,6 +35,14 @@ def __init__(self, triton_env):
         self._triton_env = triton_env
         self._model_run_configs = []
 
+        # The model run config representations the
+        # cached representation was joined from
+        self._representation_parts = ()
+        self._representation = ''
+
+        # Screening runs only inform the generators, and are not checkpointed
+        self._screening = False
+
     def add_model_run_config(self, model_run_config):
         """
         Add a ModelRunConfig to this RunConfig
@@ -50,8 +60,28 @@ def representation(self):
         Returns a representation string for the RunConfig that can be used
         as a key to uniquely identify it
         """
-        return ''.join(
-            [mrc.representation() for mrc in self.model_run_configs()])
+        representation_parts = tuple(
+            mrc.representation() for mrc in self.model_run_configs())
+
+        # The parts are interned, so this is usually an identity comparison
+        if representation_parts != self._representation_parts:
+            self._representation_parts = representation_parts
+            self._representation = sys.intern(''.join(representation_parts))
+
+        return self._representation
+
+    def set_screening(self, screening):
+        """
+        Marks the RunConfig as a screening run, whose measurement
+        is only used by the generators and is not stored
+        """
+        self._screening = screening
+
+    def is_screening(self):
+        """
+        Returns true if the RunConfig is a screening run
+        """
+        return self._screening
 
     def is_legal_combination(self):
         """
@@ -105,6 +135,19 @@ def ensemble_subconfigs(self):
         """
         return self._model_run_configs[0].ensemble_subconfigs()
 
+    def to_dict(self):
+        """
+        Returns
+        -------
+        dict
+            The checkpointed state of the RunConfig
+        """
+
+        return {
+            '_triton_env': self._triton_env,
+            '_model_run_configs': self._model_run_configs
+        }
+
     @classmethod
     def from_dict(cls, run_config_dict):
         run_config = RunConfig({})
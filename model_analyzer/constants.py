@@ -33,6 +33,10 @@
 THROUGHPUT_MINIMUM_CONSECUTIVE_CONCURRENCY_TRIES = 4
 THROUGHPUT_MINIMUM_CONSECUTIVE_BATCH_SIZE_TRIES = 4
 
+# Fraction of the offered request rate (in inferences) that must be
+# achieved, below which the model is considered to be saturated
+REQUEST_RATE_MINIMUM_ACHIEVED_FRACTION = 0.9
+
 # Quick search algorithm constants
 RADIUS = 3
 MIN_INITIALIZED = 3
@@ -54,6 +58,13 @@
 # Triton Server
 SERVER_OUTPUT_TIMEOUT_SECS = 5
 
+# Simulated launch mode
+SIMULATED_GPU_NAME = "Simulated GPU"
+SIMULATED_GPU_MEMORY_MB = 16000
+
+# GPUs read from a remote Triton's metrics, which don't report names
+REMOTE_GPU_NAME = "Remote GPU"
+
 # Logging
 LOGGER_NAME = "model_analyzer_logger"
 
@@ -12,13 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.constants import LOGGER_NAME, SIMULATED_GPU_NAME
 from model_analyzer.device.gpu_device import GPUDevice
-import model_analyzer.monitor.dcgm.dcgm_agent as dcgm_agent
-import model_analyzer.monitor.dcgm.dcgm_structs as structs
+from model_analyzer.device.gpu_inventory import GPUInventory
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 
-import numba.cuda
 import logging
 
 logger = logging.getLogger(LOGGER_NAME)
@@ -29,50 +27,62 @@ class GPUDeviceFactory:
     Factory class for creating GPUDevices
     """
 
-    def __init__(self):
+    def __init__(self, inventory=None):
+        """
+        Parameters
+        ----------
+        inventory : GPUInventory
+            The GPUs to create devices for. Defaults to
+            the inventory of the process
+        """
+
+        self._inventory = inventory if inventory else GPUInventory.get()
         self._devices = []
         self._devices_by_bus_id = {}
         self._devices_by_uuid = {}
         self.init_all_devices()
 
-    def init_all_devices(self, dcgmPath=None):
+    def init_all_devices(self):
         """
-        Create GPUDevice objects for all DCGM visible
-        devices.
-
-        Parameters
-        ----------
-        dcgmPath : str
-            Absolute path to dcgm shared library
+        Create GPUDevice objects for all the
+        devices in the inventory
         """
 
-        if numba.cuda.is_available():
+        if self._inventory.is_available():
             logger.info("Initializing GPUDevice handles")
-            structs._dcgmInit(dcgmPath)
-            dcgm_agent.dcgmInit()
 
-            # Start DCGM in the embedded mode to use the shared library
-            dcgm_handle = dcgm_agent.dcgmStartEmbedded(
-                structs.DCGM_OPERATION_MODE_MANUAL)
+        for device_info in self._inventory.get_devices():
+            gpu_device = GPUDevice(device_info['name'],
+                                   device_info['device_id'],
+                                   device_info['pci_bus_id'],
+                                   device_info['uuid'])
 
-            # Create a GPU device for every supported DCGM device
-            dcgm_device_ids = dcgm_agent.dcgmGetAllSupportedDevices(dcgm_handle)
+            self._devices.append(gpu_device)
+            self._devices_by_bus_id[device_info['pci_bus_id']] = gpu_device
+            self._devices_by_uuid[device_info['uuid']] = gpu_device
+
+    @staticmethod
+    def create_simulated_gpus(count):
+        """
+        Create GPUDevice objects for GPUs that do not
+        exist, to be used in the simulated launch mode
 
-            for device_id in dcgm_device_ids:
-                device_atrributes = dcgm_agent.dcgmGetDeviceAttributes(
-                    dcgm_handle, device_id).identifiers
-                pci_bus_id = device_atrributes.pciBusId.decode('utf-8').upper()
-                device_uuid = str(device_atrributes.uuid, encoding='utf-8')
-                device_name = str(device_atrributes.deviceName,
-                                  encoding='utf-8')
-                gpu_device = GPUDevice(device_name, device_id, pci_bus_id,
-                                       device_uuid)
+        Parameters
+        ----------
+        count : int
+            Number of simulated GPUs
 
-                self._devices.append(gpu_device)
-                self._devices_by_bus_id[pci_bus_id] = gpu_device
-                self._devices_by_uuid[device_uuid] = gpu_device
+        Returns
+        -------
+        List of GPUDevices
+        """
 
-            dcgm_agent.dcgmShutdown()
+        return [
+            GPUDevice(SIMULATED_GPU_NAME, device_id,
+                      f'00000000:{device_id:02X}:00.0',
+                      f'GPU-simulated-{device_id}')
+            for device_id in range(count)
+        ]
 
     def get_device_by_bus_id(self, bus_id, dcgmPath=None):
         """
@@ -120,19 +130,12 @@ def get_device_by_cuda_index(self, index):
             If the index is out of bound.
         """
 
-        devices = numba.cuda.list_devices()
+        self._inventory.check_cuda_device_order()
+        devices = self._inventory.get_cuda_visible_devices()
         if index > len(devices) - 1:
             raise IndexError
 
-        cuda_device = devices[index]
-        device_identity = cuda_device.get_device_identity()
-        pci_domain_id = device_identity['pci_domain_id']
-        pci_device_id = device_identity['pci_device_id']
-        pci_bus_id = device_identity['pci_bus_id']
-        device_bus_id = \
-            f'{pci_domain_id:08X}:{pci_bus_id:02X}:{pci_device_id:02X}.0'
-
-        return self.get_device_by_bus_id(device_bus_id)
+        return self.get_device_by_uuid(devices[index]['uuid'])
 
     def get_device_by_uuid(self, uuid, dcgmPath=None):
         """
@@ -163,7 +166,7 @@ def get_device_by_uuid(self, uuid, dcgmPath=None):
     def verify_requested_gpus(self, requested_gpus):
         """
         Creates a list of GPU UUIDs corresponding to the GPUs visible to
-        numba.cuda among the requested gpus
+        CUDA among the requested gpus
 
         Parameters
         ----------
@@ -223,19 +226,10 @@ def get_cuda_visible_gpus(self):
             UUIDs of the DCGM supported devices visible to CUDA
         """
 
-        cuda_visible_gpus = []
-        if numba.cuda.is_available():
-            for cuda_device in numba.cuda.list_devices():
-                try:
-                    cuda_visible_gpus.append(
-                        self.get_device_by_cuda_index(cuda_device.id))
-                except TritonModelAnalyzerException:
-                    # Device not supported by DCGM, log warning
-                    logger.warning(
-                        f"Device '{str(cuda_device.name, encoding='ascii')}' with "
-                        f"cuda device id {cuda_device.id} is not supported by DCGM."
-                    )
-        return cuda_visible_gpus
+        return [
+            self.get_device_by_uuid(device_info['uuid'])
+            for device_info in self._inventory.get_cuda_visible_devices()
+        ]
 
     def _log_gpus_used(self, gpus):
         """
@@ -0,0 +1,291 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from model_analyzer.constants import LOGGER_NAME, REMOTE_GPU_NAME
+import model_analyzer.monitor.dcgm.dcgm_agent as dcgm_agent
+import model_analyzer.monitor.dcgm.dcgm_structs as structs
+
+from prometheus_client.parser import text_string_to_metric_families
+import requests
+import logging
+import os
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# A device is described by a dict with the keys:
+#   device_id (int), name (str), pci_bus_id (str), uuid (str)
+#   and total_memory (int, in bytes)
+DeviceInfo = Dict[str, Any]
+
+
+class GPUDeviceBackend(ABC):
+    """
+    Interface for the sources of GPU device attributes
+    """
+
+    # Whether the GPUs are those of this machine (and
+    # so are subject to CUDA_VISIBLE_DEVICES)
+    is_local = True
+
+    @abstractmethod
+    def get_devices(self) -> List[DeviceInfo]:
+        """
+        Returns
+        -------
+        List of DeviceInfo
+            The attributes of every GPU, ordered by device id
+        """
+
+
+class DCGMDeviceBackend(GPUDeviceBackend):
+    """
+    Reads the GPU attributes from DCGM, using a single embedded session
+    (which does not create a CUDA context on the GPUs)
+    """
+
+    def __init__(self, dcgmPath: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+        dcgmPath : str
+            Absolute path to dcgm shared library
+        """
+
+        self._dcgm_path = dcgmPath
+
+    def get_devices(self) -> List[DeviceInfo]:
+        try:
+            structs._dcgmInit(self._dcgm_path)
+            dcgm_agent.dcgmInit()
+        except Exception as e:
+            logger.debug(f"DCGM is not available, no GPUs found: {e}")
+            return []
+
+        devices: List[DeviceInfo] = []
+        try:
+            # Start DCGM in the embedded mode to use the shared library
+            dcgm_handle = dcgm_agent.dcgmStartEmbedded(
+                structs.DCGM_OPERATION_MODE_MANUAL)
+
+            for device_id in dcgm_agent.dcgmGetAllSupportedDevices(
+                    dcgm_handle):
+                attributes = dcgm_agent.dcgmGetDeviceAttributes(
+                    dcgm_handle, device_id)
+                identifiers = attributes.identifiers
+
+                devices.append({
+                    'device_id': device_id,
+                    'name': self._to_str(identifiers.deviceName),
+                    'pci_bus_id': self._to_str(identifiers.pciBusId).upper(),
+                    'uuid': self._to_str(identifiers.uuid),
+                    # DCGM reports the framebuffer size in MiB
+                    'total_memory': int(attributes.memoryUsage.fbTotal) * 2**20
+                })
+        finally:
+            dcgm_agent.dcgmShutdown()
+
+        return devices
+
+    def _to_str(self, value: Any) -> str:
+        if isinstance(value, bytes):
+            return value.decode('utf-8')
+        return str(value)
+
+
+class TritonMetricsDeviceBackend(GPUDeviceBackend):
+    """
+    Reads the GPU attributes from the metrics page of a (remote)
+    Triton server. Only the UUIDs and total memory are reported there
+    """
+
+    is_local = False
+
+    def __init__(self, metrics_url: str) -> None:
+        """
+        Parameters
+        ----------
+        metrics_url : str
+            The URL of Triton's metrics endpoint
+        """
+
+        self._metrics_url = metrics_url
+
+    def get_devices(self) -> List[DeviceInfo]:
+        try:
+            metrics_page = str(requests.get(self._metrics_url,
+                                            timeout=10).content,
+                               encoding='ascii')
+        except requests.exceptions.RequestException as e:
+            logger.warning(
+                f"Unable to read the GPUs from {self._metrics_url}: {e}")
+            return []
+
+        devices: List[DeviceInfo] = []
+        for metric in text_string_to_metric_families(metrics_page):
+            if metric.name == 'nv_gpu_memory_total_bytes':
+                for sample in metric.samples:
+                    devices.append({
+                        'device_id': len(devices),
+                        'name': REMOTE_GPU_NAME,
+                        'pci_bus_id': '',
+                        'uuid': sample.labels['gpu_uuid'],
+                        'total_memory': int(sample.value)
+                    })
+
+        return devices
+
+
+class GPUInventory:
+    """
+    The attributes of the GPUs in the system, read once from a
+    GPUDeviceBackend and then shared by the whole process
+    """
+
+    _inventory: Optional['GPUInventory'] = None
+
+    def __init__(self, backend: GPUDeviceBackend) -> None:
+        """
+        Parameters
+        ----------
+        backend : GPUDeviceBackend
+            The source of the GPU attributes
+        """
+
+        self._devices = backend.get_devices()
+        self._is_local = backend.is_local
+        self._device_order_warning_printed = False
+
+    @classmethod
+    def get(cls) -> 'GPUInventory':
+        """
+        Returns the inventory of this process, reading it
+        from DCGM if no backend has been set
+        """
+
+        if cls._inventory is None:
+            cls._inventory = GPUInventory(DCGMDeviceBackend())
+        return cls._inventory
+
+    @classmethod
+    def set_backend(cls, backend: GPUDeviceBackend) -> 'GPUInventory':
+        """
+        Replaces the inventory of this process with one
+        read from the given backend
+        """
+
+        cls._inventory = GPUInventory(backend)
+        return cls._inventory
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Forgets the inventory of this process
+        """
+
+        cls._inventory = None
+
+    def is_available(self) -> bool:
+        """
+        Returns true if there are any GPUs
+        """
+
+        return len(self._devices) > 0
+
+    def get_devices(self) -> List[DeviceInfo]:
+        """
+        Returns the attributes of all of the GPUs
+        """
+
+        return list(self._devices)
+
+    def get_device(self, uuid: str) -> Optional[DeviceInfo]:
+        """
+        Returns the attributes of the GPU with
+        the given UUID, or None if there is none
+        """
+
+        for device in self._devices:
+            if device['uuid'] == uuid:
+                return device
+        return None
+
+    def get_cuda_visible_devices(self) -> List[DeviceInfo]:
+        """
+        Returns the GPUs visible to CUDA, in CUDA index order
+
+        GPUs are ordered by PCI bus id (the order of nvidia-smi, and of CUDA
+        with CUDA_DEVICE_ORDER=PCI_BUS_ID) and filtered by
+        CUDA_VISIBLE_DEVICES, which lists indices or (prefixes of) UUIDs.
+        As in CUDA, the list ends at the first entry that matches no GPU.
+        Remote GPUs are all visible
+
+        The processes Model Analyzer launches are given the GPUs by UUID,
+        with CUDA_DEVICE_ORDER=PCI_BUS_ID, so that their indices match
+        """
+
+        devices = sorted(self._devices, key=lambda device: device['pci_bus_id'])
+
+        visible_devices_env = os.environ.get('CUDA_VISIBLE_DEVICES')
+        if visible_devices_env is None or not self._is_local:
+            return devices
+
+        visible_devices: List[DeviceInfo] = []
+        for entry in visible_devices_env.split(','):
+            device = self._find_visible_device(entry.strip(), devices)
+            if device is None:
+                break
+            if device not in visible_devices:
+                visible_devices.append(device)
+
+        return visible_devices
+
+    def _find_visible_device(
+            self, entry: str,
+            devices: List[DeviceInfo]) -> Optional[DeviceInfo]:
+        if entry.isdigit():
+            self.check_cuda_device_order()
+            index = int(entry)
+            return devices[index] if index < len(devices) else None
+
+        if entry:
+            matches = [
+                device for device in devices
+                if device['uuid'].startswith(entry) or
+                device['uuid'].startswith(f'GPU-{entry}')
+            ]
+            if len(matches) == 1:
+                return matches[0]
+
+        return None
+
+    def check_cuda_device_order(self) -> None:
+        """
+        Warns, once, when CUDA indices of local GPUs are interpreted
+        in PCI bus order, but CUDA numbers the GPUs fastest first
+        """
+
+        if self._device_order_warning_printed or not self._is_local or \
+                len(self._devices) < 2 or \
+                os.environ.get('CUDA_DEVICE_ORDER') == 'PCI_BUS_ID':
+            return
+
+        self._device_order_warning_printed = True
+        logger.warning(
+            "GPU indices are interpreted in PCI bus order, but"
+            " CUDA_DEVICE_ORDER is not set to PCI_BUS_ID, so CUDA may number"
+            " the GPUs differently. Set CUDA_DEVICE_ORDER=PCI_BUS_ID, or"
+            " select the GPUs by UUID")
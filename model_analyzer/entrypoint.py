@@ -12,14 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from model_analyzer.device.gpu_device_factory import GPUDeviceFactory
-from .analyzer import Analyzer
+# The analyzer, devices and Triton client/server are only imported once a
+# subcommand runs, as they pull in slow to import packages (matplotlib,
+# docker, tritonclient) that --help and config errors don't need
 from .cli.cli import CLI
 from .model_analyzer_exceptions import TritonModelAnalyzerException
 from model_analyzer.constants import LOGGER_NAME
-from .triton.client.client_factory import TritonClientFactory
-from .triton.server.server_factory import TritonServerFactory
-from .state.analyzer_state_manager import AnalyzerStateManager
 from .config.input.config_command_profile import ConfigCommandProfile
 from .config.input.config_command_report import ConfigCommandReport
 from .log_formatter import setup_logging
@@ -43,7 +41,11 @@ def get_client_handle(config):
         Arguments parsed from the CLI
     """
 
-    if config.client_protocol == 'http':
+    from .triton.client.client_factory import TritonClientFactory
+
+    if config.triton_launch_mode == 'simulated':
+        client = TritonClientFactory.create_simulated_client()
+    elif config.client_protocol == 'http':
         http_ssl_options = get_http_ssl_options(config)
         client = TritonClientFactory.create_http_client(
             server_url=config.triton_http_endpoint,
@@ -110,7 +112,8 @@ def get_grpc_ssl_options(config):
 
 def get_triton_handles(config, gpus):
     """
-    Creates a TritonServer and starts it. Creates a TritonClient
+    Creates a TritonServer and starts it. Creates a TritonClient.
+    A dry run gets handles that never connect to or launch a server
 
     Parameters
     ----------
@@ -125,6 +128,14 @@ def get_triton_handles(config, gpus):
         Handles for triton client/server pair.
     """
 
+    from .triton.server.server_factory import TritonServerFactory
+
+    if config.dry_run:
+        # Nothing is measured, so neither a server nor a client is needed
+        from .triton.client.client_factory import TritonClientFactory
+        return (TritonClientFactory.create_simulated_client(),
+                TritonServerFactory.get_dry_run_server_handle(config))
+
     client = get_client_handle(config)
     fail_if_server_already_running(client, config)
     server = TritonServerFactory.get_server_handle(config, gpus)
@@ -203,10 +214,10 @@ def create_output_model_repository(config):
 def fail_if_server_already_running(client, config):
     """ 
     Checks if there is already a Triton server running
-    If there is and the launch mode is not 'remote' or 'c_api', throw an exception
-    Else, nothing will happen
+    If there is and the launch mode is not 'remote', 'c_api' or 'simulated',
+    throw an exception. Else, nothing will happen
     """
-    if config.triton_launch_mode == 'remote' or config.triton_launch_mode == "c_api":
+    if config.triton_launch_mode in ['remote', 'c_api', 'simulated']:
         return
 
     is_server_running = True
@@ -236,6 +247,9 @@ def main():
 
     logger.debug("\n%s", pformat(config.get_all_config()))
 
+    from .analyzer import Analyzer
+    from .state.analyzer_state_manager import AnalyzerStateManager
+
     # Launch subcommand handlers
     server = None
     try:
@@ -248,10 +262,21 @@ def main():
                 )
 
             # Set up devices
-            gpus = GPUDeviceFactory().verify_requested_gpus(config.gpus)
+            from .device.gpu_device_factory import GPUDeviceFactory
+            from .device.gpu_inventory import GPUInventory, TritonMetricsDeviceBackend
+            if config.triton_launch_mode == 'simulated':
+                gpus = GPUDeviceFactory.create_simulated_gpus(
+                    config.simulation_gpu_count)
+            else:
+                if config.triton_launch_mode == 'remote':
+                    # The GPUs are those of the remote server
+                    GPUInventory.set_backend(
+                        TritonMetricsDeviceBackend(config.triton_metrics_url))
+                gpus = GPUDeviceFactory().verify_requested_gpus(config.gpus)
 
             # Check/create output model repository
-            create_output_model_repository(config)
+            if not config.dry_run:
+                create_output_model_repository(config)
 
             client, server = get_triton_handles(config, gpus)
             state_manager = AnalyzerStateManager(config=config, server=server)
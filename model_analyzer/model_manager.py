@@ -97,8 +97,7 @@ def run_models(self, models: List[ConfigModelProfileSpec]) -> None:
         # Note: this is not done in config_commmand, because there isn't a ModelConfig yet,
         # so we cannot determine if the model is an ensemble
         self._check_for_ensemble_model_incompatability(models)
-
-        self._metrics_manager.start_new_model()
+        self._check_for_dry_run_incompatability()
 
         # Save the global server config and update the server's config for this model run
         server_config_copy = self._server.config().copy()
@@ -114,11 +113,15 @@ def run_models(self, models: List[ConfigModelProfileSpec]) -> None:
             result_manager=self._result_manager,
             model_variant_name_manager=self._model_variant_name_manager)
 
+        num_run_configs = 0
+        model_variants_names = set()
         for run_config in rcg.get_configs():
             if self._state_manager.exiting():
                 break
 
             if run_config.is_legal_combination():
+                num_run_configs += 1
+                model_variants_names.add(run_config.model_variants_name())
                 measurement = self._metrics_manager.execute_run_config(
                     run_config)
             else:
@@ -139,6 +142,12 @@ def run_models(self, models: List[ConfigModelProfileSpec]) -> None:
 
         self._metrics_manager.finalize()
 
+        if self._config.dry_run:
+            logger.info(
+                f"Dry run: the search space of {[model.model_name() for model in models]}"
+                f" has {num_run_configs} run configurations of {len(model_variants_names)}"
+                " model configurations")
+
         # Reset the server args to global config
         self._server.update_config(params=server_config_copy.server_args())
 
@@ -180,6 +189,13 @@ def _check_for_ensemble_model_incompatability(
                     else:
                         self._config.run_config_search_mode = 'quick'
 
+    def _check_for_dry_run_incompatability(self) -> None:
+        # Quick search has no fixed search space: where it goes depends on the measurements
+        if self._config.dry_run and self._config.run_config_search_mode == 'quick':
+            raise TritonModelAnalyzerException(
+                f'\nDry run is not supported in quick search mode'
+                '\nPlease use brute search mode (--run-config-search-mode brute)')
+
     def _init_state(self):
         """
         Sets ModelManager object managed
@@ -23,6 +23,7 @@
 from prometheus_client.parser import text_string_to_metric_families
 import requests
 import logging
+import time
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -60,8 +61,12 @@ def _monitoring_iteration(self):
         as possible
         """
 
+        # Records are time-stamped when they are
+        # requested, in nanoseconds like DCGM
+        timestamp = time.time_ns()
         self._metrics_responses.append(
-            str(requests.get(self._metrics_url).content, encoding='ascii'))
+            (timestamp,
+             str(requests.get(self._metrics_url).content, encoding='ascii')))
 
     def _collect_records(self):
         """
@@ -71,7 +76,7 @@ def _collect_records(self):
 
         records = []
 
-        for response in self._metrics_responses:
+        for timestamp, response in self._metrics_responses:
             metrics = text_string_to_metric_families(response)
             processed_gpu_used_memory = False
             calculate_free_memory_after_pass = False
@@ -84,34 +89,39 @@ def _collect_records(self):
                             processed_gpu_used_memory = True
                             gpu_memory_used_bytes = sample.value
                             self._create_and_add_record(
-                                records, sample, gpu_memory_used_bytes // 1.0e6)
+                                records, sample, gpu_memory_used_bytes // 1.0e6,
+                                timestamp)
                         elif sample.name == 'nv_gpu_memory_total_bytes':
                             if processed_gpu_used_memory:
                                 self._create_and_add_record(
                                     records, sample,
                                     (sample.value - gpu_memory_used_bytes) //
-                                    1.0e6)
+                                    1.0e6, timestamp)
                             else:
                                 total_memory_metric = metric
                                 calculate_free_memory_after_pass = True
                         elif sample.name == 'nv_gpu_utilization':
                             self._create_and_add_record(records, sample,
-                                                        sample.value * 100)
+                                                        sample.value * 100,
+                                                        timestamp)
                         else:
                             self._create_and_add_record(records, sample,
-                                                        sample.value)
+                                                        sample.value, timestamp)
             if calculate_free_memory_after_pass:
                 for sample in total_memory_metric.samples:
                     self._create_and_add_record(
                         records, sample,
-                        (sample.value - gpu_memory_used_bytes) // 1.0e6)
+                        (sample.value - gpu_memory_used_bytes) // 1.0e6,
+                        timestamp)
 
         return records
 
-    def _create_and_add_record(self, records, sample, sample_value):
+    def _create_and_add_record(self, records, sample, sample_value, timestamp):
         """
         Adds a record to given dict
         """
 
         records.append(self.gpu_metrics[sample.name](
-            value=sample_value, device_uuid=sample.labels['gpu_uuid']))
+            value=sample_value,
+            device_uuid=sample.labels['gpu_uuid'],
+            timestamp=timestamp))
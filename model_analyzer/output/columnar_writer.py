@@ -0,0 +1,197 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+from typing import Any, List, Sequence, Tuple
+
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
+
+import csv
+
+
+class ColumnarWriter(ABC):
+    """
+    Streams rows of typed columns to a file
+
+    Rows are written as they are given, or in batches,
+    so that a table is never held in memory at once
+    """
+
+    def __init__(self, filename: str, columns: List[Tuple[str, str]]) -> None:
+        """
+        Parameters
+        ----------
+        filename : str
+            The full path to the file to write to
+        columns : list of (str, str)
+            The names and types ('string', 'int',
+            'float' or 'bool') of the columns
+        """
+
+        self._filename = filename
+        self._columns = columns
+
+    @staticmethod
+    def create(filename: str, columns: List[Tuple[str, str]],
+               file_format: str) -> 'ColumnarWriter':
+        """
+        Parameters
+        ----------
+        filename : str
+            The full path to the file to write to
+        columns : list of (str, str)
+            The names and types of the columns
+        file_format : str
+            'csv', 'parquet' or 'arrow'
+
+        Returns
+        -------
+        ColumnarWriter
+            The writer of the given format
+        """
+
+        if file_format == 'csv':
+            return CSVColumnarWriter(filename, columns)
+        elif file_format in ['parquet', 'arrow']:
+            return ArrowColumnarWriter(filename, columns, file_format)
+        else:
+            raise TritonModelAnalyzerException(
+                f"Unsupported measurement export format '{file_format}'")
+
+    @abstractmethod
+    def write_row(self, row: Sequence[Any]) -> None:
+        """
+        Parameters
+        ----------
+        row : sequence
+            The values of the row, in the order of the
+            columns. None is written for missing values
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Writes out the remaining rows and closes the file
+        """
+
+
+class CSVColumnarWriter(ColumnarWriter):
+    """
+    Writes the rows as CSV, with a header of the column names
+
+    The values are written unformatted: missing values
+    are empty, and booleans are 'true' or 'false'
+    """
+
+    def __init__(self, filename: str, columns: List[Tuple[str, str]]) -> None:
+        super().__init__(filename, columns)
+
+        try:
+            self._file = open(filename, 'w', newline='')
+        except OSError as e:
+            raise TritonModelAnalyzerException(e)
+
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([name for name, _ in columns])
+
+    def write_row(self, row: Sequence[Any]) -> None:
+        self._writer.writerow([
+            str(value).lower() if isinstance(value, bool) else value
+            for value in row
+        ])
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ArrowColumnarWriter(ColumnarWriter):
+    """
+    Writes the rows as Parquet or as an Arrow IPC
+    file, one record batch at a time. Requires pyarrow
+    """
+
+    BATCH_SIZE = 4096
+
+    def __init__(self, filename: str, columns: List[Tuple[str, str]],
+                 file_format: str) -> None:
+        super().__init__(filename, columns)
+
+        pa = ArrowColumnarWriter.import_pyarrow()
+        arrow_types = {
+            'string': pa.string(),
+            'int': pa.int64(),
+            'float': pa.float64(),
+            'bool': pa.bool_()
+        }
+
+        self._pa = pa
+        self._schema = pa.schema([
+            (name, arrow_types[type_name]) for name, type_name in columns
+        ])
+        self._file_format = file_format
+        self._batch: List[List[Any]] = [[] for _ in columns]
+
+        if file_format == 'parquet':
+            import pyarrow.parquet
+            self._writer = pyarrow.parquet.ParquetWriter(
+                filename, self._schema)
+        else:
+            self._writer = pa.ipc.new_file(filename, self._schema)
+
+    @staticmethod
+    def import_pyarrow():
+        """
+        Returns
+        -------
+        module
+            pyarrow
+
+        Raises
+        ------
+        TritonModelAnalyzerException
+            If pyarrow is not installed
+        """
+
+        try:
+            import pyarrow
+        except ImportError:
+            raise TritonModelAnalyzerException(
+                'Exporting measurements as Parquet or Arrow requires pyarrow.'
+                ' Run "pip install pyarrow" and then rerun Model Analyzer.')
+
+        return pyarrow
+
+    def write_row(self, row: Sequence[Any]) -> None:
+        for column, value in zip(self._batch, row):
+            column.append(value)
+
+        if len(self._batch[0]) >= self.BATCH_SIZE:
+            self._write_batch()
+
+    def close(self) -> None:
+        if self._batch[0]:
+            self._write_batch()
+
+        self._writer.close()
+
+    def _write_batch(self):
+        batch = self._pa.record_batch(self._batch, schema=self._schema)
+
+        if self._file_format == 'parquet':
+            self._writer.write_table(self._pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+        self._batch = [[] for _ in self._columns]
@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List, Union, Tuple
+from typing import Any, Dict, Generator, List, TextIO, Union, Tuple
 from model_analyzer.model_analyzer_exceptions \
     import TritonModelAnalyzerException
 from model_analyzer.record.types.perf_latency_avg import PerfLatencyAvg
+from model_analyzer.record.types.perf_latency_p50 import PerfLatencyP50
 from model_analyzer.record.types.perf_latency_p90 import PerfLatencyP90
 from model_analyzer.record.types.perf_latency_p95 import PerfLatencyP95
 from model_analyzer.record.types.perf_latency_p99 import PerfLatencyP99
+from model_analyzer.record.types.perf_latency_p999 import PerfLatencyP999
 from model_analyzer.record.types.perf_latency import PerfLatency
 from model_analyzer.record.types.perf_throughput import PerfThroughput
 from model_analyzer.record.types.perf_client_response_wait \
@@ -33,8 +35,11 @@
     import PerfServerComputeInfer
 from model_analyzer.record.types.perf_server_compute_output \
     import PerfServerComputeOutput
+from model_analyzer.record.types.perf_client_cpu_utilization \
+    import PerfClientCPUUtilization
 
 from model_analyzer.record.record import Record
+from model_analyzer.result.latency_histogram import LatencyHistogram
 from model_analyzer.record.types.gpu_utilization import GPUUtilization
 from model_analyzer.record.types.gpu_power_usage import GPUPowerUsage
 from model_analyzer.record.types.gpu_used_memory import GPUUsedMemory
@@ -46,13 +51,16 @@
     PERF_ANALYZER_MINIMUM_REQUEST_COUNT
 
 from subprocess import Popen, STDOUT
+from math import ceil
 import psutil
 import re
 import logging
 import signal
 import os
 import csv
+import json
 import tempfile
+import time
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -72,6 +80,7 @@ class PerfAnalyzer:
     METRIC_TAG,                        CSV_STRING,             RECORD_CLASS,             REDUCTION_FACTOR = 0, 1, 2, 3
     perf_metric_table = [
         ["perf_latency_avg",           "Avg latency",           PerfLatencyAvg,          "1000"],
+        ["perf_latency_p50",           "p50 latency",           PerfLatencyP50,          "1000"],
         ["perf_latency_p90",           "p90 latency",           PerfLatencyP90,          "1000"],
         ["perf_latency_p95",           "p95 latency",           PerfLatencyP95,          "1000"],
         ["perf_latency_p99",           "p99 latency",           PerfLatencyP99,          "1000"],
@@ -91,16 +100,52 @@ class PerfAnalyzer:
         ["gpu_used_memory",            "Max GPU Memory Usage",  GPUUsedMemory,        "1000000"],
         ["gpu_free_memory",            "Total GPU Memory",      GPUFreeMemory,        "1000000"]
     ]
+
+    # Percentiles that perf_analyzer does not report, which are
+    # computed from the latency histogram of every request
+    PERCENTILE = 1
+    histogram_metric_table = [
+        ["perf_latency_p999",          "99.9",                  PerfLatencyP999,         "1000"]
+    ]
     #yapf: enable
 
+    # Metrics that are measured on the client while perf_analyzer runs
+    client_metrics = [PerfClientCPUUtilization]
+
+    # perf_analyzer's number of worker threads, when max-threads is not
+    # set: 16 for concurrencies, and 4 for request rates and intervals
+    DEFAULT_MAX_THREADS = 16
+    DEFAULT_REQUEST_RATE_MAX_THREADS = 4
+
+    # Characters of the profile export read at a time. Its requests
+    # are parsed one by one, so it is never held in memory at once
+    PROFILE_EXPORT_CHUNK_SIZE = 1 << 20
+    PROFILE_EXPORT_REQUESTS_PATTERN = re.compile(r'"requests"\s*:\s*\[')
+
     @staticmethod
     def get_perf_metrics():
         perf_metrics = [
             perf_metric[PerfAnalyzer.RECORD_CLASS]
-            for perf_metric in PerfAnalyzer.perf_metric_table
-        ]
+            for perf_metric in PerfAnalyzer.perf_metric_table +
+            PerfAnalyzer.histogram_metric_table
+        ] + PerfAnalyzer.client_metrics
         return perf_metrics
 
+    @staticmethod
+    def get_histogram_metric_tags():
+        """
+        Returns
+        -------
+        list of str
+            The tags of the metrics that are only
+            computed from the latency histograms
+        """
+
+        return [
+            histogram_metric[PerfAnalyzer.METRIC_TAG]
+            for histogram_metric in PerfAnalyzer.histogram_metric_table
+        ]
+
     @staticmethod
     def get_gpu_metrics():
         gpu_metrics = [
@@ -134,7 +179,9 @@ def __init__(self, path, config, max_retries, timeout, max_cpu_util):
         self._output = ""
         self._perf_records = {}
         self._gpu_records = []
+        self._latency_histograms = {}
         self._max_cpu_util = max_cpu_util
+        self._cpu_util_samples = []
 
     def run(self, metrics, env=None):
         """
@@ -170,6 +217,7 @@ def run(self, metrics, env=None):
                     return status
                 elif status == self.PA_SUCCESS:
                     self._parse_outputs(metrics)
+                    self._add_client_cpu_util_records(metrics)
                     break
                 elif status == self.PA_RETRY:
                     continue
@@ -206,6 +254,17 @@ def get_gpu_records(self):
 
         return self._gpu_records
 
+    def get_latency_histograms(self):
+        """
+        Returns
+        -------
+        dict
+            The LatencyHistogram of each model from the last
+            perf_analyzer run, if its latencies were collected
+        """
+
+        return self._latency_histograms
+
     def output(self):
         """
         Returns
@@ -287,8 +346,9 @@ def _create_process(self, cmd, perf_analyzer_env):
         return process
 
     def _resolve_process(self, process):
-        if self._poll_perf_analyzer(process) == 1:
-            return self.PA_FAIL
+        status = self._poll_perf_analyzer(process)
+        if status != self.PA_SUCCESS:
+            return status
 
         if process.returncode > 0:
             if self._auto_adjust_parameters(process) == self.PA_FAIL:
@@ -306,10 +366,17 @@ def _poll_perf_analyzer(self, process):
         """
         Periodically poll the perf analyzer to get output
         or see if it is taking too much time or CPU resources 
+
+        The CPU utilization is averaged over a measurement window, so
+        that short spikes do not stop perf_analyzer. When the average
+        is too high, perf_analyzer is retried with fewer threads, and
+        only fails once it cannot use fewer
         """
 
         current_timeout = self._timeout
         process_util = psutil.Process(process.pid)
+        self._cpu_util_samples = []
+        window_size = self._get_cpu_util_window_size()
 
         while current_timeout > 0:
             if process.poll() is not None:
@@ -317,26 +384,152 @@ def _poll_perf_analyzer(self, process):
                 break
 
             # perf_analyzer using too much CPU?
-            cpu_util = process_util.cpu_percent(INTERVAL_SLEEP_TIME)
-            if cpu_util > self._max_cpu_util:
-                logger.info(
-                    f'perf_analyzer used significant amount of CPU resources ({cpu_util}%), killing perf_analyzer'
-                )
-                self._output = self._get_process_output()
-                process.kill()
-
-                return self.PA_FAIL
+            self._cpu_util_samples.append(
+                self._sample_cpu_util(process_util))
+            if len(self._cpu_util_samples) >= window_size:
+                cpu_util = sum(
+                    self._cpu_util_samples[-window_size:]) / window_size
+                if cpu_util > self._max_cpu_util:
+                    logger.info(
+                        f'perf_analyzer used significant amount of CPU resources ({cpu_util:.1f}%), killing perf_analyzer'
+                    )
+                    self._output = self._get_process_output()
+                    self._kill_process(process, process_util)
+
+                    if self._reduce_cpu_load():
+                        return self.PA_RETRY
+                    return self.PA_FAIL
 
             current_timeout -= INTERVAL_SLEEP_TIME
         else:
             logger.info(
                 'perf_analyzer took very long to exit, killing perf_analyzer')
-            process.kill()
+            self._kill_process(process, process_util)
 
             return self.PA_FAIL
 
         return self.PA_SUCCESS
 
+    def _sample_cpu_util(self, process_util):
+        """
+        Returns the CPU utilization, over INTERVAL_SLEEP_TIME, of
+        perf_analyzer and of the processes it started, such as the
+        ranks of mpiexec
+        """
+
+        processes = [process_util, *self._get_child_processes(process_util)]
+        for process in processes:
+            try:
+                process.cpu_percent(None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        time.sleep(INTERVAL_SLEEP_TIME)
+
+        cpu_util = 0
+        for process in processes:
+            try:
+                cpu_util += process.cpu_percent(None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        return cpu_util
+
+    def _get_child_processes(self, process_util):
+        try:
+            return process_util.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return []
+
+    def _kill_process(self, process, process_util):
+        # The ranks of mpiexec are not always stopped with it
+        for child_process in self._get_child_processes(process_util):
+            try:
+                child_process.kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        process.kill()
+
+    def _get_cpu_util_window_size(self):
+        """
+        Returns the number of CPU utilization samples in
+        the longest measurement window of perf_analyzer
+        """
+
+        measurement_interval = max([
+            int(model_run_config.perf_config()['measurement-interval'] or
+                PERF_ANALYZER_MEASUREMENT_WINDOW)
+            for model_run_config in self._config.model_run_configs()
+        ])
+
+        return max(1,
+                   ceil(measurement_interval / 1000 / INTERVAL_SLEEP_TIME))
+
+    def _reduce_cpu_load(self):
+        """
+        Adjusts the parameters of every model so that perf_analyzer
+        uses less CPU. Returns False if none could be adjusted, as
+        perf_analyzer already uses as few threads as it can
+        """
+
+        reduced = [
+            self._reduce_cpu_load_for_perf_config(
+                model_run_config.perf_config())
+            for model_run_config in self._config.model_run_configs()
+        ]
+
+        if not any(reduced):
+            logger.info("perf_analyzer cannot use fewer threads, the client"
+                        " does not have enough CPU to generate this load")
+        return any(reduced)
+
+    def _reduce_cpu_load_for_perf_config(self, perf_config):
+        # async and max-threads are left out of the representation of
+        # the perf_analyzer config, so that the measurement is still
+        # stored under the run config the generator created
+        is_request_rate = perf_config['request-rate-range'] or perf_config[
+            'request-intervals']
+
+        # In sync mode, perf_analyzer uses a thread per concurrent request
+        sync_mode_set = any([
+            str(perf_config[mode]).lower() == 'true'
+            for mode in ['async', 'sync']
+        ])
+        if not sync_mode_set and not is_request_rate:
+            perf_config['async'] = 'true'
+            logger.info("Switched perf_analyzer to async mode, to reduce"
+                        " its CPU usage")
+            return True
+
+        max_threads = int(
+            perf_config['max-threads'] or
+            (self.DEFAULT_REQUEST_RATE_MAX_THREADS
+             if is_request_rate else self.DEFAULT_MAX_THREADS))
+        if max_threads > 1:
+            perf_config['max-threads'] = max_threads // 2
+            logger.info("Reduced perf_analyzer's max threads from"
+                        f" {max_threads} to {perf_config['max-threads']},"
+                        " to reduce its CPU usage")
+            return True
+
+        return False
+
+    def _add_client_cpu_util_records(self, metrics):
+        """
+        Adds the average CPU utilization of the client over the
+        run to the records of every model, as it is shared by the
+        models of a multi-model run
+        """
+
+        if PerfClientCPUUtilization not in metrics or not self._cpu_util_samples:
+            return
+
+        cpu_util = sum(self._cpu_util_samples) / len(self._cpu_util_samples)
+        for model_run_config in self._config.model_run_configs():
+            self._perf_records.setdefault(
+                model_run_config.perf_config()['model-name'],
+                []).append(PerfClientCPUUtilization(value=cpu_util))
+
     def _get_process_output(self):
         self._cmd_log.seek(0)
         tmp_output = self._cmd_log.read()
@@ -443,10 +636,115 @@ def _parse_outputs(self, metrics):
                     self._gpu_records = self._extract_gpu_records_from_row(
                         metrics, row)
 
+            if perf_config['profile-export-file']:
+                self._parse_profile_export(metrics, perf_config)
+
         for perf_config in [
                 mrc.perf_config() for mrc in self._config.model_run_configs()
         ]:
             os.remove(perf_config['latency-report-file'])
+            if perf_config['profile-export-file']:
+                os.remove(perf_config['profile-export-file'])
+
+    def _parse_profile_export(self, metrics, perf_config):
+        """
+        Builds the latency histogram of the model from the timestamps
+        of every request in perf_analyzer's profile export, and extracts
+        the percentiles that are not in the latency report
+        """
+
+        model_name = perf_config['model-name']
+        logger.debug(
+            f"Reading PA requests from {perf_config['profile-export-file']}")
+        latency_histogram = LatencyHistogram()
+        with open(perf_config['profile-export-file'], mode='r') as f:
+            for request in self._read_profile_export_requests(f):
+                # Timestamps are in nanoseconds, and a request
+                # is complete once its last response is received
+                if request.get('response_timestamps'):
+                    latency_histogram.record(
+                        (request['response_timestamps'][-1] -
+                         request['timestamp']) / 1000)
+
+        self._latency_histograms[model_name] = latency_histogram
+        self._perf_records.setdefault(model_name, []).extend(
+            self._extract_perf_records_from_histogram(metrics,
+                                                      latency_histogram))
+
+    def _read_profile_export_requests(
+            self, f: TextIO) -> Generator[Dict[str, Any], None, None]:
+        """
+        Yields the requests of every experiment of a profile export,
+        reading PROFILE_EXPORT_CHUNK_SIZE characters at a time
+        """
+
+        decoder = json.JSONDecoder()
+        buffer = ''
+        position = 0
+        in_requests = False
+        while True:
+            if in_requests:
+                while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                    position += 1
+
+                if position < len(buffer):
+                    if buffer[position] == ']':
+                        in_requests = False
+                        position += 1
+                        continue
+
+                    # An incomplete request is decoded
+                    # again once more has been read
+                    try:
+                        request, end = decoder.raw_decode(buffer, position)
+                    except json.JSONDecodeError:
+                        request = None
+
+                    if request is not None:
+                        position = end
+                        yield request
+                        continue
+            else:
+                match = PerfAnalyzer.PROFILE_EXPORT_REQUESTS_PATTERN.search(
+                    buffer, position)
+                if match:
+                    in_requests = True
+                    position = match.end()
+                    continue
+
+                # Keep enough to match a key split across chunks
+                position = max(position, len(buffer) - 64)
+
+            chunk = f.read(PerfAnalyzer.PROFILE_EXPORT_CHUNK_SIZE)
+            if not chunk:
+                if in_requests:
+                    raise TritonModelAnalyzerException(
+                        'perf_analyzer profile export is incomplete')
+                return
+
+            buffer = buffer[position:] + chunk
+            position = 0
+
+    def _extract_perf_records_from_histogram(
+            self, requested_metrics: List[Record],
+            latency_histogram: LatencyHistogram) -> List[Record]:
+        perf_records: List[Record] = []
+        if not latency_histogram.count():
+            return perf_records
+
+        for histogram_metric in PerfAnalyzer.histogram_metric_table:
+            if any(histogram_metric[PerfAnalyzer.METRIC_TAG] ==
+                   requested_metric.tag
+                   for requested_metric in requested_metrics):
+                value = latency_histogram.percentile(
+                    float(str(histogram_metric[PerfAnalyzer.PERCENTILE])))
+                reduction_factor = float(
+                    str(histogram_metric[PerfAnalyzer.REDUCTION_FACTOR]))
+
+                perf_records.append(histogram_metric[PerfAnalyzer.RECORD_CLASS](
+                    value / reduction_factor))  # type: ignore
+
+        return perf_records
 
     def _extract_perf_records_from_row(
             self, requested_metrics: List[Record],
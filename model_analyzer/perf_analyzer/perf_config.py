@@ -17,6 +17,9 @@
 from model_analyzer.config.input.config_defaults import DEFAULT_MEASUREMENT_MODE
 from model_analyzer.constants import SECONDS_TO_MILLISECONDS_MULTIPLIER
 
+import copy
+import sys
+
 
 class PerfAnalyzerConfig:
     """
@@ -41,7 +44,7 @@ class PerfAnalyzerConfig:
         'ssl-https-client-certificate-type',
         'ssl-https-client-certificate-file', 'ssl-https-private-key-type',
         'ssl-https-private-key-file', 'collect-metrics', 'metrics-url',
-        'metrics-interval'
+        'metrics-interval', 'profile-export-file'
     ]
 
     input_to_options = [
@@ -58,6 +61,10 @@ class PerfAnalyzerConfig:
         'collect-metrics'
     ]
 
+    # The arguments that are only copied once they are modified,
+    # in configs created by create_derived_config()
+    copy_on_write_attrs = ['_args', '_options', '_verbose']
+
     def __init__(self):
         """
         Construct a PerfAnalyzerConfig
@@ -97,6 +104,9 @@ def __init__(self):
             None for k in self.additive_args
         }
 
+        self._shared_attrs = []
+        self._representation = None
+
     @classmethod
     def allowed_keys(cls):
         """
@@ -134,6 +144,34 @@ def update_config(self, params=None):
             for key in params:
                 self[key] = params[key]
 
+    def create_derived_config(self, params=None):
+        """
+        Creates a config with the given params set on top of this one
+
+        The two configs share their arguments, and each of them only
+        copies them once it is modified (e.g. when perf_analyzer's
+        measurement interval is increased), so many configs can be
+        cheaply derived from a common base config
+
+        Parameters
+        ----------
+        params: dict
+            keys are allowed args to perf_analyzer
+
+        Returns
+        -------
+        PerfAnalyzerConfig
+            The derived config
+        """
+
+        derived_config = copy.copy(self)
+
+        self._shared_attrs = self.copy_on_write_attrs[:]
+        derived_config._shared_attrs = self.copy_on_write_attrs[:]
+
+        derived_config.update_config(params)
+        return derived_config
+
     def update_config_from_profile_config(self, model_name, profile_config):
         """
         Set common values based on the input profile config
@@ -153,6 +191,9 @@ def update_config_from_profile_config(self, model_name, profile_config):
             'verbose-csv': '--verbose-csv'
         }
 
+        if profile_config.collect_latency_histograms:
+            params['profile-export-file'] = model_name + "-profile-export.json"
+
         if profile_config.triton_launch_mode == 'c_api':
             params.update({
                 'service-kind': 'triton_c_api',
@@ -190,6 +231,19 @@ def from_dict(cls, perf_config_dict):
                 setattr(perf_config, key, perf_config_dict[key])
         return perf_config
 
+    def to_dict(self):
+        """
+        Returns
+        -------
+        dict
+            The checkpointed state of the config
+        """
+
+        perf_config_dict = dict(self.__dict__)
+        del perf_config_dict['_shared_attrs']
+        del perf_config_dict['_representation']
+        return perf_config_dict
+
     def representation(self):
         """
         Returns
@@ -199,12 +253,23 @@ def representation(self):
             that removes values which can vary between
             runs, but should be ignored when determining
             if a previous (checkpointed) run can be used
+
+            It is computed once, until the config is modified,
+            and interned so that equal representations are
+            the same object
         """
-        cli_string = self.to_cli_string()
-        cli_string = PerfAnalyzerConfig.remove_url_from_cli_string(cli_string)
-        cli_string = PerfAnalyzerConfig.remove_mrc_from_cli_string(cli_string)
+        if self._representation is None:
+            cli_string = self.to_cli_string()
+            cli_string = PerfAnalyzerConfig.remove_url_from_cli_string(
+                cli_string)
+            cli_string = PerfAnalyzerConfig.remove_mrc_from_cli_string(
+                cli_string)
+            cli_string = PerfAnalyzerConfig.remove_cpu_load_args_from_cli_string(
+                cli_string)
+
+            self._representation = sys.intern(cli_string)
 
-        return cli_string
+        return self._representation
 
     def extract_model_specific_parameters(self):
         """
@@ -216,11 +281,21 @@ def extract_model_specific_parameters(self):
           A dictionary of parameters and their values
         """
 
-        return {
+        params = {
             'batch-size': self._options['-b'],
             'concurrency-range': self._args['concurrency-range']
         }
 
+        # Only present when profiling with a request rate or trace, or
+        # through shared memory, so that other measurements are unchanged
+        for key in [
+                'request-rate-range', 'request-intervals', 'shared-memory'
+        ]:
+            if self._args[key]:
+                params[key] = self._args[key]
+
+        return params
+
     @classmethod
     def remove_url_from_cli_string(cls, cli_string):
         """
@@ -269,6 +344,26 @@ def remove_mrc_from_cli_string(cls, cli_string):
 
         return ' '.join(perf_str_tokens)
 
+    @classmethod
+    def remove_cpu_load_args_from_cli_string(cls, cli_string):
+        """
+        utility function strips the args that are adjusted to
+        reduce the CPU usage of perf_analyzer (async and max
+        threads) from a cli string representation
+
+        Parameters
+        ----------
+        cli_string : str
+            The cli string representation
+        """
+
+        perf_str_tokens = [
+            token for token in cli_string.split(' ')
+            if token.split('=')[0] not in ['--async', '--max-threads']
+        ]
+
+        return ' '.join(perf_str_tokens)
+
     def to_cli_string(self):
         """
         Utility function to convert a config into a
@@ -393,17 +488,33 @@ def __setitem__(self, key, value):
             config class
         """
 
+        self._representation = None
+
         if key in self._args:
-            self._args[key] = value
+            self._get_writable_attr('_args')[key] = value
         elif key in self._input_to_options:
-            self._options[self._input_to_options[key]] = value
+            self._get_writable_attr('_options')[
+                self._input_to_options[key]] = value
         elif key in self._input_to_verbose:
-            self._verbose[self._input_to_verbose[key]] = value
+            self._get_writable_attr('_verbose')[
+                self._input_to_verbose[key]] = value
         else:
             raise TritonModelAnalyzerException(
                 f"The argument '{key}' to the perf_analyzer "
                 "is not supported by the model analyzer.")
 
+    def _get_writable_attr(self, attr):
+        """
+        Copies the arguments in attr if they are still shared
+        with another config, and returns them
+        """
+
+        if attr in self._shared_attrs:
+            setattr(self, attr, dict(getattr(self, attr)))
+            self._shared_attrs.remove(attr)
+
+        return getattr(self, attr)
+
     def __contains__(self, key):
         """
         Returns
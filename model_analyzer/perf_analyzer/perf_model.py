@@ -0,0 +1,613 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from functools import lru_cache
+from math import ceil, log2, sqrt
+from typing import Callable, Dict, List, Optional, Tuple
+import json
+import random
+
+from model_analyzer.config.run.run_config import RunConfig
+from model_analyzer.constants import SIMULATED_GPU_MEMORY_MB
+from model_analyzer.device.gpu_device import GPUDevice
+from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
+from model_analyzer.result.results import Results
+
+PerfMetrics = Dict[str, float]
+GPUMetrics = Dict[str, Dict[str, float]]
+
+PERF_TAGS = [
+    "perf_throughput", "perf_latency_avg", "perf_latency_p90",
+    "perf_latency_p95", "perf_latency_p99", "perf_client_send_recv",
+    "perf_client_response_wait", "perf_server_queue",
+    "perf_server_compute_input", "perf_server_compute_infer",
+    "perf_server_compute_output"
+]
+
+GPU_TAGS = [
+    "gpu_utilization", "gpu_power_usage", "gpu_used_memory", "gpu_free_memory"
+]
+
+
+class PerfModel(ABC):
+    """
+    Estimates the metrics perf_analyzer would measure for a RunConfig.
+    All values are in the units of the corresponding record types
+
+    Request rates and replayed request traces are open-loop loads,
+    estimated at their mean rate
+    """
+
+    # Bounds the search for the inferences in flight at a request rate
+    MAX_OUTSTANDING_INFERENCES = 2**16
+
+    # Seconds of requests that back up once a request rate
+    # is beyond what the model can serve
+    BACKLOG_SECONDS = 1.0
+
+    def __init__(self, noise=0.0, seed=0):
+        """
+        Parameters
+        ----------
+        noise: float
+            Relative standard deviation of the noise applied
+            to every estimated perf metric
+        seed: int
+            Seed for the noise, so that simulated runs are repeatable
+        """
+
+        self._noise = noise
+        self._seed = seed
+        self._estimate_count = 0
+
+    def estimate(self, run_config: RunConfig,
+                 gpus: List[GPUDevice]) -> Tuple[List[PerfMetrics], GPUMetrics]:
+        """
+        Parameters
+        ----------
+        run_config: RunConfig
+            The RunConfig being profiled
+        gpus: List of GPUDevices
+            The (simulated) GPUs the models run on
+
+        Returns
+        -------
+        (list of dict, dict)
+            The perf metrics of each model run config, and the
+            GPU metrics for the whole run, keyed by GPU UUID
+
+        Raises
+        ------
+        TritonModelAnalyzerException
+            If the metrics cannot be estimated
+        """
+
+        perf_metrics, gpu_metrics = self._estimate(run_config, gpus)
+
+        if self._noise:
+            self._estimate_count += 1
+            rng = random.Random(f"{self._seed}:{run_config.representation()}:"
+                                f"{self._estimate_count}")
+            for model_perf_metrics in perf_metrics:
+                for tag in model_perf_metrics:
+                    model_perf_metrics[tag] *= max(0.0,
+                                                   rng.gauss(1.0, self._noise))
+
+        return perf_metrics, gpu_metrics
+
+    def estimate_idle(self, gpus: List[GPUDevice]) -> GPUMetrics:
+        """
+        Returns the GPU metrics of the server with no models
+        loaded, keyed by GPU UUID
+        """
+
+        return {
+            gpu.device_uuid(): {
+                "gpu_utilization": 0.0,
+                "gpu_power_usage": 0.0,
+                "gpu_used_memory": 0.0,
+                "gpu_free_memory": float(SIMULATED_GPU_MEMORY_MB)
+            } for gpu in gpus
+        }
+
+    @abstractmethod
+    def _estimate(self, run_config: RunConfig,
+                  gpus: List[GPUDevice]) -> Tuple[List[PerfMetrics], GPUMetrics]:
+        """
+        Returns the noiseless perf and GPU metrics of the run config
+        """
+
+    @staticmethod
+    def _get_instance_count(model_config: Dict) -> int:
+        instance_groups = model_config.get('instance_group', [{}])
+        return max(
+            1,
+            sum([
+                int(instance_group.get('count', 1))
+                for instance_group in instance_groups
+            ]))
+
+    @staticmethod
+    def _is_cpu_only(model_config: Dict) -> bool:
+        instance_groups = model_config.get('instance_group', [{}])
+        return all([
+            instance_group.get('kind') == 'KIND_CPU'
+            for instance_group in instance_groups
+        ])
+
+    @staticmethod
+    def _get_outstanding_inferences(perf_config: PerfAnalyzerConfig) -> int:
+        """
+        Returns the number of inferences perf_analyzer keeps in flight
+        """
+
+        batch_size = int(perf_config['batch-size'] or 1)
+        concurrency = perf_config['concurrency-range'] or 1
+        concurrency = int(str(concurrency).split(':')[0])
+        return max(1, batch_size * concurrency)
+
+    @staticmethod
+    def _get_offered_throughput(
+            perf_config: PerfAnalyzerConfig) -> Optional[float]:
+        """
+        Returns the inferences/sec perf_analyzer sends when it profiles
+        a request rate or replays a trace, or None for a concurrency
+        """
+
+        batch_size = int(perf_config['batch-size'] or 1)
+
+        if perf_config['request-intervals']:
+            return batch_size * PerfModel._get_trace_request_rate(
+                perf_config['request-intervals'])
+
+        request_rate = perf_config['request-rate-range']
+        if not request_rate:
+            return None
+
+        return float(batch_size * int(str(request_rate).split(':')[0]))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_trace_request_rate(intervals_file: str) -> float:
+        """
+        Returns the mean request rate of a file of request
+        intervals, in microseconds, as replayed by perf_analyzer
+        """
+
+        total_interval = 0
+        interval_count = 0
+        try:
+            with open(intervals_file, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        total_interval += int(line)
+                        interval_count += 1
+        except (OSError, ValueError) as e:
+            raise TritonModelAnalyzerException(
+                f'Unable to read request intervals {intervals_file}: {e}')
+
+        return 1000000 * interval_count / max(1, total_interval)
+
+    def _get_open_loop_outstanding(self, get_throughput: Callable[[int],
+                                                                  float],
+                                   offered_throughput: float) -> int:
+        """
+        Returns the inferences in flight once an open-loop load of
+        offered_throughput inferences/sec settles, given the (closed-loop)
+        throughput at a number of inferences in flight. If the model cannot
+        keep up, the requests that back up are in flight as well
+        """
+
+        low, high = 0, 1
+        while get_throughput(high) < offered_throughput:
+            if high >= self.MAX_OUTSTANDING_INFERENCES:
+                backlog = (offered_throughput -
+                           get_throughput(high)) * self.BACKLOG_SECONDS
+                return high + ceil(backlog)
+            low, high = high, 2 * high
+
+        while high - low > 1:
+            mid = (low + high) // 2
+            if get_throughput(mid) < offered_throughput:
+                low = mid
+            else:
+                high = mid
+
+        return high
+
+
+class QueueingPerfModel(PerfModel):
+    """
+    Closed-loop queueing model of a model served by Triton: each
+    instance executes batches whose latency grows linearly with the
+    batch size, a GPU can only overlap a few instances at once, and
+    models profiled concurrently share the GPUs
+
+    A request rate is modeled by the inferences in flight at
+    which the closed-loop throughput matches it
+    """
+
+    #yapf: disable
+    BATCH_OVERHEAD_MS      = 2.0    # Fixed cost of executing one batch
+    INFERENCE_COST_MS      = 0.5    # Additional cost per inference in a batch
+    CPU_SLOWDOWN           = 8.0    # Cost multiplier for KIND_CPU instances
+    GPU_PARALLELISM        = 2      # Instances a GPU executes concurrently
+    CLIENT_OVERHEAD_MS     = 0.1    # Client send/recv time per request
+    COMPUTE_INPUT_FRACTION = 0.05
+    COMPUTE_OUTPUT_FRACTION= 0.05
+    BASE_MEMORY_MB         = 1000   # Server and framework memory per GPU
+    INSTANCE_MEMORY_MB     = 250    # Weights per model instance
+    ACTIVATION_MEMORY_MB   = 4      # Memory per inference of max_batch_size
+    IDLE_POWER_W           = 60
+    MAX_POWER_W            = 300
+
+    # Latency percentile = avg * (offset + slope * utilization)
+    LATENCY_PERCENTILES = {
+        "perf_latency_p90": (1.05, 0.20),
+        "perf_latency_p95": (1.08, 0.35),
+        "perf_latency_p99": (1.12, 0.60)
+    }
+    #yapf: enable
+
+    def estimate_idle(self, gpus):
+        return {
+            gpu.device_uuid(): {
+                "gpu_utilization":
+                    0.0,
+                "gpu_power_usage":
+                    float(self.IDLE_POWER_W),
+                "gpu_used_memory":
+                    float(self.BASE_MEMORY_MB),
+                "gpu_free_memory":
+                    float(SIMULATED_GPU_MEMORY_MB - self.BASE_MEMORY_MB)
+            } for gpu in gpus
+        }
+
+    def _estimate(self, run_config, gpus):
+        num_gpus = len(gpus)
+
+        perf_metrics = []
+        utilizations = []
+        used_memory = self.BASE_MEMORY_MB
+        for model_run_config in run_config.model_run_configs():
+            model_configs = [
+                config.get_config()
+                for config in model_run_config.ensemble_subconfigs()
+            ] or [model_run_config.model_config().get_config()]
+
+            offered_throughput = self._get_offered_throughput(
+                model_run_config.perf_config())
+            if offered_throughput:
+                outstanding = self._get_open_loop_outstanding(
+                    lambda outstanding: self._estimate_pipeline(
+                        model_configs, outstanding, num_gpus)[0][
+                            "perf_throughput"], offered_throughput)
+            else:
+                outstanding = self._get_outstanding_inferences(
+                    model_run_config.perf_config())
+
+            model_perf_metrics, model_estimates = self._estimate_pipeline(
+                model_configs, outstanding, num_gpus)
+            if offered_throughput:
+                model_perf_metrics["perf_throughput"] = min(
+                    model_perf_metrics["perf_throughput"], offered_throughput)
+
+            perf_metrics.append(model_perf_metrics)
+            utilizations.append(
+                sum([estimate[1] for estimate in model_estimates]))
+            used_memory += sum([estimate[2] for estimate in model_estimates])
+
+        # Concurrently profiled models slow each other down once
+        # the GPUs are saturated
+        total_utilization = sum(utilizations)
+        if total_utilization > 1:
+            for model_perf_metrics in perf_metrics:
+                for tag in model_perf_metrics:
+                    if tag == "perf_throughput":
+                        model_perf_metrics[tag] /= total_utilization
+                    elif tag != "perf_client_send_recv":
+                        model_perf_metrics[tag] *= total_utilization
+            total_utilization = 1.0
+
+        gpu_metrics = {}
+        if not run_config.cpu_only():
+            for gpu in gpus:
+                gpu_metrics[gpu.device_uuid()] = {
+                    "gpu_utilization":
+                        total_utilization * 100,
+                    "gpu_power_usage":
+                        self.IDLE_POWER_W +
+                        (self.MAX_POWER_W - self.IDLE_POWER_W) *
+                        total_utilization,
+                    "gpu_used_memory":
+                        used_memory,
+                    "gpu_free_memory":
+                        max(0, SIMULATED_GPU_MEMORY_MB - used_memory)
+                }
+
+        return perf_metrics, gpu_metrics
+
+    def _estimate_pipeline(
+        self, model_configs: List[Dict], outstanding: int, num_gpus: int
+    ) -> Tuple[PerfMetrics, List[Tuple[PerfMetrics, float, float]]]:
+        """
+        Returns the perf metrics of the pipeline of models (an ensemble
+        is a pipeline of its submodels), and the estimates of each model
+        """
+
+        model_estimates = [
+            self._estimate_model(model_config, outstanding, num_gpus)
+            for model_config in model_configs
+        ]
+        return self._combine_pipeline(model_estimates), model_estimates
+
+    def _estimate_model(self, model_config: Dict, outstanding: int,
+                        num_gpus: int) -> Tuple[PerfMetrics, float, float]:
+        """
+        Returns the perf metrics, GPU utilization (0-1) and
+        GPU memory used (MB, per GPU) of a single model
+        """
+
+        cpu_only = self._is_cpu_only(model_config) or num_gpus == 0
+        instances_per_device = self._get_instance_count(model_config)
+        if cpu_only:
+            instances = instances_per_device
+            parallelism = instances
+            slowdown = self.CPU_SLOWDOWN
+        else:
+            instances = instances_per_device * num_gpus
+            parallelism = self.GPU_PARALLELISM * num_gpus
+            slowdown = 1.0
+
+        max_batch_size = int(model_config.get('max_batch_size', 0))
+        server_batch = 1.0
+        if 'dynamic_batching' in model_config and max_batch_size > 1:
+            server_batch = min(max_batch_size,
+                               max(1.0, outstanding / instances))
+
+        active_instances = min(instances, ceil(outstanding / server_batch))
+        batch_latency = slowdown * (self.BATCH_OVERHEAD_MS +
+                                    self.INFERENCE_COST_MS * server_batch)
+        compute = batch_latency * max(1.0, active_instances / parallelism)
+
+        capacity = 1000 * active_instances * server_batch / compute
+        throughput = min(capacity,
+                         1000 * outstanding / (compute + self.CLIENT_OVERHEAD_MS))
+        latency = 1000 * outstanding / throughput
+
+        max_throughput = 1000 * min(instances,
+                                    parallelism) * server_batch / batch_latency
+        utilization = min(1.0, throughput / max_throughput)
+
+        perf_metrics = {
+            "perf_throughput":
+                throughput,
+            "perf_latency_avg":
+                latency,
+            "perf_client_send_recv":
+                self.CLIENT_OVERHEAD_MS,
+            "perf_client_response_wait":
+                latency - self.CLIENT_OVERHEAD_MS,
+            "perf_server_queue":
+                max(0.0, latency - compute - self.CLIENT_OVERHEAD_MS),
+            "perf_server_compute_input":
+                compute * self.COMPUTE_INPUT_FRACTION,
+            "perf_server_compute_infer":
+                compute * (1 - self.COMPUTE_INPUT_FRACTION -
+                           self.COMPUTE_OUTPUT_FRACTION),
+            "perf_server_compute_output":
+                compute * self.COMPUTE_OUTPUT_FRACTION
+        }
+        for tag, (offset, slope) in self.LATENCY_PERCENTILES.items():
+            perf_metrics[tag] = latency * (offset + slope * utilization)
+
+        used_memory = 0.0
+        if not cpu_only:
+            used_memory = instances_per_device * (
+                self.INSTANCE_MEMORY_MB +
+                self.ACTIVATION_MEMORY_MB * max(1, max_batch_size))
+            utilization = utilization * min(instances, parallelism) / parallelism
+        else:
+            utilization = 0.0
+
+        return perf_metrics, utilization, used_memory
+
+    def _combine_pipeline(
+        self, model_estimates: List[Tuple[PerfMetrics, float,
+                                          float]]) -> PerfMetrics:
+        if len(model_estimates) == 1:
+            return model_estimates[0][0]
+
+        combined = {}
+        for tag in PERF_TAGS:
+            values = [estimate[0][tag] for estimate in model_estimates]
+            if tag == "perf_throughput":
+                combined[tag] = min(values)
+            elif tag == "perf_client_send_recv":
+                combined[tag] = values[0]
+            else:
+                combined[tag] = sum(values)
+        return combined
+
+
+class CheckpointPerfModel(PerfModel):
+    """
+    Interpolates the measurements recorded in a Model Analyzer
+    checkpoint. Configurations that were not measured are estimated by
+    inverse distance weighting of the nearest measured configurations,
+    in log2 space of instance count, max batch size and inferences
+    in flight
+    """
+
+    NEAREST_NEIGHBORS = 4
+
+    def __init__(self, checkpoint_path, noise=0.0, seed=0):
+        """
+        Parameters
+        ----------
+        checkpoint_path: str
+            Path to the checkpoint file containing the measurements
+        noise: float
+            Relative standard deviation of the noise applied
+            to every estimated perf metric
+        seed: int
+            Seed for the noise, so that simulated runs are repeatable
+        """
+
+        super().__init__(noise=noise, seed=seed)
+
+        try:
+            with open(checkpoint_path, 'r') as f:
+                results = Results.from_dict(
+                    json.load(f)['ResultManager.results'])
+        except (OSError, ValueError, KeyError) as e:
+            raise TritonModelAnalyzerException(
+                f'Unable to load simulation checkpoint {checkpoint_path}: {e}')
+
+        self._points = defaultdict(list)
+        for models_name in results.get_list_of_models():
+            # Only single model measurements can be attributed to a model
+            if ',' in models_name:
+                continue
+
+            for (run_config, run_config_measurements
+                ) in results.get_model_measurements_dict(models_name).values():
+                model_config = run_config.model_run_configs()[0].model_config(
+                ).get_config()
+
+                for run_config_measurement in run_config_measurements.values(
+                ):
+                    self._add_point(models_name, model_config,
+                                    run_config_measurement)
+
+    def _add_point(self, model_name, model_config, run_config_measurement):
+        pa_params = run_config_measurement.model_specific_pa_params()[0]
+
+        perf_metrics = {
+            tag: run_config_measurement.get_non_gpu_metric_value(tag)
+            for tag in PERF_TAGS
+        }
+
+        # The inferences in flight at a request rate (or trace) follow
+        # from Little's law, as the latencies are in ms
+        if pa_params.get('request-rate-range') or pa_params.get(
+                'request-intervals'):
+            outstanding = round(perf_metrics['perf_throughput'] *
+                                perf_metrics['perf_latency_avg'] / 1000)
+        else:
+            outstanding = int(pa_params.get('batch-size', 1)) * int(
+                pa_params.get('concurrency-range', 1))
+        gpu_metrics = {
+            tag: run_config_measurement.get_gpu_metric_value(tag)
+            for tag in GPU_TAGS
+        }
+
+        self._points[model_name].append(
+            (self._get_coordinates(model_config,
+                                   outstanding), perf_metrics, gpu_metrics))
+
+    def _get_coordinates(self, model_config: Dict,
+                         outstanding: int) -> Tuple[float, ...]:
+        return (log2(self._get_instance_count(model_config)),
+                log2(max(1, int(model_config.get('max_batch_size', 0)))),
+                log2(max(1, outstanding)),
+                float('dynamic_batching' in model_config))
+
+    def _estimate(self, run_config, gpus):
+        perf_metrics = []
+        gpu_estimates = []
+        for model_run_config in run_config.model_run_configs():
+            model_name = model_run_config.model_name()
+            if not self._points[model_name]:
+                raise TritonModelAnalyzerException(
+                    f'Simulation checkpoint has no measurements for {model_name}'
+                )
+
+            model_config = model_run_config.model_config().get_config()
+            offered_throughput = self._get_offered_throughput(
+                model_run_config.perf_config())
+            if offered_throughput:
+                outstanding = self._get_open_loop_outstanding(
+                    lambda outstanding: self._interpolate(
+                        self._points[model_name],
+                        self._get_coordinates(model_config, outstanding))[0][
+                            'perf_throughput'], offered_throughput)
+            else:
+                outstanding = self._get_outstanding_inferences(
+                    model_run_config.perf_config())
+
+            model_perf_metrics, model_gpu_metrics = self._interpolate(
+                self._points[model_name],
+                self._get_coordinates(model_config, outstanding))
+            if offered_throughput:
+                model_perf_metrics['perf_throughput'] = min(
+                    model_perf_metrics['perf_throughput'], offered_throughput)
+            perf_metrics.append(model_perf_metrics)
+            gpu_estimates.append(model_gpu_metrics)
+
+        gpu_metrics = {}
+        if not run_config.cpu_only():
+            used_memory = sum(
+                [estimate['gpu_used_memory'] for estimate in gpu_estimates])
+            total_memory = max([
+                estimate['gpu_used_memory'] + estimate['gpu_free_memory']
+                for estimate in gpu_estimates
+            ])
+            for gpu in gpus:
+                gpu_metrics[gpu.device_uuid()] = {
+                    "gpu_utilization":
+                        min(
+                            100,
+                            sum([
+                                estimate['gpu_utilization']
+                                for estimate in gpu_estimates
+                            ])),
+                    "gpu_power_usage":
+                        max([
+                            estimate['gpu_power_usage']
+                            for estimate in gpu_estimates
+                        ]),
+                    "gpu_used_memory":
+                        used_memory,
+                    "gpu_free_memory":
+                        max(0, total_memory - used_memory)
+                }
+
+        return perf_metrics, gpu_metrics
+
+    def _interpolate(self, points, coordinates):
+        distances = sorted(
+            [(sqrt(sum([(a - b)**2 for a, b in zip(point[0], coordinates)])),
+              point) for point in points],
+            key=lambda x: x[0])[:self.NEAREST_NEIGHBORS]
+
+        if distances[0][0] == 0:
+            _, (_, perf_metrics, gpu_metrics) = distances[0]
+            return dict(perf_metrics), dict(gpu_metrics)
+
+        weights = [1 / distance**2 for distance, _ in distances]
+        total_weight = sum(weights)
+
+        def weighted_average(index, tag):
+            return sum([
+                weight * point[index][tag]
+                for weight, (_, point) in zip(weights, distances)
+            ]) / total_weight
+
+        return ({tag: weighted_average(1, tag) for tag in PERF_TAGS},
+                {tag: weighted_average(2, tag) for tag in GPU_TAGS})
@@ -0,0 +1,787 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, AsyncIterator, Coroutine, Dict, List, Optional, Tuple, TypeVar
+
+from model_analyzer.constants import LOGGER_NAME, \
+    PERF_ANALYZER_MEASUREMENT_WINDOW, PERF_ANALYZER_MINIMUM_REQUEST_COUNT
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
+from model_analyzer.perf_analyzer.perf_analyzer import PerfAnalyzer
+from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.record.record import Record
+from model_analyzer.result.latency_histogram import LatencyHistogram
+
+from tritonclient.grpc import InferInput, InferResult
+from tritonclient.grpc.aio import InferenceServerClient
+from tritonclient.utils import InferenceServerException, triton_to_np_dtype
+
+from math import ceil
+import numpy as np
+import asyncio
+import itertools
+import logging
+import random
+import time
+
+logger = logging.getLogger(LOGGER_NAME)
+
+T = TypeVar('T')
+
+
+class PythonLoadGenerator(PerfAnalyzer):
+    """
+    PerfAnalyzer that generates the load in process, with the asyncio
+    gRPC client of tritonclient, instead of launching the perf_analyzer
+    binary. The requests of each model are sent over one gRPC stream,
+    and the records are computed directly from the latency of every
+    request and from the inference statistics of the server
+
+    As with perf_analyzer, the load is measured in windows until
+    the last STABLE_WINDOW_COUNT windows are stable, and the
+    records are computed over those windows
+
+    The connection and inputs of each model are kept in a
+    PythonLoadSession, so that the measurements of the concurrencies
+    (or request rates) of a loaded model config are steps of one
+    session, which is only warmed up once
+    """
+
+    STABLE_WINDOW_COUNT = 3
+    DEFAULT_STABILITY_PERCENTAGE = 10
+    DEFAULT_MAX_TRIALS = 10
+
+    # perf_analyzer arguments that change what is measured, which
+    # this load generator does not implement
+    UNSUPPORTED_ARGS = [
+        'service-kind', 'request-intervals', 'input-data', 'shared-memory',
+        'num-of-sequences', 'sequence-length', 'sequence-id-range',
+        'binary-search'
+    ]
+
+    def __init__(self,
+                 path,
+                 config,
+                 max_retries,
+                 timeout,
+                 max_cpu_util,
+                 session=None):
+        """
+        Parameters
+        ----------
+        path : full path to the perf_analyzer
+                executable (unused)
+        config : RunConfig
+            The RunConfig with information on what to execute
+        max_retries: int
+            Maximum number of times the parameters are adjusted
+            in an attempt to profile a model.
+        timeout : int
+            Maximum number of seconds that generating
+            the load may take
+        max_cpu_util : float
+            Maximum CPU utilization allowed (unused)
+        session : PythonLoadSession
+            The session to keep the connections and inputs of the
+            models in across measurements. If None, they only last
+            for this measurement
+        """
+
+        super().__init__(path=path,
+                         config=config,
+                         max_retries=max_retries,
+                         timeout=timeout,
+                         max_cpu_util=max_cpu_util)
+        self._session = session
+
+    def run(self, metrics, env=None):
+        """
+        Generates the load of every model of the RunConfig
+
+        Parameters
+        ----------
+        metrics : List of Record types
+            The list of record types to measure
+        env: dict
+            Unused, as the load is generated in process
+
+        Returns
+        -------
+        int
+            PA_SUCCESS, or PA_FAIL if no stable
+            measurement could be obtained
+        """
+
+        if not metrics:
+            return self.PA_SUCCESS
+
+        session = self._session or PythonLoadSession()
+        try:
+            return self._run_in_session(session, metrics)
+        finally:
+            if session is not self._session:
+                session.close()
+
+    def _run_in_session(self, session: 'PythonLoadSession',
+                        metrics: List[Record]) -> int:
+        for _ in range(self._max_retries):
+            try:
+                stable = session.run(self._profile_models(session, metrics),
+                                     timeout=self._timeout)
+            except asyncio.TimeoutError:
+                logger.info(
+                    'Generating the load took very long, stopping it')
+                session.reset()
+                return self.PA_FAIL
+            except (TritonModelAnalyzerException,
+                    InferenceServerException) as e:
+                self._output = str(e)
+                logger.info(f"Generating the load failed: {e}")
+                session.reset()
+                return self.PA_FAIL
+
+            if stable:
+                return self.PA_SUCCESS
+
+        logger.info(f"Generated the load {self._max_retries} times, "
+                    "but no stable measurement was obtained")
+        return self.PA_FAIL
+
+    def _get_cmd(self):
+        return ['python_load_generator'] + [
+            self._get_pa_cli_command(index)
+            for index in range(len(self._config.model_run_configs()))
+        ]
+
+    async def _profile_models(self, session: 'PythonLoadSession',
+                              metrics: List[Record]) -> bool:
+        model_loads = [
+            await session.get_model_load(model_run_config.perf_config())
+            for model_run_config in self._config.model_run_configs()
+        ]
+
+        stable = await asyncio.gather(
+            *[model_load.measure() for model_load in model_loads])
+
+        if not all(stable):
+            # Measured again with larger windows, as
+            # perf_analyzer's parameters are auto adjusted
+            for model_load, model_stable in zip(model_loads, stable):
+                if not model_stable:
+                    self._auto_adjust_parameters_for_perf_config(
+                        model_load.perf_config(),
+                        "Failed to obtain stable measurement")
+            return False
+
+        self._output = '\n'.join(
+            [model_load.summary() for model_load in model_loads])
+        for model_load in model_loads:
+            self._add_model_records(metrics, model_load)
+
+        return True
+
+    def _add_model_records(self, metrics: List[Record],
+                           model_load: '_ModelLoad') -> None:
+        perf_config = model_load.perf_config()
+        model_name = perf_config['model-name']
+        values = model_load.metric_values()
+        requested_tags = [metric.tag for metric in metrics]
+
+        perf_records: List[Record] = []
+        for perf_metric in PerfAnalyzer.perf_metric_table:
+            tag = perf_metric[PerfAnalyzer.METRIC_TAG]
+            if tag in requested_tags and tag in values and not any(
+                    record.tag == tag for record in perf_records):
+                perf_records.append(perf_metric[PerfAnalyzer.RECORD_CLASS](
+                    values[tag]))  # type: ignore
+
+        # As with perf_analyzer, the latency of every request is
+        # only kept when latency histograms are collected
+        if perf_config['profile-export-file']:
+            latency_histogram = model_load.latency_histogram()
+            self._latency_histograms[model_name] = latency_histogram
+            perf_records.extend(
+                self._extract_perf_records_from_histogram(
+                    metrics, latency_histogram))
+
+        self._perf_records[model_name] = perf_records
+
+
+class PythonLoadSession:
+    """
+    The connections to the server and the inputs of the models, kept
+    across the measurements of the python load generator. Each model
+    is connected to, and has its inputs created and is warmed up,
+    once. A measurement then only steps its load
+
+    The session runs its own event loop, as the gRPC
+    connections are bound to the loop they were made in
+    """
+
+    # The seconds gRPC is given to finish shutting the channels down.
+    # Their last events are dispatched to the loop they were made in,
+    # which must still be open
+    CHANNEL_SHUTDOWN_SECONDS = 0.1
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._model_loads: Dict[str, _ModelLoad] = {}
+
+    def run(self, coroutine: Coroutine[Any, Any, T], timeout: float) -> T:
+        """
+        Runs a coroutine in the event loop of the session
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If it took longer than timeout seconds
+        """
+
+        return self._loop.run_until_complete(
+            asyncio.wait_for(coroutine, timeout=timeout))
+
+    async def get_model_load(self,
+                             perf_config: PerfAnalyzerConfig) -> '_ModelLoad':
+        """
+        Returns the load of the model of the perf_analyzer config,
+        connecting to the server if the model has no load yet
+        """
+
+        model_name = perf_config['model-name']
+        model_load = self._model_loads.get(model_name)
+        if model_load and not model_load.is_connected_for(perf_config):
+            await model_load.close()
+            model_load = None
+
+        if model_load is None:
+            model_load = _ModelLoad(perf_config)
+            self._model_loads[model_name] = model_load
+            await model_load.connect()
+
+        model_load.set_perf_config(perf_config)
+        return model_load
+
+    def reset(self) -> None:
+        """
+        Closes the connections of all the models, for
+        instance once the server is restarted
+        """
+
+        for model_load in self._model_loads.values():
+            self._loop.run_until_complete(model_load.close())
+        self._model_loads = {}
+
+    def close(self) -> None:
+        """
+        Closes the connections and then the event loop, once its
+        tasks are cancelled and gRPC has delivered the last events
+        of the closed channels, which it posts to the loop
+        """
+
+        self.reset()
+        self._loop.run_until_complete(self._cancel_tasks())
+        self._loop.run_until_complete(
+            asyncio.sleep(self.CHANNEL_SHUTDOWN_SECONDS))
+        self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        self._loop.close()
+
+    @staticmethod
+    async def _cancel_tasks() -> None:
+        tasks = [
+            task for task in asyncio.all_tasks()
+            if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _MeasurementWindow:
+    """
+    The requests completed in one measurement window, and the
+    inference statistics of the server at the start and end of it
+    """
+
+    def __init__(self, duration: float, latencies: List[float],
+                 start_stats: Dict[str, Tuple[int, int]],
+                 end_stats: Dict[str, Tuple[int, int]]) -> None:
+        self.duration = duration
+        self.latencies = latencies
+        self.start_stats = start_stats
+        self.end_stats = end_stats
+
+    def request_count(self) -> int:
+        return len(self.latencies)
+
+    def average_latency(self) -> float:
+        return sum(self.latencies) / len(self.latencies)
+
+
+class _ModelLoad:
+    """
+    The load of one model. Requests are sent over one gRPC stream per
+    measurement, and matched to their responses by their ids. The
+    connection and the inputs are kept from one measurement to the next
+    """
+
+    # Server statistics, and the tags of their average duration
+    SERVER_STATS = {
+        'queue': 'perf_server_queue',
+        'compute_input': 'perf_server_compute_input',
+        'compute_infer': 'perf_server_compute_infer',
+        'compute_output': 'perf_server_compute_output'
+    }
+
+    # perf_analyzer arguments of the connection to the server
+    CONNECTION_ARGS = [
+        'url', 'protocol', 'model-version', 'ssl-grpc-use-ssl',
+        'ssl-grpc-root-certifications-file', 'ssl-grpc-private-key-file',
+        'ssl-grpc-certificate-chain-file'
+    ]
+
+    def __init__(self, perf_config: PerfAnalyzerConfig) -> None:
+        self._perf_config = perf_config
+        self._model_name = perf_config['model-name']
+        self._batch_size = int(perf_config['batch-size'] or 1)
+
+        self._client: Optional[InferenceServerClient] = None
+        self._metadata: dict = {}
+        self._max_batch_size = 0
+        self._inputs: List[InferInput] = []
+        self._inputs_key: Optional[Tuple] = None
+        self._warmed_up = False
+
+        self._request_ids = itertools.count()
+        self._requests: asyncio.Queue = asyncio.Queue()
+        self._pending_requests: Dict[str, Tuple[asyncio.Future, float]] = {}
+        self._error: Optional[BaseException] = None
+
+        self._window_latencies: List[float] = []
+        self._window_full = asyncio.Event()
+        self._windows: List[_MeasurementWindow] = []
+
+    def perf_config(self) -> PerfAnalyzerConfig:
+        return self._perf_config
+
+    def is_connected_for(self, perf_config: PerfAnalyzerConfig) -> bool:
+        """
+        Returns true if the connection of this load
+        is the one of the perf_analyzer config
+        """
+
+        return all(perf_config[arg] == self._perf_config[arg]
+                   for arg in self.CONNECTION_ARGS)
+
+    def set_perf_config(self, perf_config: PerfAnalyzerConfig) -> None:
+        """
+        Sets the perf_analyzer config of the next measurement,
+        creating the inputs again if their shapes changed
+        """
+
+        for arg in PythonLoadGenerator.UNSUPPORTED_ARGS:
+            if perf_config[arg]:
+                raise TritonModelAnalyzerException(
+                    f"perf_analyzer flag {arg} is not supported by"
+                    " the python load generator")
+
+        self._perf_config = perf_config
+        self._batch_size = int(perf_config['batch-size'] or 1)
+
+        inputs_key = (self._batch_size, str(perf_config['shape']))
+        if inputs_key != self._inputs_key:
+            self._create_inputs()
+            self._inputs_key = inputs_key
+
+    async def connect(self) -> None:
+        """
+        Connects to the server and gets the
+        metadata and config of the model
+        """
+
+        if self._perf_config['protocol'] not in [None, 'grpc']:
+            raise TritonModelAnalyzerException(
+                "The python load generator only supports the grpc protocol")
+
+        self._client = InferenceServerClient(
+            self._perf_config['url'],
+            ssl=str(self._perf_config['ssl-grpc-use-ssl']).lower() == 'true',
+            root_certificates=self._perf_config[
+                'ssl-grpc-root-certifications-file'],
+            private_key=self._perf_config['ssl-grpc-private-key-file'],
+            certificate_chain=self._perf_config[
+                'ssl-grpc-certificate-chain-file'])
+        self._metadata = await self._client.get_model_metadata(
+            self._model_name, self._get_model_version(), as_json=True)
+        model_config = await self._client.get_model_config(
+            self._model_name, self._get_model_version(), as_json=True)
+        self._max_batch_size = int(model_config['config'].get(
+            'max_batch_size', 0))
+
+    async def close(self) -> None:
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+    async def measure(self) -> bool:
+        """
+        Generates the load until the last windows are
+        stable, or up to the maximum number of trials.
+        The first measurement of the load starts with a
+        window that warms the model up, and is dropped
+
+        Returns
+        -------
+        bool
+            True if a stable measurement was obtained
+        """
+
+        assert self._client is not None, "The model load is not connected"
+
+        self._reset_measurement()
+        responses = self._client.stream_infer(self._get_requests())
+        response_reader = asyncio.create_task(self._read_responses(responses))
+        load = asyncio.create_task(self._generate_load())
+
+        max_trials = int(self._perf_config['max-trials'] or
+                         PythonLoadGenerator.DEFAULT_MAX_TRIALS)
+        try:
+            stats = await self._get_server_stats()
+            if not self._warmed_up:
+                stats = await self._measure_window(load, stats)
+                self._windows = []
+                self._warmed_up = True
+
+            for _ in range(max_trials):
+                stats = await self._measure_window(load, stats)
+                if self._is_stable():
+                    return True
+
+            return False
+        finally:
+            load.cancel()
+            response_reader.cancel()
+            responses.cancel()
+            await asyncio.gather(load, response_reader, return_exceptions=True)
+
+    def metric_values(self) -> Dict[str, float]:
+        """
+        Returns
+        -------
+        dict
+            The value of each metric over the stable
+            windows, with latencies in milliseconds
+        """
+
+        windows = self._windows[-PythonLoadGenerator.STABLE_WINDOW_COUNT:]
+        latencies = sorted(
+            [latency for window in windows for latency in window.latencies])
+
+        values = {
+            'perf_throughput':
+                len(latencies) * self._batch_size /
+                sum([window.duration for window in windows]),
+            'perf_latency_avg':
+                sum(latencies) / len(latencies) / 1000,
+            'perf_latency_p50':
+                self._get_percentile(latencies, 50) / 1000,
+            'perf_latency_p90':
+                self._get_percentile(latencies, 90) / 1000,
+            'perf_latency_p95':
+                self._get_percentile(latencies, 95) / 1000,
+            'perf_latency_p99':
+                self._get_percentile(latencies, 99) / 1000
+        }
+
+        start_stats = windows[0].start_stats
+        end_stats = windows[-1].end_stats
+        for stat, tag in self.SERVER_STATS.items():
+            count = end_stats[stat][0] - start_stats[stat][0]
+            if count > 0:
+                duration_ns = end_stats[stat][1] - start_stats[stat][1]
+                values[tag] = duration_ns / count / 1000000
+
+        return values
+
+    def latency_histogram(self) -> LatencyHistogram:
+        latency_histogram = LatencyHistogram()
+        for window in self._windows[-PythonLoadGenerator.STABLE_WINDOW_COUNT:]:
+            for latency in window.latencies:
+                latency_histogram.record(latency)
+
+        return latency_histogram
+
+    def summary(self) -> str:
+        values = self.metric_values()
+        return (f"{self._model_name}: {self._get_load_description()},"
+                f" throughput: {values['perf_throughput']:.2f} infer/sec,"
+                f" latency {values['perf_latency_avg'] * 1000:.0f} usec")
+
+    def _reset_measurement(self) -> None:
+        # Requests of an earlier measurement are never
+        # sent or matched to responses again
+        self._requests = asyncio.Queue()
+        self._pending_requests = {}
+        self._error = None
+
+        self._window_latencies = []
+        self._window_full = asyncio.Event()
+        self._windows = []
+
+    async def _measure_window(
+            self, load: asyncio.Task,
+            start_stats: Dict[str, Tuple[int, int]]) -> Dict[str, Tuple[int, int]]:
+        self._window_latencies = []
+        self._window_full.clear()
+        start_time = time.perf_counter()
+
+        if self._perf_config['measurement-mode'] == 'time_windows':
+            window_ms = int(self._perf_config['measurement-interval'] or
+                            PERF_ANALYZER_MEASUREMENT_WINDOW)
+            await asyncio.wait([load], timeout=window_ms / 1000)
+        else:
+            window_full = asyncio.create_task(self._window_full.wait())
+            await asyncio.wait([load, window_full],
+                               return_when=asyncio.FIRST_COMPLETED)
+            window_full.cancel()
+
+        # The load only stops when a request fails
+        if load.done():
+            load.result()
+
+        duration = time.perf_counter() - start_time
+        latencies = self._window_latencies
+        end_stats = await self._get_server_stats()
+        self._windows.append(
+            _MeasurementWindow(duration, latencies, start_stats, end_stats))
+
+        return end_stats
+
+    def _is_stable(self) -> bool:
+        windows = self._windows[-PythonLoadGenerator.STABLE_WINDOW_COUNT:]
+        if len(windows) < PythonLoadGenerator.STABLE_WINDOW_COUNT or any(
+                not window.request_count() for window in windows):
+            return False
+
+        stability = 1 + float(
+            self._perf_config['stability-percentage'] or
+            PythonLoadGenerator.DEFAULT_STABILITY_PERCENTAGE) / 100
+        throughputs = [
+            window.request_count() / window.duration for window in windows
+        ]
+        latencies = [window.average_latency() for window in windows]
+
+        return max(throughputs) <= min(throughputs) * stability and max(
+            latencies) <= min(latencies) * stability
+
+    async def _generate_load(self) -> None:
+        request_rate = self._get_load_value('request-rate-range')
+        if request_rate:
+            await self._generate_request_rate(request_rate)
+        else:
+            concurrency = self._get_load_value('concurrency-range') or 1
+            await asyncio.gather(
+                *[self._send_requests() for _ in range(int(concurrency))])
+
+    async def _send_requests(self) -> None:
+        while True:
+            await self._send_request()
+
+    async def _generate_request_rate(self, request_rate: float) -> None:
+        loop = asyncio.get_running_loop()
+        poisson = self._perf_config['request-distribution'] == 'poisson'
+        in_flight_requests = set()
+
+        send_time = loop.time()
+        while True:
+            if self._error:
+                raise self._error
+
+            request = asyncio.create_task(self._send_request())
+            in_flight_requests.add(request)
+            request.add_done_callback(self._on_request_done)
+            request.add_done_callback(in_flight_requests.discard)
+
+            send_time += random.expovariate(
+                request_rate) if poisson else 1 / request_rate
+            await asyncio.sleep(max(0, send_time - loop.time()))
+
+    def _on_request_done(self, request: asyncio.Task) -> None:
+        if not request.cancelled() and request.exception():
+            self._error = self._error or request.exception()
+
+    async def _send_request(self) -> None:
+        request_id = str(next(self._request_ids))
+        response = asyncio.get_running_loop().create_future()
+        self._pending_requests[request_id] = (response, time.perf_counter())
+
+        await self._requests.put({
+            'model_name': self._model_name,
+            'model_version': self._get_model_version(),
+            'inputs': self._inputs,
+            'request_id': request_id
+        })
+        await response
+
+    async def _get_requests(self) -> AsyncIterator[dict]:
+        while True:
+            yield await self._requests.get()
+
+    async def _read_responses(
+        self, responses: AsyncIterator[Tuple[
+            InferResult, Optional[InferenceServerException]]]
+    ) -> None:
+        try:
+            async for result, error in responses:
+                if error:
+                    raise error
+
+                request_id = result.get_response().id
+                response, start_time = self._pending_requests.pop(request_id)
+                self._add_latency((time.perf_counter() - start_time) * 1000000)
+                if not response.done():
+                    response.set_result(None)
+
+            raise TritonModelAnalyzerException(
+                f"The server closed the stream of model {self._model_name}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            for response, _ in self._pending_requests.values():
+                if not response.done():
+                    response.set_exception(e)
+            self._pending_requests = {}
+            self._error = e
+
+    def _add_latency(self, latency: float) -> None:
+        self._window_latencies.append(latency)
+
+        request_count = int(self._perf_config['measurement-request-count'] or
+                            PERF_ANALYZER_MINIMUM_REQUEST_COUNT)
+        if len(self._window_latencies) >= request_count:
+            self._window_full.set()
+
+    async def _get_server_stats(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Returns the count and total duration, in nanoseconds,
+        of each server statistic, summed over the model versions
+        """
+
+        assert self._client is not None, "The model load is not connected"
+
+        statistics = await self._client.get_inference_statistics(
+            self._model_name, self._get_model_version(), as_json=True)
+
+        # Unsigned 64-bit integers are strings in JSON,
+        # and statistics that are 0 are left out
+        stats = {stat: (0, 0) for stat in self.SERVER_STATS}
+        for model_stats in statistics.get('model_stats', []):
+            inference_stats = model_stats.get('inference_stats', {})
+            for stat in self.SERVER_STATS:
+                count, duration_ns = stats[stat]
+                stat_dict = inference_stats.get(stat, {})
+                stats[stat] = (count + int(stat_dict.get('count', 0)),
+                               duration_ns + int(stat_dict.get('ns', 0)))
+
+        return stats
+
+    def _create_inputs(self) -> None:
+        if self._batch_size > max(self._max_batch_size, 1):
+            raise TritonModelAnalyzerException(
+                f"Batch size {self._batch_size} is larger than the max"
+                f" batch size of model {self._model_name}")
+
+        self._inputs = [
+            self._create_input(tensor, self._max_batch_size > 0)
+            for tensor in self._metadata.get('inputs', [])
+        ]
+
+    def _create_input(self, tensor: dict, batching: bool) -> InferInput:
+        shape = [int(dim) for dim in tensor['shape']]
+
+        # The metadata of models that batch includes the batch dimension
+        if batching:
+            shape = shape[1:]
+
+        user_shapes = self._get_user_shapes()
+        if tensor['name'] in user_shapes:
+            shape = user_shapes[tensor['name']]
+        elif any(dim < 0 for dim in shape):
+            raise TritonModelAnalyzerException(
+                f"Input {tensor['name']} of model {self._model_name} has"
+                " a variable shape, which must be set with the shape"
+                " perf_analyzer flag")
+
+        if batching:
+            shape = [self._batch_size] + shape
+
+        infer_input = InferInput(tensor['name'], shape, tensor['datatype'])
+        infer_input.set_data_from_numpy(
+            self._create_input_data(tensor['datatype'], shape))
+
+        return infer_input
+
+    def _create_input_data(self, datatype: str, shape: List[int]) -> np.ndarray:
+        if datatype == 'BYTES':
+            return np.full(shape, b'0', dtype=np.object_)
+
+        dtype = triton_to_np_dtype(datatype)
+        if dtype is None or datatype == 'BF16':
+            raise TritonModelAnalyzerException(
+                f"Inputs of type {datatype} are not supported"
+                " by the python load generator")
+
+        # Random data, as perf_analyzer generates by default
+        rng = np.random.default_rng()
+        if np.issubdtype(dtype, np.floating):
+            return rng.random(shape).astype(dtype)
+        if np.issubdtype(dtype, np.integer):
+            return rng.integers(0, 100, shape).astype(dtype)
+        return np.zeros(shape, dtype=dtype)
+
+    def _get_user_shapes(self) -> Dict[str, List[int]]:
+        shape_args = self._perf_config['shape'] or []
+        if type(shape_args) is str:
+            shape_args = [shape_args]
+
+        user_shapes = {}
+        for shape_arg in shape_args:
+            name, dims = shape_arg.rsplit(':', 1)
+            user_shapes[name] = [int(dim) for dim in dims.split(',')]
+
+        return user_shapes
+
+    def _get_load_value(self, load_parameter: str) -> Optional[float]:
+        value = self._perf_config[load_parameter]
+        if value is None:
+            return None
+
+        try:
+            return float(value)
+        except ValueError:
+            raise TritonModelAnalyzerException(
+                f"The python load generator only supports a single"
+                f" {load_parameter} value, not {value}")
+
+    def _get_load_description(self) -> str:
+        if self._perf_config['request-rate-range']:
+            return f"request rate {self._perf_config['request-rate-range']}"
+        return f"concurrency {self._perf_config['concurrency-range'] or 1}"
+
+    def _get_model_version(self) -> str:
+        return str(self._perf_config['model-version'] or '')
+
+    @staticmethod
+    def _get_percentile(sorted_values: List[float], percentile: int) -> float:
+        rank = max(1, ceil(percentile / 100 * len(sorted_values)))
+        return sorted_values[rank - 1]
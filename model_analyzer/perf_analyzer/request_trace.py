@@ -0,0 +1,353 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, List, Optional
+
+from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
+
+from math import prod
+
+import json
+import logging
+import os
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class RequestTrace:
+    """
+    Converts a recorded trace of requests into the files perf_analyzer
+    replays for each model: the intervals between its requests
+    (--request-intervals) and the shapes of their inputs (--input-data)
+
+    The trace is a JSON Lines file with one request per line, in
+    order of time. For example:
+
+        {"timestamp": 12.5, "model_name": "my_model",
+         "inputs": {"INPUT0": {"shape": [16]}}}
+
+    The timestamp is in seconds. Requests without a model name are
+    sent to every model, and requests without inputs use the input
+    data generated by perf_analyzer. perf_analyzer cycles through the
+    steps of the input data, so the input data of short traces has
+    one step per request, in order. Longer traces have
+    MAX_INPUT_DATA_STEPS steps, where each distinct set of input shapes
+    is repeated in proportion to its share of the requests, and spread
+    evenly, so that the mix of shapes of the trace is kept
+
+    The trace is streamed and the request intervals are written in
+    chunks, so that traces larger than memory can be converted
+    """
+
+    CHUNK_SIZE = 4096
+
+    # Every step holds the content of its inputs, so the
+    # steps are bounded for the input data to stay small
+    MAX_INPUT_DATA_STEPS = 100
+
+    def __init__(self, trace_path: str, output_path: str) -> None:
+        """
+        Parameters
+        ----------
+        trace_path : str
+            The path to the recorded trace
+        output_path : str
+            The directory to write the files of every model to
+        """
+
+        self._trace_path = trace_path
+        self._output_path = output_path
+
+    @staticmethod
+    def get_output_path(export_path: str) -> str:
+        """
+        Returns the directory traces are converted to, under the export path
+        """
+
+        return os.path.join(export_path, 'request_traces')
+
+    @staticmethod
+    def get_perf_analyzer_flags(output_path: str,
+                                model_name: str) -> Dict[str, str]:
+        """
+        Parameters
+        ----------
+        output_path : str
+            The directory the trace was converted to
+        model_name : str
+            The name of the model to replay the trace of
+
+        Returns
+        -------
+        dict
+            The perf_analyzer flags that replay the trace of the model
+        """
+
+        flags = {
+            'request-intervals':
+                RequestTrace._get_intervals_file(output_path, model_name)
+        }
+
+        input_data_file = RequestTrace._get_input_data_file(
+            output_path, model_name)
+        if os.path.isfile(input_data_file):
+            flags['input-data'] = input_data_file
+
+        return flags
+
+    def convert(
+        self,
+        model_names: List[str],
+        input_data_types: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> None:
+        """
+        Writes the files that replay the trace of every model
+
+        Parameters
+        ----------
+        model_names : list of str
+            The models to replay the trace of. Requests to
+            other models are skipped
+        input_data_types : dict
+            keys are model names, and values map the names of the
+            inputs of the model to their data type in the model
+            config (e.g. 'TYPE_STRING'). Inputs without one are
+            filled with numbers
+
+        Raises
+        ------
+        TritonModelAnalyzerException
+            If the trace cannot be read, or has
+            fewer than two requests of a model
+        """
+
+        os.makedirs(self._output_path, exist_ok=True)
+        logger.info(f"Converting request trace {self._trace_path}")
+
+        input_data_types = input_data_types or {}
+        writers = {
+            model_name: _ModelTraceWriter(
+                RequestTrace._get_intervals_file(self._output_path,
+                                                 model_name),
+                RequestTrace._get_input_data_file(self._output_path,
+                                                  model_name),
+                input_data_types.get(model_name, {}))
+            for model_name in model_names
+        }
+
+        try:
+            self._write_requests(writers)
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        for model_name, writer in writers.items():
+            if writer.request_count() < 2:
+                raise TritonModelAnalyzerException(
+                    f"Request trace {self._trace_path} must have at least two"
+                    f" requests of model {model_name}")
+
+            logger.info(f"Replaying {writer.request_count()} requests"
+                        f" of the trace for model {model_name}")
+
+    def _write_requests(self, writers: Dict[str, '_ModelTraceWriter']) -> None:
+        try:
+            with open(self._trace_path, 'r') as f:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+
+                    request = self._parse_request(line, line_number)
+                    model_name = request.get('model_name')
+                    if model_name is None:
+                        request_writers = list(writers.values())
+                    elif model_name in writers:
+                        request_writers = [writers[model_name]]
+                    else:
+                        continue
+
+                    for writer in request_writers:
+                        writer.add_request(request['timestamp'],
+                                           request.get('inputs'), line_number)
+        except OSError as e:
+            raise TritonModelAnalyzerException(
+                f"Unable to read request trace {self._trace_path}: {e}")
+
+    def _parse_request(self, line: str, line_number: int) -> dict:
+        try:
+            request = json.loads(line)
+            float(request['timestamp'])
+        except (ValueError, TypeError, KeyError):
+            raise TritonModelAnalyzerException(
+                f"Line {line_number} of request trace {self._trace_path} is"
+                " not a request with a timestamp")
+
+        return request
+
+    @staticmethod
+    def _get_intervals_file(output_path: str, model_name: str) -> str:
+        return os.path.join(output_path, f'{model_name}-request-intervals.txt')
+
+    @staticmethod
+    def _get_input_data_file(output_path: str, model_name: str) -> str:
+        return os.path.join(output_path, f'{model_name}-input-data.json')
+
+
+class _ModelTraceWriter:
+    """
+    Writes the request intervals (in microseconds) of the requests of
+    one model, a chunk at a time, and the input data of their input
+    shapes once all the requests are counted
+    """
+
+    def __init__(self, intervals_file: str, input_data_file: str,
+                 input_data_types: Dict[str, str]) -> None:
+        self._intervals_file = intervals_file
+        self._input_data_file = input_data_file
+        self._input_data_types = input_data_types
+
+        # Input data from an earlier conversion must not be replayed
+        if os.path.isfile(input_data_file):
+            os.remove(input_data_file)
+
+        self._intervals_writer = open(intervals_file, 'w')
+        self._has_inputs: Optional[bool] = None
+
+        # The distinct sets of input shapes, their number of
+        # requests and, while the trace is short, their order
+        self._shape_set_indexes: Dict[str, int] = {}
+        self._shape_sets: List[Dict[str, List[int]]] = []
+        self._shape_set_counts: List[int] = []
+        self._shape_set_order: Optional[List[int]] = []
+
+        self._request_count = 0
+        self._last_timestamp = 0.0
+        self._intervals: List[str] = []
+
+    def request_count(self) -> int:
+        return self._request_count
+
+    def add_request(self, timestamp: float, inputs: Optional[dict],
+                    line_number: int) -> None:
+        timestamp = float(timestamp)
+        if self._request_count and timestamp < self._last_timestamp:
+            raise TritonModelAnalyzerException(
+                f"Request on line {line_number} of the request trace is"
+                " earlier than the one before it. The trace must be sorted")
+
+        if self._has_inputs is None:
+            self._has_inputs = bool(inputs)
+        elif self._has_inputs != bool(inputs):
+            raise TritonModelAnalyzerException(
+                f"Request on line {line_number} of the request trace must"
+                " have inputs if and only if the other requests of the model"
+                " have them")
+
+        if self._request_count:
+            self._intervals.append(
+                str(round((timestamp - self._last_timestamp) * 1000000)))
+        if inputs:
+            try:
+                shapes = {
+                    name: [int(dim) for dim in tensor['shape']]
+                    for name, tensor in inputs.items()
+                }
+            except (AttributeError, KeyError, TypeError, ValueError):
+                raise TritonModelAnalyzerException(
+                    f"Request on line {line_number} of the request trace must"
+                    " map each input to its shape")
+
+            self._add_shape_set(shapes)
+
+        self._last_timestamp = timestamp
+        self._request_count += 1
+
+        if len(self._intervals) >= RequestTrace.CHUNK_SIZE:
+            self._write_chunk()
+
+    def close(self) -> None:
+        self._write_chunk()
+        self._intervals_writer.close()
+
+        if self._shape_sets:
+            self._write_input_data()
+
+    def _add_shape_set(self, shapes: Dict[str, List[int]]) -> None:
+        key = json.dumps(shapes, sort_keys=True)
+        index = self._shape_set_indexes.get(key)
+        if index is None:
+            index = len(self._shape_sets)
+            self._shape_set_indexes[key] = index
+            self._shape_sets.append(shapes)
+            self._shape_set_counts.append(0)
+
+        self._shape_set_counts[index] += 1
+        if self._shape_set_order is not None:
+            self._shape_set_order.append(index)
+            if len(self._shape_set_order) > RequestTrace.MAX_INPUT_DATA_STEPS:
+                self._shape_set_order = None
+
+    def _get_input_data_steps(self) -> List[int]:
+        """
+        Returns the index of the set of input shapes of each
+        step: one per request if the trace is short, and
+        otherwise in proportion to their number of requests
+        """
+
+        if self._shape_set_order is not None:
+            return self._shape_set_order
+
+        scale = RequestTrace.MAX_INPUT_DATA_STEPS / sum(self._shape_set_counts)
+        positions = []
+        for index, count in enumerate(self._shape_set_counts):
+            # Rare sets of shapes still get a step
+            repeats = max(1, round(count * scale))
+            positions += [((step + 0.5) / repeats, index)
+                          for step in range(repeats)]
+
+        return [index for _, index in sorted(positions)]
+
+    def _write_input_data(self) -> None:
+        with open(self._input_data_file, 'w') as f:
+            f.write('{"data": [\n')
+            f.write(',\n'.join(
+                self._create_input_data_step(self._shape_sets[index])
+                for index in self._get_input_data_steps()))
+            f.write('\n]}\n')
+
+    def _create_input_data_step(self, shapes: Dict[str, List[int]]) -> str:
+        # perf_analyzer needs the content of every input, so inputs are
+        # filled with zeros (of their data type) of the recorded shape
+        return json.dumps({
+            name: {
+                'content': [self._get_zero(name)] * prod(shape),
+                'shape': shape
+            } for name, shape in shapes.items()
+        })
+
+    def _get_zero(self, input_name: str) -> Any:
+        data_type = self._input_data_types.get(input_name)
+        if data_type == 'TYPE_STRING':
+            return '0'
+        elif data_type == 'TYPE_BOOL':
+            return False
+        else:
+            return 0
+
+    def _write_chunk(self) -> None:
+        if self._intervals:
+            self._intervals_writer.write('\n'.join(self._intervals) + '\n')
+            self._intervals = []
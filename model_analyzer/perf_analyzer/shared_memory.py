@@ -0,0 +1,163 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, List, Optional
+
+from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
+from model_analyzer.constants import LOGGER_NAME
+
+from math import prod
+
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class SharedMemory:
+    """
+    Selects the shared memory that perf_analyzer passes the
+    tensors of a model through, instead of copying them to
+    the server over the network
+
+    With 'auto', shared memory is used when perf_analyzer runs on
+    the same host as the server, and the tensors of an inference
+    are large enough for their copies to dominate the latency.
+    CUDA shared memory is used for models with GPU instances, and
+    system shared memory otherwise
+    """
+
+    # The launch modes where perf_analyzer and the server share a host.
+    # In c_api mode there are no copies to avoid
+    CO_LOCATED_LAUNCH_MODES = ['local', 'docker']
+
+    # The size of the tensors of one inference, in
+    # bytes, from which shared memory is used
+    MINIMUM_TENSOR_BYTES = 1024 * 1024
+
+    DATA_TYPE_BYTES = {
+        'TYPE_BOOL': 1,
+        'TYPE_UINT8': 1,
+        'TYPE_UINT16': 2,
+        'TYPE_UINT32': 4,
+        'TYPE_UINT64': 8,
+        'TYPE_INT8': 1,
+        'TYPE_INT16': 2,
+        'TYPE_INT32': 4,
+        'TYPE_INT64': 8,
+        'TYPE_FP16': 2,
+        'TYPE_FP32': 4,
+        'TYPE_FP64': 8,
+        'TYPE_BF16': 2
+    }
+
+    @staticmethod
+    def get_perf_analyzer_flags(profile_config: ConfigCommandProfile,
+                                model_config: Dict,
+                                perf_analyzer_flags: Dict) -> Dict[str, str]:
+        """
+        Parameters
+        ----------
+        profile_config : ConfigCommandProfile
+            The configuration of model analyzer for the profile step
+        model_config : dict
+            The config of the model variant that is profiled
+        perf_analyzer_flags : dict
+            The perf_analyzer flags of the model, whose
+            shape flags set the size of variable inputs
+
+        Returns
+        -------
+        dict
+            The perf_analyzer flags that select the shared memory,
+            empty if the tensors are copied to the server
+        """
+
+        mode = profile_config.perf_analyzer_shared_memory
+        if mode in ['system', 'cuda']:
+            return {'shared-memory': mode}
+        if mode != 'auto' or not SharedMemory._is_co_located(profile_config):
+            return {}
+
+        tensor_bytes = SharedMemory.get_tensor_bytes(model_config,
+                                                     perf_analyzer_flags)
+        if not tensor_bytes or tensor_bytes < SharedMemory.MINIMUM_TENSOR_BYTES:
+            return {}
+
+        mode = 'cuda' if SharedMemory._has_only_gpu_instances(
+            model_config) else 'system'
+        logger.info(
+            f"Passing the tensors of model {model_config['name']} through"
+            f" {mode} shared memory, instead of copying"
+            f" {tensor_bytes / 1024 / 1024:.1f} MB per inference")
+
+        return {'shared-memory': mode}
+
+    @staticmethod
+    def get_tensor_bytes(model_config: Dict,
+                         perf_analyzer_flags: Dict) -> Optional[int]:
+        """
+        Returns the size, in bytes, of the inputs and outputs of one
+        inference of the model, or None if it cannot be known from
+        its config, as a tensor has a variable shape or is a string
+        """
+
+        input_shapes = SharedMemory._get_input_shapes(perf_analyzer_flags)
+
+        # Only the shapes of inputs can be set
+        tensors = [(tensor, input_shapes.get(tensor['name']))
+                   for tensor in model_config.get('input', [])]
+        tensors += [(tensor, None) for tensor in model_config.get('output', [])]
+
+        tensor_bytes = 0
+        for tensor, shape in tensors:
+            dims = [int(dim) for dim in tensor.get('dims', [])]
+            if any(dim < 0 for dim in dims):
+                if shape is None:
+                    return None
+                dims = shape
+
+            data_type_bytes = SharedMemory.DATA_TYPE_BYTES.get(
+                tensor.get('data_type'))
+            if data_type_bytes is None:
+                return None
+
+            tensor_bytes += prod(dims) * data_type_bytes
+
+        return tensor_bytes or None
+
+    @staticmethod
+    def _is_co_located(profile_config: ConfigCommandProfile) -> bool:
+        # The python load generator does not support shared memory
+        return profile_config.load_generator == 'perf_analyzer' and \
+            profile_config.triton_launch_mode in SharedMemory.CO_LOCATED_LAUNCH_MODES
+
+    @staticmethod
+    def _get_input_shapes(perf_analyzer_flags: Dict) -> Dict[str, List[int]]:
+        shape_flags = (perf_analyzer_flags or {}).get('shape') or []
+        if type(shape_flags) is str:
+            shape_flags = [shape_flags]
+
+        input_shapes = {}
+        for shape_flag in shape_flags:
+            name, dims = shape_flag.rsplit(':', 1)
+            input_shapes[name] = [int(dim) for dim in dims.split(',')]
+
+        return input_shapes
+
+    @staticmethod
+    def _has_only_gpu_instances(model_config: Dict) -> bool:
+        instance_groups = model_config.get('instance_group', [])
+        return bool(instance_groups) and all(
+            instance_group.get('kind', 'KIND_GPU') == 'KIND_GPU'
+            for instance_group in instance_groups)
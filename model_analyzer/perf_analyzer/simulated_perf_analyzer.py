@@ -0,0 +1,209 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from .perf_analyzer import PerfAnalyzer
+from .perf_model import PerfModel, QueueingPerfModel, CheckpointPerfModel
+from model_analyzer.config.input.config_command_profile \
+    import ConfigCommandProfile
+from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
+
+import csv
+import json
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class SimulatedPerfAnalyzer(PerfAnalyzer):
+    """
+    PerfAnalyzer that writes the latency reports estimated by a
+    PerfModel instead of running the perf_analyzer binary. The reports
+    are then parsed exactly as real perf_analyzer output would be
+    """
+
+    # Requests in a simulated profile export, whose latencies
+    # follow the estimated latency percentiles
+    PROFILE_EXPORT_REQUEST_COUNT = 10000
+
+    def __init__(self, path, config, max_retries, timeout, max_cpu_util,
+                 perf_model, gpus):
+        """
+        Parameters
+        ----------
+        path : full path to the perf_analyzer
+                executable (unused)
+        config : RunConfig
+            The RunConfig with information on what to execute
+        max_retries: int
+            Maximum number of times perf_analyzer adjusts parameters
+            in an attempt to profile a model.
+        timeout : int
+            Maximum number of seconds that perf_analyzer
+            will wait until the execution is complete.
+        max_cpu_util : float
+            Maximum CPU utilization allowed for perf_analyzer
+        perf_model : PerfModel
+            The model used to estimate the measurements
+        gpus : List of GPUDevices
+            The simulated GPUs
+        """
+
+        super().__init__(path=path,
+                         config=config,
+                         max_retries=max_retries,
+                         timeout=timeout,
+                         max_cpu_util=max_cpu_util)
+        self._perf_model = perf_model
+        self._gpus = gpus
+
+    @staticmethod
+    def create_perf_model(config: ConfigCommandProfile) -> PerfModel:
+        """
+        Returns the PerfModel selected by the profile config
+
+        Parameters
+        ----------
+        config : ConfigCommandProfile
+            The model analyzer's config
+        """
+
+        if config.simulation_checkpoint:
+            return CheckpointPerfModel(config.simulation_checkpoint,
+                                       noise=config.simulation_noise,
+                                       seed=config.simulation_seed)
+        return QueueingPerfModel(noise=config.simulation_noise,
+                                 seed=config.simulation_seed)
+
+    def _execute_pa(self, env):
+        logger.debug(f"Simulating {self._get_cmd()}")
+
+        try:
+            perf_metrics, gpu_metrics = self._perf_model.estimate(
+                self._config, self._gpus)
+        except TritonModelAnalyzerException as e:
+            self._output = str(e)
+            logger.info(f"Simulating perf_analyzer failed: {e}")
+            return self.PA_FAIL
+
+        self._output = ""
+        for model_run_config, model_perf_metrics in zip(
+                self._config.model_run_configs(), perf_metrics):
+            perf_config = model_run_config.perf_config()
+            self._write_latency_report(perf_config, model_perf_metrics,
+                                       gpu_metrics)
+            if perf_config['profile-export-file']:
+                self._write_profile_export(perf_config, model_perf_metrics)
+            self._output += (
+                f"{perf_config['model-name']}: "
+                f"throughput: {model_perf_metrics['perf_throughput']:.2f} infer/sec, "
+                f"latency {model_perf_metrics['perf_latency_avg'] * 1000:.0f} usec\n"
+            )
+
+        return self.PA_SUCCESS
+
+    def _write_latency_report(self, perf_config, perf_metrics, gpu_metrics):
+        """
+        Writes the metrics to the latency report file in
+        the format of perf_analyzer's verbose CSV
+        """
+
+        if perf_config['request-rate-range']:
+            row = {'Request Rate': perf_config['request-rate-range']}
+        else:
+            row = {'Concurrency': perf_config['concurrency-range']}
+
+        written_tags = set()
+        for tag, csv_string, _, reduction_factor in PerfAnalyzer.perf_metric_table:
+            if tag in perf_metrics and tag not in written_tags:
+                written_tags.add(tag)
+                row[csv_string] = perf_metrics[tag] * float(reduction_factor)
+
+        for tag, csv_string, _, reduction_factor in PerfAnalyzer.gpu_metric_table:
+            values = []
+            for uuid, metrics in gpu_metrics.items():
+                value = metrics[tag]
+
+                # perf_analyzer reports the total, not the free, GPU memory
+                if tag == 'gpu_free_memory':
+                    value += metrics['gpu_used_memory']
+
+                values.append(f"{uuid}:{value * float(reduction_factor)}")
+            row[csv_string] = ";".join(values)
+
+        with open(perf_config['latency-report-file'], mode='w') as f:
+            csv_writer = csv.DictWriter(f, fieldnames=list(row.keys()))
+            csv_writer.writeheader()
+            csv_writer.writerow(row)
+
+    def _write_profile_export(self, perf_config, perf_metrics):
+        """
+        Writes requests to the profile export file, in the format of
+        perf_analyzer, whose latencies are interpolated between the
+        estimated percentiles and sent at the estimated throughput
+        """
+
+        latency_avg = perf_metrics['perf_latency_avg']
+        latency_p95 = perf_metrics['perf_latency_p95']
+        latency_p99 = perf_metrics['perf_latency_p99']
+
+        # (quantile, latency in ms), with a tail beyond p99
+        # that falls off as it does from p95 to p99
+        knots = [(0, latency_avg / 2), (0.5, latency_avg),
+                 (0.9, perf_metrics['perf_latency_p90']), (0.95, latency_p95),
+                 (0.99, latency_p99),
+                 (1, latency_p99 + 2 * (latency_p99 - latency_p95))]
+        for i in range(1, len(knots)):
+            knots[i] = (knots[i][0], max(knots[i][1], knots[i - 1][1]))
+
+        request_count = self.PROFILE_EXPORT_REQUEST_COUNT
+        interval_ns = 1e9 / max(perf_metrics['perf_throughput'], 1e-3)
+        requests = []
+        knot_index = 1
+        for i in range(request_count):
+            quantile = (i + 0.5) / request_count
+            while knots[knot_index][0] < quantile:
+                knot_index += 1
+            (q0, l0), (q1, l1) = knots[knot_index - 1], knots[knot_index]
+            latency_ms = l0 + (l1 - l0) * (quantile - q0) / (q1 - q0)
+
+            timestamp = round(i * interval_ns)
+            requests.append({
+                'timestamp': timestamp,
+                'sequence_id': 0,
+                'response_timestamps': [timestamp + round(latency_ms * 1e6)]
+            })
+
+        if perf_config['request-rate-range']:
+            experiment = {
+                'mode': 'request_rate',
+                'value': perf_config['request-rate-range']
+            }
+        else:
+            experiment = {
+                'mode': 'concurrency',
+                'value': perf_config['concurrency-range']
+            }
+
+        with open(perf_config['profile-export-file'], mode='w') as f:
+            json.dump(
+                {
+                    'experiments': [{
+                        'experiment': experiment,
+                        'requests': requests,
+                        'window_boundaries': []
+                    }],
+                    'version': 'simulated'
+                }, f)
@@ -14,10 +14,14 @@
 
 from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.record.metrics_manager import MetricsManager
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
 
 import os
-import matplotlib.pyplot as plt
+import csv
+import json
 from matplotlib import patches as mpatches
+from matplotlib.figure import Figure
 from collections import defaultdict
 
 import logging
@@ -57,11 +61,7 @@ def __init__(self, name, title, bar_width=0.5):
         self._name = name
         self._title = title
 
-        self._fig, self._ax_latency = plt.subplots()
-        self._ax_latency.set_title(title)
-        self._ax_throughput = self._ax_latency.twinx()
-
-        latency_axis_label, throughput_axis_label = [
+        self._latency_axis_label, self._throughput_axis_label = [
             metric.header(aggregation_tag='')
             for metric in MetricsManager.get_metric_types(
                 ['perf_latency_avg', 'perf_throughput'])
@@ -79,15 +79,17 @@ def __init__(self, name, title, bar_width=0.5):
         self._legend_x = 0.92
         self._legend_y = 1.15
         self._legend_font_size = 10
-        self._fig.set_figheight(8)
-        self._fig.set_figwidth(12)
-
-        self._ax_latency.set_xlabel('Concurrent Client Requests')
-        self._ax_latency.set_ylabel(latency_axis_label)
-        self._ax_throughput.set_ylabel(throughput_axis_label)
+        self._fig_width = 12
+        self._fig_height = 8
 
         self._data = defaultdict(list)
 
+        # The load is a request rate, instead of a concurrency, once
+        # a request rate measurement is added. A replayed request trace
+        # has the same load in every measurement, which only differ
+        # in their batch size
+        self._load_key = 'concurrency'
+
     def data(self):
         """
         Get the data in this plot
@@ -113,9 +115,15 @@ def add_run_config_measurement(self, run_config_measurement):
         """
 
         # TODO-TMA-568: This needs to be updated because there will be multiple model configs
-        self._data['concurrency'].append(
-            run_config_measurement.model_specific_pa_params()[0]
-            ['concurrency-range'])
+        pa_params = run_config_measurement.model_specific_pa_params()[0]
+        if 'request-intervals' in pa_params:
+            self._load_key = 'batch_size'
+            self._data[self._load_key].append(pa_params['batch-size'])
+        elif 'request-rate-range' in pa_params:
+            self._load_key = 'request_rate'
+            self._data[self._load_key].append(pa_params['request-rate-range'])
+        else:
+            self._data[self._load_key].append(pa_params['concurrency-range'])
 
         self._data['perf_throughput'].append(
             run_config_measurement.get_non_gpu_metric_value(
@@ -129,21 +137,34 @@ def add_run_config_measurement(self, run_config_measurement):
                 self._data[metric].append(
                     run_config_measurement.get_non_gpu_metric_value(tag=metric))
 
-    def plot_data(self):
+    def plot_data(self, ax_latency):
         """
         Calls plotting function
-        on this plot's Axes object
+        on the given Axes object
+
+        Parameters
+        ----------
+        ax_latency: matplotlib.axes.Axes
+            The axes to plot the latency breakdown on. The
+            throughput is plotted on a twin of these axes
         """
 
-        # Sort the data by concurrency
-        concurrency_sort_indices = list(
-            zip(*sorted(enumerate(self._data['concurrency']),
-                        key=lambda x: x[1])))[0]
+        ax_latency.set_title(self._title)
+        ax_throughput = ax_latency.twinx()
 
-        sorted_data = {
-            key: [data_list[i] for i in concurrency_sort_indices
-                 ] for key, data_list in self._data.items()
-        }
+        if self._load_key == 'batch_size':
+            ax_latency.set_xlabel('Client Batch Size')
+        elif self._load_key == 'request_rate':
+            ax_latency.set_xlabel('Client Request Rate (requests/sec)')
+        else:
+            ax_latency.set_xlabel('Concurrent Client Requests')
+        ax_latency.set_ylabel(self._latency_axis_label)
+        ax_throughput.set_ylabel(self._throughput_axis_label)
+
+        if not self._data:
+            return
+
+        sorted_data = self._get_sorted_data()
 
         # Plot latency breakdown bars
         labels = dict(
@@ -153,16 +174,17 @@ def plot_data(self):
             ]))
         bottoms = None
 
-        sorted_data['concurrency'] = list(map(str, sorted_data['concurrency']))
+        sorted_data[self._load_key] = list(
+            map(str, sorted_data[self._load_key]))
 
         # Plot latency breakdown with concurrency casted as string to make uniform x
         for metric, label in labels.items():
-            self._ax_latency.bar(sorted_data['concurrency'],
-                                 sorted_data[metric],
-                                 width=self._bar_width,
-                                 label=label,
-                                 bottom=bottoms,
-                                 color=self._bar_colors[metric])
+            ax_latency.bar(sorted_data[self._load_key],
+                           sorted_data[metric],
+                           width=self._bar_width,
+                           label=label,
+                           bottom=bottoms,
+                           color=self._bar_colors[metric])
             if not bottoms:
                 bottoms = sorted_data[metric]
             else:
@@ -170,8 +192,8 @@ def plot_data(self):
                     map(lambda x, y: x + y, bottoms, sorted_data[metric]))
 
         # Plot the inference line
-        inference_line = self._ax_throughput.plot(
-            sorted_data['concurrency'],
+        inference_line = ax_throughput.plot(
+            sorted_data[self._load_key],
             sorted_data['perf_throughput'],
             label='Inferences/second',
             marker='o',
@@ -185,31 +207,112 @@ def plot_data(self):
         ]
         handles.append(inference_line[0])
 
-        self._ax_latency.legend(handles=handles,
-                                ncol=(len(self._bar_colors) // 2) + 1,
-                                bbox_to_anchor=(self._legend_x, self._legend_y),
-                                prop=dict(size=self._legend_font_size))
+        ax_latency.legend(handles=handles,
+                          ncol=(len(self._bar_colors) // 2) + 1,
+                          bbox_to_anchor=(self._legend_x, self._legend_y),
+                          prop=dict(size=self._legend_font_size))
         # Annotate inferences
-        for x, y in zip(sorted_data['concurrency'],
+        for x, y in zip(sorted_data[self._load_key],
                         sorted_data['perf_throughput']):
-            self._ax_throughput.annotate(
+            ax_throughput.annotate(
                 str(round(y, 2)),
                 xy=(x, y),
                 textcoords="offset points",  # how to position the text
                 xytext=(0, 10),  # distance from text to points (x,y)
                 ha='center')
 
-        self._ax_latency.grid()
-        self._ax_latency.set_axisbelow(True)
+        ax_latency.grid()
+        ax_latency.set_axisbelow(True)
 
-    def save(self, filepath):
+    def _get_sorted_data(self):
+        """
+        Returns
+        -------
+        dict
+            The data of this plot, sorted by concurrency
+            (or request rate)
         """
-        Saves a .png of the plot to disk
+
+        if not self._data:
+            return {}
+
+        concurrency_sort_indices = list(
+            zip(*sorted(enumerate(self._data[self._load_key]),
+                        key=lambda x: x[1])))[0]
+
+        return {
+            key: [data_list[i] for i in concurrency_sort_indices
+                 ] for key, data_list in self._data.items()
+        }
+
+    def save(self, filepath, figure=None):
+        """
+        Plots the data and saves a .png of the plot to disk
 
         Parameters
         ----------
         filepath : the path to the directory
             this plot should be saved to
+        figure : matplotlib.figure.Figure
+            A figure to reuse, which is cleared first.
+            A new one is created if not given
+
+        Returns
+        -------
+        matplotlib.figure.Figure
+            The figure the plot was drawn on
+        """
+
+        if figure is None:
+            figure = Figure()
+
+        figure.clf()
+        figure.set_size_inches(self._fig_width, self._fig_height)
+        self.plot_data(figure.subplots())
+        figure.savefig(os.path.join(filepath, self._name))
+
+        return figure
+
+    def export_data(self, filepath, data_format):
+        """
+        Saves the data of the plot to disk, sorted by
+        concurrency, so that it can be rendered elsewhere
+
+        Parameters
+        ----------
+        filepath : str
+            the path to the directory
+            the data should be saved to
+        data_format : str
+            'csv', to save a row per concurrency,
+            or 'json', to also save the title
+
+        Raises
+        ------
+        TritonModelAnalyzerException
+            If the data format is not supported
         """
 
-        self._fig.savefig(os.path.join(filepath, self._name))
+        sorted_data = self._get_sorted_data()
+        columns = [self._load_key, 'perf_throughput'] + self.detailed_metrics
+        filename = os.path.join(filepath, f'{self._name}.{data_format}')
+
+        if data_format == 'csv':
+            with open(filename, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(
+                    zip(*[sorted_data.get(column, []) for column in columns]))
+        elif data_format == 'json':
+            with open(filename, 'w') as f:
+                json.dump(
+                    {
+                        'title': self._title,
+                        'data': {
+                            column: sorted_data.get(column, [])
+                            for column in columns
+                        }
+                    }, f)
+        else:
+            raise TritonModelAnalyzerException(
+                f"Unsupported plot data format '{data_format}'")
@@ -0,0 +1,233 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
+
+import os
+import csv
+import json
+from math import log10
+from matplotlib.figure import Figure
+
+import logging
+
+logging.getLogger('matplotlib').setLevel(logging.ERROR)
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class LatencyDistributionPlot:
+    """
+    A wrapper class around a matplotlib plot of the
+    latency distribution of a model config, with one
+    line per load, from the latency histograms of its
+    measurements
+
+    Percentiles are spaced by their number of nines,
+    so that the tail of the distribution is visible
+    """
+
+    percentile_ticks = [0, 90, 99, 99.9, 99.99]
+
+    def __init__(self, name, title):
+        """
+        Parameters
+        ----------
+        name: str
+            The name of the file that the plot
+            will be saved as
+        title : str
+            The title of this plot/figure
+        """
+
+        self._name = name
+        self._title = title
+
+        self._fig_width = 12
+        self._fig_height = 8
+
+        # The latencies, in ms, at each percentile, for every load
+        self._data = {}
+        self._load_key = 'concurrency'
+
+    def data(self):
+        """
+        Get the data in this plot
+
+        Returns
+        -------
+        dict
+            keys are loads and values are lists
+            of (percentile, latency) tuples
+        """
+
+        return self._data
+
+    def has_data(self):
+        """
+        Returns
+        -------
+        bool
+            True if any measurement had a latency histogram
+        """
+
+        return bool(self._data)
+
+    def add_run_config_measurement(self, run_config_measurement):
+        """
+        Adds the latency distribution of a
+        measurement to this plot, if it has one
+
+        Parameters
+        ----------
+        run_config_measurement : RunConfigMeasurement
+            The measurement containing the latency histogram
+        """
+
+        # TODO-TMA-568: This needs to be updated because there will be multiple model configs
+        latency_histogram = run_config_measurement.latency_histograms()[0]
+        if not latency_histogram or not latency_histogram.count():
+            return
+
+        pa_params = run_config_measurement.model_specific_pa_params()[0]
+        if 'request-intervals' in pa_params:
+            self._load_key = 'batch_size'
+            load = pa_params['batch-size']
+        elif 'request-rate-range' in pa_params:
+            self._load_key = 'request_rate'
+            load = pa_params['request-rate-range']
+        else:
+            load = pa_params['concurrency-range']
+
+        self._data[load] = [
+            (percentile, latency / 1000)
+            for percentile, latency in latency_histogram.distribution()
+        ]
+
+    def plot_data(self, ax):
+        """
+        Calls plotting function
+        on the given Axes object
+
+        Parameters
+        ----------
+        ax: matplotlib.axes.Axes
+            The axes to plot the distributions on
+        """
+
+        ax.set_title(self._title)
+        ax.set_xlabel('Percentile')
+        ax.set_ylabel('Latency (ms)')
+
+        if not self._data:
+            return
+
+        labels = {
+            'batch_size': 'Client Batch Size',
+            'request_rate': 'Request Rate',
+            'concurrency': 'Concurrency'
+        }
+        for load in sorted(self._data):
+            # The maximum has infinitely many nines
+            distribution = [(percentile, latency)
+                            for percentile, latency in self._data[load]
+                            if percentile < 100]
+            ax.plot([self._get_nines(p) for p, _ in distribution],
+                    [latency for _, latency in distribution],
+                    label=f"{labels[self._load_key]} {load}",
+                    marker='o')
+
+        ax.set_xticks([self._get_nines(p) for p in self.percentile_ticks])
+        ax.set_xticklabels([f"{p}%" for p in self.percentile_ticks])
+        ax.legend()
+        ax.grid()
+        ax.set_axisbelow(True)
+
+    def save(self, filepath, figure=None):
+        """
+        Plots the data and saves a .png of the plot to disk
+
+        Parameters
+        ----------
+        filepath : the path to the directory
+            this plot should be saved to
+        figure : matplotlib.figure.Figure
+            A figure to reuse, which is cleared first.
+            A new one is created if not given
+
+        Returns
+        -------
+        matplotlib.figure.Figure
+            The figure the plot was drawn on
+        """
+
+        if figure is None:
+            figure = Figure()
+
+        figure.clf()
+        figure.set_size_inches(self._fig_width, self._fig_height)
+        self.plot_data(figure.subplots())
+        figure.savefig(os.path.join(filepath, self._name))
+
+        return figure
+
+    def export_data(self, filepath, data_format):
+        """
+        Saves the data of the plot to disk, sorted by
+        load, so that it can be rendered elsewhere
+
+        Parameters
+        ----------
+        filepath : str
+            the path to the directory
+            the data should be saved to
+        data_format : str
+            'csv', to save a row per load and percentile,
+            or 'json', to also save the title
+
+        Raises
+        ------
+        TritonModelAnalyzerException
+            If the data format is not supported
+        """
+
+        columns = [self._load_key, 'percentile', 'latency_ms']
+        rows = [[load, percentile, latency]
+                for load in sorted(self._data)
+                for percentile, latency in self._data[load]]
+        filename = os.path.join(filepath, f'{self._name}.{data_format}')
+
+        if data_format == 'csv':
+            with open(filename, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(rows)
+        elif data_format == 'json':
+            with open(filename, 'w') as f:
+                json.dump(
+                    {
+                        'title': self._title,
+                        'data': {
+                            column: [row[i] for row in rows
+                                    ] for i, column in enumerate(columns)
+                        }
+                    }, f)
+        else:
+            raise TritonModelAnalyzerException(
+                f"Unsupported plot data format '{data_format}'")
+
+    def _get_nines(self, percentile):
+        return log10(100 / (100 - percentile))
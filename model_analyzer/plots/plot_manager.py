@@ -20,11 +20,13 @@
 
 from .simple_plot import SimplePlot
 from .detailed_plot import DetailedPlot
+from .latency_distribution_plot import LatencyDistributionPlot
 
 from model_analyzer.result.constraint_manager import ConstraintManager
 from model_analyzer.result.result_manager import ResultManager
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
 from model_analyzer.config.input.config_command_report import ConfigCommandReport
+from model_analyzer.reports.render_pool import RenderPool
 
 import os
 from collections import defaultdict
@@ -65,6 +67,13 @@ def __init__(self, config:  Union[ConfigCommandProfile, ConfigCommandReport],
         # Dict of list of plots
         self._simple_plots: DefaultDict[str, Dict[str, SimplePlot]] = defaultdict()
         self._detailed_plots: Dict[str, DetailedPlot] = {}
+        self._latency_distribution_plots: Dict[str,
+                                               LatencyDistributionPlot] = {}
+
+        self._render_pool = RenderPool(config.num_report_workers)
+        self._plot_data_formats = [
+            data_format.strip() for data_format in config.plot_data_formats
+        ]
 
     def create_summary_plots(self):
         """
@@ -133,10 +142,8 @@ def _create_update_simple_plot(self, plots_key, plot_config,
                     label=run_config_measurement.model_variants_name(),
                     run_config_measurement=run_config_measurement)
 
-        # In case this plot already had lines, we want to clear and replot
-        self._simple_plots[plots_key][plot_config.name()].clear()
-        self._simple_plots[plots_key][plot_config.name(
-        )].plot_data_and_constraints(constraints=constraints)
+        self._simple_plots[plots_key][plot_config.name()].set_constraints(
+            constraints)
 
     def create_detailed_plots(self):
         """
@@ -149,6 +156,8 @@ def create_detailed_plots(self):
             model_config_name = model.model_config_name()
             self._detailed_plots[model_config_name] = DetailedPlot(
                 f'latency_breakdown', 'Online Performance')
+            latency_distribution_plot = LatencyDistributionPlot(
+                'latency_distribution', 'Latency Distribution')
             model_config, run_config_measurements = self._result_manager.get_model_configs_run_config_measurements(
                 model_config_name)
 
@@ -158,7 +167,13 @@ def create_detailed_plots(self):
                     self._detailed_plots[
                         model_config_name].add_run_config_measurement(
                             run_config_measurement)
-                self._detailed_plots[model_config_name].plot_data()
+                    latency_distribution_plot.add_run_config_measurement(
+                        run_config_measurement)
+
+            # Only plotted if the latency histograms were collected
+            if latency_distribution_plot.has_data():
+                self._latency_distribution_plots[
+                    model_config_name] = latency_distribution_plot
 
             # Create the simple plots for the detailed reports
             for plot_config in model.plots():
@@ -172,23 +187,39 @@ def create_detailed_plots(self):
                     run_config_measurements=run_config_measurements,
                     constraints=None)
 
+    def has_latency_distribution_plot(self, model_config_name):
+        """
+        Returns
+        -------
+        bool
+            True if the latency distribution of the model
+            config is plotted in its detailed plots
+        """
+
+        return model_config_name in self._latency_distribution_plots
+
     def export_summary_plots(self):
         """
         write the plots to disk
         """
 
+        plots = []
         simple_plot_dir = os.path.join(self._plot_export_directory, 'simple')
         for plots_key, plot_dicts in self._simple_plots.items():
             model_plot_dir = os.path.join(simple_plot_dir, plots_key)
             os.makedirs(model_plot_dir, exist_ok=True)
             for plot in plot_dicts.values():
-                plot.save(model_plot_dir)
+                plots.append((plot, model_plot_dir))
+
+        self._export_plot_data(plots)
+        self._render_pool.save_plots(plots)
 
     def export_detailed_plots(self):
         """
         Write detaild plots to disk
         """
 
+        plots = []
         detailed_plot_dir = os.path.join(self._plot_export_directory,
                                          'detailed')
         simple_plot_dir = os.path.join(self._plot_export_directory, 'simple')
@@ -196,10 +227,27 @@ def export_detailed_plots(self):
             detailed_model_config_plot_dir = os.path.join(
                 detailed_plot_dir, model_config_name)
             os.makedirs(detailed_model_config_plot_dir, exist_ok=True)
-            plot.save(detailed_model_config_plot_dir)
+            plots.append((plot, detailed_model_config_plot_dir))
+            if model_config_name in self._latency_distribution_plots:
+                plots.append(
+                    (self._latency_distribution_plots[model_config_name],
+                     detailed_model_config_plot_dir))
 
             simple_model_config_plot_dir = os.path.join(simple_plot_dir,
                                                         model_config_name)
             os.makedirs(simple_model_config_plot_dir, exist_ok=True)
             for plot in self._simple_plots[model_config_name].values():
-                plot.save(simple_model_config_plot_dir)
+                plots.append((plot, simple_model_config_plot_dir))
+
+        self._export_plot_data(plots)
+        self._render_pool.save_plots(plots)
+
+    def _export_plot_data(self, plots):
+        """
+        Writes the data of the plots to disk, next
+        to their images, in every requested format
+        """
+
+        for plot, directory in plots:
+            for data_format in self._plot_data_formats:
+                plot.export_data(directory, data_format)
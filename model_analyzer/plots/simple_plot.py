@@ -13,11 +13,16 @@
 # limitations under the License.
 
 import os
-import matplotlib.pyplot as plt
+import csv
+import json
+from matplotlib import rcParams
+from matplotlib.figure import Figure
 from collections import defaultdict
 
 from model_analyzer.record.metrics_manager import MetricsManager
 from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
 
 
 class SimplePlot:
@@ -55,9 +60,8 @@ def __init__(self, name, title, x_axis, y_axis, monotonic=False):
         self._y_axis = y_axis
         self._monotonic = monotonic
 
-        self._fig, self._ax = plt.subplots()
-
         self._data = {}
+        self._constraints = None
 
     def add_run_config_measurement(self, label, run_config_measurement):
         """
@@ -104,43 +108,72 @@ def add_run_config_measurement(self, label, run_config_measurement):
                     run_config_measurement.get_non_gpu_metric_value(
                         tag=self._y_axis))
 
-    def clear(self):
+    def set_constraints(self, constraints):
         """
-        Clear the contents of the current Axes object
+        Sets the constraints to plot along with the data
+
+        Parameters
+        ----------
+        constraints: ModelConstraints object
+            The keys are metric tags and values are dicts whose
+            keys are constraint types (min, max) and values are their 
+            values
         """
 
-        self._ax.clear()
+        self._constraints = constraints
 
-    def plot_data_and_constraints(self, constraints):
+    def plot_data_and_constraints(self, ax):
         """
         Calls plotting function
-        on this plot's Axes object
+        on the given Axes object
 
         Parameters
         ----------
-        constraints: ModelConstraints object
-            The keys are metric tags and values are dicts whose
-            keys are constraint types (min, max) and values are their 
-            values
+        ax: matplotlib.axes.Axes
+            The axes to plot the data and constraints on
         """
 
-        self._ax.set_title(self._title)
+        ax.set_title(self._title)
 
-        if self._x_axis.replace('_', '-') in PerfAnalyzerConfig.allowed_keys():
-            self._x_header = self._x_axis.replace('_', ' ').title()
-        else:
-            self._x_header = MetricsManager.get_metric_types(
-                [self._x_axis])[0].header(aggregation_tag='')
+        self._x_header = self._get_header(self._x_axis)
+        self._y_header = self._get_header(self._y_axis)
 
-        if self._y_axis.replace('_', '-') in PerfAnalyzerConfig.allowed_keys():
-            self._y_header = self._y_axis.replace('_', ' ').title()
+        ax.set_xlabel(self._x_header)
+        ax.set_ylabel(self._y_header)
+
+        for model_config_name, (x_data, y_data) in self._get_series().items():
+            ax.plot(x_data, y_data, marker='o', label=model_config_name)
+
+        # Plot constraints
+        x_constraints, y_constraints = self._get_constraint_values()
+        for constraint_val in x_constraints:
+            constraint_label = f"Target {self._x_header.rsplit(' ',1)[0]}"
+            ax.axvline(x=constraint_val, linestyle='--', label=constraint_label)
+        for constraint_val in y_constraints:
+            constraint_label = f"Target {self._y_header.rsplit(' ', 1)[0]}"
+            ax.axhline(y=constraint_val, linestyle='--', label=constraint_label)
+
+        ax.legend()
+        ax.grid()
+
+    def _get_header(self, axis):
+        if axis.replace('_', '-') in PerfAnalyzerConfig.allowed_keys():
+            return axis.replace('_', ' ').title()
         else:
-            self._y_header = MetricsManager.get_metric_types(
-                [self._y_axis])[0].header(aggregation_tag='')
+            return MetricsManager.get_metric_types(
+                [axis])[0].header(aggregation_tag='')
 
-        self._ax.set_xlabel(self._x_header)
-        self._ax.set_ylabel(self._y_header)
+    def _get_series(self):
+        """
+        Returns
+        -------
+        dict
+            keys are line labels and values are the x and y
+            data of the line, sorted by x. Decreasing points
+            are pruned if this plot is monotonic
+        """
 
+        series = {}
         for model_config_name, data in self._data.items():
             # Sort the data by x-axis
             x_data, y_data = (
@@ -155,25 +188,27 @@ def plot_data_and_constraints(self, constraints):
                         filtered_y.append(y_data[i])
                 x_data, y_data = filtered_x, filtered_y
 
-            self._ax.plot(x_data, y_data, marker='o', label=model_config_name)
+            series[model_config_name] = (x_data, y_data)
 
-        # Plot constraints
-        if constraints:
-            if constraints.has_metric(self._x_axis):
-                for _, constraint_val in constraints[self._x_axis].items():
-                    constraint_label = f"Target {self._x_header.rsplit(' ',1)[0]}"
-                    self._ax.axvline(x=constraint_val,
-                                     linestyle='--',
-                                     label=constraint_label)
-            if constraints.has_metric(self._y_axis):
-                for _, constraint_val in constraints[self._y_axis].items():
-                    constraint_label = f"Target {self._y_header.rsplit(' ', 1)[0]}"
-                    self._ax.axhline(y=constraint_val,
-                                     linestyle='--',
-                                     label=constraint_label)
-            # plot h lines
-        self._ax.legend()
-        self._ax.grid()
+        return series
+
+    def _get_constraint_values(self):
+        """
+        Returns
+        -------
+        (list, list)
+            The values of the constraints on the x-axis,
+            and of the constraints on the y-axis
+        """
+
+        x_constraints, y_constraints = [], []
+        if self._constraints:
+            if self._constraints.has_metric(self._x_axis):
+                x_constraints = list(self._constraints[self._x_axis].values())
+            if self._constraints.has_metric(self._y_axis):
+                y_constraints = list(self._constraints[self._y_axis].values())
+
+        return x_constraints, y_constraints
 
     def data(self):
         """
@@ -188,14 +223,86 @@ def data(self):
 
         return self._data
 
-    def save(self, filepath):
+    def save(self, filepath, figure=None):
         """
-        Saves a .png of the plot to disk
+        Plots the data and saves a .png of the plot to disk
 
         Parameters
         ----------
         filepath : the path to the directory
             this plot should be saved to
+        figure : matplotlib.figure.Figure
+            A figure to reuse, which is cleared first.
+            A new one is created if not given
+
+        Returns
+        -------
+        matplotlib.figure.Figure
+            The figure the plot was drawn on
         """
 
-        self._fig.savefig(os.path.join(filepath, self._name))
+        if figure is None:
+            figure = Figure()
+
+        figure.clf()
+        figure.set_size_inches(rcParams['figure.figsize'])
+        self.plot_data_and_constraints(figure.subplots())
+        figure.savefig(os.path.join(filepath, self._name))
+
+        return figure
+
+    def export_data(self, filepath, data_format):
+        """
+        Saves the data of the plot to disk, as
+        drawn, so that it can be rendered elsewhere
+
+        Parameters
+        ----------
+        filepath : str
+            the path to the directory
+            the data should be saved to
+        data_format : str
+            'csv', to save a row per point, or 'json',
+            to also save the title, axes and constraints
+
+        Raises
+        ------
+        TritonModelAnalyzerException
+            If the data format is not supported
+        """
+
+        series = self._get_series()
+        filename = os.path.join(filepath, f'{self._name}.{data_format}')
+
+        if data_format == 'csv':
+            with open(filename, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['model_config', self._x_axis, self._y_axis])
+                for model_config_name, (x_data, y_data) in series.items():
+                    for x, y in zip(x_data, y_data):
+                        writer.writerow([model_config_name, x, y])
+        elif data_format == 'json':
+            x_constraints, y_constraints = self._get_constraint_values()
+            with open(filename, 'w') as f:
+                json.dump(
+                    {
+                        'title': self._title,
+                        'x_axis': self._x_axis,
+                        'y_axis': self._y_axis,
+                        'x_header': self._get_header(self._x_axis),
+                        'y_header': self._get_header(self._y_axis),
+                        'series': {
+                            model_config_name: {
+                                'x': x_data,
+                                'y': y_data
+                            } for model_config_name, (x_data,
+                                                      y_data) in series.items()
+                        },
+                        'constraints': {
+                            'x': x_constraints,
+                            'y': y_constraints
+                        }
+                    }, f)
+        else:
+            raise TritonModelAnalyzerException(
+                f"Unsupported plot data format '{data_format}'")
@@ -14,26 +14,35 @@
 
 from .record_aggregator import RecordAggregator
 from .record import RecordType
-from model_analyzer.constants import LOGGER_NAME
-from model_analyzer.device.gpu_device_factory import GPUDeviceFactory
+from model_analyzer.constants import LOGGER_NAME, SIMULATED_GPU_MEMORY_MB
 from model_analyzer.model_analyzer_exceptions \
     import TritonModelAnalyzerException
+from model_analyzer.device.gpu_inventory import GPUInventory
 from model_analyzer.monitor.cpu_monitor import CPUMonitor
 from model_analyzer.monitor.dcgm.dcgm_monitor import DCGMMonitor
 from model_analyzer.monitor.remote_monitor import RemoteMonitor
 from model_analyzer.output.file_writer import FileWriter
 from model_analyzer.perf_analyzer.perf_analyzer import PerfAnalyzer
+from model_analyzer.perf_analyzer.simulated_perf_analyzer import SimulatedPerfAnalyzer
+from model_analyzer.perf_analyzer.python_load_generator \
+    import PythonLoadGenerator, PythonLoadSession
 from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
+from model_analyzer.record.types.gpu_energy import GPUEnergy
+from model_analyzer.record.types.gpu_power_usage import GPUPowerUsage
+from model_analyzer.record.types.perf_inferences_per_dollar import PerfInferencesPerDollar
+from model_analyzer.record.types.perf_inferences_per_joule import PerfInferencesPerJoule
+from model_analyzer.record.types.perf_latency_p99 import PerfLatencyP99
+from model_analyzer.record.types.perf_throughput import PerfThroughput
 from model_analyzer.result.results import Results
 from model_analyzer.config.generate.base_model_config_generator import BaseModelConfigGenerator
+from model_analyzer.config.run.model_run_config import ModelRunConfig
+from model_analyzer.triton.model.model_variant_repository import ModelVariantRepository
 
 from collections import defaultdict
 from prometheus_client.parser import text_string_to_metric_families
-import numba
 import requests
 import logging
-import os
 import time
 
 logger = logging.getLogger(LOGGER_NAME)
@@ -46,15 +55,23 @@ class MetricsManager:
     """
 
     metrics = [
-        "perf_throughput", "perf_latency_avg", "perf_latency_p90",
-        "perf_latency_p95", "perf_latency_p99", "perf_latency",
-        "perf_client_response_wait", "perf_client_send_recv",
+        "perf_throughput", "perf_latency_avg", "perf_latency_p50",
+        "perf_latency_p90", "perf_latency_p95", "perf_latency_p99",
+        "perf_latency_p999", "perf_latency", "perf_client_response_wait",
+        "perf_client_send_recv", "perf_client_cpu_utilization",
         "perf_server_queue", "perf_server_compute_input",
         "perf_server_compute_infer", "perf_server_compute_output",
+        "perf_inferences_per_joule", "perf_inferences_per_dollar",
         "gpu_used_memory", "gpu_free_memory", "gpu_utilization",
-        "gpu_power_usage", "cpu_available_ram", "cpu_used_ram"
+        "gpu_power_usage", "gpu_energy", "cpu_available_ram", "cpu_used_ram"
     ]
 
+    # GPU metrics that are computed from the
+    # collected ones, instead of being collected
+    derived_gpu_metrics = [GPUEnergy]
+
+    SECONDS_PER_HOUR = 3600
+
     def __init__(self, config, client, server, gpus, result_manager,
                  state_manager):
         """
@@ -84,7 +101,11 @@ def __init__(self, config, client, server, gpus, result_manager,
             raise TritonModelAnalyzerException(
                 f"Duplicate model names detected: "
                 f"{[model._model_name for model in config.profile_models]}")
-        self._first_config_variant = {}
+        self._variant_repository = ModelVariantRepository(
+            config.model_repository,
+            self._output_model_repo_path,
+            # The docker container only mounts the output model repository
+            allow_absolute_symlinks=config.triton_launch_mode != 'docker')
         self._config = config
         self._client = client
         self._server = server
@@ -92,17 +113,32 @@ def __init__(self, config, client, server, gpus, result_manager,
         self._state_manager = state_manager
         self._loaded_models = None
 
+        # The measurement request count that perf_analyzer needed to
+        # obtain a stable measurement of each loaded model, so that
+        # the next measurements of the model start from it
+        self._stable_request_counts = {}
+
+        # The connections and inputs of the loaded models
+        # kept by the python load generator across measurements
+        self._load_session = None
+
+        self._perf_model = None
+        if config.triton_launch_mode == 'simulated':
+            self._perf_model = SimulatedPerfAnalyzer.create_perf_model(config)
+
         self._cpu_warning_printed = False
 
+        # Seconds spent starting the server, waiting for it to be
+        # ready and loading models, summed over all server starts
+        self._server_start_count = 0
+        self._dry_run_measurement_count = 0
+        self._server_phase_times = defaultdict(float)
+
         self._gpu_metrics, self._perf_metrics, self._cpu_metrics = self._categorize_metrics(
             self.metrics, self._config.collect_cpu_metrics)
         self._gpus = gpus
         self._init_state()
 
-    def start_new_model(self):
-        """ Indicate that profiling of a new model is starting """
-        self._first_config_variant = {}
-
     def _init_state(self):
         """
         Sets MetricsManager object managed
@@ -110,24 +146,37 @@ def _init_state(self):
         """
 
         gpu_info = self._state_manager.get_state_variable(
-            'MetricsManager.gpu_info')
+            'MetricsManager.gpus')
 
         if self._state_manager.starting_fresh_run() or gpu_info is None:
             gpu_info = {}
 
-        for i in range(len(self._gpus)):
-            if self._gpus[i].device_uuid() not in gpu_info:
-                device_info = {}
-                device = numba.cuda.list_devices()[i]
-                device_info['name'] = str(device.name, encoding='utf-8')
-                with device:
-                    # convert bytes to GB
-                    device_info['total_memory'] = numba.cuda.current_context(
-                    ).get_memory_info().total
-                gpu_info[self._gpus[i].device_uuid()] = device_info
+        for gpu in self._gpus:
+            if gpu.device_uuid() not in gpu_info:
+                if self._perf_model:
+                    total_memory = SIMULATED_GPU_MEMORY_MB * 1000000
+                else:
+                    device_info = GPUInventory.get().get_device(
+                        gpu.device_uuid())
+                    total_memory = device_info[
+                        'total_memory'] if device_info else 0
+
+                gpu_info[gpu.device_uuid()] = {
+                    'name': gpu.device_name(),
+                    'total_memory': total_memory
+                }
 
         self._state_manager.set_state_variable('MetricsManager.gpus', gpu_info)
 
+        # Carry the server start times over from the checkpoint,
+        # so that they cover all of the profile
+        server_phase_times = self._state_manager.get_state_variable(
+            'MetricsManager.server_phase_times')
+        if not self._state_manager.starting_fresh_run() and server_phase_times:
+            server_phase_times = dict(server_phase_times)
+            self._server_start_count = server_phase_times.pop('starts', 0)
+            self._server_phase_times.update(server_phase_times)
+
     @staticmethod
     def _categorize_metrics(metric_tags, collect_cpu_metrics=False):
         """
@@ -160,7 +209,12 @@ def profile_server(self):
         TritonModelAnalyzerException
         """
 
-        cpu_only = (not numba.cuda.is_available())
+        if self._perf_model:
+            self._result_manager.add_server_data(
+                data=self._get_simulated_server_gpu_metrics())
+            return
+
+        cpu_only = not GPUInventory.get().is_available()
         self._start_monitors(cpu_only=cpu_only)
         time.sleep(self._config.duration_seconds)
         if not cpu_only:
@@ -174,6 +228,9 @@ def execute_run_config(self, run_config):
         measurement to the result manager
         """
 
+        if self._config.dry_run:
+            return self._create_dry_run_measurement(run_config)
+
         self._create_model_variants(run_config)
 
         # If this run config was already run, do not run again, just get the measurement
@@ -185,8 +242,21 @@ def execute_run_config(self, run_config):
 
         current_model_variants = run_config.model_variants_name()
         if current_model_variants != self._loaded_models:
+            self._stable_request_counts = {}
+            if self._load_session:
+                self._load_session.reset()
             self._server.stop()
+            self._server.set_host_ipc(self._uses_shared_memory(run_config))
+            start_time = time.monotonic()
             self._server.start(env=run_config.triton_environment())
+            self._server_start_count += 1
+            self._record_server_phase_time('spawn', start_time)
+
+            # The variants were being materialized while the server restarted
+            self._variant_repository.wait()
+            if self._config.prune_output_model_repository:
+                self._variant_repository.prune(
+                    self._get_model_variant_names(run_config))
 
             if not self._load_model_variants(run_config):
                 self._server.stop()
@@ -215,15 +285,67 @@ def profile_models(self, run_config):
             The gpu specific and non gpu metrics
         """
 
+        self._print_run_config_info(run_config)
+
+        run_config_measurement = self._measure_models(run_config)
+        if run_config_measurement is None:
+            return None
+
+        # Screening measurements are only returned to the generators
+        if run_config.is_screening():
+            return run_config_measurement
+
+        run_config_measurement = self._repeat_while_ambiguous(
+            run_config, run_config_measurement)
+
+        self._result_manager.add_run_config_measurement(
+            run_config, run_config_measurement)
+
+        return run_config_measurement
+
+    def _repeat_while_ambiguous(self, run_config, run_config_measurement):
+        """
+        Measures the RunConfig again while its measurement is too close
+        to the best one to be ranked against it, up to
+        max_measurement_repeats times in total, and returns
+        the measurements combined
+        """
+
+        run_config_measurements = [run_config_measurement]
+        while len(run_config_measurements
+                 ) < self._config.max_measurement_repeats and \
+                self._result_manager.is_ranking_ambiguous(
+                    run_config, run_config_measurement,
+                    self._config.measurement_repeat_tolerance):
+            logger.info(
+                "Measurement is too close to the best one to be ranked."
+                f" Repeating it ({len(run_config_measurements) + 1}"
+                f"/{self._config.max_measurement_repeats})")
+
+            repeated_measurement = self._measure_models(run_config)
+            if repeated_measurement is None:
+                break
+
+            run_config_measurements.append(repeated_measurement)
+            run_config_measurement = RunConfigMeasurement.combine(
+                run_config_measurements)
+
+        return run_config_measurement
+
+    def _measure_models(self, run_config):
+        """
+        Takes one measurement of the RunConfig, without
+        sending it to the result manager. Returns None
+        if the measurement failed
+        """
+
         perf_output_writer = None if \
             not self._config.perf_output else FileWriter(self._config.perf_output_path)
         cpu_only = run_config.cpu_only()
 
-        self._print_run_config_info(run_config)
-
         self._start_monitors(cpu_only=cpu_only)
 
-        perf_analyzer_metrics, model_gpu_metrics = self._run_perf_analyzer(
+        perf_analyzer_metrics, model_gpu_metrics, latency_histograms = self._run_perf_analyzer(
             run_config, perf_output_writer)
 
         if not perf_analyzer_metrics:
@@ -232,8 +354,15 @@ def profile_models(self, run_config):
             return None
 
         # Get metrics for model inference and combine metrics that do not have GPU UUID
+        throughput = self._get_total_throughput(perf_analyzer_metrics)
         if not cpu_only and not model_gpu_metrics:
-            model_gpu_metrics = self._get_gpu_inference_metrics()
+            model_gpu_metrics = self._get_gpu_inference_metrics(throughput)
+        elif not cpu_only and self._gpu_monitor:
+            # perf_analyzer collected the GPU metrics, but only
+            # the monitor has the power samples to integrate
+            self._add_gpu_energy_records(
+                model_gpu_metrics, self._gpu_monitor.stop_recording_metrics(),
+                throughput)
         model_cpu_metrics = self._get_cpu_inference_metrics()
 
         self._destroy_monitors(cpu_only=cpu_only)
@@ -252,22 +381,108 @@ def profile_models(self, run_config):
 
                 model_non_gpu_metrics = \
                       list(perf_analyzer_metrics[model_name].values()) \
-                    + list(model_cpu_metrics.values())
+                    + list(model_cpu_metrics.values()) \
+                    + self._get_efficiency_records(
+                        perf_analyzer_metrics[model_name], model_gpu_metrics,
+                        throughput)
 
                 model_specific_pa_params = perf_config.extract_model_specific_parameters(
                 )
 
                 run_config_measurement.add_model_config_measurement(
                     perf_config['model-name'], model_specific_pa_params,
-                    model_non_gpu_metrics)
+                    model_non_gpu_metrics, latency_histograms.get(model_name))
 
-            self._result_manager.add_run_config_measurement(
-                run_config, run_config_measurement)
+        return run_config_measurement
+
+    def _create_dry_run_measurement(self, run_config):
+        """
+        Returns a stand-in measurement for the RunConfig, without running
+        anything. Its latency is 0 and its throughput grows with every
+        parameter that is searched, and with every measurement for loads
+        that are not a number (a replayed trace), so that the generators
+        never stop early and walk all of their search space
+        """
+
+        self._dry_run_measurement_count += 1
+
+        run_config_measurement = RunConfigMeasurement(
+            run_config.model_variants_name(), {})
+        for model_run_config in run_config.model_run_configs():
+            perf_config = model_run_config.perf_config()
+            run_config_measurement.add_model_config_measurement(
+                perf_config['model-name'],
+                perf_config.extract_model_specific_parameters(), [
+                    PerfThroughput(
+                        self._get_dry_run_throughput(model_run_config)),
+                    PerfLatencyP99(0)
+                ])
+
+        self._result_manager.add_run_config_measurement(
+            run_config, run_config_measurement)
 
         return run_config_measurement
 
+    def _get_dry_run_throughput(self, model_run_config):
+        perf_config = model_run_config.perf_config()
+
+        throughput = 1
+        for key in ['batch-size', 'concurrency-range', 'request-rate-range']:
+            if type(perf_config[key]) is int:
+                throughput *= perf_config[key]
+        if perf_config['request-intervals']:
+            throughput *= self._dry_run_measurement_count
+
+        model_configs = [model_run_config.model_config()
+                        ] + model_run_config.ensemble_subconfigs()
+        for model_config in model_configs:
+            model_config_dict = model_config.get_config()
+            throughput *= ModelRunConfig.get_max_batch_size(model_config_dict)
+            throughput *= sum(
+                instance_group.get('count', 1)
+                for instance_group in model_config_dict.get(
+                    'instance_group', [{}]))
+
+        return throughput
+
     def finalize(self):
+        if self._load_session:
+            self._load_session.close()
+            self._load_session = None
         self._server.stop()
+        self._variant_repository.close()
+
+        if self._server_start_count:
+            self._state_manager.set_state_variable(
+                'MetricsManager.server_phase_times', {
+                    'starts': self._server_start_count,
+                    **self._server_phase_times
+                })
+            logger.info(
+                f"Triton Server was started {self._server_start_count} times: "
+                f"{self._server_phase_times['spawn']:.1f}s spawning, "
+                f"{self._server_phase_times['ready']:.1f}s waiting until ready, "
+                f"{self._server_phase_times['model load']:.1f}s loading models")
+
+    def server_phase_times(self):
+        """
+        Returns
+        -------
+        dict
+            keys are the phases of starting the server ('spawn',
+            'ready' and 'model load') and values are the seconds
+            spent in them, summed over all server starts. They
+            are also saved in the checkpoint, under
+            'MetricsManager.server_phase_times', with the
+            number of server starts under 'starts'
+        """
+
+        return dict(self._server_phase_times)
+
+    def _record_server_phase_time(self, phase, start_time):
+        phase_time = time.monotonic() - start_time
+        self._server_phase_times[phase] += phase_time
+        logger.debug(f"Triton Server {phase} took {phase_time:.3f}s")
 
     def _create_model_variants(self, run_config):
         """
@@ -286,34 +501,37 @@ def _create_model_variants(self, run_config):
 
     def _create_model_variant(self, original_name, variant_config):
         """
-        Creates a directory for the model config variant in the output model
-        repository and fills directory with config
+        Starts creating the directory for the model config variant in
+        the output model repository, in the background
         """
 
-        variant_name = variant_config.get_field('name')
         if self._config.triton_launch_mode != 'remote':
-            model_repository = self._config.model_repository
+            self._variant_repository.materialize(original_name, variant_config)
 
-            original_model_dir = os.path.join(model_repository, original_name)
-            new_model_dir = os.path.join(self._output_model_repo_path,
-                                         variant_name)
-            try:
-                # Create the directory for the new model
-                os.makedirs(new_model_dir, exist_ok=False)
-                self._first_config_variant.setdefault(original_name, None)
-                variant_config.write_config_to_file(
-                    new_model_dir, original_model_dir,
-                    self._first_config_variant[original_name])
-                if self._first_config_variant[original_name] is None:
-                    self._first_config_variant[original_name] = os.path.join(
-                        self._output_model_repo_path, variant_name)
-            except FileExistsError:
-                pass
+    def _get_model_variant_names(self, run_config):
+        """
+        Returns the names of all of the model variants in the run config
+        """
+
+        variant_names = []
+        for mrc in run_config.model_run_configs():
+            variant_names.append(mrc.model_config().get_field('name'))
+            variant_names.extend([
+                ensemble_subconfig.get_field('name')
+                for ensemble_subconfig in mrc.ensemble_subconfigs()
+            ])
+        return variant_names
 
     def _load_model_variants(self, run_config):
         """
         Loads all model variants in the client
         """
+        if self._is_model_load_enabled():
+            start_time = time.monotonic()
+            self._client.wait_for_server_ready(self._config.client_max_retries,
+                                               server=self._server)
+            self._record_server_phase_time('ready', start_time)
+
         for mrc in run_config.model_run_configs():
             if not self._load_model_variant(variant_config=mrc.model_config()):
                 return False
@@ -328,22 +546,26 @@ def _load_model_variant(self, variant_config):
         """
         Conditionally loads a model variant in the client
         """
-        remote = self._config.triton_launch_mode == 'remote'
-        c_api = self._config.triton_launch_mode == 'c_api'
-        disabled = self._config.reload_model_disable
-        do_load = (remote and not disabled) or (not remote and not c_api)
-
         retval = True
-        if do_load:
+        if self._is_model_load_enabled():
             retval = self._do_load_model_variant(variant_config)
         return retval
 
-    def _do_load_model_variant(self, variant_config):
+    def _is_model_load_enabled(self):
         """
-        Loads a model variant in the client
+        Returns true if the model variants are loaded by the client
         """
-        self._client.wait_for_server_ready(self._config.client_max_retries)
+        remote = self._config.triton_launch_mode == 'remote'
+        c_api = self._config.triton_launch_mode == 'c_api'
+        disabled = self._config.reload_model_disable
+        return (remote and not disabled) or (not remote and not c_api)
 
+    def _do_load_model_variant(self, variant_config):
+        """
+        Loads a model variant in the client. The server
+        must be ready
+        """
+        start_time = time.monotonic()
         variant_name = variant_config.get_field('name')
         if self._client.load_model(model_name=variant_name) == -1:
             return False
@@ -352,6 +574,7 @@ def _do_load_model_variant(self, variant_config):
                 model_name=variant_name,
                 num_retries=self._config.client_max_retries) == -1:
             return False
+        self._record_server_phase_time('model load', start_time)
         return True
 
     def _get_measurement_if_config_duplicate(self, run_config):
@@ -381,7 +604,9 @@ def _start_monitors(self, cpu_only=False):
         """
 
         self._gpu_monitor = None
-        if not cpu_only:
+
+        # The simulated perf_analyzer reports the GPU metrics itself
+        if not cpu_only and not self._perf_model:
             try:
                 self._gpu_monitor = RemoteMonitor(
                     self._config.triton_metrics_url,
@@ -403,7 +628,7 @@ def _stop_monitors(self, cpu_only=False):
         """
 
         # Stop DCGM Monitor only if there are GPUs available
-        if not cpu_only:
+        if not cpu_only and self._gpu_monitor:
             self._gpu_monitor.stop_recording_metrics()
         self._cpu_monitor.stop_recording_metrics()
 
@@ -422,7 +647,8 @@ def _destroy_monitors(self, cpu_only=False):
 
     def _run_perf_analyzer(self, run_config, perf_output_writer):
         """
-        Runs perf_analyzer and returns the aggregated metrics
+        Runs perf_analyzer and returns the aggregated metrics,
+        and the latency histogram of each model if collected
 
         Parameters
         ----------
@@ -444,13 +670,11 @@ def _run_perf_analyzer(self, run_config, perf_output_writer):
         if self._config.triton_launch_mode == 'c_api':
             perf_analyzer_env['CUDA_VISIBLE_DEVICES'] = ','.join(
                 [gpu.device_uuid() for gpu in self._gpus])
+            perf_analyzer_env['CUDA_DEVICE_ORDER'] = 'PCI_BUS_ID'
 
-        perf_analyzer = PerfAnalyzer(
-            path=self._config.perf_analyzer_path,
-            config=run_config,
-            max_retries=self._config.perf_analyzer_max_auto_adjusts,
-            timeout=self._config.perf_analyzer_timeout,
-            max_cpu_util=self._config.perf_analyzer_cpu_util)
+        perf_analyzer = self._create_load_generator(run_config)
+
+        self._reuse_stable_request_counts(run_config)
 
         metrics_to_gather = self._perf_metrics + self._gpu_metrics
         status = perf_analyzer.run(metrics_to_gather, env=perf_analyzer_env)
@@ -466,7 +690,9 @@ def _run_perf_analyzer(self, run_config, perf_output_writer):
 
         # PerfAnalyzer run was not succesful
         if status == 1:
-            return (None, None)
+            return (None, None, None)
+
+        self._save_stable_request_counts(run_config)
 
         perf_records = perf_analyzer.get_perf_records()
         gpu_records = perf_analyzer.get_gpu_records()
@@ -474,7 +700,94 @@ def _run_perf_analyzer(self, run_config, perf_output_writer):
         aggregated_perf_records = self._aggregate_perf_records(perf_records)
         aggregated_gpu_records = self._aggregate_gpu_records(gpu_records)
 
-        return aggregated_perf_records, aggregated_gpu_records
+        return aggregated_perf_records, aggregated_gpu_records, perf_analyzer.get_latency_histograms(
+        )
+
+    def _create_load_generator(self, run_config):
+        """
+        Returns the load generator that measures the RunConfig.
+        They all have the interface of PerfAnalyzer
+        """
+
+        if self._perf_model:
+            return SimulatedPerfAnalyzer(
+                path=self._config.perf_analyzer_path,
+                config=run_config,
+                max_retries=self._config.perf_analyzer_max_auto_adjusts,
+                timeout=self._config.perf_analyzer_timeout,
+                max_cpu_util=self._config.perf_analyzer_cpu_util,
+                perf_model=self._perf_model,
+                gpus=self._gpus)
+
+        if self._config.load_generator == 'python':
+            if self._load_session is None:
+                self._load_session = PythonLoadSession()
+
+            return PythonLoadGenerator(
+                path=self._config.perf_analyzer_path,
+                config=run_config,
+                max_retries=self._config.perf_analyzer_max_auto_adjusts,
+                timeout=self._config.perf_analyzer_timeout,
+                max_cpu_util=self._config.perf_analyzer_cpu_util,
+                session=self._load_session)
+
+        return PerfAnalyzer(
+            path=self._config.perf_analyzer_path,
+            config=run_config,
+            max_retries=self._config.perf_analyzer_max_auto_adjusts,
+            timeout=self._config.perf_analyzer_timeout,
+            max_cpu_util=self._config.perf_analyzer_cpu_util)
+
+    def _reuse_stable_request_counts(self, run_config):
+        """
+        Starts perf_analyzer from the request count that the previous
+        measurements of each loaded model needed to be stable, instead
+        of failing to stabilize and retrying again at every concurrency
+
+        The request count is not part of the representation of
+        the run config, so checkpointed measurements still match.
+        It only ever grows while the model stays loaded, as a
+        smaller count is raised to the stable one
+        """
+
+        for model_run_config in run_config.model_run_configs():
+            perf_config = model_run_config.perf_config()
+            stable_request_count = self._stable_request_counts.get(
+                perf_config['model-name'])
+
+            if stable_request_count is None or not self._is_count_windows(
+                    perf_config):
+                continue
+
+            request_count = perf_config['measurement-request-count']
+            if request_count is None or int(
+                    request_count) < stable_request_count:
+                logger.debug(
+                    f"Reusing the stable measurement request count of"
+                    f" {stable_request_count} for {perf_config['model-name']}"
+                )
+                perf_config['measurement-request-count'] = stable_request_count
+
+    def _save_stable_request_counts(self, run_config):
+        for model_run_config in run_config.model_run_configs():
+            perf_config = model_run_config.perf_config()
+            if self._is_count_windows(perf_config) and perf_config[
+                    'measurement-request-count'] is not None:
+                self._stable_request_counts[perf_config['model-name']] = int(
+                    perf_config['measurement-request-count'])
+
+    def _uses_shared_memory(self, run_config):
+        """
+        Returns true if perf_analyzer passes the tensors of
+        a model of the RunConfig through shared memory
+        """
+
+        return any(
+            model_run_config.perf_config()['shared-memory'] not in
+            [None, 'none'] for model_run_config in run_config.model_run_configs())
+
+    def _is_count_windows(self, perf_config):
+        return perf_config['measurement-mode'] in [None, 'count_windows']
 
     def _aggregate_perf_records(self, perf_records):
         per_model_perf_records = {}
@@ -485,10 +798,17 @@ def _aggregate_perf_records(self, perf_records):
             per_model_perf_records[model] = perf_record_aggregator.aggregate()
         return per_model_perf_records
 
-    def _get_gpu_inference_metrics(self):
+    def _get_gpu_inference_metrics(self, throughput=None):
         """
         Stops GPU monitor and aggregates any records
         that are GPU specific
+
+        Parameters
+        ----------
+        throughput : float
+            The throughput of all the models measured, if
+            any, that the energy of each GPU is divided by
+
         Returns
         -------
         dict
@@ -500,8 +820,116 @@ def _get_gpu_inference_metrics(self):
         gpu_records = self._gpu_monitor.stop_recording_metrics()
 
         gpu_metrics = self._aggregate_gpu_records(gpu_records)
+        if throughput:
+            self._add_gpu_energy_records(gpu_metrics, gpu_records, throughput)
         return gpu_metrics
 
+    def _add_gpu_energy_records(self, gpu_metrics, gpu_records, throughput):
+        """
+        Adds the energy each GPU used per inference to its metrics:
+        its average power, integrated from the time-stamped power
+        samples, divided by the throughput of all the models.
+        Unlike the energy over the whole monitoring, it does not grow
+        with the passes and retries of the load generator
+        """
+
+        if not throughput:
+            return
+
+        power_samples = defaultdict(list)
+        for record in gpu_records:
+            if isinstance(record, GPUPowerUsage):
+                power_samples[record.device_uuid()].append(
+                    (record.timestamp(), record.value()))
+
+        for gpu_uuid, samples in power_samples.items():
+            duration = max(samples)[0] - min(samples)[0]
+            if gpu_uuid in gpu_metrics and duration > 0:
+                power = self._integrate_power(samples) / duration * 1e9
+                gpu_metrics[gpu_uuid].append(
+                    GPUEnergy(value=power / throughput, device_uuid=gpu_uuid))
+
+    @staticmethod
+    def _get_gpu_power(gpu_metrics, total_throughput):
+        """
+        Returns the power of all the GPUs of the measurement. It is
+        the time-weighted power the energy per inference is derived
+        from, and the average of the power samples without it
+        """
+
+        energy_per_inference = [
+            record.value()
+            for records in gpu_metrics.values()
+            for record in records
+            if isinstance(record, GPUEnergy)
+        ]
+        if energy_per_inference and total_throughput:
+            return sum(energy_per_inference) * total_throughput
+
+        return sum(
+            record.value()
+            for records in gpu_metrics.values()
+            for record in records
+            if isinstance(record, GPUPowerUsage))
+
+    @staticmethod
+    def _get_total_throughput(perf_analyzer_metrics):
+        """
+        Returns the throughput of all the models
+        measured, or None if it was not measured
+        """
+
+        throughputs = [
+            model_metrics[PerfThroughput].value()
+            for model_metrics in (perf_analyzer_metrics or {}).values()
+            if PerfThroughput in model_metrics
+        ]
+        return sum(throughputs) if throughputs else None
+
+    @staticmethod
+    def _integrate_power(samples):
+        """
+        Returns the energy in joules, with the trapezoidal rule, of
+        (timestamp, power) samples in nanoseconds and watts
+        """
+
+        samples = sorted(samples)
+        energy = 0.0
+        for (start, start_power), (end, end_power) in zip(samples, samples[1:]):
+            energy += (start_power + end_power) / 2 * (end - start) / 1e9
+        return energy
+
+    def _get_efficiency_records(self,
+                                model_perf_metrics,
+                                gpu_metrics,
+                                total_throughput=None):
+        """
+        Returns the records of how efficiently the GPUs of the
+        measurement serve the model: its inferences per joule and,
+        when the GPU price is set, its inferences per dollar
+        """
+
+        throughput = model_perf_metrics.get(PerfThroughput)
+        if throughput is None or not gpu_metrics:
+            return []
+
+        efficiency_records = []
+
+        # The power of the GPUs is shared by all the models measured
+        # together, so the inferences per joule of these models add up
+        power = self._get_gpu_power(gpu_metrics, total_throughput)
+        if power > 0:
+            efficiency_records.append(
+                PerfInferencesPerJoule(value=throughput.value() / power))
+
+        if self._config.gpu_price_per_hour > 0:
+            price_per_hour = self._config.gpu_price_per_hour * len(gpu_metrics)
+            efficiency_records.append(
+                PerfInferencesPerDollar(value=throughput.value() *
+                                        self.SECONDS_PER_HOUR / price_per_hour))
+
+        return efficiency_records
+
     def _aggregate_gpu_records(self, gpu_records):
         # Insert all records into aggregator and get aggregated DCGM records
         gpu_record_aggregator = RecordAggregator()
@@ -517,6 +945,21 @@ def _aggregate_gpu_records(self, gpu_records):
                 gpu_metrics[gpu_uuid].append(metric_value)
         return gpu_metrics
 
+    def _get_simulated_server_gpu_metrics(self):
+        """
+        Returns the idle GPU metrics of the simulated server
+        in the format of _aggregate_gpu_records
+        """
+
+        gpu_metrics = defaultdict(list)
+        for gpu_uuid, metrics in self._perf_model.estimate_idle(
+                self._gpus).items():
+            for gpu_metric in self._gpu_metrics:
+                gpu_metrics[gpu_uuid].append(
+                    gpu_metric(value=metrics[gpu_metric.tag],
+                               device_uuid=gpu_uuid))
+        return gpu_metrics
+
     def _get_cpu_inference_metrics(self):
         """
         Stops any monitors that just need the records to be aggregated
@@ -539,7 +982,8 @@ def _check_triton_and_model_analyzer_gpus(self):
         """
 
         if self._config.triton_launch_mode != 'remote' and self._config.triton_launch_mode != 'c_api':
-            self._client.wait_for_server_ready(self._config.client_max_retries)
+            self._client.wait_for_server_ready(self._config.client_max_retries,
+                                               server=self._server)
 
             model_analyzer_gpus = [gpu.device_uuid() for gpu in self._gpus]
             triton_gpus = self._get_triton_metrics_gpus()
@@ -576,8 +1020,15 @@ def _print_run_config_info(self, run_config):
         for perf_config in [
                 mrc.perf_config() for mrc in run_config.model_run_configs()
         ]:
+            if perf_config['request-intervals']:
+                load = f"request intervals={perf_config['request-intervals']}"
+            elif perf_config['request-rate-range']:
+                load = f"request rate={perf_config['request-rate-range']}"
+            else:
+                load = f"concurrency={perf_config['concurrency-range']}"
+
             logger.info(
-                f"Profiling {perf_config['model-name']}: client batch size={perf_config['batch-size']}, concurrency={perf_config['concurrency-range']}"
+                f"Profiling {perf_config['model-name']}: client batch size={perf_config['batch-size']}, {load}"
             )
 
         # Vertical spacing when running multiple models at a time
@@ -629,7 +1080,8 @@ def is_gpu_metric(tag):
         False otherwise
         """
         metric = MetricsManager.get_metric_types([tag])[0]
-        return metric in DCGMMonitor.model_analyzer_to_dcgm_field
+        return metric in DCGMMonitor.model_analyzer_to_dcgm_field or \
+            metric in MetricsManager.derived_gpu_metrics
 
     @staticmethod
     def is_perf_analyzer_metric(tag):
@@ -0,0 +1,106 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Tuple
+
+import multiprocessing
+import os
+
+# The figure every plot rendered by this process is drawn on
+_figure = None
+
+
+def _init_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _save_plot(plot, directory):
+    global _figure
+    _figure = plot.save(directory, figure=_figure)
+
+
+def _release_figure():
+    global _figure
+    _figure = None
+
+
+def _write_report(report, filename):
+    report.write_report(filename=filename)
+
+
+class RenderPool:
+    """
+    Renders plots and writes reports to disk on a pool
+    of worker processes, one plot or report per task
+
+    Every worker draws all of its plots on a single reused
+    figure, with the Agg backend. The files are written in
+    the order they are given, and the first error that occurred
+    while writing them is raised in the calling process
+    """
+
+    def __init__(self, num_workers: int) -> None:
+        """
+        Parameters
+        ----------
+        num_workers : int
+            The number of worker processes. 0 uses one per CPU,
+            and 1 renders everything in the calling process
+        """
+
+        self._num_workers = num_workers or os.cpu_count() or 1
+
+    def save_plots(self, plots: List[Tuple[Any, str]]) -> None:
+        """
+        Parameters
+        ----------
+        plots : list of (SimplePlot or DetailedPlot, str)
+            The plots to render, and the
+            directories to save them in
+        """
+
+        self._run(_save_plot, plots)
+
+    def write_reports(self, reports: List[Tuple[Any, str]]) -> None:
+        """
+        Parameters
+        ----------
+        reports : list of (Report, str)
+            The reports to write, and their filenames
+        """
+
+        self._run(_write_report, reports)
+
+    def _run(self, function: Callable, tasks: List[Tuple[Any, str]]) -> None:
+        num_workers = min(self._num_workers, len(tasks))
+
+        if num_workers <= 1:
+            try:
+                for task in tasks:
+                    function(*task)
+            finally:
+                _release_figure()
+            return
+
+        # Workers are spawned, as forking a process with
+        # running threads (e.g. the monitors) is unsafe
+        with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker) as executor:
+            futures = [executor.submit(function, *task) for task in tasks]
+            for future in futures:
+                future.result()
@@ -31,6 +31,7 @@
 
 from model_analyzer.reports.pdf_report import PDFReport
 from model_analyzer.reports.html_report import HTMLReport
+from model_analyzer.reports.render_pool import RenderPool
 from model_analyzer.config.run.run_config import RunConfig
 from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 
@@ -89,6 +90,8 @@ def __init__(self, mode: str, config: Union[ConfigCommandProfile, ConfigCommandR
                                                       'reports')
         os.makedirs(self._reports_export_directory, exist_ok=True)
 
+        self._render_pool = RenderPool(config.num_report_workers)
+
         self._cpu_metrics_gathered_sticky = None
 
     def report_keys(self):
@@ -153,6 +156,7 @@ def export_summaries(self):
         Write a summary to disk
         """
 
+        summaries = []
         for report_key, summary in self._summaries.items():
             model_report_dir = os.path.join(self._reports_export_directory,
                                             'summaries', report_key)
@@ -161,7 +165,9 @@ def export_summaries(self):
                 model_report_dir,
                 f'result_summary.{summary.get_file_extension()}')
             logger.info(f"Exporting Summary Report to {output_filename}")
-            summary.write_report(filename=output_filename)
+            summaries.append((summary, output_filename))
+
+        self._render_pool.write_reports(summaries)
 
     def create_detailed_reports(self):
         """
@@ -183,6 +189,7 @@ def export_detailed_reports(self):
         Write a detailed report to disk
         """
 
+        reports = []
         for report_key, report in self._detailed_reports.items():
             model_report_dir = os.path.join(self._reports_export_directory,
                                             'detailed', report_key)
@@ -191,7 +198,9 @@ def export_detailed_reports(self):
                 model_report_dir,
                 f'detailed_report.{report.get_file_extension()}')
             logger.info(f"Exporting Detailed Report to {output_filename}")
-            report.write_report(filename=output_filename)
+            reports.append((report, output_filename))
+
+        self._render_pool.write_reports(reports)
 
     def _add_summary_data(self):
         """
@@ -260,6 +269,12 @@ def _build_detailed_report(self, report_model_config):
             # First add row of detailed
             detailed_report.add_images([detailed_plot], [detailed_caption])
 
+            if self._plot_manager.has_latency_distribution_plot(report_key):
+                detailed_report.add_images([
+                    os.path.join(self._config.export_path, 'plots', 'detailed',
+                                 report_key, 'latency_distribution.png')
+                ], [f"Latency Distribution of {report_key} at each load"])
+
         # Next add the SimplePlots created for this detailed report
         plot_stack = []
         caption_stack = []
@@ -877,6 +892,15 @@ def _build_detailed_table(self, model_config_name):
 
         first_column_header = 'Request Concurrency' if self._mode == 'online' else 'Client Batch Size'
         first_column_tag = 'concurrency-range' if self._mode == 'online' else 'batch-size'
+        if self._mode == 'online' and measurements:
+            # A replayed request trace has the same load in every measurement
+            pa_params = measurements[0].model_specific_pa_params()[0]
+            if 'request-intervals' in pa_params:
+                first_column_header = 'Client Batch Size'
+                first_column_tag = 'batch-size'
+            elif 'request-rate-range' in pa_params:
+                first_column_header = 'Request Rate'
+                first_column_tag = 'request-rate-range'
         if not cpu_only:
             headers = [
                 first_column_header, 'p99 Latency (ms)',
@@ -63,7 +63,8 @@ def satisfies_constraints(self,
             run_config_measurement: 'RunConfigMeasurement') -> bool:
         """
         Checks that the measurements, for every model, satisfy 
-        the provided list of constraints
+        the provided list of constraints. A request rate that
+        the models could not keep up with never satisfies them
 
         Parameters
         ----------
@@ -76,6 +77,9 @@ def satisfies_constraints(self,
         False otherwise
         """
 
+        if run_config_measurement.is_request_rate_saturated():
+            return False
+
         if self._constraints:
             for (model_name, model_metrics) in run_config_measurement.data().items():
                 for metric in model_metrics:
@@ -99,6 +103,10 @@ def constraint_failure_percentage(self,
         """
         failure_percentage: float = 0
 
+        if run_config_measurement.is_request_rate_saturated():
+            failure_percentage += run_config_measurement.get_request_rate_shortfall(
+            )
+
         if self._constraints:
             for (model_name, model_metrics) in run_config_measurement.data().items():
                 for metric in model_metrics:
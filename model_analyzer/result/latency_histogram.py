@@ -0,0 +1,138 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, List, Tuple
+
+from math import ceil, log
+
+
+class LatencyHistogram:
+    """
+    A compact histogram of the latencies of every request of a
+    measurement, in microseconds
+
+    Latencies are counted in logarithmic buckets, so that any
+    percentile is reported within a relative error of PRECISION,
+    whatever its magnitude. Only the buckets that were hit are
+    stored, and histograms of the same precision are merged by
+    adding their counts
+    """
+
+    PRECISION = 0.01
+
+    # Percentiles at which the distribution is sampled for plots
+    DISTRIBUTION_PERCENTILES = [
+        0, 10, 25, 50, 75, 90, 95, 99, 99.5, 99.9, 99.95, 99.99, 100
+    ]
+
+    _log_base = log(1 + PRECISION)
+
+    def __init__(self) -> None:
+        self._counts: Dict[int, int] = {}
+        self._count = 0
+
+    def record(self, latency: float, count: int = 1) -> None:
+        """
+        Parameters
+        ----------
+        latency : float
+            The latency of a request, in microseconds
+        count : int
+            The number of requests with this latency
+        """
+
+        index = self._get_index(latency)
+        self._counts[index] = self._counts.get(index, 0) + count
+        self._count += count
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """
+        Adds the requests of the other histogram to this one
+        """
+
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self._count += other._count
+
+    def count(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The number of requests in the histogram
+        """
+
+        return self._count
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Parameters
+        ----------
+        percentile : float
+            The percentile, between 0 and 100
+
+        Returns
+        -------
+        float
+            The latency, in microseconds, that the given percentile of
+            the requests do not exceed. 0 if the histogram is empty
+        """
+
+        if not self._count:
+            return 0
+
+        rank = max(1, ceil(percentile / 100 * self._count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return self._get_value(index)
+
+        return self._get_value(max(self._counts))
+
+    def distribution(self) -> List[Tuple[float, float]]:
+        """
+        Returns
+        -------
+        list of (float, float)
+            The latency, in microseconds, at each
+            of the DISTRIBUTION_PERCENTILES
+        """
+
+        return [(percentile, self.percentile(percentile))
+                for percentile in self.DISTRIBUTION_PERCENTILES]
+
+    def to_dict(self) -> Dict:
+        return {'counts': sorted(self._counts.items())}
+
+    @classmethod
+    def from_dict(cls, histogram_dict: Dict) -> 'LatencyHistogram':
+        histogram = LatencyHistogram()
+        for index, count in histogram_dict['counts']:
+            histogram._counts[index] = count
+            histogram._count += count
+
+        return histogram
+
+    def _get_index(self, latency: float) -> int:
+        # Latencies under a microsecond share the first bucket
+        if latency <= 1:
+            return 0
+
+        return ceil(log(latency) / self._log_base)
+
+    def _get_value(self, index: int) -> float:
+        # The upper bound of the bucket, so that percentiles
+        # are never under-reported
+        return (1 + self.PRECISION)**index
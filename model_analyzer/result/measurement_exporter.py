@@ -0,0 +1,189 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, List
+
+from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
+from model_analyzer.output.columnar_writer import ColumnarWriter, ArrowColumnarWriter
+from model_analyzer.record.metrics_manager import MetricsManager
+from model_analyzer.result.constraint_manager import ConstraintManager
+from model_analyzer.result.result_manager import ResultManager
+
+import os
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class MeasurementExporter:
+    """
+    Exports every measurement, with typed columns, in a single
+    pass over the results. Unlike the result tables, nothing is
+    formatted, filtered or held in memory as a table
+
+    One row is written per model of every measurement to the
+    inference table, and one row per GPU of every measurement
+    to the GPU table. The tables are joined on 'measurement_key'
+    """
+
+    inference_columns = [('measurement_key', 'string'),
+                         ('model_name', 'string'),
+                         ('model_config_name', 'string'),
+                         ('batch_size', 'int'), ('concurrency', 'int'),
+                         ('request_rate', 'int'),
+                         ('request_intervals', 'string'),
+                         ('max_batch_size', 'int'),
+                         ('instance_group', 'string'),
+                         ('dynamic_batching', 'bool'), ('cpu_only', 'bool'),
+                         ('satisfies_constraints', 'bool')]
+
+    gpu_columns = [('measurement_key', 'string'), ('model_name', 'string'),
+                   ('model_config_name', 'string'), ('gpu_uuid', 'string')]
+
+    def __init__(self, config: ConfigCommandProfile,
+                 result_manager: ResultManager,
+                 constraint_manager: ConstraintManager) -> None:
+        """
+        Parameters
+        ----------
+        config : ConfigCommandProfile
+            The model analyzer's config
+        result_manager : ResultManager
+            instance that holds the measurements
+        constraint_manager: ConstraintManager
+            instance that checks the measurements against the constraints
+
+        Raises
+        ------
+        TritonModelAnalyzerException
+            If pyarrow is needed for the requested formats,
+            but is not installed
+        """
+
+        self._config = config
+        self._result_manager = result_manager
+        self._constraint_manager = constraint_manager
+
+        self._formats = [
+            export_format.strip()
+            for export_format in config.measurement_export_formats
+        ]
+
+        if set(self._formats) & {'parquet', 'arrow'}:
+            ArrowColumnarWriter.import_pyarrow()
+
+        self._inference_metric_tags = [
+            tag for tag in MetricsManager.metrics
+            if not MetricsManager.is_gpu_metric(tag)
+        ]
+        self._gpu_metric_tags = [
+            tag for tag in MetricsManager.metrics
+            if MetricsManager.is_gpu_metric(tag)
+        ]
+
+    def export(self) -> None:
+        """
+        Writes the inference and GPU tables of all
+        measurements, in every requested format
+        """
+
+        if not self._formats:
+            return
+
+        export_directory = os.path.join(self._config.export_path, 'results')
+        os.makedirs(export_directory, exist_ok=True)
+
+        inference_columns = self.inference_columns + [
+            (tag, 'float') for tag in self._inference_metric_tags
+        ]
+        gpu_columns = self.gpu_columns + [
+            (tag, 'float') for tag in self._gpu_metric_tags
+        ]
+
+        inference_writers: List[ColumnarWriter] = []
+        gpu_writers: List[ColumnarWriter] = []
+        try:
+            for export_format in self._formats:
+                inference_file = os.path.join(
+                    export_directory,
+                    f'measurements-model-inference.{export_format}')
+                gpu_file = os.path.join(
+                    export_directory, f'measurements-model-gpu.{export_format}')
+                logger.info(
+                    f"Exporting measurements to {inference_file} and {gpu_file}")
+
+                inference_writers.append(
+                    ColumnarWriter.create(inference_file, inference_columns,
+                                          export_format))
+                gpu_writers.append(
+                    ColumnarWriter.create(gpu_file, gpu_columns, export_format))
+
+            self._write_rows(inference_writers, gpu_writers)
+        finally:
+            for writer in inference_writers + gpu_writers:
+                writer.close()
+
+    def _write_rows(self, inference_writers: List[ColumnarWriter],
+                    gpu_writers: List[ColumnarWriter]) -> None:
+        gpu_count = len(self._result_manager.get_server_only_data())
+
+        for run_config, key, run_config_measurement in self._result_manager.get_results(
+        ).iterate_run_config_measurements():
+            cpu_only = run_config.cpu_only()
+            satisfies_constraints = self._constraint_manager.satisfies_constraints(
+                run_config_measurement)
+
+            for model_run_config, pa_params, non_gpu_metrics in zip(
+                    run_config.model_run_configs(),
+                    run_config_measurement.model_specific_pa_params(),
+                    run_config_measurement.non_gpu_data()):
+                model_config = model_run_config.model_config()
+                row = [
+                    key,
+                    model_run_config.model_name(),
+                    model_run_config.model_variant_name(),
+                    pa_params.get('batch-size'),
+                    pa_params.get('concurrency-range'),
+                    pa_params.get('request-rate-range'),
+                    pa_params.get('request-intervals'),
+                    model_config.max_batch_size(),
+                    model_config.instance_group_string(gpu_count),
+                    'dynamic_batching' in model_config.get_config(), cpu_only,
+                    satisfies_constraints
+                ] + self._get_metric_values(non_gpu_metrics,
+                                            self._inference_metric_tags)
+
+                for writer in inference_writers:
+                    writer.write_row(row)
+
+            if cpu_only:
+                continue
+
+            for gpu_uuid, gpu_metrics in run_config_measurement.gpu_data(
+            ).items():
+                row = [
+                    key,
+                    run_config.models_name(),
+                    run_config.model_variants_name(), gpu_uuid
+                ] + self._get_metric_values(gpu_metrics, self._gpu_metric_tags)
+
+                for writer in gpu_writers:
+                    writer.write_row(row)
+
+    def _get_metric_values(self, metrics, tags):
+        values: Dict[str, float] = {
+            metric.tag: metric.value() for metric in metrics
+        }
+        return [values.get(tag) for tag in tags]
@@ -16,14 +16,24 @@
 from model_analyzer.constants import LOGGER_NAME
 
 from model_analyzer.record.record import RecordType
+from model_analyzer.result.latency_histogram import LatencyHistogram
 
 from copy import deepcopy
-from statistics import mean
+from math import sqrt
+from statistics import mean, stdev
 from functools import total_ordering
 import logging
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Two-sided 95% critical values of Student's t-distribution,
+# by degrees of freedom. Beyond the table, the normal one is used
+T_CRITICAL_VALUES_95 = [
+    None, 12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262,
+    2.228
+]
+NORMAL_CRITICAL_VALUE_95 = 1.96
+
 
 @total_ordering
 class ModelConfigMeasurement:
@@ -32,8 +42,11 @@ class ModelConfigMeasurement:
     RunConfig run
     """
 
-    def __init__(self, model_config_name, model_specific_pa_params,
-                 non_gpu_data):
+    def __init__(self,
+                 model_config_name,
+                 model_specific_pa_params,
+                 non_gpu_data,
+                 latency_histogram=None):
         """
         model_config_name : string
             The model config name that was used in the RunConfig
@@ -43,11 +56,19 @@ def __init__(self, model_config_name, model_specific_pa_params,
         non_gpu_data : list of Records
             Metrics that do not have a GPU UUID associated with them,
             from either CPU or PA
+        latency_histogram : LatencyHistogram
+            The latencies of every request, if they were collected
         """
 
         self._model_config_name = model_config_name
         self._model_specific_pa_params = model_specific_pa_params
         self._non_gpu_data = non_gpu_data
+        self._latency_histogram = latency_histogram
+
+        # Only measurements combined from repeats have
+        # a 95% confidence interval (its half-width) per tag
+        self._measurement_count = 1
+        self._confidence_intervals = {}
 
         self._non_gpu_data_from_tag = self._get_non_gpu_data_from_tag()
 
@@ -76,6 +97,68 @@ def from_dict(cls, model_config_measurement_dict):
         model_config_measurement._non_gpu_data_from_tag = cls._get_non_gpu_data_from_tag(
             model_config_measurement)
 
+        # Checkpoints from before histograms were collected do not have one
+        if model_config_measurement_dict.get('_latency_histogram'):
+            model_config_measurement._latency_histogram = LatencyHistogram.from_dict(
+                model_config_measurement_dict['_latency_histogram'])
+
+        model_config_measurement._measurement_count = model_config_measurement_dict.get(
+            '_measurement_count', 1)
+        model_config_measurement._confidence_intervals = model_config_measurement_dict.get(
+            '_confidence_intervals', {})
+
+        return model_config_measurement
+
+    @classmethod
+    def combine(cls, model_config_measurements):
+        """
+        Combines repeated measurements of the same model config
+        into one, with the mean of each metric and its 95%
+        confidence interval
+
+        Parameters
+        ----------
+        model_config_measurements : list of ModelConfigMeasurements
+            The repeated measurements
+
+        Returns
+        -------
+        ModelConfigMeasurement
+        """
+
+        first_measurement = model_config_measurements[0]
+
+        non_gpu_data = []
+        confidence_intervals = {}
+        for tag in first_measurement._non_gpu_data_from_tag:
+            values = [
+                model_config_measurement.get_metric_value(tag)
+                for model_config_measurement in model_config_measurements
+                if model_config_measurement.get_metric(tag) is not None
+            ]
+            record_type = type(first_measurement.get_metric(tag))
+            non_gpu_data.append(record_type(value=mean(values)))
+
+            if len(values) > 1:
+                confidence_intervals[tag] = cls._get_critical_value(
+                    len(values) - 1) * stdev(values) / sqrt(len(values))
+
+        latency_histogram = None
+        if first_measurement.latency_histogram():
+            latency_histogram = LatencyHistogram()
+            for model_config_measurement in model_config_measurements:
+                if model_config_measurement.latency_histogram():
+                    latency_histogram.merge(
+                        model_config_measurement.latency_histogram())
+
+        model_config_measurement = ModelConfigMeasurement(
+            first_measurement.model_config_name(),
+            first_measurement.model_specific_pa_params(), non_gpu_data,
+            latency_histogram)
+        model_config_measurement._measurement_count = len(
+            model_config_measurements)
+        model_config_measurement._confidence_intervals = confidence_intervals
+
         return model_config_measurement
 
     def set_metric_weighting(self, metric_objectives):
@@ -128,6 +211,68 @@ def non_gpu_data(self):
 
         return self._non_gpu_data
 
+    def latency_histogram(self):
+        """
+        Return the LatencyHistogram of every request,
+        or None if the latencies were not collected
+        """
+
+        return self._latency_histogram
+
+    def measurement_count(self):
+        """
+        Return the number of repeated measurements
+        this measurement was combined from
+        """
+
+        return self._measurement_count
+
+    def get_confidence_interval(self, tag):
+        """
+        Parameters
+        ----------
+        tag : str
+            A human readable tag that corresponds
+            to a particular metric
+
+        Returns
+        -------
+        float
+            The half-width of the 95% confidence interval of
+            the metric, 0 if it was measured only once
+        """
+
+        return self._confidence_intervals.get(tag, 0)
+
+    def confidence_intervals_overlap(self, other):
+        """
+        Checks whether the confidence intervals of every objective
+        of this and the other measurement overlap, in which case
+        neither can be ranked above the other
+
+        Parameters
+        ----------
+        other: ModelConfigMeasurement
+            set of (non_gpu) metrics to be compared against
+        """
+
+        if self._measurement_count == 1 and other._measurement_count == 1:
+            return False
+
+        for objective in self._metric_weights:
+            self_metric = self.get_metric(tag=objective)
+            other_metric = other.get_metric(tag=objective)
+
+            if self_metric is None or other_metric is None:
+                return False
+
+            if abs(self_metric.value() - other_metric.value()) > (
+                    self.get_confidence_interval(objective) +
+                    other.get_confidence_interval(objective)):
+                return False
+
+        return True
+
     def get_metric(self, tag):
         """
         Parameters
@@ -256,6 +401,9 @@ def _compare_measurements(self, other):
             -1
                 if self < other (is worse than)
         """
+        if self.confidence_intervals_overlap(other):
+            return 0
+
         weighted_score = self._calculate_weighted_score(other)
 
         if weighted_score > COMPARISON_SCORE_THRESHOLD:
@@ -338,6 +486,12 @@ def calculate_weighted_percentage_gain(self, other):
 
         return weighted_pct
 
+    @staticmethod
+    def _get_critical_value(degrees_of_freedom):
+        if degrees_of_freedom < len(T_CRITICAL_VALUES_95):
+            return T_CRITICAL_VALUES_95[degrees_of_freedom]
+        return NORMAL_CRITICAL_VALUE_95
+
     def _get_non_gpu_data_from_tag(self):
         return {metric.tag: metric for metric in self._non_gpu_data}
 
@@ -131,11 +131,7 @@ def add_run_config_measurement(
             comparator=self._run_comparators[model_name],
             constraint_manager=self._constraint_manager)
 
-        run_config_measurement.set_metric_weightings(
-            self._run_comparators[model_name].get_metric_weights())
-
-        run_config_measurement.set_model_config_weighting(
-            self._run_comparators[model_name].get_model_weights())
+        self._set_weightings(model_name, run_config_measurement)
 
         self._add_rcm_to_results(run_config, run_config_measurement)
         run_config_result.add_run_config_measurement(run_config_measurement)
@@ -143,6 +139,51 @@ def add_run_config_measurement(
         self._per_model_sorted_results[model_name].add_result(run_config_result)
         self._across_model_sorted_results.add_result(run_config_result)
 
+    def is_ranking_ambiguous(self, run_config: RunConfig,
+                             run_config_measurement: RunConfigMeasurement,
+                             tolerance: float) -> bool:
+        """
+        Checks whether a measurement that is not yet added is too close
+        to the best measurement of its models to be ranked against it,
+        so that measuring it again could change which is the best
+
+        Parameters
+        ----------
+        run_config: RunConfig
+            The run config the measurement was obtained for
+        run_config_measurement: RunConfigMeasurement
+            The measurement, possibly combined from repeats
+        tolerance: float
+            The weighted score within which measurements
+            are too close to be ranked
+
+        Returns
+        -------
+        bool
+            True if the measurement is within the tolerance of the best
+            one, and its confidence intervals, if it was repeated,
+            still overlap with the best one
+        """
+
+        model_name = run_config.models_name()
+        if model_name not in self._per_model_sorted_results:
+            return False
+
+        best_measurement = self._per_model_sorted_results[
+            model_name].best_passing_measurement()
+        if best_measurement is None or best_measurement.model_variants_name(
+        ) == run_config_measurement.model_variants_name():
+            return False
+
+        self._set_weightings(model_name, run_config_measurement)
+
+        if abs(run_config_measurement.compare_measurements(
+                best_measurement)) > tolerance:
+            return False
+
+        return run_config_measurement.measurement_count(
+        ) == 1 or run_config_measurement == best_measurement
+
     def get_model_configs_run_config_measurements(self, model_variants_name):
         """
         Unsorted list of RunConfigMeasurements for a config
@@ -333,6 +374,14 @@ def _setup_for_sequential_profile(self):
             for model in self._config.profile_models
         }
 
+    def _set_weightings(self, model_name: str,
+                        run_config_measurement: RunConfigMeasurement) -> None:
+        run_config_measurement.set_metric_weightings(
+            self._run_comparators[model_name].get_metric_weights())
+
+        run_config_measurement.set_model_config_weighting(
+            self._run_comparators[model_name].get_model_weights())
+
     def _add_rcm_to_results(self, run_config, run_config_measurement):
         """
         This function adds model inference
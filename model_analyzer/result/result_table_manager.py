@@ -34,6 +34,8 @@ class ResultTableManager:
         'model_name': 'Model',
         'batch_size': 'Batch',
         'concurrency': 'Concurrency',
+        'request_rate': 'Request Rate',
+        'request_intervals': 'Request Intervals',
         'model_config_path': 'Model Config Path',
         'instance_group': 'Instance Group',
         'max_batch_size': 'Max Batch Size',
@@ -416,7 +418,7 @@ def _tabulate_measurement(self, model_name, instance_groups,
                 if ensemble_subconfig_name != ensemble_subconfig_names[-1]:
                     model_config_name = model_config_name + ", "
 
-        model_specific_pa_params, batch_sizes, concurrencies = self._tabulate_measurement_setup(
+        model_specific_pa_params, batch_sizes, concurrencies, request_rates, request_intervals = self._tabulate_measurement_setup(
             run_config_measurement)
 
         satisfies = "Yes" if passes else "No"
@@ -426,7 +428,8 @@ def _tabulate_measurement(self, model_name, instance_groups,
         inference_row = self._get_common_row_items(
             inference_fields, batch_sizes, concurrencies, satisfies, model_name,
             model_config_name, dynamic_batchings, instance_groups,
-            max_batch_sizes, backend_parameters)
+            max_batch_sizes, backend_parameters, request_rates,
+            request_intervals)
 
         self._populate_inference_rows(run_config_measurement, inference_fields,
                                       inference_row)
@@ -440,9 +443,17 @@ def _tabulate_measurement(self, model_name, instance_groups,
                 gpu_fields = self._gpu_output_fields
 
                 gpu_row = self._get_common_row_items(
-                    gpu_fields, batch_sizes, concurrencies, satisfies,
-                    model_name, model_config_name, dynamic_batchings,
-                    instance_groups, max_batch_sizes)
+                    gpu_fields,
+                    batch_sizes,
+                    concurrencies,
+                    satisfies,
+                    model_name,
+                    model_config_name,
+                    dynamic_batchings,
+                    instance_groups,
+                    max_batch_sizes,
+                    request_rates=request_rates,
+                    request_intervals=request_intervals)
 
                 self._add_uuid_to_gpu_row(gpu_row, gpu_uuid, gpu_fields)
                 self._add_metrics_to_gpu_row(gpu_row, metrics, gpu_fields)
@@ -460,8 +471,19 @@ def _tabulate_measurement_setup(self, run_config_measurement):
             pa_params['concurrency-range']
             for pa_params in model_specific_pa_params
         ]
+        request_rates = [
+            pa_params.get('request-rate-range')
+            for pa_params in model_specific_pa_params
+        ]
 
-        return model_specific_pa_params, batch_sizes, concurrencies
+        # The intervals files of a replayed trace are named after the model
+        request_intervals = [
+            os.path.basename(pa_params['request-intervals'])
+            if pa_params.get('request-intervals') else None
+            for pa_params in model_specific_pa_params
+        ]
+
+        return model_specific_pa_params, batch_sizes, concurrencies, request_rates, request_intervals
 
     def _populate_inference_rows(self, run_config_measurement, inference_fields,
                                  inference_row):
@@ -515,7 +537,9 @@ def _get_common_row_items(self,
                               dynamic_batchings,
                               instance_groups,
                               max_batch_sizes,
-                              backend_parameters=None):
+                              backend_parameters=None,
+                              request_rates=None,
+                              request_intervals=None):
         row = [None] * len(fields)
 
         # Model Name
@@ -533,6 +557,17 @@ def _get_common_row_items(self,
         if concurrency_index is not None:
             row[concurrency_index] = format_for_csv(concurrencies)
 
+        # Request Rate
+        request_rate_index = self._find_index_for_field(fields, 'request_rate')
+        if request_rate_index is not None:
+            row[request_rate_index] = format_for_csv(request_rates)
+
+        # Request Intervals
+        request_intervals_index = self._find_index_for_field(
+            fields, 'request_intervals')
+        if request_intervals_index is not None:
+            row[request_intervals_index] = format_for_csv(request_intervals)
+
         # Satisfies
         satisfies_constraints_index = self._find_index_for_field(
             fields, 'satisfies_constraints')
@@ -17,6 +17,7 @@
 from model_analyzer.constants import LOGGER_NAME
 
 import logging
+import sys
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -59,9 +60,11 @@ def from_dict(cls, results_dict):
                     run_config_measurement = RunConfigMeasurement.from_dict(
                         measurement_dict)
 
+                    # Share the keys with the representations of the
+                    # run configs that are generated again
                     results._add_run_config_measurement(models_name, run_config,
                                                         model_variants_name,
-                                                        key,
+                                                        sys.intern(key),
                                                         run_config_measurement)
 
         return results
@@ -165,6 +168,25 @@ def get_list_of_run_config_measurements(self):
 
         return measurements
 
+    def iterate_run_config_measurements(self):
+        """
+        Iterates over the RunConfigMeasurements of every
+        model/model_config, without copying them
+
+        Yields
+        ------
+        (RunConfig, str, RunConfigMeasurement)
+            The run config, the key the measurement
+            is stored under and the measurement
+        """
+
+        for model_result in self._results.values():
+            for model_config_result in model_result.values():
+                run_config = model_config_result[Results.RUN_CONFIG_INDEX]
+                for key, measurement in model_config_result[
+                        Results.MEASUREMENTS_INDEX].items():
+                    yield run_config, key, measurement
+
     def get_model_measurements_dict(self, models_name, suppress_warning=False):
         """
         Given a model name, return a dict with all measurements for that model.
@@ -15,9 +15,11 @@
 from typing import Any, Dict, List, Optional
 
 from model_analyzer.constants import COMPARISON_SCORE_THRESHOLD
+from model_analyzer.constants import REQUEST_RATE_MINIMUM_ACHIEVED_FRACTION
 from model_analyzer.constants import LOGGER_NAME
 
 from model_analyzer.result.model_config_measurement import ModelConfigMeasurement
+from model_analyzer.result.latency_histogram import LatencyHistogram
 from model_analyzer.result.constraint_manager import ConstraintManager
 from model_analyzer.record.record import Record, RecordType
 
@@ -88,6 +90,48 @@ def from_dict(cls,
 
         return run_config_measurement
 
+    @classmethod
+    def combine(
+        cls, run_config_measurements: List['RunConfigMeasurement']
+    ) -> 'RunConfigMeasurement':
+        """
+        Combines repeated measurements of the same RunConfig into one,
+        with the mean of each metric and, for the metrics of each
+        model config, its confidence interval
+
+        Parameters
+        ----------
+        run_config_measurements: list of RunConfigMeasurements
+            The repeated measurements
+
+        Returns
+        -------
+        RunConfigMeasurement
+        """
+
+        first_measurement = run_config_measurements[0]
+
+        gpu_data = {
+            gpu_uuid: first_measurement._average_list([
+                run_config_measurement.gpu_data()[gpu_uuid]
+                for run_config_measurement in run_config_measurements
+                if gpu_uuid in run_config_measurement.gpu_data()
+            ]) for gpu_uuid in first_measurement.gpu_data()
+        }
+
+        run_config_measurement = RunConfigMeasurement(
+            first_measurement.model_variants_name(), gpu_data)
+
+        for index in range(len(first_measurement._model_config_measurements)):
+            run_config_measurement._model_config_measurements.append(
+                ModelConfigMeasurement.combine([
+                    measurement._model_config_measurements[index]
+                    for measurement in run_config_measurements
+                ]))
+            run_config_measurement._model_config_weights.append(1)
+
+        return run_config_measurement
+
     def set_model_config_weighting(self,
                                    model_config_weights: List[int]) -> None:
         """
@@ -116,9 +160,12 @@ def set_constraint_manager(
         """
         self._constraint_manager = constraint_manager
 
-    def add_model_config_measurement(self, model_config_name: str,
-                                     model_specific_pa_params: Dict[str, int],
-                                     non_gpu_data: List[Record]) -> None:
+    def add_model_config_measurement(
+            self,
+            model_config_name: str,
+            model_specific_pa_params: Dict[str, int],
+            non_gpu_data: List[Record],
+            latency_histogram: Optional[LatencyHistogram] = None) -> None:
         """ 
         Adds a measurement from a single model config in this PA's run 
         
@@ -130,10 +177,13 @@ def add_model_config_measurement(self, model_config_name: str,
         non_gpu_data : list of Records
             Metrics that do not have a GPU UUID associated with them,
             from either CPU or PA
+        latency_histogram : LatencyHistogram
+            The latencies of every request of the model,
+            if they were collected
         """
         self._model_config_measurements.append(
             ModelConfigMeasurement(model_config_name, model_specific_pa_params,
-                                   non_gpu_data))
+                                   non_gpu_data, latency_histogram))
 
         # By default setting all models to have equal weighting
         self._model_config_weights.append(1)
@@ -377,6 +427,36 @@ def model_specific_pa_params(self) -> List[Dict[str, int]]:
             for model_config_measurement in self._model_config_measurements
         ]
 
+    def latency_histograms(self) -> List[Optional[LatencyHistogram]]:
+        """
+        Returns
+        -------
+        list:
+            of the LatencyHistogram of each model config,
+            or None where the latencies were not collected
+        """
+
+        return [
+            model_config_measurement.latency_histogram()
+            for model_config_measurement in self._model_config_measurements
+        ]
+
+    def measurement_count(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The number of repeated measurements
+            this measurement was combined from
+        """
+
+        measurement_counts = [
+            model_config_measurement.measurement_count()
+            for model_config_measurement in self._model_config_measurements
+        ]
+
+        return min(measurement_counts) if measurement_counts else 1
+
     def is_better_than(self, other: 'RunConfigMeasurement') -> bool:
         """
         Checks whether a measurement is better than another
@@ -413,6 +493,38 @@ def __lt__(self, other: 'RunConfigMeasurement') -> bool:
 
         return not self.is_better_than(other)
 
+    def is_request_rate_saturated(self) -> bool:
+        """
+        Returns true if the throughput of a request rate measurement fell
+        short of the offered load, meaning that requests queued up faster
+        than the models could serve them
+        """
+
+        offered_throughput = self._get_offered_throughput()
+        if not offered_throughput:
+            return False
+
+        return self.get_non_gpu_metric_value(
+            'perf_throughput'
+        ) < offered_throughput * REQUEST_RATE_MINIMUM_ACHIEVED_FRACTION
+
+    def get_request_rate_shortfall(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The fraction of the offered load that was not served,
+            or 0 if the measurement is not of request rates
+        """
+
+        offered_throughput = self._get_offered_throughput()
+        if not offered_throughput:
+            return 0
+
+        return max(
+            0, 1 - self.get_non_gpu_metric_value('perf_throughput') /
+            offered_throughput)
+
     def is_passing_constraints(self) -> bool:
         """
         Returns true if all model measurements pass
@@ -519,13 +631,17 @@ def _compare_measurements(self, other: 'RunConfigMeasurement') -> int:
         int
             0
                 if the results are determined
-                to be the same within a threshold
+                to be the same within a threshold,
+                or within their confidence intervals
             1
                 if self > other (is better than)
             -1
                 if self < other (is worse than)
         """
 
+        if self._confidence_intervals_overlap(other):
+            return 0
+
         # Step 1: for each ModelConfig determine the weighted score
         weighted_mcm_scores = self._calculate_weighted_mcm_score(other)
 
@@ -540,6 +656,14 @@ def _compare_measurements(self, other: 'RunConfigMeasurement') -> int:
             return -1
         return 0
 
+    def _confidence_intervals_overlap(self,
+                                      other: 'RunConfigMeasurement') -> bool:
+        return all([
+            self_mcm.confidence_intervals_overlap(other_mcm)
+            for self_mcm, other_mcm in zip(self._model_config_measurements,
+                                           other._model_config_measurements)
+        ])
+
     def _calculate_weighted_mcm_score(
             self, other: 'RunConfigMeasurement') -> List[float]:
         """
@@ -615,6 +739,23 @@ def _average_list(self, row_list):
                               start=row_list[0][i]) * 1.0) / N
             return avg
 
+    def _get_offered_throughput(self) -> float:
+        """
+        Returns the inferences/sec offered by the request rates
+        of all the models, or 0 if any model was not measured
+        at a request rate
+        """
+
+        offered_throughput = 0
+        for pa_params in self.model_specific_pa_params():
+            request_rate = pa_params.get('request-rate-range')
+            if type(request_rate) is not int:
+                return 0
+
+            offered_throughput += request_rate * int(pa_params['batch-size'])
+
+        return offered_throughput
+
     def _deserialize_gpu_data(
             self, serialized_gpu_data: Dict) -> Dict[int, List[Record]]:
         gpu_data = {}
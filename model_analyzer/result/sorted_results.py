@@ -19,6 +19,7 @@
 
 from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.result.run_config_result import RunConfigResult
+from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 
 import logging
 
@@ -93,6 +94,21 @@ def top_n_results(self, n: int) -> List[RunConfigResult]:
         else:
             return self._get_top_n_results(passing_results, n)
 
+    def best_passing_measurement(self) -> Optional[RunConfigMeasurement]:
+        """
+        Returns
+        -------
+        RunConfigMeasurement
+            The best measurement of the best result that
+            satisfies the constraints, None if there is none
+        """
+
+        passing_results, _ = self._create_passing_and_failing_lists()
+        if not passing_results:
+            return None
+
+        return passing_results[0].passing_measurements()[0]
+
     def _find_existing_run_config_result(
             self,
             run_config_result: RunConfigResult) -> Optional[RunConfigResult]:
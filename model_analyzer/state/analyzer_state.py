@@ -58,6 +58,12 @@ def from_dict(cls, state_dict):
         state._state_dict['MetricsManager.gpus'] = state_dict[
             'MetricsManager.gpus']
 
+        # Server start times, missing from older checkpoints
+        if 'MetricsManager.server_phase_times' in state_dict:
+            state._state_dict[
+                'MetricsManager.server_phase_times'] = state_dict[
+                    'MetricsManager.server_phase_times']
+
         return state
 
     def get(self, name):
@@ -28,14 +28,26 @@ class TritonClient:
     TritonClientFactory
     """
 
-    def wait_for_server_ready(self, num_retries, sleep_time=1):
+    # Readiness is polled with exponential backoff between these intervals
+    MIN_POLL_INTERVAL = 0.005
+    MAX_POLL_INTERVAL = 0.08
+
+    def wait_for_server_ready(self, num_retries, sleep_time=1, server=None):
         """
+        Returns as soon as the server is ready
+
         Parameters
         ----------
         num_retries : int
-            number of times to send a ready status
-            request to the server before raising
+            the server is given num_retries * sleep_time
+            seconds to become ready before raising
             an exception
+        sleep_time : float
+            seconds per retry
+        server : TritonServer
+            the server being waited on. Waiting stops
+            early if it is no longer running
+
         Raises
         ------
         TritonModelAnalyzerException
@@ -43,20 +55,15 @@ def wait_for_server_ready(self, num_retries, sleep_time=1):
             determined in given num_retries
         """
 
-        retries = num_retries
-        while retries > 0:
-            try:
-                if self._client.is_server_ready():
-                    time.sleep(sleep_time)
-                    return
-                else:
-                    time.sleep(sleep_time)
-                    retries -= 1
-            except Exception as e:
-                time.sleep(sleep_time)
-                retries -= 1
-                if retries == 0:
-                    raise TritonModelAnalyzerException(e)
+        ready, error = self._wait_until(self._client.is_server_ready,
+                                        num_retries * sleep_time, server)
+        if ready:
+            return
+        if server is not None and not server.is_running():
+            raise TritonModelAnalyzerException(
+                "Triton Server exited before it was ready.")
+        if error is not None:
+            raise TritonModelAnalyzerException(error)
         raise TritonModelAnalyzerException(
             "Could not determine server readiness. "
             "Number of retries exceeded.")
@@ -111,41 +118,63 @@ def unload_model(self, model_name):
 
     def wait_for_model_ready(self, model_name, num_retries, sleep_time=1):
         """
-        Returns when model is ready.
+        Returns as soon as the model is ready.
 
         Parameters
         ----------
         model_name : str
             name of the model to load from repository
         num_retries : int
-            number of times to send a ready status
-            request to the server before raising
-            an exception
+            the model is given num_retries * sleep_time
+            seconds to become ready
+        sleep_time : float
+            seconds per retry
 
-        Raises
-        ------
-        TritonModelAnalyzerException
-            If could not determine model readiness
-            in given num_retries
+        Returns
+        -------
+        int or None
+            Returns -1 if the model is not ready in time
         """
 
-        retries = num_retries
+        ready, error = self._wait_until(
+            lambda: self._client.is_model_ready(model_name),
+            num_retries * sleep_time)
+        if ready:
+            return
+
+        logger.info(
+            f'Model readiness failed for model {model_name}. Error {error}')
+        return -1
+
+    def _wait_until(self, is_ready, timeout, server=None):
+        """
+        Polls is_ready, with exponential backoff, until
+        it returns True or the timeout expires
+
+        Returns
+        -------
+        (bool, Exception or None)
+            Whether is_ready returned True, and the
+            last exception it raised
+        """
+
+        deadline = time.monotonic() + timeout
+        interval = self.MIN_POLL_INTERVAL
         error = None
-        while retries > 0:
+        while True:
             try:
-                if self._client.is_model_ready(model_name):
-                    return
-                else:
-                    time.sleep(sleep_time)
-                    retries -= 1
+                if is_ready():
+                    return True, None
             except Exception as e:
                 error = e
-                time.sleep(sleep_time)
-                retries -= 1
 
-        logger.info(
-            f'Model readiness failed for model {model_name}. Error {error}')
-        return -1
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (server is not None and
+                                  not server.is_running()):
+                return False, error
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, self.MAX_POLL_INTERVAL)
 
     def get_model_config(self, model_name, num_retries):
         """
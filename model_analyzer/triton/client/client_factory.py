@@ -14,6 +14,7 @@
 
 from .grpc_client import TritonGRPCClient
 from .http_client import TritonHTTPClient
+from .simulated_client import TritonSimulatedClient
 
 
 class TritonClientFactory:
@@ -53,3 +54,12 @@ def create_http_client(server_url, ssl_options={}):
         TritonHTTPClient
         """
         return TritonHTTPClient(server_url=server_url, ssl_options=ssl_options)
+
+    @staticmethod
+    def create_simulated_client():
+        """
+        Returns
+        -------
+        TritonSimulatedClient
+        """
+        return TritonSimulatedClient()
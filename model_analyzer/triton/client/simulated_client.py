@@ -0,0 +1,58 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from .client import TritonClient
+from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
+
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class TritonSimulatedClient(TritonClient):
+    """
+    Concrete implementation of TritonClient
+    for the simulated Triton Server. Loading
+    a model always succeeds and never waits
+    """
+
+    def __init__(self):
+        self._loaded_models = set()
+
+    def wait_for_server_ready(self, num_retries, sleep_time=1, server=None):
+        return
+
+    def load_model(self, model_name):
+        self._loaded_models.add(model_name)
+        logger.debug(f'Model {model_name} loaded')
+
+    def unload_model(self, model_name):
+        self._loaded_models.discard(model_name)
+        logger.debug(f'Model {model_name} unloaded')
+
+    def wait_for_model_ready(self, model_name, num_retries, sleep_time=1):
+        if model_name not in self._loaded_models:
+            logger.info(f'Model readiness failed for model {model_name}. '
+                        'Model is not loaded')
+            return -1
+
+    def get_model_config(self, model_name, num_retries):
+        raise TritonModelAnalyzerException(
+            'The simulated Triton Server cannot create model configs. '
+            f'Add a config.pbtxt for {model_name} to the model repository.')
+
+    def is_server_ready(self):
+        return True
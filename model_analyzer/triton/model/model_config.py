@@ -16,19 +16,18 @@
 from typing import Dict, Any, List, Optional
 from copy import deepcopy
 
-from numba import cuda
-from distutils.dir_util import copy_tree
+from shutil import copytree
 from google.protobuf import text_format, json_format
 from google.protobuf.descriptor import FieldDescriptor
 from tritonclient.grpc import model_config_pb2
 from model_analyzer.model_analyzer_exceptions \
     import TritonModelAnalyzerException
 
-from model_analyzer.triton.server.server_factory import TritonServerFactory
 from model_analyzer.config.input.objects.config_model_profile_spec import ConfigModelProfileSpec
 from model_analyzer.config.input.config_command_profile import ConfigCommandProfile
 from model_analyzer.triton.client.client import TritonClient
 from model_analyzer.device.gpu_device import GPUDevice
+from model_analyzer.device.gpu_inventory import GPUInventory
 
 
 class ModelConfig:
@@ -134,11 +133,14 @@ def _get_default_config_from_server(config, client, gpus, model_name,
             path to the base model
         """
 
+        # Only needed when profiling, and pulls in the docker client
+        from model_analyzer.triton.server.server_factory import TritonServerFactory
+
         server = TritonServerFactory.get_server_handle(
             config, gpus, use_model_repository=True)
 
         server.start()
-        client.wait_for_server_ready(config.client_max_retries)
+        client.wait_for_server_ready(config.client_max_retries, server=server)
 
         if (client.load_model(model_name) == -1):
             server.stop()
@@ -360,7 +362,9 @@ def write_config_to_file(self, model_path, src_model_path,
             Path to the source model in the Triton Model Repository
 
         first_variant_model_path : str
-            Indicates the path to the first model variant.
+            Path to a directory with the model files (such as the first
+            model variant), which are symlinked into model_path. If None,
+            the source model is copied instead.
 
         Raises
         ------
@@ -391,7 +395,7 @@ def write_config_to_file(self, model_path, src_model_path,
                         os.path.join(model_path, file))
         else:
             # Create first variant model as copy of source model
-            copy_tree(src_model_path, model_path)
+            copytree(src_model_path, model_path, dirs_exist_ok=True)
 
         with open(os.path.join(model_path, "config.pbtxt"), 'wb') as f:
             f.write(model_config_bytes)
@@ -486,7 +490,7 @@ def instance_group_string(self, system_gpu_count: int) -> str:
         model_config = self.get_config()
 
         # TODO change when remote mode is fixed
-        default_kind = 'GPU' if cuda.is_available() else 'CPU'
+        default_kind = 'GPU' if GPUInventory.get().is_available() else 'CPU'
         default_count = 1
 
         instance_group_list: List[Dict[str, Any]] = [{}]
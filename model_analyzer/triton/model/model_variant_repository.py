@@ -0,0 +1,220 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Set
+
+from model_analyzer.constants import LOGGER_NAME
+from model_analyzer.triton.model.model_config import ModelConfig
+
+import fcntl
+import logging
+import os
+import shutil
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# From linux/fs.h: clone (reflink) a whole file on a copy-on-write filesystem
+FICLONE = 0x40049409
+
+
+class ModelVariantRepository:
+    """
+    Materializes model config variants in the output model repository
+
+    The files of each original model are linked once into a base directory
+    inside the output model repository, so the weights are never copied.
+    Every variant is then a directory of relative symlinks into that base,
+    plus its own config.pbtxt. Variants are materialized on a background
+    thread, and can be pruned once they are no longer needed.
+    """
+
+    BASE_DIRECTORY = '.model_analyzer_base'
+
+    def __init__(self,
+                 model_repository: str,
+                 output_model_repository: str,
+                 allow_absolute_symlinks: bool = True) -> None:
+        """
+        Parameters
+        ----------
+        model_repository : str
+            Path to the repository of the original models
+        output_model_repository : str
+            Path to the repository the variants are created in
+        allow_absolute_symlinks : bool
+            Whether model files that cannot be reflinked or hardlinked
+            (e.g. across filesystems) can be symlinked to the original
+            model. If not, for instance when only the output model
+            repository is visible to Triton, they are copied
+        """
+
+        self._model_repository = model_repository
+        self._output_model_repository = output_model_repository
+        self._allow_absolute_symlinks = allow_absolute_symlinks
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='model_variant_repository')
+        self._pending: List[Future] = []
+        self._base_dirs: Dict[str, str] = {}
+        self._variant_names: Set[str] = set()
+        self._copy_warning_printed = False
+
+    def materialize(self, original_name: str,
+                    variant_config: ModelConfig) -> Future:
+        """
+        Starts creating the directory of a model config
+        variant in the background, if it doesn't exist yet
+
+        Parameters
+        ----------
+        original_name : str
+            The name of the model the variant was generated from
+        variant_config : ModelConfig
+            The config of the variant
+
+        Returns
+        -------
+        Future
+            Completes once the variant is ready to be loaded
+        """
+
+        self._variant_names.add(variant_config.get_field('name'))
+
+        future = self._executor.submit(self._create_variant, original_name,
+                                       variant_config)
+        self._pending.append(future)
+        return future
+
+    def wait(self) -> None:
+        """
+        Waits for all of the pending variants to be materialized,
+        raising any error that occurred while creating them
+        """
+
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def prune(self, keep_variant_names: Iterable[str]) -> None:
+        """
+        Removes the directories of all of the variants materialized
+        so far, except for the ones given
+
+        Parameters
+        ----------
+        keep_variant_names : iterable of str
+            The names of the variants to keep
+        """
+
+        self.wait()
+
+        for variant_name in self._variant_names - set(keep_variant_names):
+            shutil.rmtree(os.path.join(self._output_model_repository,
+                                       variant_name),
+                          ignore_errors=True)
+            logger.debug(f"Pruned model variant {variant_name}")
+
+        self._variant_names &= set(keep_variant_names)
+
+    def close(self) -> None:
+        """
+        Waits for the pending variants and stops the background thread
+        """
+
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _create_variant(self, original_name, variant_config):
+        variant_dir = os.path.join(self._output_model_repository,
+                                   variant_config.get_field('name'))
+        if os.path.exists(variant_dir):
+            return
+
+        base_dir = self._get_base_dir(original_name)
+
+        os.makedirs(variant_dir)
+        variant_config.write_config_to_file(
+            variant_dir, os.path.join(self._model_repository, original_name),
+            base_dir)
+
+    def _get_base_dir(self, original_name):
+        if original_name not in self._base_dirs:
+            base_dir = os.path.join(self._output_model_repository,
+                                    self.BASE_DIRECTORY, original_name)
+
+            if not os.path.isdir(base_dir):
+                # Link into a staging directory first, so that an interrupted
+                # run never leaves behind an incomplete base
+                staging_dir = f'{base_dir}.partial'
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                self._link_tree(
+                    os.path.join(self._model_repository, original_name),
+                    staging_dir)
+                os.rename(staging_dir, base_dir)
+
+            self._base_dirs[original_name] = base_dir
+
+        return self._base_dirs[original_name]
+
+    def _link_tree(self, src_dir, dst_dir):
+        for root, _, files in os.walk(src_dir, followlinks=True):
+            relative_root = os.path.relpath(root, src_dir)
+            os.makedirs(os.path.join(dst_dir, relative_root), exist_ok=True)
+
+            for file in files:
+                # Every variant writes its own config
+                if relative_root == '.' and file == 'config.pbtxt':
+                    continue
+
+                self._link_file(
+                    os.path.realpath(os.path.join(root, file)),
+                    os.path.normpath(os.path.join(dst_dir, relative_root,
+                                                  file)))
+
+    def _link_file(self, src_file, dst_file):
+        """
+        Links a model file by reflink, else by hardlink, else by
+        symlink. Only copies it if none of them is possible
+        """
+
+        for link in [self._reflink, os.link]:
+            try:
+                link(src_file, dst_file)
+                return
+            except OSError:
+                pass
+
+        if self._allow_absolute_symlinks:
+            os.symlink(src_file, dst_file)
+            return
+
+        if not self._copy_warning_printed:
+            logger.warning(
+                f"Unable to link the model files in {self._model_repository}"
+                f" into {self._output_model_repository}, copying them instead."
+                " Put both repositories on the same filesystem to avoid this.")
+            self._copy_warning_printed = True
+        shutil.copy2(src_file, dst_file)
+
+    def _reflink(self, src_file, dst_file):
+        try:
+            with open(src_file, 'rb') as src, open(dst_file, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            if os.path.exists(dst_file):
+                os.remove(dst_file)
+            raise
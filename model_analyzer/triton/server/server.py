@@ -44,6 +44,30 @@ def cpu_stats(self):
         Returns the CPU memory usage and CPU available memory in MB
         """
 
+    def is_running(self):
+        """
+        Returns
+        -------
+        bool
+            False if the server is known to have exited.
+            True by default, when it cannot be determined
+        """
+
+        return True
+
+    def set_host_ipc(self, host_ipc):
+        """
+        Sets whether the server shares the IPC namespace, and so the
+        shared memory, of the host from its next start. Only the
+        docker server runs in a namespace of its own
+
+        Parameters
+        ----------
+        host_ipc: bool
+            True if perf_analyzer passes tensors to
+            the server through shared memory
+        """
+
     def update_config(self, params):
         """
         Update the server's arguments
@@ -34,7 +34,15 @@ class TritonServerDocker(TritonServer):
     triton in a docker container.
     """
 
-    def __init__(self, image, config, gpus, log_path, mounts, labels, shm_size):
+    def __init__(self,
+                 image,
+                 config,
+                 gpus,
+                 log_path,
+                 mounts,
+                 labels,
+                 shm_size,
+                 ipc_mode=None):
         """
         Parameters
         ----------
@@ -53,6 +61,9 @@ def __init__(self, image, config, gpus, log_path, mounts, labels, shm_size):
             container. (Not the same as environment variables)
         shm-size: str
             The size of /dev/shm for the triton docker container.
+        ipc_mode: str
+            The IPC namespace of the triton docker container. 'host'
+            shares the shared memory of the host with the container
         """
 
         self._server_config = config
@@ -64,6 +75,8 @@ def __init__(self, image, config, gpus, log_path, mounts, labels, shm_size):
         self._labels = labels if labels else {}
         self._gpus = gpus
         self._shm_size = shm_size
+        self._ipc_mode = ipc_mode
+        self._shm_size_warning_printed = False
 
         assert self._server_config['model-repository'], \
             "Triton Server requires --model-repository argument to be set."
@@ -74,6 +87,20 @@ def __init__(self, image, config, gpus, log_path, mounts, labels, shm_size):
             logger.info(f"Pulling docker image {self._tritonserver_image}")
             self._docker_client.images.pull(self._tritonserver_image)
 
+    def set_host_ipc(self, host_ipc):
+        """
+        Shares the IPC namespace of the host with the container
+        from its next start. Docker then ignores the shm size,
+        as /dev/shm is the one of the host
+        """
+
+        self._ipc_mode = 'host' if host_ipc else None
+        if host_ipc and self._shm_size and not self._shm_size_warning_printed:
+            logger.warning(
+                f"triton_docker_shm_size of {self._shm_size} is ignored, as"
+                " the Triton container shares the shared memory of the host")
+            self._shm_size_warning_printed = True
+
     def start(self, env=None):
         """
         Starts the tritonserver docker container using docker-py
@@ -91,7 +118,8 @@ def start(self, env=None):
         # Set environment inside container.
         # Supports only strings, and value lookups/concats
         env_cmds = [
-            f"CUDA_VISIBLE_DEVICES={','.join([gpu.device_uuid() for gpu in self._gpus])}"
+            f"CUDA_VISIBLE_DEVICES={','.join([gpu.device_uuid() for gpu in self._gpus])}",
+            "CUDA_DEVICE_ORDER=PCI_BUS_ID"
         ]
         if env:
             # Set all environment variables inside the container
@@ -140,7 +168,8 @@ def start(self, env=None):
                 tty=False,
                 stdin_open=False,
                 detach=True,
-                shm_size=self._shm_size)
+                shm_size=self._shm_size,
+                ipc_mode=self._ipc_mode)
             logger.debug('Triton Server started.')
         except docker.errors.APIError as e:
             if e.explanation.find('port is already allocated') != -1:
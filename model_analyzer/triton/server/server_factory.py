@@ -14,6 +14,7 @@
 
 from .server_docker import TritonServerDocker
 from .server_local import TritonServerLocal
+from .server_simulated import TritonServerSimulated
 from .server_config import TritonServerConfig
 
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
@@ -41,7 +42,8 @@ def create_server_docker(image,
                              log_path=None,
                              mounts=None,
                              labels=None,
-                             shm_size=None):
+                             shm_size=None,
+                             ipc_mode=None):
         """
         Parameters
         ----------
@@ -61,6 +63,9 @@ def create_server_docker(image,
             container. (Not the same as environment variables)
         shm-size: str
             The size of /dev/shm for the triton docker container.
+        ipc_mode: str
+            The IPC namespace of the triton docker container. 'host'
+            shares the shared memory of the host with the container
         Returns
         -------
         TritonServerDocker
@@ -72,7 +77,8 @@ def create_server_docker(image,
                                   log_path=log_path,
                                   mounts=mounts,
                                   labels=labels,
-                                  shm_size=shm_size)
+                                  shm_size=shm_size,
+                                  ipc_mode=ipc_mode)
 
     @staticmethod
     def create_server_local(path, config, gpus, log_path=None):
@@ -99,6 +105,21 @@ def create_server_local(path, config, gpus, log_path=None):
                                  gpus=gpus,
                                  log_path=log_path)
 
+    @staticmethod
+    def create_server_simulated(config):
+        """
+        Parameters
+        ----------
+        config : TritonServerConfig
+            the config object containing arguments for this server instance
+
+        Returns
+        -------
+        TritonServerSimulated
+        """
+
+        return TritonServerSimulated(config=config)
+
     @staticmethod
     def get_server_handle(config, gpus, use_model_repository=False):
         """
@@ -131,6 +152,9 @@ def get_server_handle(config, gpus, use_model_repository=False):
         elif config.triton_launch_mode == 'c_api':
             server = TritonServerFactory._get_c_api_server_handle(
                 config, use_model_repository)
+        elif config.triton_launch_mode == 'simulated':
+            server = TritonServerFactory._get_simulated_server_handle(
+                config, use_model_repository)
         else:
             raise TritonModelAnalyzerException(
                 f"Unrecognized triton-launch-mode : {config.triton_launch_mode}"
@@ -253,6 +277,50 @@ def _get_c_api_server_handle(config, use_model_repository):
 
         return server
 
+    @staticmethod
+    def _get_simulated_server_handle(config, use_model_repository):
+        triton_config = TritonServerConfig()
+        triton_config.update_config(config.triton_server_flags)
+
+        if use_model_repository:
+            triton_config['model-repository'] = config.model_repository
+        else:
+            triton_config[
+                'model-repository'] = config.output_model_repository_path
+
+        logger.info('Using a simulated Triton Server')
+        server = TritonServerFactory.create_server_simulated(
+            config=triton_config)
+        logger.warning(
+            'Measurements in the "simulated" mode are estimated by a '
+            'performance model. They do not reflect the performance of '
+            'the model on real hardware.')
+
+        return server
+
+    @staticmethod
+    def get_dry_run_server_handle(config):
+        """
+        Creates and returns a TritonServer that never launches
+        anything, for a dry run of the profile
+
+        Parameters
+        ----------
+        config : namespace
+            Arguments parsed from the CLI
+
+        Returns
+        -------
+        TritonServerSimulated
+            Handle to a Triton Server that is never started
+        """
+
+        triton_config = TritonServerConfig()
+        triton_config.update_config(config.triton_server_flags)
+        triton_config['model-repository'] = config.output_model_repository_path
+
+        return TritonServerFactory.create_server_simulated(config=triton_config)
+
     @staticmethod
     def _validate_triton_server_path(config):
         """
@@ -76,9 +76,10 @@ def start(self, env=None):
                         # Collect the ones that need lookups to give to the shell
                         triton_env[variable] = os.path.expandvars(value)
 
-            # List GPUs to be used by tritonserver
+            # List GPUs to be used by tritonserver, numbered as in nvidia-smi
             triton_env['CUDA_VISIBLE_DEVICES'] = ','.join(
                 [gpu.device_uuid() for gpu in self._gpus])
+            triton_env['CUDA_DEVICE_ORDER'] = 'PCI_BUS_ID'
 
             if self._log_path:
                 try:
@@ -120,6 +121,18 @@ def stop(self):
                 self._log_file.close()
             logger.debug('Stopped Triton Server.')
 
+    def is_running(self):
+        """
+        Returns
+        -------
+        bool
+            False if the tritonserver process
+            was started and has exited
+        """
+
+        return self._tritonserver_process is None or \
+            self._tritonserver_process.poll() is None
+
     def cpu_stats(self):
         """
         Returns the CPU memory usage and CPU available memory in MB
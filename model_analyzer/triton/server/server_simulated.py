@@ -0,0 +1,63 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from .server import TritonServer
+from model_analyzer.constants import LOGGER_NAME
+
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class TritonServerSimulated(TritonServer):
+    """
+    Concrete Implementation of TritonServer interface that
+    stands in for tritonserver without launching anything.
+    Used with the simulated perf_analyzer
+    """
+
+    def __init__(self, config):
+        """
+        Parameters
+        ----------
+        config : TritonServerConfig
+            the config object containing arguments for this server instance
+        """
+
+        self._server_config = config
+        self._running = False
+
+    def start(self, env=None):
+        """
+        Marks the simulated server as running
+        """
+
+        self._running = True
+        logger.debug('Simulated Triton Server started.')
+
+    def stop(self):
+        """
+        Marks the simulated server as stopped
+        """
+
+        if self._running:
+            self._running = False
+            logger.debug('Stopped simulated Triton Server.')
+
+    def cpu_stats(self):
+        """
+        Returns the CPU memory usage and CPU available memory in MB
+        """
+
+        return 0.0, 0.0
@@ -29,4 +29,7 @@ def _fill_patchers(self):
         patchers.append(
             patch("builtins.open", mock_open(read_data=self.yaml_file_content)))
         patchers.append(patch("sys.argv", self.args))
-        patchers.append(patch('numba.cuda.is_available', MagicMock(True)))
+        patchers.append(
+            patch(
+                'model_analyzer.device.gpu_inventory.GPUInventory.is_available',
+                MagicMock(True)))
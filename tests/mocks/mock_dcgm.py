@@ -29,7 +29,7 @@ def _fill_patchers(self):
 
         structs_imports_path = [
             'model_analyzer.monitor.dcgm.dcgm_monitor',
-            'model_analyzer.device.gpu_device_factory'
+            'model_analyzer.device.gpu_inventory'
         ]
         for import_path in structs_imports_path:
             patchers.append(
@@ -37,7 +37,7 @@ def _fill_patchers(self):
 
         dcgm_agent_imports_path = [
             'model_analyzer.monitor.dcgm.dcgm_monitor',
-            'model_analyzer.device.gpu_device_factory'
+            'model_analyzer.device.gpu_inventory'
         ]
         for import_path in dcgm_agent_imports_path:
             patchers.append(patch(f'{import_path}.dcgm_agent', MockDCGMAgent))
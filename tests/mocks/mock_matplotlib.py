@@ -23,9 +23,14 @@ class MockMatplotlibMethods(MockBase):
     """
 
     def __init__(self):
-        plt_attrs = {'subplots': Mock(return_value=(MagicMock(), MagicMock()))}
-        self.patcher_pyplot = patch('model_analyzer.plots.simple_plot.plt',
-                                    Mock(**plt_attrs))
+        self.patcher_figure = patch('model_analyzer.plots.simple_plot.Figure',
+                                    Mock(return_value=MagicMock()))
+
+        # The figures are only mocked in this process, so the
+        # plots have to be rendered in it
+        self.patcher_cpu_count = patch(
+            'model_analyzer.reports.render_pool.os.cpu_count',
+            Mock(return_value=1))
         super().__init__()
 
     def start(self):
@@ -33,28 +38,30 @@ def start(self):
         Start mock
         """
 
-        self.pyplot_mock = self.patcher_pyplot.start()
+        self.figure_mock = self.patcher_figure.start()
+        self.patcher_cpu_count.start()
 
     def _fill_patchers(self):
         """
         Add patchers to list
         """
 
-        self._patchers.append(self.patcher_pyplot)
+        self._patchers.append(self.patcher_figure)
+        self._patchers.append(self.patcher_cpu_count)
 
     def assert_called_subplots(self):
         """
-        Checks for a call to subplots
+        Checks for a call to figure.subplots
         """
 
-        self.pyplot_mock.subplots.assert_called()
+        self.figure_mock.return_value.subplots.assert_called()
 
     def assert_called_plot_with_args(self, x_data, y_data, marker, label):
         """
         Checks for call to axes.plot
         """
 
-        self.pyplot_mock.subplots.return_value[1].plot.assert_called_with(
+        self.figure_mock.return_value.subplots.return_value.plot.assert_called_with(
             x_data, y_data, marker=marker, label=label)
 
     def assert_called_save_with_args(self, filepath):
@@ -62,5 +69,4 @@ def assert_called_save_with_args(self, filepath):
         Checks for call to figure.savefig
         """
 
-        self.pyplot_mock.subplots.return_value[0].savefig.assert_called_with(
-            filepath)
+        self.figure_mock.return_value.savefig.assert_called_with(filepath)
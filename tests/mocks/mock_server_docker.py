@@ -95,7 +95,8 @@ def assert_server_process_start_called_with(self,
                                                 metrics_port=8002,
                                                 mounts=None,
                                                 labels=None,
-                                                shm_size=None):
+                                                shm_size=None,
+                                                ipc_mode=None):
         """
         Asserts that a triton container was created using the
         supplied arguments
@@ -109,7 +110,8 @@ def assert_server_process_start_called_with(self,
         self._assert_docker_initialized()
 
         env_cmds = [
-            f"CUDA_VISIBLE_DEVICES={','.join([gpu.device_uuid() for gpu in gpus])}"
+            f"CUDA_VISIBLE_DEVICES={','.join([gpu.device_uuid() for gpu in gpus])}",
+            "CUDA_DEVICE_ORDER=PCI_BUS_ID"
         ]
 
         mock_volumes = {
@@ -136,7 +138,8 @@ def assert_server_process_start_called_with(self,
             tty=False,
             stdin_open=False,
             detach=True,
-            shm_size=shm_size)
+            shm_size=shm_size,
+            ipc_mode=ipc_mode)
 
     def raise_exception_on_container_run(self):
         """
@@ -78,6 +78,7 @@ def assert_server_process_start_called_with(self, cmd, gpus):
         env = os.environ.copy()
         env["CUDA_VISIBLE_DEVICES"] = ','.join(
             [gpu.device_uuid() for gpu in gpus])
+        env["CUDA_DEVICE_ORDER"] = "PCI_BUS_ID"
 
         self.popen_mock.assert_called_once_with(cmd,
                                                 stdout=self.pipe_mock,
@@ -60,13 +60,19 @@ def get_test_options():
         # Options format:
         #   (bool, MA step, long_option)
         OptionStruct("bool", "profile","--override-output-model-repository"),
+        OptionStruct("bool", "profile","--prune-output-model-repository"),
         OptionStruct("bool", "profile","--collect-cpu-metrics"),
         OptionStruct("bool", "profile","--perf-output"),
+        OptionStruct("bool", "profile","--collect-latency-histograms"),
         OptionStruct("bool", "profile","--run-config-search-disable"),
         OptionStruct("bool", "profile","--run-config-profile-models-concurrently-enable"),
         OptionStruct("bool", "profile","--reload-model-disable"),
         OptionStruct("bool", "profile","--early-exit-enable"),
+        OptionStruct("bool", "profile","--successive-halving-enable"),
+        OptionStruct("bool", "profile","--concurrency-binary-search-enable"),
+        OptionStruct("bool", "profile","--request-rate-search-enable"),
         OptionStruct("bool", "profile","--skip-summary-reports"),
+        OptionStruct("bool", "profile","--dry-run"),
         #Int/Float options
         # Options format:
         #   (int/float, MA step, long_option, short_option, test_value, expected_default_value)
@@ -79,6 +85,8 @@ def get_test_options():
         OptionStruct("int", "profile", "--perf-analyzer-max-auto-adjusts", None, "100", "10"),
         OptionStruct("int", "profile", "--run-config-search-min-concurrency", None, "2", "1"),
         OptionStruct("int", "profile", "--run-config-search-max-concurrency", None, "100", "1024"),
+        OptionStruct("int", "profile", "--run-config-search-min-request-rate", None, "32", "16"),
+        OptionStruct("int", "profile", "--run-config-search-max-request-rate", None, "1000", "8192"),
         OptionStruct("int", "profile", "--run-config-search-min-model-batch-size", None, "100", "1"),
         OptionStruct("int", "profile", "--run-config-search-max-model-batch-size", None, "100", "128"),
         OptionStruct("int", "profile", "--run-config-search-min-instance-count", None, "2", "1"),
@@ -87,6 +95,16 @@ def get_test_options():
         OptionStruct("float", "profile", "--perf-analyzer-cpu-util", None, "10.0", str(psutil.cpu_count() * 80.0)),
         OptionStruct("int", "profile", "--num-configs-per-model", None, "10", "3"),
         OptionStruct("int", "profile", "--num-top-model-configs", None, "10", "0"),
+        OptionStruct("int", "profile", "--num-report-workers", None, "4", "0"),
+        OptionStruct("int", "profile", "--simulation-gpu-count", None, "4", "1"),
+        OptionStruct("int", "profile", "--successive-halving-screening-concurrencies", None, "3", "2"),
+        OptionStruct("int", "profile", "--successive-halving-screening-window", None, "500", "1000"),
+        OptionStruct("float", "profile", "--successive-halving-keep-fraction", None, "0.25", "0.5"),
+        OptionStruct("int", "profile", "--max-measurement-repeats", None, "5", "1"),
+        OptionStruct("float", "profile", "--measurement-repeat-tolerance", None, "0.1", "0.05"),
+        OptionStruct("float", "profile", "--gpu-price-per-hour", None, "2.5", "0"),
+        OptionStruct("float", "profile", "--simulation-noise", None, "0.1", "0.0"),
+        OptionStruct("int", "profile", "--simulation-seed", None, "7", "0"),
         OptionStruct("int", "profile", "--latency-budget", None, "200", None),
         OptionStruct("int", "profile", "--min-throughput", None, "300", None),
 
@@ -102,6 +120,8 @@ def get_test_options():
         OptionStruct("string", "profile", "--checkpoint-directory", "-s", "./test_dir", os.path.join(os.getcwd(), "checkpoints"), None),
         OptionStruct("string", "profile", "--output-model-repository-path", None, "./test_dir", os.path.join(os.getcwd(), "output_model_repository"), None),
         OptionStruct("string", "profile", "--client-protocol", None, ["http", "grpc"], "grpc", "SHOULD_FAIL"),
+        OptionStruct("string", "profile", "--load-generator", None, ["perf_analyzer", "python"], "perf_analyzer", "SHOULD_FAIL"),
+        OptionStruct("string", "profile", "--perf-analyzer-shared-memory", None, ["auto", "none", "system", "cuda"], "auto", "SHOULD_FAIL"),
         OptionStruct("string", "profile", "--perf-analyzer-path", None, ".", "perf_analyzer", None),
         OptionStruct("string", "profile", "--perf-output-path", None, ".", None, None),
         OptionStruct("string", "profile", "--triton-docker-image", None, "test_image", DEFAULT_TRITON_DOCKER_IMAGE, None),
@@ -110,8 +130,10 @@ def get_test_options():
         OptionStruct("string", "profile", "--triton-metrics-url", None, "localhost:4002", "http://localhost:8002/metrics", None),
         OptionStruct("string", "profile", "--triton-server-path", None, "test_path", "tritonserver", None),
         OptionStruct("string", "profile", "--triton-output-path", None, "test_path", None, None),
-        OptionStruct("string", "profile", "--triton-launch-mode", None, ["local", "docker", "remote","c_api"], "local", "SHOULD_FAIL"),
+        OptionStruct("string", "profile", "--triton-launch-mode", None, ["local", "docker", "remote","c_api", "simulated"], "local", "SHOULD_FAIL"),
         OptionStruct("string", "profile", "--triton-install-path", None, "test_path", "/opt/tritonserver", None),
+        OptionStruct("string", "profile", "--simulation-checkpoint", None, "./test_dir/0.ckpt", None, None),
+        OptionStruct("string", "profile", "--request-trace", None, "./test_dir/trace.jsonl", None, None),
         OptionStruct("string", "profile", "--checkpoint-directory", "-s", "./test_dir", os.path.join(os.getcwd(), "checkpoints"), None),
         OptionStruct("string", "profile", "--export-path", "-e", "./test_dir", os.getcwd(), None),
         OptionStruct("string", "profile", "--filename-model-inference", None, "foo", "metrics-model-inference.csv", None),
@@ -121,6 +143,7 @@ def get_test_options():
 
         OptionStruct("string", "report", "--checkpoint-directory", "-s", "./test_dir", os.path.join(os.getcwd(), "checkpoints"), None),
         OptionStruct("string", "report", "--export-path", "-e", "./test_dir", os.getcwd(), None),
+        OptionStruct("int", "report", "--num-report-workers", None, "4", "0"),
         OptionStruct("string", "report", "--config-file", "-f", "baz", None, None),
         OptionStruct("string", "profile", "--triton-docker-shm-size", None, "1G", None, extra_commands=["--triton-launch-mode", "docker"]),
         OptionStruct("string", "profile","--run-config-search-mode", None, ["quick", "brute"], "brute", "SHOULD_FAIL"),
@@ -133,6 +156,7 @@ def get_test_options():
         #   expected_default_value
         OptionStruct("intlist", "profile", "--batch-sizes", "-b", "2, 4, 6", "1"),
         OptionStruct("intlist", "profile", "--concurrency", "-c", "1, 2, 3", None),
+        OptionStruct("intlist", "profile", "--request-rate", None, "10, 20, 30", None),
         OptionStruct("stringlist", "profile", "--triton-docker-mounts", None, "a:b:c, d:e:f", None, extra_commands=["--triton-launch-mode", "docker"]),
         OptionStruct("stringlist", "profile", "--gpus", None, "a, b, c", "all"),
         OptionStruct("stringlist", "profile", "--inference-output-fields", None, "a, b, c",
@@ -141,6 +165,9 @@ def get_test_options():
             "model_name,gpu_uuid,batch_size,concurrency,model_config_path,instance_group,satisfies_constraints,gpu_used_memory,gpu_utilization,gpu_power_usage"),
         OptionStruct("stringlist", "profile", "--server-output-fields", None, "a, b, c",
             "model_name,gpu_uuid,gpu_used_memory,gpu_utilization,gpu_power_usage"),
+        OptionStruct("stringlist", "profile", "--plot-data-formats", None, "csv, json", None),
+        OptionStruct("stringlist", "profile", "--measurement-export-formats", None, "csv, parquet", None),
+        OptionStruct("stringlist", "report", "--plot-data-formats", None, "csv, json", None),
 
         # No OP Options:
         # Option format:
@@ -15,7 +15,6 @@
 import unittest
 import re
 from .mocks.mock_config import MockConfig
-from .mocks.mock_numba import MockNumba
 from .mocks.mock_os import MockOSMethods
 
 from typing import Dict, List, Optional
@@ -46,6 +45,8 @@
     CONFIG_PARSER_FAILURE
 
 from model_analyzer.result.model_constraints import ModelConstraints
+from model_analyzer.config.generate.perf_analyzer_config_generator \
+    import PerfAnalyzerConfigGenerator
 
 from copy import deepcopy
 
@@ -55,12 +56,8 @@
 class TestConfig(trc.TestResultCollector):
 
     def _evaluate_config(self, args, yaml_content, subcommand='profile'):
-        mock_numba = MockNumba(
-            mock_paths=['model_analyzer.config.input.config_command_profile'])
-
         mock_config = MockConfig(args, yaml_content)
         mock_config.start()
-        mock_numba.start()
 
         if subcommand == 'report':
             config = ConfigCommandReport()
@@ -72,7 +69,6 @@ def _evaluate_config(self, args, yaml_content, subcommand='profile'):
                            help="Test subcommand help")
         cli.parse()
         mock_config.stop()
-        mock_numba.stop()
         return config
 
     def _assert_error_on_evaluate_config(self,
@@ -1899,6 +1895,39 @@ def test_model_weightings_profile(self):
 
         self._evaluate_config(args, yaml_content, subcommand='profile')
 
+    def test_request_rate_with_search_disabled(self):
+        """
+        Test that disabling the search does not default the concurrency
+        when request rates are profiled instead
+        """
+
+        args = [
+            'model-analyzer', 'profile', '--model-repository', 'cli-repository',
+            '--profile-models', 'add_sub', '--run-config-search-disable'
+        ]
+        yaml_content = ''
+
+        config = self._evaluate_config(args, yaml_content)
+        self.assertEqual(config.concurrency, [1])
+
+        config = self._evaluate_config(args + ['--request-rate', '100'],
+                                       yaml_content)
+        model_parameters = config.profile_models[0].parameters()
+        self.assertEqual(model_parameters['concurrency'], [])
+        self.assertEqual(model_parameters['request_rate'], [100])
+
+        config = self._evaluate_config(args + ['--request-rate-search-enable'],
+                                       yaml_content)
+        model_parameters = config.profile_models[0].parameters()
+        self.assertEqual(model_parameters['concurrency'], [])
+        self.assertTrue(
+            PerfAnalyzerConfigGenerator.is_request_rate_enabled(
+                config, model_parameters))
+        self.assertEqual(
+            PerfAnalyzerConfigGenerator.create_request_rate_list(
+                config, model_parameters),
+            [config.run_config_search_min_request_rate])
+
     def _test_quick_search_with_rcs(self,
                                     args: Namespace,
                                     yaml_content: Optional[Dict[str, List]],
@@ -394,6 +394,37 @@ def test_single_model_min_failure_percentage(self):
             constraint_manager.constraint_failure_percentage(rcm),
             0)
 
+    def test_saturated_request_rate(self):
+        """
+        Test that a request rate the model cannot keep up with
+        fails the constraints, even when there are none
+        """
+        config = self._create_single_model_no_constraints()
+        constraint_manager = ConstraintManager(config)
+
+        # 100 requests/sec of batch size 2 offer 200 inferences/sec
+        pa_params = [{'batch-size': 2, 'request-rate-range': 100}]
+        rcm = self._construct_rcm({"perf_throughput": 190},
+                                  constraint_manager,
+                                  model_specific_pa_params=pa_params)
+        self.assertTrue(constraint_manager.satisfies_constraints(rcm))
+        self.assertEqual(
+            constraint_manager.constraint_failure_percentage(rcm), 0)
+
+        rcm = self._construct_rcm({"perf_throughput": 150},
+                                  constraint_manager,
+                                  model_specific_pa_params=pa_params)
+        self.assertFalse(constraint_manager.satisfies_constraints(rcm))
+        self.assertAlmostEqual(
+            constraint_manager.constraint_failure_percentage(rcm), 25)
+
+        # A concurrency is never saturated
+        pa_params = [{'batch-size': 2, 'concurrency-range': 100}]
+        rcm = self._construct_rcm({"perf_throughput": 150},
+                                  constraint_manager,
+                                  model_specific_pa_params=pa_params)
+        self.assertTrue(constraint_manager.satisfies_constraints(rcm))
+
     def test_multi_model_failure_percentage(self):
         """
         Test that constraint_failure_percentage works for multi-model
@@ -638,12 +669,15 @@ def _create_multi_model_with_different_global_constrants(self):
 
         return config
 
-    def _construct_rcm(self, non_gpu_metric_values, constraint_manager):
+    def _construct_rcm(self,
+                       non_gpu_metric_values,
+                       constraint_manager,
+                       model_specific_pa_params=MagicMock()):
         rcm = construct_run_config_measurement(
             model_name=MagicMock(),
             model_config_names=["model_A_config_name_0"],
             constraint_manager=constraint_manager,
-            model_specific_pa_params=MagicMock(),
+            model_specific_pa_params=model_specific_pa_params,
             gpu_metric_values=MagicMock(),
             non_gpu_metric_values=[non_gpu_metric_values])
 
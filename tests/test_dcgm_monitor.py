@@ -26,7 +26,6 @@
 
 from .common import test_result_collector as trc
 from .mocks.mock_dcgm import MockDCGM
-from .mocks.mock_numba import MockNumba
 from .mocks.mock_dcgm_agent import TEST_PCI_BUS_ID, TEST_UUID
 from .mocks.mock_dcgm_field_group_watcher import TEST_RECORD_VALUE
 
@@ -40,11 +39,7 @@ class TestDCGMMonitor(trc.TestResultCollector):
 
     def setUp(self):
         self.mock_dcgm = MockDCGM()
-        self.mock_numba = MockNumba(mock_paths=[
-            'model_analyzer.device.gpu_device_factory',
-        ])
         self.mock_dcgm.start()
-        self.mock_numba.start()
 
         self._gpus = [
             GPUDevice(TEST_DEVICE_NAME, TEST_DEVICE_ID, TEST_PCI_BUS_ID,
@@ -147,7 +142,6 @@ def test_immediate_start_stop(self):
 
     def tearDown(self):
         self.mock_dcgm.stop()
-        self.mock_numba.stop()
 
 
 if __name__ == '__main__':
@@ -50,6 +50,9 @@ def _init_managers(self,
         args = ["model-analyzer", subcommand, "-f", "path-to-config-file"]
         args.extend(["--checkpoint-directory", f"{ROOT_DIR}/ensemble-ckpt"])
 
+        # The mocked constraint manager can't be sent to render workers
+        args.extend(["--num-report-workers", "1"])
+
         if subcommand == 'profile':
             args.extend(["--profile-models", models])
             args.extend(["--model-repository", "/tmp"])
@@ -0,0 +1,175 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from unittest.mock import patch, MagicMock
+
+from model_analyzer.device.gpu_device_factory import GPUDeviceFactory
+from model_analyzer.device.gpu_inventory import GPUInventory, GPUDeviceBackend, \
+    TritonMetricsDeviceBackend
+from model_analyzer.constants import LOGGER_NAME, REMOTE_GPU_NAME
+
+from .common import test_result_collector as trc
+
+TEST_DEVICES = [{
+    'device_id': 0,
+    'name': 'TEST_GPU_A',
+    'pci_bus_id': '00000000:B1:00.0',
+    'uuid': 'GPU-aaaaaaaa-0000',
+    'total_memory': 16 * 2**30
+}, {
+    'device_id': 1,
+    'name': 'TEST_GPU_B',
+    'pci_bus_id': '00000000:3B:00.0',
+    'uuid': 'GPU-bbbbbbbb-1111',
+    'total_memory': 32 * 2**30
+}]
+
+TEST_METRICS_PAGE = '''
+# HELP nv_gpu_memory_total_bytes GPU total memory, in bytes
+# TYPE nv_gpu_memory_total_bytes gauge
+nv_gpu_memory_total_bytes{gpu_uuid="GPU-cccccccc-2222"} 8000000000
+'''
+
+
+class MockDeviceBackend(GPUDeviceBackend):
+
+    def __init__(self, devices):
+        self.devices = devices
+        self.num_reads = 0
+
+    def get_devices(self):
+        self.num_reads += 1
+        return self.devices
+
+
+class TestGPUInventory(trc.TestResultCollector):
+
+    def setUp(self):
+        self.backend = MockDeviceBackend(TEST_DEVICES)
+        GPUInventory.reset()
+
+    def tearDown(self):
+        GPUInventory.reset()
+        patch.stopall()
+
+    def test_read_once(self):
+        inventory = GPUInventory.set_backend(self.backend)
+
+        self.assertIs(GPUInventory.get(), inventory)
+        self.assertTrue(GPUInventory.get().is_available())
+        self.assertEqual(
+            GPUInventory.get().get_device('GPU-bbbbbbbb-1111')['total_memory'],
+            32 * 2**30)
+        self.assertIsNone(GPUInventory.get().get_device('GPU-missing'))
+        self.assertEqual(self.backend.num_reads, 1)
+
+    def test_no_gpus(self):
+        inventory = GPUInventory(MockDeviceBackend([]))
+
+        self.assertFalse(inventory.is_available())
+        self.assertEqual(inventory.get_cuda_visible_devices(), [])
+
+    def test_cuda_visible_devices(self):
+        inventory = GPUInventory(self.backend)
+
+        # Ordered by PCI bus id
+        with patch.dict(os.environ, clear=True):
+            self.assertEqual(self._uuids(inventory.get_cuda_visible_devices()),
+                             ['GPU-bbbbbbbb-1111', 'GPU-aaaaaaaa-0000'])
+
+        with patch.dict(os.environ, {'CUDA_VISIBLE_DEVICES': '1'}):
+            self.assertEqual(self._uuids(inventory.get_cuda_visible_devices()),
+                             ['GPU-aaaaaaaa-0000'])
+
+        # UUID prefixes, with or without the GPU- prefix
+        with patch.dict(os.environ,
+                        {'CUDA_VISIBLE_DEVICES': 'aaaaaaaa,GPU-bbbbbbbb'}):
+            self.assertEqual(self._uuids(inventory.get_cuda_visible_devices()),
+                             ['GPU-aaaaaaaa-0000', 'GPU-bbbbbbbb-1111'])
+
+        # The list ends at the first invalid entry
+        with patch.dict(os.environ, {'CUDA_VISIBLE_DEVICES': '0,7,1'}):
+            self.assertEqual(self._uuids(inventory.get_cuda_visible_devices()),
+                             ['GPU-bbbbbbbb-1111'])
+
+        with patch.dict(os.environ, {'CUDA_VISIBLE_DEVICES': ''}):
+            self.assertEqual(inventory.get_cuda_visible_devices(), [])
+
+    def test_cuda_device_order(self):
+        inventory = GPUInventory(self.backend)
+
+        # Indices are only known to match CUDA's in PCI bus order
+        with patch.dict(os.environ, {'CUDA_VISIBLE_DEVICES': '1'},
+                        clear=True):
+            with self.assertLogs(LOGGER_NAME, level='WARNING'):
+                inventory.get_cuda_visible_devices()
+
+        inventory = GPUInventory(self.backend)
+        with patch.dict(os.environ, {
+                'CUDA_VISIBLE_DEVICES': '1',
+                'CUDA_DEVICE_ORDER': 'PCI_BUS_ID'
+        }):
+            with self.assertNoLogs(LOGGER_NAME, level='WARNING'):
+                inventory.get_cuda_visible_devices()
+
+        # UUIDs do not depend on the order
+        with patch.dict(os.environ, {'CUDA_VISIBLE_DEVICES': 'aaaaaaaa'},
+                        clear=True):
+            with self.assertNoLogs(LOGGER_NAME, level='WARNING'):
+                inventory.get_cuda_visible_devices()
+
+    def test_gpu_device_factory(self):
+        factory = GPUDeviceFactory(GPUInventory(self.backend))
+
+        with patch.dict(os.environ, {'CUDA_VISIBLE_DEVICES': '1'}):
+            self.assertEqual(
+                [gpu.device_uuid() for gpu in factory.get_cuda_visible_gpus()],
+                ['GPU-aaaaaaaa-0000'])
+
+            gpus = factory.verify_requested_gpus(['all'])
+            self.assertEqual([gpu.device_name() for gpu in gpus],
+                             ['TEST_GPU_A'])
+
+            gpus = factory.verify_requested_gpus(['0'])
+            self.assertEqual([gpu.device_id() for gpu in gpus], [0])
+
+    def test_triton_metrics_backend(self):
+        response = MagicMock()
+        response.content = TEST_METRICS_PAGE.encode('ascii')
+
+        with patch('model_analyzer.device.gpu_inventory.requests.get',
+                   MagicMock(return_value=response)):
+            inventory = GPUInventory(
+                TritonMetricsDeviceBackend('localhost:8002/metrics'))
+
+        self.assertEqual(inventory.get_devices(), [{
+            'device_id': 0,
+            'name': REMOTE_GPU_NAME,
+            'pci_bus_id': '',
+            'uuid': 'GPU-cccccccc-2222',
+            'total_memory': 8000000000
+        }])
+
+        # Remote GPUs are not subject to the local CUDA_VISIBLE_DEVICES
+        with patch.dict(os.environ, {'CUDA_VISIBLE_DEVICES': ''}):
+            self.assertEqual(len(inventory.get_cuda_visible_devices()), 1)
+
+    def _uuids(self, devices):
+        return [device['uuid'] for device in devices]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from model_analyzer.result.latency_histogram import LatencyHistogram
+
+from .common import test_result_collector as trc
+
+
+class TestLatencyHistogram(trc.TestResultCollector):
+
+    def test_percentiles(self):
+        histogram = self._create_histogram(range(1, 10001))
+
+        self.assertEqual(histogram.count(), 10000)
+        for percentile in [1, 50, 90, 99, 99.9, 99.99, 100]:
+            expected = percentile * 100
+            value = histogram.percentile(percentile)
+
+            # Never under-reported, and within the precision
+            self.assertGreaterEqual(value, expected)
+            self.assertLessEqual(value,
+                                 expected * (1 + LatencyHistogram.PRECISION))
+
+    def test_small_latencies(self):
+        histogram = self._create_histogram([0, 0.5, 1])
+        self.assertEqual(histogram.percentile(100), 1)
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.count(), 0)
+        self.assertEqual(histogram.percentile(99), 0)
+
+    def test_merge(self):
+        histogram = self._create_histogram(range(1, 501))
+        histogram.merge(self._create_histogram(range(501, 1001)))
+
+        expected = self._create_histogram(range(1, 1001))
+        self.assertEqual(histogram.count(), 1000)
+        self.assertEqual(histogram.to_dict(), expected.to_dict())
+
+    def test_serialization(self):
+        histogram = self._create_histogram([100, 200, 200, 5000])
+
+        # Checkpoints are written as JSON
+        histogram_dict = json.loads(json.dumps(histogram.to_dict()))
+        deserialized_histogram = LatencyHistogram.from_dict(histogram_dict)
+
+        self.assertEqual(deserialized_histogram.count(), 4)
+        self.assertEqual(deserialized_histogram.distribution(),
+                         histogram.distribution())
+
+    def _create_histogram(self, latencies):
+        histogram = LatencyHistogram()
+        for latency in latencies:
+            histogram.record(latency)
+
+        return histogram
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
+from model_analyzer.result.constraint_manager import ConstraintManager
+from model_analyzer.result.measurement_exporter import MeasurementExporter
+
+from .common import test_result_collector as trc
+from .common.test_utils import load_multi_model_result_manager
+
+
+class TestMeasurementExporter(trc.TestResultCollector):
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._result_manager, config = load_multi_model_result_manager()
+        self._constraint_manager = ConstraintManager(config)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+        patch.stopall()
+
+    def test_export_csv(self):
+        self._create_exporter(['csv']).export()
+
+        results_dir = os.path.join(self._tmp_dir.name, 'results')
+        self.assertEqual(sorted(os.listdir(results_dir)), [
+            'measurements-model-gpu.csv', 'measurements-model-inference.csv'
+        ])
+
+        with open(os.path.join(results_dir,
+                               'measurements-model-inference.csv')) as f:
+            inference_rows = list(csv.DictReader(f))
+        with open(os.path.join(results_dir, 'measurements-model-gpu.csv')) as f:
+            gpu_rows = list(csv.DictReader(f))
+
+        # One row per model of every measurement, and one per GPU
+        num_measurements = len(self._result_manager.get_results().
+                               get_list_of_run_config_measurements())
+        self.assertEqual(len(inference_rows), 2 * num_measurements)
+        self.assertEqual(len(gpu_rows), num_measurements)
+
+        row = inference_rows[0]
+        self.assertEqual(row['model_name'], 'resnet50_libtorch')
+        self.assertEqual(row['model_config_name'],
+                         'resnet50_libtorch_config_default')
+        self.assertEqual(row['batch_size'], '1')
+        self.assertEqual(row['concurrency'], '1')
+        self.assertEqual(row['cpu_only'], 'false')
+        self.assertIn(row['satisfies_constraints'], ['true', 'false'])
+        self.assertGreater(float(row['perf_throughput']), 0)
+
+        # Metrics that were not collected are empty
+        self.assertEqual(row['cpu_used_ram'], '')
+
+        # The tables are joined on the measurement key
+        self.assertEqual(gpu_rows[0]['measurement_key'],
+                         row['measurement_key'])
+        self.assertGreater(float(gpu_rows[0]['gpu_used_memory']), 0)
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'),
+                         'pyarrow is not installed')
+    def test_export_parquet_and_arrow(self):
+        import pyarrow
+        import pyarrow.parquet
+
+        self._create_exporter(['parquet', 'arrow']).export()
+
+        results_dir = os.path.join(self._tmp_dir.name, 'results')
+        parquet_table = pyarrow.parquet.read_table(
+            os.path.join(results_dir, 'measurements-model-inference.parquet'))
+        with pyarrow.ipc.open_file(
+                os.path.join(results_dir,
+                             'measurements-model-inference.arrow')) as reader:
+            arrow_table = reader.read_all()
+
+        self.assertTrue(parquet_table.equals(arrow_table))
+        self.assertEqual(parquet_table.schema.field('batch_size').type,
+                         pyarrow.int64())
+        self.assertEqual(
+            parquet_table.schema.field('perf_throughput').type,
+            pyarrow.float64())
+
+    def test_missing_pyarrow(self):
+        patch.dict('sys.modules', {'pyarrow': None}).start()
+
+        # Fails when the exporter is created, before any profiling
+        with self.assertRaises(TritonModelAnalyzerException):
+            self._create_exporter(['csv', 'parquet'])
+
+        self._create_exporter(['csv'])
+
+    def _create_exporter(self, export_formats):
+        config = MagicMock(export_path=self._tmp_dir.name,
+                           measurement_export_formats=export_formats)
+        return MeasurementExporter(config, self._result_manager,
+                                   self._constraint_manager)
+
+
+if __name__ == '__main__':
+    unittest.main()
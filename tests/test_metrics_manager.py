@@ -0,0 +1,275 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from model_analyzer.config.run.model_run_config import ModelRunConfig
+from model_analyzer.config.run.run_config import RunConfig
+from model_analyzer.triton.model.model_config import ModelConfig
+from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.record.metrics_manager import MetricsManager
+from model_analyzer.record.types.gpu_energy import GPUEnergy
+from model_analyzer.record.types.gpu_power_usage import GPUPowerUsage
+from model_analyzer.record.types.gpu_utilization import GPUUtilization
+from model_analyzer.record.types.perf_inferences_per_dollar import PerfInferencesPerDollar
+from model_analyzer.record.types.perf_inferences_per_joule import PerfInferencesPerJoule
+from model_analyzer.record.types.perf_throughput import PerfThroughput
+
+from .common import test_result_collector as trc
+
+
+class TestMetricsManager(trc.TestResultCollector):
+
+    def setUp(self):
+        self._metrics_manager = MetricsManager(MagicMock(), MagicMock(),
+                                               MagicMock(), [], MagicMock(),
+                                               MagicMock())
+
+    def tearDown(self):
+        patch.stopall()
+
+    def test_reuse_stable_request_count(self):
+        """
+        Test that the request count perf_analyzer was adjusted to is
+        reused by the next measurements of the same model, in count
+        windows mode only
+        """
+        first_run_config = self._create_run_config(
+            ['test_model_config_0', 'time_windows_model'])
+
+        # perf_analyzer needed a larger request count to be stable
+        first_run_config.model_run_configs()[0].perf_config(
+        )['measurement-request-count'] = 150
+        first_run_config.model_run_configs()[1].perf_config(
+        )['measurement-request-count'] = 150
+        first_run_config.model_run_configs()[1].perf_config(
+        )['measurement-mode'] = 'time_windows'
+        self._metrics_manager._save_stable_request_counts(first_run_config)
+
+        run_config = self._create_run_config(
+            ['test_model_config_0', 'time_windows_model', 'test_model_config_1'])
+        run_config.model_run_configs()[1].perf_config(
+        )['measurement-mode'] = 'time_windows'
+        representation = run_config.representation()
+        self._metrics_manager._reuse_stable_request_counts(run_config)
+
+        request_counts = [
+            model_run_config.perf_config()['measurement-request-count']
+            for model_run_config in run_config.model_run_configs()
+        ]
+        self.assertEqual(request_counts, [150, None, None])
+
+        # Checkpointed measurements of the run config still match
+        self.assertEqual(run_config.representation(), representation)
+
+    def test_larger_request_count_is_kept(self):
+        """
+        Test that a request count larger than the stable one is kept
+        """
+        run_config = self._create_run_config(['test_model_config_0'])
+        run_config.model_run_configs()[0].perf_config(
+        )['measurement-request-count'] = 100
+        self._metrics_manager._save_stable_request_counts(run_config)
+
+        run_config = self._create_run_config(['test_model_config_0'])
+        run_config.model_run_configs()[0].perf_config(
+        )['measurement-request-count'] = 200
+        self._metrics_manager._reuse_stable_request_counts(run_config)
+
+        self.assertEqual(
+            run_config.model_run_configs()[0].perf_config()
+            ['measurement-request-count'], 200)
+
+    def test_screening_measurement_is_not_stored(self):
+        """
+        Test that screening measurements are only returned,
+        and never sent to the result manager
+        """
+        run_config = self._create_run_config(['test_model_config_0'])
+        run_config.set_screening(True)
+
+        measurement = MagicMock()
+        patch.object(self._metrics_manager,
+                     '_measure_models',
+                     return_value=measurement).start()
+        patch.object(self._metrics_manager, '_print_run_config_info').start()
+
+        self.assertIs(self._metrics_manager.profile_models(run_config),
+                      measurement)
+        self._metrics_manager._result_manager.add_run_config_measurement.assert_not_called(
+        )
+
+    def test_dry_run_throughput_grows_for_traces(self):
+        """
+        Test that the stand-in throughput of a dry run keeps growing
+        when a trace is replayed, which has no number to grow with
+        """
+        self._metrics_manager._config.dry_run = True
+
+        throughputs = []
+        for _ in range(3):
+            perf_config = PerfAnalyzerConfig()
+            perf_config['model-name'] = 'test_model_config_0'
+            perf_config['request-intervals'] = 'trace.txt'
+            run_config = RunConfig({})
+            run_config.add_model_run_config(
+                ModelRunConfig(
+                    'test_model_config_0',
+                    ModelConfig.create_from_dictionary(
+                        {'name': 'test_model_config_0'}), perf_config))
+
+            measurement = self._metrics_manager.execute_run_config(run_config)
+            throughputs.append(
+                measurement.get_non_gpu_metric_value('perf_throughput'))
+
+        self.assertEqual(throughputs, sorted(set(throughputs)))
+
+    def test_server_phase_times(self):
+        """
+        Test that the server is waited on once per start, however many
+        variants are loaded, and that the phase times are checkpointed
+        """
+        self._metrics_manager._config.triton_launch_mode = 'local'
+        client = self._metrics_manager._client
+        client.load_model.return_value = 0
+        client.wait_for_model_ready.return_value = 0
+
+        run_config = self._create_run_config(
+            ['test_model_config_0', 'test_model_config_1'])
+        self.assertTrue(
+            self._metrics_manager._load_model_variants(run_config))
+        client.wait_for_server_ready.assert_called_once()
+        self.assertEqual(client.load_model.call_count, 2)
+
+        self._metrics_manager._server_start_count = 1
+        self._metrics_manager.finalize()
+
+        state_manager = self._metrics_manager._state_manager
+        name, server_phase_times = state_manager.set_state_variable.call_args[
+            0]
+        self.assertEqual(name, 'MetricsManager.server_phase_times')
+        self.assertEqual(server_phase_times['starts'], 1)
+        self.assertEqual(sorted(server_phase_times),
+                         ['model load', 'ready', 'starts'])
+
+    def test_gpu_energy(self):
+        """
+        Test that the energy per inference of each GPU is its average
+        power over the time-stamped power samples per inference
+        """
+
+        # 100W for 1s, then ramping up to 200W over 2s
+        gpu_records = [
+            GPUPowerUsage(value=100, device_uuid='GPU-0', timestamp=0),
+            GPUPowerUsage(value=100, device_uuid='GPU-0', timestamp=1000000000),
+            GPUPowerUsage(value=200, device_uuid='GPU-0', timestamp=3000000000),
+            GPUUtilization(value=50, device_uuid='GPU-0', timestamp=0),
+            GPUPowerUsage(value=50, device_uuid='GPU-1', timestamp=2000000000),
+            GPUPowerUsage(value=50, device_uuid='GPU-1', timestamp=0),
+            # A single sample has no duration
+            GPUPowerUsage(value=50, device_uuid='GPU-2', timestamp=0)
+        ]
+        gpu_metrics = {'GPU-0': [], 'GPU-1': [], 'GPU-2': []}
+        self._metrics_manager._add_gpu_energy_records(gpu_metrics,
+                                                      gpu_records,
+                                                      throughput=50)
+
+        # 400J over 3s, and 100J over 2s, at 50 infer/sec
+        self.assertEqual(len(gpu_metrics['GPU-0']), 1)
+        self.assertIsInstance(gpu_metrics['GPU-0'][0], GPUEnergy)
+        self.assertAlmostEqual(gpu_metrics['GPU-0'][0].value(), 400 / 3 / 50)
+        self.assertAlmostEqual(gpu_metrics['GPU-1'][0].value(), 50 / 50)
+        self.assertEqual(gpu_metrics['GPU-2'], [])
+
+        # Without inferences, there is no energy per inference
+        gpu_metrics = {'GPU-0': []}
+        self._metrics_manager._add_gpu_energy_records(gpu_metrics,
+                                                      gpu_records,
+                                                      throughput=None)
+        self.assertEqual(gpu_metrics['GPU-0'], [])
+
+        self.assertTrue(MetricsManager.is_gpu_metric('gpu_energy'))
+
+    def test_efficiency_records(self):
+        """
+        Test that the inferences per joule and per dollar are derived
+        from the throughput and the power of all the measured GPUs
+        """
+
+        gpu_metrics = {
+            'GPU-0': [GPUPowerUsage(value=150, device_uuid='GPU-0')],
+            'GPU-1': [GPUPowerUsage(value=50, device_uuid='GPU-1')]
+        }
+        model_perf_metrics = {PerfThroughput: PerfThroughput(1000)}
+
+        self._metrics_manager._config.gpu_price_per_hour = 0
+        records = self._metrics_manager._get_efficiency_records(
+            model_perf_metrics, gpu_metrics)
+        self.assertEqual(len(records), 1)
+        self.assertIsInstance(records[0], PerfInferencesPerJoule)
+        self.assertAlmostEqual(records[0].value(), 5)
+
+        self._metrics_manager._config.gpu_price_per_hour = 2
+        records = self._metrics_manager._get_efficiency_records(
+            model_perf_metrics, gpu_metrics)
+        self.assertIsInstance(records[1], PerfInferencesPerDollar)
+        self.assertAlmostEqual(records[1].value(), 1000 * 3600 / 4)
+
+        # Nothing to derive from without GPUs
+        self.assertEqual(
+            self._metrics_manager._get_efficiency_records(
+                model_perf_metrics, {}), [])
+
+    def test_efficiency_matches_energy(self):
+        """
+        Test that the inferences per joule and the energy per inference
+        are derived from the same time-weighted power
+        """
+
+        # 100W for 1s, then 300W for 1s, sampled unevenly
+        gpu_records = [
+            GPUPowerUsage(value=100, device_uuid='GPU-0', timestamp=0),
+            GPUPowerUsage(value=100, device_uuid='GPU-0', timestamp=500000000),
+            GPUPowerUsage(value=100, device_uuid='GPU-0', timestamp=1000000000),
+            GPUPowerUsage(value=300, device_uuid='GPU-0', timestamp=1000000001),
+            GPUPowerUsage(value=300, device_uuid='GPU-0', timestamp=2000000000)
+        ]
+        gpu_metrics = {'GPU-0': [GPUPowerUsage(value=180, device_uuid='GPU-0')]}
+        self._metrics_manager._config.gpu_price_per_hour = 0
+        self._metrics_manager._add_gpu_energy_records(gpu_metrics,
+                                                      gpu_records,
+                                                      throughput=50)
+
+        # The mean of the samples is 180W, but the GPU used 200W
+        energy = gpu_metrics['GPU-0'][1]
+        self.assertAlmostEqual(energy.value(), 200 / 50, places=5)
+
+        records = self._metrics_manager._get_efficiency_records(
+            {PerfThroughput: PerfThroughput(50)}, gpu_metrics, 50)
+        self.assertAlmostEqual(records[0].value(), 1 / energy.value())
+
+    def _create_run_config(self, model_names):
+        run_config = RunConfig({})
+        for model_name in model_names:
+            perf_config = PerfAnalyzerConfig()
+            perf_config['model-name'] = model_name
+            run_config.add_model_run_config(
+                ModelRunConfig(model_name, MagicMock(), perf_config))
+
+        return run_config
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -196,7 +196,7 @@ def test_write_config_file(self):
         # Write the model config to output
         with patch('model_analyzer.triton.model.model_config.open',
                    mock_open()) as mocked_file:
-            with patch('model_analyzer.triton.model.model_config.copy_tree',
+            with patch('model_analyzer.triton.model.model_config.copytree',
                        MagicMock()):
                 model_config.write_config_to_file(model_output_path,
                                                   '/mock/path', None)
@@ -225,7 +225,7 @@ def test_write_config_file(self):
 
     @patch('model_analyzer.triton.model.model_config.os.listdir',
            MagicMock(return_value=['1', 'config.pbtxt', 'output0_labels.txt']))
-    @patch('model_analyzer.triton.model.model_config.copy_tree')
+    @patch('model_analyzer.triton.model.model_config.copytree')
     @patch('model_analyzer.triton.model.model_config.os.symlink')
     def test_write_config_to_file_with_relative_path(self, mock_os_symlink,
                                                      *args):
@@ -278,7 +278,9 @@ def _test_helper(config_dict, expected_result, gpu_count=None):
         # No instance group info in model_config_dict:
         #  - default to 1 on CPU if cuda not available
         model_config_dict = {}
-        with patch('numba.cuda.is_available', MagicMock(return_value=False)):
+        with patch(
+                'model_analyzer.device.gpu_inventory.GPUInventory.is_available',
+                MagicMock(return_value=False)):
             _test_helper(model_config_dict, "1:CPU", gpu_count=5)
 
         # 2 per GPU, 3 gpus in the system = 6 total
@@ -795,6 +795,33 @@ def test_early_exit_on_manual(self):
                                                       early_exit_enable=True)
         # yapf: enable
 
+    def test_prune_illegal_preferred_batch_size(self):
+        """
+        Test that model configs whose preferred batch size is greater
+        than their max batch size are never generated
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            profile_models:
+                test_model:
+                    model_config_parameters:
+                        max_batch_size: [1,4,8]
+                        dynamic_batching:
+                            preferred_batch_size: [[4], [8]]
+            """)
+
+        expected_configs = [
+            {'max_batch_size': 4, 'dynamic_batching': {'preferred_batch_size': [4]}},
+            {'max_batch_size': 8, 'dynamic_batching': {'preferred_batch_size': [4]}},
+            {'max_batch_size': 8, 'dynamic_batching': {'preferred_batch_size': [8]}}
+        ]
+        # yapf: enable
+
+        self._run_and_test_model_config_generator(yaml_str,
+                                                  expected_configs,
+                                                  early_exit_enable=False)
+
     def _run_and_test_model_config_generator(self,
                                              yaml_str,
                                              expected_configs,
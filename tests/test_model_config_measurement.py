@@ -15,6 +15,7 @@
 from tests.common.test_utils import convert_non_gpu_metrics_to_data, default_encode
 from model_analyzer.record.metrics_manager import MetricsManager
 from model_analyzer.result.model_config_measurement import ModelConfigMeasurement
+from model_analyzer.result.latency_histogram import LatencyHistogram
 
 import unittest
 from unittest.mock import MagicMock, patch
@@ -239,6 +240,98 @@ def test_from_dict(self):
 
         # Catchall in case something new is added
         self.assertEqual(mcmA_from_dict, self.mcmA)
+        self.assertIsNone(mcmA_from_dict.latency_histogram())
+
+    def test_from_dict_with_latency_histogram(self):
+        """
+        Test that the latency histogram is restored from a dictionary
+        """
+        latency_histogram = LatencyHistogram()
+        for latency in [1000, 2000, 20000]:
+            latency_histogram.record(latency)
+        mcm = ModelConfigMeasurement(
+            self.model_config_name, self.model_specific_pa_params,
+            convert_non_gpu_metrics_to_data(self.non_gpu_metric_values),
+            latency_histogram)
+
+        mcm_json = json.dumps(mcm, default=default_encode)
+        mcm_from_dict = ModelConfigMeasurement.from_dict(json.loads(mcm_json))
+
+        self.assertEqual(mcm_from_dict.latency_histogram().to_dict(),
+                         latency_histogram.to_dict())
+
+    def test_combine(self):
+        """
+        Test that repeated measurements are averaged, with the
+        confidence interval of each metric
+        """
+        mcms = [
+            self._construct_model_config_measurement(
+                self.model_config_name, self.model_specific_pa_params, {
+                    "perf_throughput": throughput,
+                    "perf_latency_p99": 20
+                }) for throughput in [900, 1000, 1100]
+        ]
+
+        mcm = ModelConfigMeasurement.combine(mcms)
+
+        self.assertEqual(mcm.model_config_name(), self.model_config_name)
+        self.assertEqual(mcm.measurement_count(), 3)
+        self.assertEqual(mcm.get_metric_value("perf_throughput"), 1000)
+        self.assertEqual(mcm.get_metric_value("perf_latency_p99"), 20)
+
+        # t(0.975, 2) * stdev / sqrt(3)
+        self.assertAlmostEqual(mcm.get_confidence_interval("perf_throughput"),
+                               4.303 * 100 / 3**0.5)
+        self.assertEqual(mcm.get_confidence_interval("perf_latency_p99"), 0)
+        self.assertEqual(self.mcmA.get_confidence_interval("perf_throughput"),
+                         0)
+
+    def test_overlapping_confidence_intervals(self):
+        """
+        Test that repeated measurements whose confidence
+        intervals overlap are ranked as ties
+        """
+        noisy_mcm = ModelConfigMeasurement.combine([
+            self._construct_model_config_measurement(
+                "modelB", self.model_specific_pa_params,
+                {"perf_throughput": throughput})
+            for throughput in [900, 1300, 1100]
+        ])
+        noisy_mcm.set_metric_weighting({"perf_throughput": 1})
+        self.mcmA.set_metric_weighting({"perf_throughput": 1})
+
+        # 1000 is within 1100 +/- 497
+        self.assertTrue(noisy_mcm.confidence_intervals_overlap(self.mcmA))
+        self.assertTrue(noisy_mcm == self.mcmA)
+
+        precise_mcm = ModelConfigMeasurement.combine([
+            self._construct_model_config_measurement(
+                "modelB", self.model_specific_pa_params,
+                {"perf_throughput": throughput})
+            for throughput in [1090, 1110, 1100]
+        ])
+        precise_mcm.set_metric_weighting({"perf_throughput": 1})
+
+        # 1000 is not within 1100 +/- 25
+        self.assertFalse(precise_mcm.confidence_intervals_overlap(self.mcmA))
+        self.assertTrue(precise_mcm.is_better_than(self.mcmA))
+
+        # Single measurements have no confidence interval
+        self.assertFalse(self.mcmA.confidence_intervals_overlap(self.mcmB))
+
+    def test_from_dict_with_confidence_intervals(self):
+        """
+        Test that the confidence intervals are restored from a dictionary
+        """
+        mcm = ModelConfigMeasurement.combine([self.mcmA, self.mcmB])
+
+        mcm_json = json.dumps(mcm, default=default_encode)
+        mcm_from_dict = ModelConfigMeasurement.from_dict(json.loads(mcm_json))
+
+        self.assertEqual(mcm_from_dict.measurement_count(), 2)
+        self.assertEqual(mcm_from_dict.get_confidence_interval("perf_throughput"),
+                         mcm.get_confidence_interval("perf_throughput"))
 
     def _construct_model_config_measurement(self, model_config_name,
                                             model_specific_pa_params,
@@ -224,6 +224,64 @@ def test_from_dict(self):
         self.assertEqual(b0, (True, "modelB_config_0"))
         self.assertEqual(b1, (False, "modelB_config_1"))
 
+    def test_key_order(self):
+        """
+        Model config dicts that only differ in the order
+        of their keys are the same variant
+        """
+        a0 = self._mvnm.get_model_variant_name(
+            "modelA", {
+                'A': 1,
+                'B': {
+                    'C': [1, 2],
+                    'D': 3
+                }
+            }, self._non_default_param_combo)
+        a1 = self._mvnm.get_model_variant_name(
+            "modelA", {
+                'B': {
+                    'D': 3,
+                    'C': [1, 2]
+                },
+                'A': 1
+            }, self._non_default_param_combo)
+        a2 = self._mvnm.get_model_variant_name(
+            "modelA", {
+                'A': 1,
+                'B': {
+                    'C': [2, 1],
+                    'D': 3
+                }
+            }, self._non_default_param_combo)
+
+        self.assertEqual(a0, (False, "modelA_config_0"))
+        self.assertEqual(a1, (True, "modelA_config_0"))
+        self.assertEqual(a2, (False, "modelA_config_1"))
+
+    def test_checkpoint_excludes_fingerprints(self):
+        """
+        Only the model config dicts are checkpointed, and
+        the fingerprints are rebuilt from them
+        """
+        config_dict = {'A': {'B': 1}}
+        _ = self._mvnm.get_model_variant_name("modelA", config_dict,
+                                              self._non_default_param_combo)
+
+        # The stored dict doesn't change with the caller's
+        config_dict['A']['B'] = 2
+
+        mvnm_dict = default_encode(self._mvnm)
+        self.assertEqual(sorted(mvnm_dict.keys()),
+                         ['_model_config_dicts', '_model_name_index'])
+
+        mvnm = ModelVariantNameManager.from_dict(mvnm_dict)
+        self.assertEqual(mvnm._model_config_fingerprints,
+                         self._mvnm._model_config_fingerprints)
+        self.assertEqual(
+            mvnm.get_model_variant_name("modelA", {'A': {
+                'B': 1
+            }}, self._non_default_param_combo), (True, "modelA_config_0"))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,156 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from model_analyzer.triton.model.model_config import ModelConfig
+from model_analyzer.triton.model.model_variant_repository import ModelVariantRepository
+
+from .common import test_result_collector as trc
+
+
+class TestModelVariantRepository(trc.TestResultCollector):
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.model_repository = os.path.join(self._tmp_dir.name, 'models')
+        self.output_repository = os.path.join(self._tmp_dir.name, 'output')
+        os.makedirs(os.path.join(self.model_repository, 'my_model', '1'))
+        os.makedirs(self.output_repository)
+
+        self._write_file('my_model/config.pbtxt', 'name: "my_model"')
+        self._write_file('my_model/1/model.plan', 'weights')
+        self._write_file('my_model/labels.txt', 'labels')
+
+        self.repository = ModelVariantRepository(self.model_repository,
+                                                 self.output_repository)
+
+    def tearDown(self):
+        self.repository.close()
+        self._tmp_dir.cleanup()
+        patch.stopall()
+
+    def test_materialize(self):
+        for variant_name in ['my_model_config_0', 'my_model_config_1']:
+            self.repository.materialize('my_model',
+                                        self._variant_config(variant_name))
+        self.repository.wait()
+
+        for variant_name in ['my_model_config_0', 'my_model_config_1']:
+            variant_dir = os.path.join(self.output_repository, variant_name)
+            self.assertEqual(sorted(os.listdir(variant_dir)),
+                             ['1', 'config.pbtxt', 'labels.txt'])
+
+            # The model files are relative links into the base
+            self.assertEqual(
+                os.readlink(os.path.join(variant_dir, '1')),
+                os.path.join('..', ModelVariantRepository.BASE_DIRECTORY,
+                             'my_model', '1'))
+            self.assertFalse(
+                os.path.islink(os.path.join(variant_dir, 'config.pbtxt')))
+
+            with open(os.path.join(variant_dir, 'config.pbtxt')) as f:
+                self.assertIn(variant_name, f.read())
+
+        # The base shares the weights with the original model
+        self.assertTrue(
+            os.path.samefile(
+                os.path.join(self.model_repository, 'my_model', '1',
+                             'model.plan'),
+                os.path.join(self.output_repository, 'my_model_config_1', '1',
+                             'model.plan')))
+        self.assertFalse(
+            os.path.exists(
+                os.path.join(self.output_repository,
+                             ModelVariantRepository.BASE_DIRECTORY, 'my_model',
+                             'config.pbtxt')))
+
+    def test_symlink_fallback(self):
+        # Neither reflinks nor hardlinks are possible
+        patch.object(ModelVariantRepository,
+                     '_reflink',
+                     side_effect=OSError).start()
+        patch('model_analyzer.triton.model.model_variant_repository.os.link',
+              side_effect=OSError).start()
+
+        self.repository.materialize('my_model',
+                                    self._variant_config('my_model_config_0'))
+        self.repository.wait()
+
+        weights = os.path.join(self.output_repository,
+                               ModelVariantRepository.BASE_DIRECTORY,
+                               'my_model', '1', 'model.plan')
+        self.assertEqual(
+            os.readlink(weights),
+            os.path.realpath(
+                os.path.join(self.model_repository, 'my_model', '1',
+                             'model.plan')))
+
+    def test_copy_fallback(self):
+        patch.object(ModelVariantRepository,
+                     '_reflink',
+                     side_effect=OSError).start()
+        patch('model_analyzer.triton.model.model_variant_repository.os.link',
+              side_effect=OSError).start()
+
+        repository = ModelVariantRepository(self.model_repository,
+                                            self.output_repository,
+                                            allow_absolute_symlinks=False)
+        repository.materialize('my_model',
+                               self._variant_config('my_model_config_0'))
+        repository.close()
+
+        weights = os.path.join(self.output_repository,
+                               ModelVariantRepository.BASE_DIRECTORY,
+                               'my_model', '1', 'model.plan')
+        self.assertFalse(os.path.islink(weights))
+        with open(weights) as f:
+            self.assertEqual(f.read(), 'weights')
+
+    def test_prune(self):
+        for variant_name in ['my_model_config_0', 'my_model_config_1']:
+            self.repository.materialize('my_model',
+                                        self._variant_config(variant_name))
+
+        self.repository.prune(['my_model_config_1'])
+
+        self.assertEqual(
+            sorted(os.listdir(self.output_repository)),
+            [ModelVariantRepository.BASE_DIRECTORY, 'my_model_config_1'])
+
+        # A pruned variant can be materialized again
+        self.repository.materialize('my_model',
+                                    self._variant_config('my_model_config_0'))
+        self.repository.wait()
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(self.output_repository, 'my_model_config_0', '1',
+                             'model.plan')))
+
+    def _variant_config(self, variant_name):
+        return ModelConfig.create_from_dictionary({
+            'name': variant_name,
+            'max_batch_size': 8
+        })
+
+    def _write_file(self, path, contents):
+        with open(os.path.join(self.model_repository, path), 'w') as f:
+            f.write(contents)
+
+
+if __name__ == '__main__':
+    unittest.main()
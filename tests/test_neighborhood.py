@@ -102,8 +102,7 @@ def test_create_neighborhood(self):
                                  [2, 1, 1], [2, 1, 2], [2, 2, 0], [2, 2, 1],
                                  [2, 2, 2], [3, 1, 1]]
 
-        expected_coordinates = [Coordinate(x) for x in expected_neighborhood]
-        self.assertEqual(tuple(n._neighborhood), tuple(expected_coordinates))
+        self.assertEqual(n._neighborhood.tolist(), expected_neighborhood)
 
     def test_num_initialized(self):
         dims = SearchDimensions()
@@ -737,6 +736,41 @@ def test_all_same_throughputs(self):
         new_coord = n.determine_new_home()
         self.assertEqual(new_coord, Coordinate([1, 1, 1]))
 
+    def test_best_coordinate_found_with_equal_measurements(self):
+        """
+        Test that the best coordinate is picked on the measurements only,
+        so that equal measurements do not compare their coordinates
+        """
+        dims = SearchDimensions()
+        dims.add_dimensions(0, [
+            SearchDimension("foo", SearchDimension.DIMENSION_TYPE_LINEAR),
+            SearchDimension("bar", SearchDimension.DIMENSION_TYPE_EXPONENTIAL)
+        ])
+
+        nc = NeighborhoodConfig(dims, radius=2, min_initialized=3)
+        cd = CoordinateData()
+        n = Neighborhood(nc,
+                         home_coordinate=Coordinate([1, 1]),
+                         coordinate_data=cd)
+
+        cd.set_measurement(Coordinate([1, 1]),
+                           self._construct_rcm(throughput=10, latency=5))
+        cd.set_measurement(Coordinate([2, 1]),
+                           self._construct_rcm(throughput=10, latency=5))
+        cd.set_measurement(Coordinate([1, 2]),
+                           self._construct_rcm(throughput=10, latency=5))
+
+        # Any of the tied coordinates may be picked
+        self.assertIn(
+            n._get_best_coordinate_found(),
+            [Coordinate([1, 1]),
+             Coordinate([2, 1]),
+             Coordinate([1, 2])])
+
+        cd.set_measurement(Coordinate([0, 1]),
+                           self._construct_rcm(throughput=20, latency=5))
+        self.assertEqual(n._get_best_coordinate_found(), Coordinate([0, 1]))
+
     def test_translate_step_vector(self):
         """
         Test the functionality of translate_step_vector()
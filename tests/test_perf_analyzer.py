@@ -14,6 +14,7 @@
 
 from model_analyzer.config.run.model_run_config import ModelRunConfig
 from model_analyzer.device.gpu_device import GPUDevice
+import json
 import unittest
 from unittest.mock import MagicMock, patch, mock_open
 
@@ -37,6 +38,7 @@
 from model_analyzer.record.types.perf_latency_p90 import PerfLatencyP90
 from model_analyzer.record.types.perf_latency_p95 import PerfLatencyP95
 from model_analyzer.record.types.perf_latency_p99 import PerfLatencyP99
+from model_analyzer.record.types.perf_latency_p999 import PerfLatencyP999
 from model_analyzer.record.types.perf_latency import PerfLatency
 from model_analyzer.record.types.perf_client_response_wait \
     import PerfClientResponseWait
@@ -50,6 +52,8 @@
     import PerfServerComputeInfer
 from model_analyzer.record.types.perf_server_compute_output \
     import PerfServerComputeOutput
+from model_analyzer.record.types.perf_client_cpu_utilization \
+    import PerfClientCPUUtilization
 
 from model_analyzer.record.types.gpu_utilization import GPUUtilization
 from model_analyzer.record.types.gpu_power_usage import GPUPowerUsage
@@ -162,6 +166,36 @@ def test_perf_analyzer_additive_args(self):
         with self.assertRaises(TritonModelAnalyzerException):
             self.config.to_cli_string()
 
+    def test_perf_analyzer_derived_config(self):
+        """ Test that derived configs copy the arguments on write """
+        derived_config = self.config.create_derived_config({
+            'batch-size': 4,
+            'concurrency-range': 2
+        })
+        other_derived_config = self.config.create_derived_config(
+            {'batch-size': 8})
+
+        self.assertEqual(derived_config['model-name'], TEST_MODEL_NAME)
+        self.assertEqual(derived_config['batch-size'], 4)
+        self.assertEqual(derived_config['concurrency-range'], 2)
+        self.assertEqual(other_derived_config['batch-size'], 8)
+        self.assertIsNone(other_derived_config['concurrency-range'])
+        self.assertIsNone(self.config['batch-size'])
+
+        # Unmodified arguments are still shared with the base config
+        self.assertIs(derived_config._verbose, self.config._verbose)
+
+        derived_config['measurement-interval'] = 2000
+        self.assertEqual(derived_config['measurement-interval'], 2000)
+        self.assertEqual(other_derived_config['measurement-interval'], 1000)
+        self.assertEqual(self.config['measurement-interval'], 1000)
+
+        # The base config copies its arguments before modifying them too
+        self.config['measurement-interval'] = 3000
+        self.assertEqual(other_derived_config['measurement-interval'], 1000)
+
+        self.assertNotIn('_shared_attrs', derived_config.to_dict())
+
     def test_perf_analyzer_ssl_args(self):
         """
         Verify that the generated cli string passed to PA matches our expected output.
@@ -500,6 +534,68 @@ def test_run(self):
             self.assertTrue(perf_analyzer.run(perf_metrics))
         self.server.stop()
 
+    def test_profile_export(self):
+        self.config['latency-report-file'] = 'test-results.csv'
+        self.config['profile-export-file'] = 'test-profile-export.json'
+        perf_analyzer = PerfAnalyzer(path=PERF_BIN_PATH,
+                                     config=self.run_config,
+                                     max_retries=10,
+                                     timeout=100,
+                                     max_cpu_util=50)
+
+        pa_csv_mock = """Concurrency,Inferences/Second,p99 latency\n1,46.8,4900"""
+
+        # Request i takes i + 1 microseconds, split in two experiments
+        profile_export = {
+            'experiments': [{
+                'experiment': {
+                    'mode': 'concurrency',
+                    'value': 1
+                },
+                'requests': [{
+                    'timestamp': i * 10000,
+                    'sequence_id': 1,
+                    'response_timestamps': [i * 10000 + (i + 1) * 1000]
+                } for i in range(first, first + 500)],
+                'window_boundaries': []
+            } for first in [0, 500]],
+            'version': '1.0.0'
+        }
+        files = {
+            'test-results.csv': pa_csv_mock,
+            'test-profile-export.json': json.dumps(profile_export, indent=2)
+        }
+
+        # The requests are read in chunks that split them
+        patch.object(PerfAnalyzer, 'PROFILE_EXPORT_CHUNK_SIZE', 7).start()
+
+        def open_file(filename, mode):
+            return mock_open(read_data=files[filename])()
+
+        patch.object(PerfAnalyzer,
+                     '_execute_pa',
+                     return_value=PerfAnalyzer.PA_SUCCESS).start()
+        patch('model_analyzer.perf_analyzer.perf_analyzer.open',
+              open_file).start()
+        mock_remove = patch(
+            'model_analyzer.perf_analyzer.perf_analyzer.os.remove').start()
+
+        perf_analyzer.run([PerfLatencyP99, PerfLatencyP999])
+
+        # Percentiles in the latency report are read from it, and the
+        # others are computed from the histogram, within its precision
+        records = {
+            type(record): record.value()
+            for record in perf_analyzer.get_perf_records()[TEST_MODEL_NAME]
+        }
+        self.assertEqual(records[PerfLatencyP99], 4.9)
+        self.assertAlmostEqual(records[PerfLatencyP999], 0.999, delta=0.01)
+
+        latency_histogram = perf_analyzer.get_latency_histograms()[
+            TEST_MODEL_NAME]
+        self.assertEqual(latency_histogram.count(), 1000)
+        mock_remove.assert_any_call('test-profile-export.json')
+
     def test_measurement_interval_increase(self):
         server_config = TritonServerConfig()
         server_config['model-repository'] = MODEL_REPOSITORY_PATH
@@ -780,6 +876,73 @@ def test_auto_adjust_parameters(self):
             pa._config.model_run_configs()[2].perf_config()
             ['measurement-request-count'])
 
+    def test_cpu_util_is_averaged(self):
+        """
+        Test that a CPU utilization spike does not stop perf_analyzer,
+        as long as the average over its measurement window is allowed
+        """
+        self.config['measurement-interval'] = 3000
+        pa = PerfAnalyzer(path=PERF_BIN_PATH,
+                          config=self.run_config,
+                          max_retries=10,
+                          timeout=100,
+                          max_cpu_util=50)
+
+        process = MagicMock()
+        process.poll.side_effect = [None, None, None, None, 0]
+        pa._cmd_log = MagicMock()
+        pa._cmd_log.read.return_value = b''
+
+        with patch.object(pa,
+                          '_sample_cpu_util',
+                          side_effect=[120, 10, 10, 10]):
+            self.assertEqual(pa._poll_perf_analyzer(process), pa.PA_SUCCESS)
+        process.kill.assert_not_called()
+
+        # The whole run is recorded
+        pa._add_client_cpu_util_records([PerfClientCPUUtilization])
+        records = pa.get_perf_records()[TEST_MODEL_NAME]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].value(), 37.5)
+
+    def test_cpu_util_reduces_threads(self):
+        """
+        Test that perf_analyzer is retried with fewer threads while
+        it uses too much CPU, and only fails once it cannot use fewer
+        """
+        pa = PerfAnalyzer(path=PERF_BIN_PATH,
+                          config=self.run_config,
+                          max_retries=10,
+                          timeout=100,
+                          max_cpu_util=50)
+
+        process = MagicMock()
+        process.poll.return_value = None
+        pa._cmd_log = MagicMock()
+        pa._cmd_log.read.return_value = b''
+
+        representation = self.config.representation()
+        statuses = []
+        with patch.object(pa, '_sample_cpu_util', return_value=80):
+            for _ in range(6):
+                statuses.append(pa._poll_perf_analyzer(process))
+
+        # Async mode, then 16 threads halved down to 1
+        self.assertEqual(statuses, [pa.PA_RETRY] * 5 + [pa.PA_FAIL])
+        self.assertEqual(self.config['async'], 'true')
+        self.assertEqual(self.config['max-threads'], 1)
+        self.assertEqual(process.kill.call_count, 6)
+
+        # The measurement is still stored under the same run config
+        self.assertEqual(self.config.representation(), representation)
+
+        # With request rates, perf_analyzer starts from 4 threads
+        self.config['request-rate-range'] = 100
+        self.config['max-threads'] = None
+        with patch.object(pa, '_sample_cpu_util', return_value=80):
+            self.assertEqual(pa._poll_perf_analyzer(process), pa.PA_RETRY)
+        self.assertEqual(self.config['max-threads'], 2)
+
     def tearDown(self):
         # In case test raises exception
         if self.server is not None:
@@ -16,6 +16,7 @@
 from tests.common.test_utils import construct_perf_analyzer_config, evaluate_mock_config, construct_run_config_measurement
 
 from model_analyzer.config.generate.perf_analyzer_config_generator import PerfAnalyzerConfigGenerator
+from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
 from .common import test_result_collector as trc
 from .mocks.mock_os import MockOSMethods
 from model_analyzer.config.generate.generator_utils import GeneratorUtils as utils
@@ -23,6 +24,7 @@
 from unittest.mock import patch
 
 from model_analyzer.config.input.config_defaults import DEFAULT_RUN_CONFIG_MAX_CONCURRENCY
+from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 
 
 class TestPerfAnalyzerConfigGenerator(trc.TestResultCollector):
@@ -548,6 +550,391 @@ def test_throughput_gain_based_on_max(self):
         self._test_throughput_gain_valid_helper(throughput_values,
                                                 expected_result)
 
+    def test_concurrency_binary_search(self):
+        """
+        Test that with a latency budget of 100ms, where latency (in ms) equals
+        concurrency, only the bracketing concurrencies are measured:
+        32 (pass), 256 (fail), 64 (pass), 128 (fail)
+        """
+        concurrencies = self._run_concurrency_binary_search(
+            throughput_function=lambda concurrency: concurrency)
+
+        self.assertEqual(concurrencies, [32, 256, 64, 128])
+
+    def test_concurrency_binary_search_fallback(self):
+        """
+        Test that when throughput decreases with concurrency, the binary search
+        falls back to sweeping all of the concurrencies not yet measured
+        """
+        concurrencies = self._run_concurrency_binary_search(
+            throughput_function=lambda concurrency: 1000 / concurrency)
+
+        self.assertEqual(concurrencies,
+                         [32, 256, 64, 1, 2, 4, 8, 16, 128, 512, 1024])
+
+    def test_request_rate_search(self):
+        """
+        Test that with request rate search enabled, request rates are swept
+        instead of concurrencies
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            profile_models:
+                - my-model
+            """)
+        # yapf: enable
+
+        request_rates = utils.generate_doubled_list(16, 256)
+        expected_configs = [
+            construct_perf_analyzer_config(
+                concurrency=None,
+                perf_analyzer_flags={'request-rate-range': r})
+            for r in request_rates
+        ]
+
+        pa_cli_args = [
+            '--request-rate-search-enable',
+            '--run-config-search-max-request-rate', '256'
+        ]
+        self._run_and_test_perf_analyzer_config_generator(
+            yaml_str, expected_configs, pa_cli_args)
+
+    def test_request_rate_list(self):
+        """
+        Test that a model's list of request rates is swept
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            profile_models:
+                my-model:
+                    parameters:
+                        request_rate: [100, 20, 50]
+            """)
+        # yapf: enable
+
+        expected_configs = [
+            construct_perf_analyzer_config(
+                concurrency=None,
+                perf_analyzer_flags={'request-rate-range': r})
+            for r in [20, 50, 100]
+        ]
+
+        self._run_and_test_perf_analyzer_config_generator(
+            yaml_str, expected_configs)
+
+    def test_request_rate_and_concurrency_lists(self):
+        """
+        Test that a model cannot have both a list of
+        concurrencies and a list of request rates
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            profile_models:
+                my-model:
+                    parameters:
+                        concurrency: [1, 2]
+                        request_rate: [10, 20]
+            """)
+        # yapf: enable
+
+        args = [
+            'model-analyzer', 'profile', '--model-repository', 'cli_repository',
+            '-f', 'path-to-config-file'
+        ]
+        with self.assertRaises(TritonModelAnalyzerException):
+            evaluate_mock_config(args, yaml_str, subcommand="profile")
+
+    def test_request_rate_early_exit_on_saturation(self):
+        """
+        Test that when the model can only serve 100 infer/sec, the request
+        rate sweep stops at the first rate whose throughput falls short of it
+        """
+        request_rates = self._run_request_rate_search(
+            throughput_function=lambda request_rate: min(request_rate, 100))
+
+        self.assertEqual(request_rates, [16, 32, 64, 128])
+
+    def test_request_rate_binary_search(self):
+        """
+        Test that with a latency budget of 100ms, the request rates are
+        binary searched for the highest rate meeting it
+        """
+        request_rates = self._run_request_rate_search(
+            throughput_function=lambda request_rate: request_rate,
+            latency_function=lambda request_rate: request_rate / 2,
+            latency_budget=100)
+
+        self.assertEqual(request_rates, [256, 32, 64, 128])
+
+    def test_request_trace(self):
+        """
+        Test that a request trace is replayed once per
+        batch size, instead of sweeping the concurrency
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            profile_models:
+                - my-model
+            """)
+        # yapf: enable
+
+        intervals_file = '/tmp/request_traces/my-model-request-intervals.txt'
+        expected_configs = [
+            construct_perf_analyzer_config(
+                batch_size=b,
+                concurrency=None,
+                perf_analyzer_flags={'request-intervals': intervals_file})
+            for b in [1, 2, 4]
+        ]
+
+        pa_cli_args = [
+            '--request-trace', 'trace.jsonl', '--export-path', '/tmp',
+            '-b', '1,2,4'
+        ]
+        self._run_and_test_perf_analyzer_config_generator(
+            yaml_str, expected_configs, pa_cli_args)
+
+    def test_prune_client_batch_size_above_max_batch_size(self):
+        """
+        Test that client batch sizes greater than the model's
+        max batch size are never generated
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            profile_models:
+                my-model:
+                    parameters:
+                        batch_sizes: [1, 4, 8, 16]
+                        concurrency: [1, 2]
+            """)
+        # yapf: enable
+
+        config = evaluate_mock_config([
+            'model-analyzer', 'profile', '--model-repository',
+            'cli_repository', '-f', 'path-to-config-file'
+        ],
+                                      yaml_str,
+                                      subcommand="profile")
+
+        pacg = PerfAnalyzerConfigGenerator(
+            config,
+            config.profile_models[0].model_name(),
+            config.profile_models[0].perf_analyzer_flags(),
+            config.profile_models[0].parameters(),
+            early_exit_enable=False,
+            max_batch_size=4)
+
+        batch_sizes = []
+        for perf_config in pacg.get_configs():
+            batch_sizes.append(perf_config['batch-size'])
+            pacg.set_last_results([self._get_next_measurement()])
+
+        self.assertEqual(batch_sizes, [1, 1, 4, 4])
+
+        # Nothing is generated if every batch size is illegal
+        pacg = PerfAnalyzerConfigGenerator(
+            config,
+            config.profile_models[0].model_name(),
+            config.profile_models[0].perf_analyzer_flags(),
+            {
+                'batch_sizes': [8, 16],
+                'concurrency': [1]
+            },
+            early_exit_enable=False,
+            max_batch_size=4)
+
+        self.assertEqual(list(pacg.get_configs()), [])
+
+    def test_shared_memory(self):
+        """
+        Test that the tensors of a model with large inputs are passed
+        through shared memory, unless its perf_analyzer flags say otherwise
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            profile_models:
+                my-model:
+                    parameters:
+                        concurrency: [1]
+            """)
+        # yapf: enable
+
+        config = evaluate_mock_config([
+            'model-analyzer', 'profile', '--model-repository',
+            'cli_repository', '-f', 'path-to-config-file'
+        ],
+                                      yaml_str,
+                                      subcommand="profile")
+
+        model_config = {
+            'name': 'my-model',
+            'input': [{
+                'name': 'INPUT0',
+                'data_type': 'TYPE_UINT8',
+                'dims': ['3', '1024', '1024']
+            }]
+        }
+
+        shared_memory = []
+        for perf_analyzer_flags in [{}, {'shared-memory': 'none'}]:
+            pacg = PerfAnalyzerConfigGenerator(
+                config,
+                config.profile_models[0].model_name(),
+                perf_analyzer_flags,
+                config.profile_models[0].parameters(),
+                early_exit_enable=False,
+                model_config=model_config)
+
+            for perf_config in pacg.get_configs():
+                shared_memory.append(perf_config['shared-memory'])
+                pacg.set_last_results([self._get_next_measurement()])
+
+        self.assertEqual(shared_memory, ['system', 'none'])
+
+    def test_configs_derived_from_base_config(self):
+        """
+        Test that the profile config is only applied once, to the base
+        config, and that modifying a generated config (as perf_analyzer
+        does to its measurement interval) leaves the others untouched
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            profile_models:
+                my-model:
+                    parameters:
+                        batch_sizes: [1, 2]
+                        concurrency: [1, 2]
+            """)
+        # yapf: enable
+
+        config = evaluate_mock_config([
+            'model-analyzer', 'profile', '--model-repository',
+            'cli_repository', '-f', 'path-to-config-file'
+        ],
+                                      yaml_str,
+                                      subcommand="profile")
+
+        with patch.object(PerfAnalyzerConfig,
+                          'update_config_from_profile_config',
+                          autospec=True,
+                          side_effect=PerfAnalyzerConfig.
+                          update_config_from_profile_config) as mock_update:
+            pacg = PerfAnalyzerConfigGenerator(
+                config,
+                config.profile_models[0].model_name(),
+                config.profile_models[0].perf_analyzer_flags(),
+                config.profile_models[0].parameters(),
+                early_exit_enable=False)
+
+            perf_configs = []
+            for perf_config in pacg.get_configs():
+                perf_config['measurement-interval'] = 5000
+                perf_configs.append(perf_config)
+                pacg.set_last_results([self._get_next_measurement()])
+
+        mock_update.assert_called_once()
+        self.assertEqual(len(perf_configs), 4)
+        self.assertIsNone(pacg._base_perf_config['measurement-interval'])
+        self.assertEqual(
+            [(c['batch-size'], c['concurrency-range']) for c in perf_configs],
+            [(1, 1), (1, 2), (2, 1), (2, 2)])
+
+    def _run_concurrency_binary_search(self, throughput_function):
+        args = [
+            'model-analyzer', 'profile', '--model-repository', 'cli_repository',
+            '-f', 'path-to-config-file', '--concurrency-binary-search-enable'
+        ]
+
+        # yapf: disable
+        yaml_str = ("""
+            profile_models:
+                - my-model
+            """)
+        # yapf: enable
+
+        config = evaluate_mock_config(args, yaml_str, subcommand="profile")
+
+        pacg = PerfAnalyzerConfigGenerator(
+            config,
+            config.profile_models[0].model_name(),
+            config.profile_models[0].perf_analyzer_flags(),
+            config.profile_models[0].parameters(),
+            early_exit_enable=True,
+            latency_budget=100)
+
+        concurrencies = []
+        for perf_config in pacg.get_configs():
+            concurrency = perf_config['concurrency-range']
+            concurrencies.append(concurrency)
+            pacg.set_last_results([
+                construct_run_config_measurement(
+                    model_name=MagicMock(),
+                    model_config_names=["test_model_config_name"],
+                    model_specific_pa_params=MagicMock(),
+                    gpu_metric_values=MagicMock(),
+                    non_gpu_metric_values=[{
+                        "perf_throughput": throughput_function(concurrency),
+                        "perf_latency_p99": concurrency
+                    }])
+            ])
+
+        return concurrencies
+
+    def _run_request_rate_search(self,
+                                 throughput_function,
+                                 latency_function=lambda request_rate: 1,
+                                 latency_budget=None):
+        args = [
+            'model-analyzer', 'profile', '--model-repository', 'cli_repository',
+            '-f', 'path-to-config-file', '--request-rate-search-enable',
+            '--concurrency-binary-search-enable'
+        ]
+
+        # yapf: disable
+        yaml_str = ("""
+            profile_models:
+                - my-model
+            """)
+        # yapf: enable
+
+        config = evaluate_mock_config(args, yaml_str, subcommand="profile")
+
+        pacg = PerfAnalyzerConfigGenerator(
+            config,
+            config.profile_models[0].model_name(),
+            config.profile_models[0].perf_analyzer_flags(),
+            config.profile_models[0].parameters(),
+            early_exit_enable=True,
+            latency_budget=latency_budget)
+
+        request_rates = []
+        for perf_config in pacg.get_configs():
+            self.assertIsNone(perf_config['concurrency-range'])
+            request_rate = perf_config['request-rate-range']
+            request_rates.append(request_rate)
+            pacg.set_last_results([
+                construct_run_config_measurement(
+                    model_name=MagicMock(),
+                    model_config_names=["test_model_config_name"],
+                    model_specific_pa_params=[
+                        perf_config.extract_model_specific_parameters()
+                    ],
+                    gpu_metric_values=MagicMock(),
+                    non_gpu_metric_values=[{
+                        "perf_throughput": throughput_function(request_rate),
+                        "perf_latency_p99": latency_function(request_rate)
+                    }])
+            ])
+
+        return request_rates
+
     def _test_throughput_gain_valid_helper(self, throughput_values,
                                            expected_result):
         throughputs = [
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import csv
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -20,6 +24,10 @@
 
 from .mocks.mock_matplotlib import MockMatplotlibMethods
 from model_analyzer.plots.simple_plot import SimplePlot
+from model_analyzer.plots.detailed_plot import DetailedPlot
+from model_analyzer.result.model_constraints import ModelConstraints
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
 
 
 class TestPlotMethods(trc.TestResultCollector):
@@ -30,12 +38,14 @@ def setUp(self):
         self.matplotlib_mock.start()
 
     def test_create_plot(self):
-        # Create a plot and check for call to subplots
-        SimplePlot(name='test_plot',
-                   title='test_title',
-                   x_axis='perf_throughput',
-                   y_axis='perf_latency_p99')
+        # Create a plot, the figure is only created when it is saved
+        plot = SimplePlot(name='test_plot',
+                          title='test_title',
+                          x_axis='perf_throughput',
+                          y_axis='perf_latency_p99')
+        self.matplotlib_mock.figure_mock.assert_not_called()
 
+        plot.save('test_path')
         self.matplotlib_mock.assert_called_subplots()
 
     def test_add_measurement(self):
@@ -120,7 +130,8 @@ def test_plot_data(self):
         plot.add_run_config_measurement('test_model_label', measurement)
 
         # Call plot and assert args
-        plot.plot_data_and_constraints(constraints={})
+        plot.set_constraints(constraints={})
+        plot.save('test_path')
         self.matplotlib_mock.assert_called_plot_with_args(
             x_data=[200], y_data=[8000], marker='o', label='test_model_label')
 
@@ -130,9 +141,116 @@ def test_save(self):
                           x_axis='perf_throughput',
                           y_axis='perf_latency_p99')
 
-        plot.save('test_path')
+        figure = plot.save('test_path')
         self.matplotlib_mock.assert_called_save_with_args('test_path/test_plot')
 
+        # The figure is cleared and reused for the next plot
+        other_plot = SimplePlot(name='other_test_plot',
+                                title='test_title',
+                                x_axis='perf_throughput',
+                                y_axis='perf_latency_p99')
+        self.assertIs(other_plot.save('test_path', figure=figure), figure)
+        self.matplotlib_mock.figure_mock.assert_called_once()
+        figure.clf.assert_called()
+        self.matplotlib_mock.assert_called_save_with_args(
+            'test_path/other_test_plot')
+
+    def test_export_data(self):
+        plot = SimplePlot(name='test_plot',
+                          title='test_title',
+                          x_axis='perf_throughput',
+                          y_axis='perf_latency_p99',
+                          monotonic=True)
+
+        # The data is sorted by x, and the decreasing point is pruned
+        for throughput, latency in [(300, 9000), (100, 7000), (200, 6000)]:
+            measurement = construct_run_config_measurement(
+                model_name='test_model',
+                model_config_names=['test_model_config_0'],
+                model_specific_pa_params=MagicMock(),
+                gpu_metric_values={},
+                non_gpu_metric_values=[{
+                    'perf_throughput': throughput,
+                    'perf_latency_p99': latency
+                }],
+                metric_objectives=[{
+                    'perf_throughput': 1
+                }])
+            plot.add_run_config_measurement('test_model_label', measurement)
+        plot.set_constraints(
+            ModelConstraints({'perf_latency_p99': {
+                'max': 8000
+            }}))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            plot.export_data(tmp_dir, 'csv')
+            with open(os.path.join(tmp_dir, 'test_plot.csv')) as f:
+                self.assertEqual(list(csv.reader(f)), [
+                    ['model_config', 'perf_throughput', 'perf_latency_p99'],
+                    ['test_model_label', '100', '7000'],
+                    ['test_model_label', '300', '9000']
+                ])
+
+            plot.export_data(tmp_dir, 'json')
+            with open(os.path.join(tmp_dir, 'test_plot.json')) as f:
+                data = json.load(f)
+            self.assertEqual(data['title'], 'test_title')
+            self.assertEqual(data['series'],
+                             {'test_model_label': {
+                                 'x': [100, 300],
+                                 'y': [7000, 9000]
+                             }})
+            self.assertEqual(data['constraints'], {'x': [], 'y': [8000]})
+
+            with self.assertRaises(TritonModelAnalyzerException):
+                plot.export_data(tmp_dir, 'xml')
+
+        # Exporting the data does not draw the plot
+        self.matplotlib_mock.figure_mock.assert_not_called()
+
+    def test_export_detailed_data(self):
+        plot = DetailedPlot('test_detailed_plot', 'test_title')
+
+        for concurrency in [4, 1]:
+            measurement = construct_run_config_measurement(
+                model_name='test_model',
+                model_config_names=['test_model_config_0'],
+                model_specific_pa_params=[{
+                    'concurrency-range': concurrency
+                }],
+                gpu_metric_values={},
+                non_gpu_metric_values=[{
+                    'perf_throughput': concurrency * 100,
+                    'perf_server_queue': concurrency,
+                    'perf_server_compute_input': 1,
+                    'perf_server_compute_infer': 2,
+                    'perf_server_compute_output': 3
+                }],
+                metric_objectives=[{
+                    'perf_throughput': 1
+                }])
+            plot.add_run_config_measurement(measurement)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            plot.export_data(tmp_dir, 'csv')
+            with open(os.path.join(tmp_dir, 'test_detailed_plot.csv')) as f:
+                self.assertEqual(list(csv.reader(f)), [
+                    [
+                        'concurrency', 'perf_throughput', 'perf_server_queue',
+                        'perf_server_compute_input',
+                        'perf_server_compute_infer',
+                        'perf_server_compute_output'
+                    ],
+                    ['1', '100', '1', '1', '2', '3'],
+                    ['4', '400', '4', '1', '2', '3'],
+                ])
+
+            plot.export_data(tmp_dir, 'json')
+            with open(os.path.join(tmp_dir, 'test_detailed_plot.json')) as f:
+                data = json.load(f)
+            self.assertEqual(data['data']['concurrency'], [1, 4])
+            self.assertEqual(data['data']['perf_throughput'], [100, 400])
+
     def tearDown(self):
         self.matplotlib_mock.stop()
         patch.stopall()
@@ -0,0 +1,260 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from concurrent import futures
+from unittest.mock import MagicMock, patch
+
+import grpc
+from tritonclient.grpc import service_pb2, service_pb2_grpc
+
+from model_analyzer.config.run.model_run_config import ModelRunConfig
+from model_analyzer.config.run.run_config import RunConfig
+from model_analyzer.perf_analyzer.perf_analyzer import PerfAnalyzer
+from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.perf_analyzer.python_load_generator \
+    import PythonLoadGenerator, PythonLoadSession
+from model_analyzer.record.types.perf_latency_avg import PerfLatencyAvg
+from model_analyzer.record.types.perf_latency_p99 import PerfLatencyP99
+from model_analyzer.record.types.perf_server_queue import PerfServerQueue
+from model_analyzer.record.types.perf_throughput import PerfThroughput
+
+from .common import test_result_collector as trc
+
+# The time the stub server takes to execute each request
+STUB_COMPUTE_SECONDS = 0.002
+
+
+class StubInferenceServicer(service_pb2_grpc.GRPCInferenceServiceServicer):
+    """
+    A gRPC inference service with one model, that echoes
+    the id of every streamed request after a short delay
+    """
+
+    def __init__(self, fail_requests=False):
+        self._fail_requests = fail_requests
+        self._lock = threading.Lock()
+        self._request_count = 0
+
+    def ModelMetadata(self, request, context):
+        return service_pb2.ModelMetadataResponse(
+            name=request.name,
+            inputs=[
+                service_pb2.ModelMetadataResponse.TensorMetadata(
+                    name='INPUT0', datatype='FP32', shape=[-1, -1])
+            ])
+
+    def ModelConfig(self, request, context):
+        response = service_pb2.ModelConfigResponse()
+        response.config.name = request.name
+        response.config.max_batch_size = 8
+        return response
+
+    def ModelStatistics(self, request, context):
+        with self._lock:
+            request_count = self._request_count
+
+        response = service_pb2.ModelStatisticsResponse()
+        model_stats = response.model_stats.add()
+        model_stats.name = request.name
+        model_stats.inference_stats.queue.count = request_count
+        model_stats.inference_stats.queue.ns = request_count * 1000000
+        model_stats.inference_stats.compute_infer.count = request_count
+        model_stats.inference_stats.compute_infer.ns = int(
+            request_count * STUB_COMPUTE_SECONDS * 1000000000)
+        return response
+
+    def ModelStreamInfer(self, request_iterator, context):
+        for request in request_iterator:
+            time.sleep(STUB_COMPUTE_SECONDS)
+            with self._lock:
+                self._request_count += 1
+
+            if self._fail_requests:
+                yield service_pb2.ModelStreamInferResponse(
+                    error_message='inference failed')
+            else:
+                yield service_pb2.ModelStreamInferResponse(
+                    infer_response=service_pb2.ModelInferResponse(
+                        model_name=request.model_name, id=request.id))
+
+
+class TestPythonLoadGenerator(trc.TestResultCollector):
+
+    def setUp(self):
+        self._start_server(StubInferenceServicer())
+        self._record_event_loop_errors()
+
+    def tearDown(self):
+        self._server.stop(None)
+        patch.stopall()
+
+        # Callbacks that gRPC posted to a closed event loop
+        self.assertEqual(self._event_loop_errors, [])
+
+    def test_concurrency(self):
+        perf_config = self._create_perf_config()
+        perf_config['concurrency-range'] = 2
+        load_generator = self._create_load_generator(perf_config)
+
+        status = load_generator.run(
+            [PerfThroughput, PerfLatencyAvg, PerfLatencyP99, PerfServerQueue])
+        self.assertEqual(status, PerfAnalyzer.PA_SUCCESS)
+
+        records = {
+            type(record): record.value()
+            for record in load_generator.get_perf_records()['test_model']
+        }
+        self.assertEqual(len(records), 4)
+
+        # Requests are executed one at a time by the stub server
+        self.assertGreater(records[PerfThroughput], 0)
+        self.assertLess(records[PerfThroughput],
+                        8 / STUB_COMPUTE_SECONDS * 1.1)
+        self.assertGreaterEqual(records[PerfLatencyP99],
+                                records[PerfLatencyAvg])
+        self.assertGreater(records[PerfLatencyAvg],
+                           STUB_COMPUTE_SECONDS * 1000)
+        self.assertAlmostEqual(records[PerfServerQueue], 1)
+
+        self.assertIn('concurrency 2', load_generator.output())
+        self.assertTrue(
+            load_generator.get_cmd().startswith('python_load_generator'))
+
+    def test_request_rate(self):
+        perf_config = self._create_perf_config()
+        perf_config['request-rate-range'] = 100
+        perf_config['measurement-mode'] = 'count_windows'
+        perf_config['measurement-request-count'] = 20
+        load_generator = self._create_load_generator(perf_config)
+
+        status = load_generator.run([PerfThroughput])
+        self.assertEqual(status, PerfAnalyzer.PA_SUCCESS)
+
+        throughput = load_generator.get_perf_records()['test_model'][0]
+        self.assertAlmostEqual(throughput.value(), 100 * 4, delta=100 * 4 * 0.2)
+
+    def test_unsupported_flag(self):
+        perf_config = self._create_perf_config()
+        perf_config['input-data'] = 'zero'
+        load_generator = self._create_load_generator(perf_config)
+
+        self.assertEqual(load_generator.run([PerfThroughput]),
+                         PerfAnalyzer.PA_FAIL)
+
+    def test_variable_shape_requires_shape_flag(self):
+        perf_config = self._create_perf_config()
+        perf_config['shape'] = None
+        load_generator = self._create_load_generator(perf_config)
+
+        self.assertEqual(load_generator.run([PerfThroughput]),
+                         PerfAnalyzer.PA_FAIL)
+        self.assertIn('variable shape', load_generator.output())
+
+    def test_failed_request(self):
+        self._server.stop(None)
+        self._start_server(StubInferenceServicer(fail_requests=True))
+        load_generator = self._create_load_generator(
+            self._create_perf_config())
+
+        self.assertEqual(load_generator.run([PerfThroughput]),
+                         PerfAnalyzer.PA_FAIL)
+        self.assertIn('inference failed', load_generator.output())
+
+    def test_session_steps_concurrency(self):
+        session = PythonLoadSession()
+        try:
+            load_generator = self._create_load_generator(
+                self._create_perf_config(), session=session)
+            self.assertEqual(load_generator.run([PerfThroughput]),
+                             PerfAnalyzer.PA_SUCCESS)
+            model_load = session._model_loads['test_model']
+            client = model_load._client
+            self.assertTrue(model_load._warmed_up)
+
+            perf_config = self._create_perf_config()
+            perf_config['concurrency-range'] = 2
+            load_generator = self._create_load_generator(perf_config,
+                                                         session=session)
+            self.assertEqual(load_generator.run([PerfThroughput]),
+                             PerfAnalyzer.PA_SUCCESS)
+
+            # The second step reuses the connection of the first
+            self.assertIs(session._model_loads['test_model'], model_load)
+            self.assertIs(model_load._client, client)
+            self.assertIn('concurrency 2', load_generator.output())
+
+            session.reset()
+            self.assertIsNone(model_load._client)
+            self.assertEqual(session._model_loads, {})
+        finally:
+            session.close()
+
+    def test_sessions_close_cleanly(self):
+        for _ in range(3):
+            session = PythonLoadSession()
+            load_generator = self._create_load_generator(
+                self._create_perf_config(), session=session)
+            self.assertEqual(load_generator.run([PerfThroughput]),
+                             PerfAnalyzer.PA_SUCCESS)
+            session.close()
+
+    def _record_event_loop_errors(self):
+        self._event_loop_errors = []
+        session_init = PythonLoadSession.__init__
+
+        def init(session):
+            session_init(session)
+            session._loop.set_exception_handler(
+                lambda loop, context: self._event_loop_errors.append(
+                    context['message']))
+
+        patch.object(PythonLoadSession, '__init__', init).start()
+
+    def _start_server(self, servicer):
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        service_pb2_grpc.add_GRPCInferenceServiceServicer_to_server(
+            servicer, self._server)
+        self._port = self._server.add_insecure_port('localhost:0')
+        self._server.start()
+
+    def _create_perf_config(self):
+        perf_config = PerfAnalyzerConfig()
+        perf_config['model-name'] = 'test_model'
+        perf_config['url'] = f'localhost:{self._port}'
+        perf_config['protocol'] = 'grpc'
+        perf_config['batch-size'] = 4
+        perf_config['shape'] = 'INPUT0:16'
+        perf_config['measurement-mode'] = 'time_windows'
+        perf_config['measurement-interval'] = 100
+        perf_config['stability-percentage'] = 50
+        return perf_config
+
+    def _create_load_generator(self, perf_config, session=None):
+        run_config = RunConfig({})
+        run_config.add_model_run_config(
+            ModelRunConfig('test_model', MagicMock(), perf_config))
+
+        return PythonLoadGenerator(path='perf_analyzer',
+                                   config=run_config,
+                                   max_retries=3,
+                                   timeout=60,
+                                   max_cpu_util=50,
+                                   session=session)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -42,17 +42,20 @@ def setUp(self):
         self.less_is_better_types = {
             record_types[k] for k in [
                 'perf_latency_avg', 'perf_latency_p90', 'perf_latency_p95',
-                'perf_latency_p99', 'gpu_used_memory', 'cpu_used_ram',
+                'perf_latency_p99', 'perf_latency_p50', 'perf_latency_p999',
+                'gpu_used_memory', 'cpu_used_ram',
                 'perf_server_compute_infer', 'perf_latency',
                 'perf_server_queue', 'perf_client_response_wait',
                 'perf_server_compute_output', 'perf_client_send_recv',
-                'perf_server_compute_input', 'gpu_power_usage'
+                'perf_server_compute_input', 'gpu_power_usage',
+                'perf_client_cpu_utilization', 'gpu_energy'
             ]
         }
         self.more_is_better_types = {
             record_types[k] for k in [
                 'perf_throughput', 'gpu_free_memory', 'gpu_utilization',
-                'cpu_available_ram', 'gpu_total_memory'
+                'cpu_available_ram', 'gpu_total_memory',
+                'perf_inferences_per_joule', 'perf_inferences_per_dollar'
             ]
         }
 
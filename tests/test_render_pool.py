@@ -0,0 +1,112 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from model_analyzer.plots.detailed_plot import DetailedPlot
+from model_analyzer.plots.simple_plot import SimplePlot
+from model_analyzer.reports.html_report import HTMLReport
+from model_analyzer.reports.render_pool import RenderPool
+
+from .common import test_result_collector as trc
+from .common.test_utils import construct_run_config_measurement
+
+
+class TestRenderPool(trc.TestResultCollector):
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+        patch.stopall()
+
+    def test_save_plots_in_workers(self):
+        plots = [(self._create_simple_plot(f'plot_{i}'), self._tmp_dir.name)
+                 for i in range(3)]
+        plots.append((DetailedPlot('latency_breakdown',
+                                   'Online Performance'), self._tmp_dir.name))
+
+        RenderPool(num_workers=2).save_plots(plots)
+
+        self.assertEqual(sorted(os.listdir(self._tmp_dir.name)), [
+            'latency_breakdown.png', 'plot_0.png', 'plot_1.png', 'plot_2.png'
+        ])
+
+    def test_save_plots_in_process(self):
+        """
+        Test that all of the plots are drawn on the same figure
+        """
+        figure = MagicMock()
+        figure_mock = patch('model_analyzer.plots.simple_plot.Figure',
+                            return_value=figure).start()
+
+        plots = [(self._create_simple_plot(f'plot_{i}'), self._tmp_dir.name)
+                 for i in range(3)]
+        RenderPool(num_workers=1).save_plots(plots)
+
+        figure_mock.assert_called_once()
+        self.assertEqual(figure.clf.call_count, 3)
+        self.assertEqual(figure.savefig.call_count, 3)
+
+    def test_write_reports(self):
+        reports = []
+        for i in range(2):
+            report = HTMLReport()
+            report.add_title(f'report_{i}')
+            reports.append(
+                (report, os.path.join(self._tmp_dir.name, f'report_{i}.html')))
+
+        RenderPool(num_workers=2).write_reports(reports)
+
+        for i in range(2):
+            with open(os.path.join(self._tmp_dir.name,
+                                   f'report_{i}.html')) as f:
+                self.assertIn(f'report_{i}', f.read())
+
+        # Errors of the workers are raised
+        with self.assertRaises(FileNotFoundError):
+            RenderPool(num_workers=2).write_reports([
+                (report, os.path.join(self._tmp_dir.name, 'missing', 'a.html')),
+                (report, os.path.join(self._tmp_dir.name, 'missing', 'b.html'))
+            ])
+
+    def _create_simple_plot(self, name):
+        plot = SimplePlot(name=name,
+                          title='test_title',
+                          x_axis='perf_throughput',
+                          y_axis='perf_latency_p99')
+
+        measurement = construct_run_config_measurement(
+            model_name='test_model',
+            model_config_names=['test_model_config_0'],
+            model_specific_pa_params=MagicMock(),
+            gpu_metric_values={},
+            non_gpu_metric_values=[{
+                'perf_throughput': 200,
+                'perf_latency_p99': 8000
+            }],
+            metric_objectives=[{
+                'perf_throughput': 1
+            }])
+        plot.add_run_config_measurement('test_model_config_0', measurement)
+
+        return plot
+
+
+if __name__ == '__main__':
+    unittest.main()
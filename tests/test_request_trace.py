@@ -0,0 +1,255 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from model_analyzer.model_analyzer_exceptions \
+    import TritonModelAnalyzerException
+from model_analyzer.perf_analyzer.request_trace import RequestTrace
+
+from .common import test_result_collector as trc
+
+
+class TestRequestTrace(trc.TestResultCollector):
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._output_path = os.path.join(self._tmp_dir.name, 'traces')
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+        patch.stopall()
+
+    def test_convert(self):
+        # Chunks of two requests
+        patch.object(RequestTrace, 'CHUNK_SIZE', 2).start()
+
+        self._convert([{
+            'timestamp': 1.0,
+            'model_name': 'model_a',
+            'inputs': {
+                'INPUT0': {
+                    'shape': [2]
+                }
+            }
+        }, {
+            'timestamp': 1.5,
+            'model_name': 'model_b'
+        }, {
+            'timestamp': 1.001,
+            'model_name': 'model_a',
+            'inputs': {
+                'INPUT0': {
+                    'shape': [1, 3]
+                }
+            }
+        }, {
+            'timestamp': 2.0,
+            'model_name': 'model_c'
+        }, {
+            'timestamp': 2.5,
+            'model_name': 'model_b'
+        }, {
+            'timestamp': 3.0,
+            'model_name': 'model_a',
+            'inputs': {
+                'INPUT0': {
+                    'shape': [1]
+                }
+            }
+        }, {
+            'timestamp': 3.5,
+            'model_name': 'model_a',
+            'inputs': {
+                'INPUT0': {
+                    'shape': [2]
+                }
+            }
+        }], ['model_a', 'model_b'])
+
+        # The requests of other models are skipped, and the input
+        # data of a short trace has a step for each request
+        flags = RequestTrace.get_perf_analyzer_flags(self._output_path,
+                                                     'model_a')
+        with open(flags['request-intervals']) as f:
+            self.assertEqual(f.read().split(), ['1000', '1999000', '500000'])
+        with open(flags['input-data']) as f:
+            self.assertEqual(
+                json.load(f), {
+                    'data': [{
+                        'INPUT0': {
+                            'content': [0, 0],
+                            'shape': [2]
+                        }
+                    }, {
+                        'INPUT0': {
+                            'content': [0, 0, 0],
+                            'shape': [1, 3]
+                        }
+                    }, {
+                        'INPUT0': {
+                            'content': [0],
+                            'shape': [1]
+                        }
+                    }, {
+                        'INPUT0': {
+                            'content': [0, 0],
+                            'shape': [2]
+                        }
+                    }]
+                })
+
+        # Without inputs, perf_analyzer generates the input data
+        flags = RequestTrace.get_perf_analyzer_flags(self._output_path,
+                                                     'model_b')
+        self.assertNotIn('input-data', flags)
+        with open(flags['request-intervals']) as f:
+            self.assertEqual(f.read().split(), ['1000000'])
+
+    def test_input_data_types(self):
+        self._convert([{
+            'timestamp': 1.0,
+            'inputs': {
+                'TEXT': {
+                    'shape': [2]
+                },
+                'MASK': {
+                    'shape': [1]
+                },
+                'INPUT0': {
+                    'shape': [1]
+                }
+            }
+        }, {
+            'timestamp': 2.0,
+            'inputs': {
+                'TEXT': {
+                    'shape': [2]
+                },
+                'MASK': {
+                    'shape': [1]
+                },
+                'INPUT0': {
+                    'shape': [1]
+                }
+            }
+        }], ['model_a'], {
+            'model_a': {
+                'TEXT': 'TYPE_STRING',
+                'MASK': 'TYPE_BOOL',
+                'INPUT0': 'TYPE_FP32'
+            }
+        })
+
+        # BYTES inputs are filled with strings, and BOOL inputs with false
+        flags = RequestTrace.get_perf_analyzer_flags(self._output_path,
+                                                     'model_a')
+        step = {
+            'TEXT': {
+                'content': ['0', '0'],
+                'shape': [2]
+            },
+            'MASK': {
+                'content': [False],
+                'shape': [1]
+            },
+            'INPUT0': {
+                'content': [0],
+                'shape': [1]
+            }
+        }
+        with open(flags['input-data']) as f:
+            self.assertEqual(json.load(f), {'data': [step, step]})
+
+    def test_skewed_shape_mix(self):
+        # One large request for every 99 small ones
+        requests = [{
+            'timestamp': i / 1000,
+            'inputs': {
+                'INPUT0': {
+                    'shape': [64] if i % 100 == 50 else [1]
+                }
+            }
+        } for i in range(1000)]
+        self._convert(requests, ['model_a'])
+
+        # The long trace is replayed with the same mix of shapes
+        flags = RequestTrace.get_perf_analyzer_flags(self._output_path,
+                                                     'model_a')
+        with open(flags['input-data']) as f:
+            shapes = [step['INPUT0']['shape'] for step in json.load(f)['data']]
+        self.assertEqual(len(shapes), RequestTrace.MAX_INPUT_DATA_STEPS)
+        self.assertEqual(shapes.count([64]), 1)
+        self.assertEqual(shapes.count([1]), 99)
+
+        # A rare set of shapes still has a step
+        requests[0]['inputs']['INPUT0']['shape'] = [8]
+        self._convert(requests, ['model_a'])
+        with open(flags['input-data']) as f:
+            shapes = [step['INPUT0']['shape'] for step in json.load(f)['data']]
+        self.assertEqual(shapes.count([8]), 1)
+        self.assertEqual(shapes.count([64]), 1)
+
+    def test_requests_without_model_name(self):
+        self._convert([{
+            'timestamp': 1.0
+        }, {
+            'timestamp': 1.25
+        }], ['model_a', 'model_b'])
+
+        # Requests without a model name are sent to every model
+        for model_name in ['model_a', 'model_b']:
+            flags = RequestTrace.get_perf_analyzer_flags(
+                self._output_path, model_name)
+            with open(flags['request-intervals']) as f:
+                self.assertEqual(f.read().split(), ['250000'])
+
+    def test_unsorted_trace(self):
+        with self.assertRaises(TritonModelAnalyzerException):
+            self._convert([{
+                'timestamp': 2.0
+            }, {
+                'timestamp': 1.0
+            }], ['model_a'])
+
+    def test_too_few_requests(self):
+        with self.assertRaises(TritonModelAnalyzerException):
+            self._convert([{
+                'timestamp': 1.0,
+                'model_name': 'model_a'
+            }, {
+                'timestamp': 2.0,
+                'model_name': 'model_b'
+            }], ['model_a', 'model_b'])
+
+    def test_invalid_request(self):
+        with self.assertRaises(TritonModelAnalyzerException):
+            self._convert([{'model_name': 'model_a'}], ['model_a'])
+
+    def _convert(self, requests, model_names, input_data_types=None):
+        trace_path = os.path.join(self._tmp_dir.name, 'trace.jsonl')
+        with open(trace_path, 'w') as f:
+            for request in requests:
+                f.write(json.dumps(request) + '\n')
+
+        RequestTrace(trace_path,
+                     self._output_path).convert(model_names, input_data_types)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import unittest
+from copy import deepcopy
 
 from model_analyzer.model_analyzer_exceptions import TritonModelAnalyzerException
 
@@ -22,6 +23,7 @@
 from unittest.mock import patch, MagicMock
 from model_analyzer.result.sorted_results import SortedResults
 from model_analyzer.result.result_manager import ResultManager
+from model_analyzer.result.run_config_measurement import RunConfigMeasurement
 from model_analyzer.state.analyzer_state_manager import AnalyzerStateManager
 from model_analyzer.config.input.config_command_report import ConfigCommandReport
 from model_analyzer.result.constraint_manager import ConstraintManager
@@ -159,6 +161,42 @@ def test_get_across_model_sorted_results(self):
         self.assertTrue(isinstance(sorted_results, SortedResults))
         self.assertEqual(6, len(sorted_results.results()))
 
+    def test_is_ranking_ambiguous(self):
+        """
+        Test that only measurements within the tolerance of the best
+        one, whose confidence intervals overlap it, are ambiguous
+        """
+        result_manager, _ = load_single_model_result_manager()
+        best_measurement = result_manager.get_model_sorted_results(
+            "add_sub").best_passing_measurement()
+
+        run_config = MagicMock()
+        run_config.models_name.return_value = "add_sub"
+
+        # The best measurement is not ambiguous with itself
+        self.assertFalse(
+            result_manager.is_ranking_ambiguous(run_config, best_measurement,
+                                                0.05))
+
+        candidate = deepcopy(best_measurement)
+        candidate._model_variants_name = "add_sub_config_new"
+        self.assertTrue(
+            result_manager.is_ranking_ambiguous(run_config, candidate, 0.05))
+        self.assertFalse(
+            result_manager.is_ranking_ambiguous(run_config, candidate, -1))
+
+        # Identical repeats overlap the best measurement
+        repeated_candidate = RunConfigMeasurement.combine(
+            [candidate, candidate])
+        self.assertTrue(
+            result_manager.is_ranking_ambiguous(run_config, repeated_candidate,
+                                                0.05))
+
+        # Models without results have nothing to be ranked against
+        run_config.models_name.return_value = "FakeModel"
+        self.assertFalse(
+            result_manager.is_ranking_ambiguous(run_config, candidate, 0.05))
+
     def _add_a_fake_result(self, result_manager):
         fake_model = MagicMock()
         fake_model.model_name.return_value = "FakeModel"
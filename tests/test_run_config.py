@@ -85,6 +85,36 @@ def test_representation_mrc_removal(self):
         expected_represenation = "-m TestModel1"
         self.assertEqual(mrc.representation(), expected_represenation)
 
+    def test_representation_cached(self):
+        """
+        Test that the representation is only recomputed after a
+        perf config changes, and that equal representations are shared
+        """
+        pc1 = PerfAnalyzerConfig()
+        pc1.update_config({'model-name': "TestModel1", 'batch-size': 1})
+        pc2 = PerfAnalyzerConfig()
+        pc2.update_config({'model-name': "TestModel1", 'batch-size': 1})
+        rc = RunConfig({})
+        rc.add_model_run_config(ModelRunConfig("model1", MagicMock(), pc1))
+
+        with patch.object(PerfAnalyzerConfig,
+                          'to_cli_string',
+                          autospec=True,
+                          side_effect=PerfAnalyzerConfig.to_cli_string
+                         ) as mock_to_cli_string:
+            representation = rc.representation()
+            self.assertIs(rc.representation(), representation)
+            self.assertIs(pc2.representation(), representation)
+            self.assertEqual(mock_to_cli_string.call_count, 2)
+
+            pc1.update_config({'measurement-interval': 10000})
+            self.assertEqual(rc.representation(),
+                             "-m TestModel1 -b 1 --measurement-interval=10000")
+            self.assertEqual(mock_to_cli_string.call_count, 3)
+
+        self.assertNotIn('_representation', rc.to_dict())
+        self.assertNotIn('_representation', pc1.to_dict())
+
     def test_cpu_only(self):
         """
         Test that cpu_only() is only true if all ModelConfigs are cpu_only() 
@@ -36,6 +36,7 @@ class TestRunConfigGenerator(trc.TestResultCollector):
     def __init__(self, methodname):
         super().__init__(methodname)
         self._fake_throughput = 1
+        self._constraint_manager = None
 
     def test_default_config_single_model(self):
         """
@@ -601,6 +602,62 @@ def test_variant_naming(self):
             self.assertEqual(expected_modelB_name_order[i],
                              rc.model_run_configs()[1].model_variant_name())
 
+    def test_successive_halving(self):
+        """
+        Test that every model config is screened at the lowest and highest
+        concurrency with time windows, and that only the best half of the
+        model configs is fully swept
+
+        The default config is fully swept (3 configs)
+        The 4 automatic model configs are screened (2 configs each)
+        The best 2 of them are fully swept (3 configs each)
+        """
+
+        # yapf: disable
+        yaml_str = ("""
+            successive_halving_enable: true
+            run_config_search_max_concurrency: 4
+            run_config_search_max_instance_count: 2
+            run_config_search_max_model_batch_size: 2
+            profile_models:
+                - my-model
+            """)
+        # yapf: enable
+
+        self._constraint_manager = MagicMock()
+        self._constraint_manager.satisfies_constraints.return_value = True
+
+        run_configs = self._run_and_test_run_config_generator(
+            yaml_str, expected_config_count=17)
+
+        perf_configs = [
+            run_config.model_run_configs()[0].perf_config()
+            for run_config in run_configs
+        ]
+        variant_names = [
+            run_config.model_run_configs()[0].model_variant_name()
+            for run_config in run_configs
+        ]
+
+        screening = [
+            perf_config['measurement-mode'] == 'time_windows'
+            for perf_config in perf_configs
+        ]
+        self.assertEqual(screening, [False] * 3 + [True] * 8 + [False] * 6)
+
+        # Screening measurements are kept out of the results
+        self.assertEqual(
+            [run_config.is_screening() for run_config in run_configs],
+            screening)
+        self.assertEqual(
+            [perf_config['concurrency-range'] for perf_config in perf_configs[3:11]],
+            [1, 4] * 4)
+
+        # Throughput increases with every measurement, so the last two
+        # screened model configs are the best, and are swept best first
+        self.assertEqual(variant_names[11:],
+                         [variant_names[9]] * 3 + [variant_names[7]] * 3)
+
     def _run_and_test_run_config_generator(self, yaml_str,
                                            expected_config_count):
         args = [
@@ -669,7 +726,8 @@ def _get_next_fake_results(self):
                 gpu_metric_values=MagicMock(),
                 non_gpu_metric_values=[{
                     "perf_throughput": throughput_value
-                }])
+                }],
+                constraint_manager=self._constraint_manager)
 
         return [measurement]
 
@@ -406,6 +406,23 @@ def test_from_dict(self):
                          self.rcm0._model_config_measurements)
         self.assertEqual(rcm0_from_dict._model_config_weights, [])
 
+    def test_combine(self):
+        """
+        Test that repeated measurements are combined per GPU
+        and per model config
+        """
+        rcm = RunConfigMeasurement.combine([self.rcm0, self.rcm0])
+
+        self.assertEqual(rcm.model_variants_name(), self.model_variants_name)
+        self.assertEqual(rcm.measurement_count(), 2)
+        self.assertEqual(self.rcm0.measurement_count(), 1)
+        self.assertEqual(rcm.gpus_used(), self.rcm0.gpus_used())
+        self.assertEqual(rcm.get_gpu_metric_value("gpu_used_memory"), 8000)
+        self.assertEqual(rcm.get_non_gpu_metric_value("perf_throughput"),
+                         self.rcm0.get_non_gpu_metric_value("perf_throughput"))
+        self.assertEqual(rcm.model_specific_pa_params(),
+                         self.model_specific_pa_params)
+
     def _construct_rcm0(self):
         self.model_name = "modelA,modelB"
         self.model_config_name = ["modelA_config_0", "modelB_config_1"]
@@ -0,0 +1,131 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import MagicMock
+
+from model_analyzer.perf_analyzer.shared_memory import SharedMemory
+
+from .common import test_result_collector as trc
+
+
+class TestSharedMemory(trc.TestResultCollector):
+
+    def test_tensor_bytes(self):
+        model_config = self._create_model_config([512, 512], [1000])
+        self.assertEqual(SharedMemory.get_tensor_bytes(model_config, {}),
+                         512 * 512 * 4 + 1000 * 4)
+
+        # Variable inputs are sized by the shape flag
+        model_config = self._create_model_config([-1, 3], [1000])
+        self.assertIsNone(SharedMemory.get_tensor_bytes(model_config, {}))
+        self.assertEqual(
+            SharedMemory.get_tensor_bytes(model_config,
+                                          {'shape': ['INPUT0:100,3']}),
+            100 * 3 * 4 + 1000 * 4)
+
+        # Variable outputs cannot be sized
+        model_config = self._create_model_config([16], [-1])
+        self.assertIsNone(
+            SharedMemory.get_tensor_bytes(model_config,
+                                          {'shape': 'OUTPUT0:16'}))
+
+        # Nor can strings
+        model_config = self._create_model_config([16], [16])
+        model_config['input'][0]['data_type'] = 'TYPE_STRING'
+        self.assertIsNone(SharedMemory.get_tensor_bytes(model_config, {}))
+
+    def test_auto(self):
+        large_model_config = self._create_model_config([3, 1024, 1024], [1000])
+        small_model_config = self._create_model_config([16], [16])
+
+        self.assertEqual(
+            SharedMemory.get_perf_analyzer_flags(self._create_config(),
+                                                 large_model_config, {}),
+            {'shared-memory': 'system'})
+        self.assertEqual(
+            SharedMemory.get_perf_analyzer_flags(self._create_config(),
+                                                 small_model_config, {}), {})
+
+        # CUDA shared memory for models on GPUs only
+        large_model_config['instance_group'] = [{'kind': 'KIND_GPU'}]
+        self.assertEqual(
+            SharedMemory.get_perf_analyzer_flags(self._create_config(),
+                                                 large_model_config, {}),
+            {'shared-memory': 'cuda'})
+        large_model_config['instance_group'].append({'kind': 'KIND_CPU'})
+        self.assertEqual(
+            SharedMemory.get_perf_analyzer_flags(self._create_config(),
+                                                 large_model_config, {}),
+            {'shared-memory': 'system'})
+
+        # Only when perf_analyzer runs on the host of the server
+        for launch_mode in ['remote', 'c_api']:
+            self.assertEqual(
+                SharedMemory.get_perf_analyzer_flags(
+                    self._create_config(triton_launch_mode=launch_mode),
+                    large_model_config, {}), {})
+        self.assertEqual(
+            SharedMemory.get_perf_analyzer_flags(
+                self._create_config(load_generator='python'),
+                large_model_config, {}), {})
+
+    def test_set_by_config(self):
+        small_model_config = self._create_model_config([16], [16])
+
+        for mode in ['system', 'cuda']:
+            self.assertEqual(
+                SharedMemory.get_perf_analyzer_flags(
+                    self._create_config(perf_analyzer_shared_memory=mode,
+                                        triton_launch_mode='remote'),
+                    small_model_config, {}), {'shared-memory': mode})
+
+        large_model_config = self._create_model_config([3, 1024, 1024], [1000])
+        self.assertEqual(
+            SharedMemory.get_perf_analyzer_flags(
+                self._create_config(perf_analyzer_shared_memory='none'),
+                large_model_config, {}), {})
+
+    def _create_config(self,
+                       perf_analyzer_shared_memory='auto',
+                       triton_launch_mode='local',
+                       load_generator='perf_analyzer'):
+        config = MagicMock()
+        config.perf_analyzer_shared_memory = perf_analyzer_shared_memory
+        config.triton_launch_mode = triton_launch_mode
+        config.load_generator = load_generator
+        return config
+
+    def _create_model_config(self, input_dims, output_dims):
+        # Dims are strings in the JSON of model configs
+        return {
+            'name':
+                'my-model',
+            'max_batch_size':
+                8,
+            'input': [{
+                'name': 'INPUT0',
+                'data_type': 'TYPE_FP32',
+                'dims': [str(dim) for dim in input_dims]
+            }],
+            'output': [{
+                'name': 'OUTPUT0',
+                'data_type': 'TYPE_FP32',
+                'dims': [str(dim) for dim in output_dims]
+            }]
+        }
+
+
+if __name__ == '__main__':
+    unittest.main()
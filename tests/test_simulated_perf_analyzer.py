@@ -0,0 +1,193 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from model_analyzer.config.run.model_run_config import ModelRunConfig
+from model_analyzer.config.run.run_config import RunConfig
+from model_analyzer.device.gpu_device_factory import GPUDeviceFactory
+from model_analyzer.perf_analyzer.perf_analyzer import PerfAnalyzer
+from model_analyzer.perf_analyzer.perf_config import PerfAnalyzerConfig
+from model_analyzer.perf_analyzer.perf_model import QueueingPerfModel
+from model_analyzer.perf_analyzer.simulated_perf_analyzer \
+    import SimulatedPerfAnalyzer
+from model_analyzer.triton.client.simulated_client \
+    import TritonSimulatedClient
+from model_analyzer.triton.model.model_config import ModelConfig
+from model_analyzer.record.types.perf_throughput import PerfThroughput
+from model_analyzer.record.types.perf_latency_p99 import PerfLatencyP99
+from model_analyzer.record.types.gpu_used_memory import GPUUsedMemory
+from model_analyzer.record.types.gpu_free_memory import GPUFreeMemory
+
+from .common import test_result_collector as trc
+
+
+class TestSimulatedPerfAnalyzer(trc.TestResultCollector):
+
+    def setUp(self):
+        self.gpus = GPUDeviceFactory.create_simulated_gpus(2)
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_simulated_gpus(self):
+        self.assertEqual(len(self.gpus), 2)
+        self.assertEqual(self.gpus[1].device_uuid(), 'GPU-simulated-1')
+        self.assertEqual(self.gpus[1].device_id(), 1)
+
+    def test_concurrency_increases_latency(self):
+        perf_model = QueueingPerfModel()
+
+        low, _ = perf_model.estimate(self._make_run_config(concurrency=1),
+                                     self.gpus)
+        high, _ = perf_model.estimate(self._make_run_config(concurrency=64),
+                                      self.gpus)
+
+        self.assertGreater(high[0]['perf_latency_p99'],
+                           low[0]['perf_latency_p99'])
+        self.assertGreaterEqual(high[0]['perf_throughput'],
+                                low[0]['perf_throughput'])
+
+    def test_dynamic_batching_increases_throughput(self):
+        perf_model = QueueingPerfModel()
+
+        unbatched, _ = perf_model.estimate(
+            self._make_run_config(concurrency=64), self.gpus)
+        batched, _ = perf_model.estimate(
+            self._make_run_config(concurrency=64, dynamic_batching=True),
+            self.gpus)
+
+        self.assertGreater(batched[0]['perf_throughput'],
+                           unbatched[0]['perf_throughput'])
+
+    def test_request_rate_saturates(self):
+        perf_model = QueueingPerfModel()
+
+        sustained, _ = perf_model.estimate(
+            self._make_run_config(concurrency=None, request_rate=100),
+            self.gpus)
+        saturated, _ = perf_model.estimate(
+            self._make_run_config(concurrency=None, request_rate=100000),
+            self.gpus)
+
+        # Below capacity the offered rate is served, beyond
+        # it the requests queue up
+        self.assertAlmostEqual(sustained[0]['perf_throughput'], 100)
+        self.assertLess(saturated[0]['perf_throughput'], 100000)
+        self.assertGreater(saturated[0]['perf_server_queue'],
+                           100 * sustained[0]['perf_latency_avg'])
+
+    def test_noise_is_repeatable(self):
+        run_config = self._make_run_config(concurrency=8)
+
+        first, _ = QueueingPerfModel(noise=0.1, seed=3).estimate(
+            run_config, self.gpus)
+        second, _ = QueueingPerfModel(noise=0.1, seed=3).estimate(
+            run_config, self.gpus)
+        noiseless, _ = QueueingPerfModel().estimate(run_config, self.gpus)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, noiseless)
+
+    def test_run(self):
+        run_config = self._make_run_config(concurrency=8)
+        perf_metrics, gpu_metrics = QueueingPerfModel().estimate(
+            run_config, self.gpus)
+
+        perf_analyzer = SimulatedPerfAnalyzer(path='perf_analyzer',
+                                              config=run_config,
+                                              max_retries=1,
+                                              timeout=100,
+                                              max_cpu_util=50,
+                                              perf_model=QueueingPerfModel(),
+                                              gpus=self.gpus)
+        status = perf_analyzer.run(
+            [PerfThroughput, PerfLatencyP99, GPUUsedMemory, GPUFreeMemory])
+
+        self.assertEqual(status, PerfAnalyzer.PA_SUCCESS)
+
+        perf_records = {
+            type(record): record.value()
+            for record in perf_analyzer.get_perf_records()['test_model']
+        }
+        self.assertAlmostEqual(perf_records[PerfThroughput],
+                               perf_metrics[0]['perf_throughput'])
+        self.assertAlmostEqual(perf_records[PerfLatencyP99],
+                               perf_metrics[0]['perf_latency_p99'])
+
+        # Free memory is reported as the total by perf_analyzer
+        gpu_records = perf_analyzer.get_gpu_records()
+        self.assertEqual(len(gpu_records), 4)
+        free_memory = [
+            record for record in gpu_records
+            if type(record) == GPUFreeMemory and
+            record.device_uuid() == 'GPU-simulated-0'
+        ]
+        self.assertAlmostEqual(
+            free_memory[0].value(),
+            gpu_metrics['GPU-simulated-0']['gpu_free_memory'])
+
+        self.assertFalse(
+            os.path.exists(
+                run_config.model_run_configs()[0].perf_config()
+                ['latency-report-file']))
+
+    def test_simulated_client(self):
+        client = TritonSimulatedClient()
+
+        self.assertTrue(client.is_server_ready())
+        self.assertEqual(client.wait_for_model_ready('test_model', 1), -1)
+
+        client.load_model('test_model')
+        self.assertIsNone(client.wait_for_model_ready('test_model', 1))
+
+        client.unload_model('test_model')
+        self.assertEqual(client.wait_for_model_ready('test_model', 1), -1)
+
+    def _make_run_config(self,
+                         concurrency,
+                         dynamic_batching=False,
+                         request_rate=None):
+        model_config_dict = {
+            'name': 'test_model',
+            'max_batch_size': 8,
+            'instance_group': [{
+                'count': 1,
+                'kind': 'KIND_GPU'
+            }]
+        }
+        if dynamic_batching:
+            model_config_dict['dynamic_batching'] = {}
+
+        perf_config = PerfAnalyzerConfig()
+        perf_config['model-name'] = 'test_model'
+        perf_config['batch-size'] = 1
+        perf_config['concurrency-range'] = concurrency
+        perf_config['request-rate-range'] = request_rate
+        perf_config['latency-report-file'] = os.path.join(
+            self.temp_dir.name, 'test_model-results.csv')
+
+        run_config = RunConfig({})
+        run_config.add_model_run_config(
+            ModelRunConfig('test_model',
+                           ModelConfig.create_from_dictionary(model_config_dict),
+                           perf_config))
+        return run_config
+
+
+if __name__ == '__main__':
+    unittest.main()
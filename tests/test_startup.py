@@ -0,0 +1,96 @@
+# Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Startup import budget for each subcommand. Each check runs in a fresh
+# interpreter, and fails if a slow to import package that the subcommand
+# doesn't need gets imported.
+
+import json
+import subprocess
+import sys
+import unittest
+
+from model_analyzer.config.input.objects.config_protobuf_utils \
+    import ModelConfigSchema, get_model_config_schema
+from model_analyzer.config.input.config_object import ConfigObject
+from model_analyzer.constants import CONFIG_PARSER_SUCCESS
+
+from .common import test_result_collector as trc
+
+PARSE_CLI = """
+import json, sys
+from model_analyzer.entrypoint import get_cli_and_config_options
+sys.argv = ['model-analyzer'] + sys.argv[1:] + ['--help']
+try:
+    get_cli_and_config_options()
+except SystemExit:
+    pass
+{extra_imports}
+print(json.dumps(sorted(sys.modules)))
+"""
+
+# Packages needed only to profile (or to build reports)
+PROFILE_ONLY_PACKAGES = ['docker', 'tritonclient.http']
+REPORT_ONLY_PACKAGES = ['matplotlib', 'pdfkit']
+ALL_HEAVY_PACKAGES = PROFILE_ONLY_PACKAGES + REPORT_ONLY_PACKAGES + [
+    'tritonclient.grpc', 'prometheus_client', 'distutils'
+]
+
+
+class TestStartup(trc.TestResultCollector):
+
+    def test_help_budget(self):
+        self._assert_not_imported([], '', ALL_HEAVY_PACKAGES)
+
+    def test_profile_cli_budget(self):
+        self._assert_not_imported(['profile'], '', ALL_HEAVY_PACKAGES)
+
+    def test_report_cli_budget(self):
+        self._assert_not_imported(['report'], '', ALL_HEAVY_PACKAGES)
+
+    def test_report_analyzer_budget(self):
+        self._assert_not_imported(['report'], 'import model_analyzer.analyzer',
+                                  PROFILE_ONLY_PACKAGES)
+
+    def test_model_config_schema(self):
+        schema = ModelConfigSchema()
+
+        self.assertIn('max_batch_size', schema)
+        self.assertIn('instance_group', schema)
+        self.assertNotIn('not_a_model_config_field', schema)
+
+        # The schema is built once and shared
+        self.assertIs(schema['max_batch_size'],
+                      get_model_config_schema()['max_batch_size'])
+
+        model_config_fields = ConfigObject(schema=schema)
+        status = model_config_fields.set_value({'max_batch_size': 8})
+        self.assertEqual(status.status(), CONFIG_PARSER_SUCCESS)
+        self.assertIn('max_batch_size', model_config_fields.value())
+
+    def _assert_not_imported(self, subcommand, extra_imports, packages):
+        output = subprocess.run(
+            [sys.executable, '-c',
+             PARSE_CLI.format(extra_imports=extra_imports)] + subcommand,
+            stdout=subprocess.PIPE,
+            check=True,
+            text=True).stdout
+        modules = json.loads(output.splitlines()[-1])
+
+        for package in packages:
+            self.assertNotIn(package, modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
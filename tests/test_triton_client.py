@@ -23,8 +23,9 @@
 from .common import test_result_collector as trc
 
 import os
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 # Test parameters
 MODEL_REPOSITORY_PATH = 'test_repo'
@@ -140,6 +141,47 @@ def _test_with_client(self, client):
         self.tritonclient_mock.assert_grpc_client_waited_for_model_ready(
             model_name=TEST_MODEL_NAME)
 
+    def test_wait_polls_with_backoff(self):
+        client = TritonClientFactory.create_grpc_client(server_url=GRPC_URL)
+        is_server_ready = self.tritonclient_mock.grpc_mock.return_value.is_server_ready
+
+        # Returns as soon as the server is ready, without sleeping
+        start = time.monotonic()
+        client.wait_for_server_ready(num_retries=10, sleep_time=1)
+        self.assertLess(time.monotonic() - start, 0.5)
+        is_server_ready.assert_called_once()
+
+        # Polls until the server is ready, at short intervals
+        is_server_ready.side_effect = [False, Exception, False, True]
+        start = time.monotonic()
+        client.wait_for_server_ready(num_retries=10, sleep_time=1)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(is_server_ready.call_count, 5)
+
+        # Retries for num_retries * sleep_time seconds
+        self.tritonclient_mock.reset()
+        self.tritonclient_mock.set_model_not_ready()
+        start = time.monotonic()
+        self.assertEqual(
+            client.wait_for_model_ready(model_name=TEST_MODEL_NAME,
+                                        num_retries=3,
+                                        sleep_time=0.1), -1)
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+
+    def test_wait_for_exited_server(self):
+        client = TritonClientFactory.create_grpc_client(server_url=GRPC_URL)
+        self.tritonclient_mock.set_server_not_ready()
+
+        # Waiting stops as soon as the server has exited
+        server = MagicMock()
+        server.is_running.return_value = False
+        start = time.monotonic()
+        with self.assertRaisesRegex(TritonModelAnalyzerException, 'exited'):
+            client.wait_for_server_ready(num_retries=10,
+                                         sleep_time=1,
+                                         server=server)
+        self.assertLess(time.monotonic() - start, 0.5)
+
     def test_load_unload_model(self):
 
         # Create client
@@ -23,6 +23,7 @@
 from model_analyzer.triton.server.server_factory import TritonServerFactory
 from model_analyzer.triton.server.server_config import TritonServerConfig
 from model_analyzer.device.gpu_device import GPUDevice
+from model_analyzer.constants import LOGGER_NAME
 from model_analyzer.model_analyzer_exceptions \
     import TritonModelAnalyzerException
 
@@ -249,6 +250,23 @@ def start_stop_docker_args(self):
         self.server.stop()
         self.server_docker_mock.assert_server_process_terminate_called()
 
+    def test_docker_host_ipc(self):
+        server_config = TritonServerConfig()
+        server_config['model-repository'] = MODEL_REPOSITORY_PATH
+        self.server = TritonServerFactory.create_server_docker(
+            image=TRITON_IMAGE, config=server_config, gpus=[], shm_size='1G')
+
+        with self.assertLogs(LOGGER_NAME, level='WARNING'):
+            self.server.set_host_ipc(True)
+        self.server.start()
+        self.server_docker_mock.assert_server_process_start_called_with(
+            f"{TRITON_DOCKER_BIN_PATH} {server_config.to_cli_string()}",
+            MODEL_REPOSITORY_PATH,
+            TRITON_IMAGE, [], [],
+            shm_size='1G',
+            ipc_mode='host')
+        self.server.stop()
+
     def _test_get_logs(self, gpus):
         # Create a TritonServerConfig
         server_config = TritonServerConfig()